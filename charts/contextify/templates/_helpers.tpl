@@ -137,4 +137,35 @@ Validate required image tags
 {{- if not .Values.image.server.tag }}
 {{- fail "You must set image.server.tag in values.yaml; no default allowed." }}
 {{- end }}
-{{- end }}
\ No newline at end of file
+{{- end }}
+{{/*
+Worker component labels
+*/}}
+{{- define "contextify.worker.labels" -}}
+{{ include "contextify.labels" . }}
+app.kubernetes.io/component: worker
+{{- end }}
+
+{{/*
+Worker component selector labels
+*/}}
+{{- define "contextify.worker.selectorLabels" -}}
+{{ include "contextify.selectorLabels" . }}
+app.kubernetes.io/component: worker
+{{- end }}
+
+{{/*
+Worker deployment name
+*/}}
+{{- define "contextify.worker.fullname" -}}
+{{- printf "%s-worker" (include "contextify.fullname" .) }}
+{{- end }}
+
+{{/*
+Whether processing runs in a separate worker deployment, enabled unless worker.enabled is false.
+The server doesn't process items itself then.
+*/}}
+{{- define "contextify.worker.enabled" -}}
+{{- $worker := .Values.worker | default dict }}
+{{- if or (not (hasKey $worker "enabled")) $worker.enabled }}true{{- end }}
+{{- end }}
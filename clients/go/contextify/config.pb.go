@@ -164,10 +164,12 @@ func (b0 GlobalConfig_builder) Build() *GlobalConfig {
 }
 
 type PeriodicConfig struct {
-	state                  protoimpl.MessageState `protogen:"opaque.v1"`
-	xxx_hidden_Concurrency int32                  `protobuf:"varint,1,opt,name=concurrency,proto3"`
-	unknownFields          protoimpl.UnknownFields
-	sizeCache              protoimpl.SizeCache
+	state                       protoimpl.MessageState             `protogen:"opaque.v1"`
+	xxx_hidden_Concurrency      int32                              `protobuf:"varint,1,opt,name=concurrency,proto3"`
+	xxx_hidden_LeaseDurationSec int32                              `protobuf:"varint,2,opt,name=lease_duration_sec,json=leaseDurationSec,proto3"`
+	xxx_hidden_EntityLimits     *[]*PeriodicConfig_EntityTypeLimit `protobuf:"bytes,3,rep,name=entity_limits,json=entityLimits,proto3"`
+	unknownFields               protoimpl.UnknownFields
+	sizeCache                   protoimpl.SizeCache
 }
 
 func (x *PeriodicConfig) Reset() {
@@ -202,14 +204,42 @@ func (x *PeriodicConfig) GetConcurrency() int32 {
 	return 0
 }
 
+func (x *PeriodicConfig) GetLeaseDurationSec() int32 {
+	if x != nil {
+		return x.xxx_hidden_LeaseDurationSec
+	}
+	return 0
+}
+
+func (x *PeriodicConfig) GetEntityLimits() []*PeriodicConfig_EntityTypeLimit {
+	if x != nil {
+		if x.xxx_hidden_EntityLimits != nil {
+			return *x.xxx_hidden_EntityLimits
+		}
+	}
+	return nil
+}
+
 func (x *PeriodicConfig) SetConcurrency(v int32) {
 	x.xxx_hidden_Concurrency = v
 }
 
+func (x *PeriodicConfig) SetLeaseDurationSec(v int32) {
+	x.xxx_hidden_LeaseDurationSec = v
+}
+
+func (x *PeriodicConfig) SetEntityLimits(v []*PeriodicConfig_EntityTypeLimit) {
+	x.xxx_hidden_EntityLimits = &v
+}
+
 type PeriodicConfig_builder struct {
 	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
 
 	Concurrency int32
+	// Lease a worker holds on a claimed item, renewed while the item is processed. Defaults to 60 seconds.
+	LeaseDurationSec int32
+	// Per entity type limits. Types without an entry are claimed with priority 0 and only bounded by `concurrency`.
+	EntityLimits []*PeriodicConfig_EntityTypeLimit
 }
 
 func (b0 PeriodicConfig_builder) Build() *PeriodicConfig {
@@ -217,6 +247,8 @@ func (b0 PeriodicConfig_builder) Build() *PeriodicConfig {
 	b, x := &b0, m0
 	_, _ = b, x
 	x.xxx_hidden_Concurrency = b.Concurrency
+	x.xxx_hidden_LeaseDurationSec = b.LeaseDurationSec
+	x.xxx_hidden_EntityLimits = &b.EntityLimits
 	return m0
 }
 
@@ -227,6 +259,12 @@ type AnalysisConfig struct {
 	xxx_hidden_DisableMasking                   bool                   `protobuf:"varint,3,opt,name=disable_masking,json=disableMasking,proto3"`
 	xxx_hidden_DefaultGitChangesAnalyzer        *Analyzer              `protobuf:"bytes,4,opt,name=default_git_changes_analyzer,json=defaultGitChangesAnalyzer,proto3,oneof"`
 	xxx_hidden_DefaultAggregatedSummaryAnalyzer *Analyzer              `protobuf:"bytes,5,opt,name=default_aggregated_summary_analyzer,json=defaultAggregatedSummaryAnalyzer,proto3,oneof"`
+	xxx_hidden_AnalyzerConcurrency              int32                  `protobuf:"varint,7,opt,name=analyzer_concurrency,json=analyzerConcurrency,proto3"`
+	xxx_hidden_CombineFanOut                    int32                  `protobuf:"varint,8,opt,name=combine_fan_out,json=combineFanOut,proto3"`
+	xxx_hidden_CombineMaxDepth                  int32                  `protobuf:"varint,9,opt,name=combine_max_depth,json=combineMaxDepth,proto3"`
+	xxx_hidden_ChunkConcurrency                 int32                  `protobuf:"varint,10,opt,name=chunk_concurrency,json=chunkConcurrency,proto3"`
+	xxx_hidden_PipelinedAnalysis                bool                   `protobuf:"varint,11,opt,name=pipelined_analysis,json=pipelinedAnalysis,proto3"`
+	xxx_hidden_PipelineMaxPendingChunks         int32                  `protobuf:"varint,12,opt,name=pipeline_max_pending_chunks,json=pipelineMaxPendingChunks,proto3"`
 	unknownFields                               protoimpl.UnknownFields
 	sizeCache                                   protoimpl.SizeCache
 }
@@ -295,6 +333,48 @@ func (x *AnalysisConfig) GetDefaultAggregatedSummaryAnalyzer() *Analyzer {
 	return nil
 }
 
+func (x *AnalysisConfig) GetAnalyzerConcurrency() int32 {
+	if x != nil {
+		return x.xxx_hidden_AnalyzerConcurrency
+	}
+	return 0
+}
+
+func (x *AnalysisConfig) GetCombineFanOut() int32 {
+	if x != nil {
+		return x.xxx_hidden_CombineFanOut
+	}
+	return 0
+}
+
+func (x *AnalysisConfig) GetCombineMaxDepth() int32 {
+	if x != nil {
+		return x.xxx_hidden_CombineMaxDepth
+	}
+	return 0
+}
+
+func (x *AnalysisConfig) GetChunkConcurrency() int32 {
+	if x != nil {
+		return x.xxx_hidden_ChunkConcurrency
+	}
+	return 0
+}
+
+func (x *AnalysisConfig) GetPipelinedAnalysis() bool {
+	if x != nil {
+		return x.xxx_hidden_PipelinedAnalysis
+	}
+	return false
+}
+
+func (x *AnalysisConfig) GetPipelineMaxPendingChunks() int32 {
+	if x != nil {
+		return x.xxx_hidden_PipelineMaxPendingChunks
+	}
+	return 0
+}
+
 func (x *AnalysisConfig) SetRepoAnalyzers(v []*Analyzer) {
 	x.xxx_hidden_RepoAnalyzers = &v
 }
@@ -315,6 +395,30 @@ func (x *AnalysisConfig) SetDefaultAggregatedSummaryAnalyzer(v *Analyzer) {
 	x.xxx_hidden_DefaultAggregatedSummaryAnalyzer = v
 }
 
+func (x *AnalysisConfig) SetAnalyzerConcurrency(v int32) {
+	x.xxx_hidden_AnalyzerConcurrency = v
+}
+
+func (x *AnalysisConfig) SetCombineFanOut(v int32) {
+	x.xxx_hidden_CombineFanOut = v
+}
+
+func (x *AnalysisConfig) SetCombineMaxDepth(v int32) {
+	x.xxx_hidden_CombineMaxDepth = v
+}
+
+func (x *AnalysisConfig) SetChunkConcurrency(v int32) {
+	x.xxx_hidden_ChunkConcurrency = v
+}
+
+func (x *AnalysisConfig) SetPipelinedAnalysis(v bool) {
+	x.xxx_hidden_PipelinedAnalysis = v
+}
+
+func (x *AnalysisConfig) SetPipelineMaxPendingChunks(v int32) {
+	x.xxx_hidden_PipelineMaxPendingChunks = v
+}
+
 func (x *AnalysisConfig) HasDefaultGitChangesAnalyzer() bool {
 	if x == nil {
 		return false
@@ -345,6 +449,19 @@ type AnalysisConfig_builder struct {
 	DisableMasking                   bool
 	DefaultGitChangesAnalyzer        *Analyzer
 	DefaultAggregatedSummaryAnalyzer *Analyzer
+	// Max number of analyzers run concurrently on the same flattened content. Defaults to 3.
+	AnalyzerConcurrency int32
+	// Chunk analyses that don't fit a single prompt are combined in groups, and the results combined again.
+	// Max number of summaries combined by a single prompt. 0 means only the summary tokens limit applies.
+	CombineFanOut int32
+	// Max number of combining levels, remaining summaries that don't fit are omitted. Defaults to 3.
+	CombineMaxDepth int32
+	// Max number of chunks of an analyzer analyzed concurrently. Defaults to 10.
+	ChunkConcurrency int32
+	// Analyze chunks while the content is still being flattened, instead of after flattening.
+	PipelinedAnalysis bool
+	// Max number of chunks flattened ahead of the slowest analyzer with `pipelined_analysis`. Defaults to 4.
+	PipelineMaxPendingChunks int32
 }
 
 func (b0 AnalysisConfig_builder) Build() *AnalysisConfig {
@@ -356,6 +473,12 @@ func (b0 AnalysisConfig_builder) Build() *AnalysisConfig {
 	x.xxx_hidden_DisableMasking = b.DisableMasking
 	x.xxx_hidden_DefaultGitChangesAnalyzer = b.DefaultGitChangesAnalyzer
 	x.xxx_hidden_DefaultAggregatedSummaryAnalyzer = b.DefaultAggregatedSummaryAnalyzer
+	x.xxx_hidden_AnalyzerConcurrency = b.AnalyzerConcurrency
+	x.xxx_hidden_CombineFanOut = b.CombineFanOut
+	x.xxx_hidden_CombineMaxDepth = b.CombineMaxDepth
+	x.xxx_hidden_ChunkConcurrency = b.ChunkConcurrency
+	x.xxx_hidden_PipelinedAnalysis = b.PipelinedAnalysis
+	x.xxx_hidden_PipelineMaxPendingChunks = b.PipelineMaxPendingChunks
 	return m0
 }
 
@@ -671,6 +794,94 @@ func (b0 WebsiteCrawlingConfig_builder) Build() *WebsiteCrawlingConfig {
 	return m0
 }
 
+type PeriodicConfig_EntityTypeLimit struct {
+	state                  protoimpl.MessageState `protogen:"opaque.v1"`
+	xxx_hidden_EntityType  string                 `protobuf:"bytes,1,opt,name=entity_type,json=entityType,proto3"`
+	xxx_hidden_Concurrency int32                  `protobuf:"varint,2,opt,name=concurrency,proto3"`
+	xxx_hidden_Priority    int32                  `protobuf:"varint,3,opt,name=priority,proto3"`
+	unknownFields          protoimpl.UnknownFields
+	sizeCache              protoimpl.SizeCache
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) Reset() {
+	*x = PeriodicConfig_EntityTypeLimit{}
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*PeriodicConfig_EntityTypeLimit) ProtoMessage() {}
+
+func (x *PeriodicConfig_EntityTypeLimit) ProtoReflect() protoreflect.Message {
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) GetEntityType() string {
+	if x != nil {
+		return x.xxx_hidden_EntityType
+	}
+	return ""
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) GetConcurrency() int32 {
+	if x != nil {
+		return x.xxx_hidden_Concurrency
+	}
+	return 0
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) GetPriority() int32 {
+	if x != nil {
+		return x.xxx_hidden_Priority
+	}
+	return 0
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) SetEntityType(v string) {
+	x.xxx_hidden_EntityType = v
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) SetConcurrency(v int32) {
+	x.xxx_hidden_Concurrency = v
+}
+
+func (x *PeriodicConfig_EntityTypeLimit) SetPriority(v int32) {
+	x.xxx_hidden_Priority = v
+}
+
+type PeriodicConfig_EntityTypeLimit_builder struct {
+	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
+
+	// Name of the ProcessingItemKey entity field, e.g. "request_id" or "research_git_repo_id".
+	EntityType string
+	// Max number of items of the type processed concurrently by a worker. 0 means no separate limit.
+	Concurrency int32
+	// Types with a higher priority are claimed first.
+	Priority int32
+}
+
+func (b0 PeriodicConfig_EntityTypeLimit_builder) Build() *PeriodicConfig_EntityTypeLimit {
+	m0 := &PeriodicConfig_EntityTypeLimit{}
+	b, x := &b0, m0
+	_, _ = b, x
+	x.xxx_hidden_EntityType = b.EntityType
+	x.xxx_hidden_Concurrency = b.Concurrency
+	x.xxx_hidden_Priority = b.Priority
+	return m0
+}
+
 type RepoAnalysisConfig_Flatten struct {
 	state                             protoimpl.MessageState `protogen:"opaque.v1"`
 	xxx_hidden_Compress               bool                   `protobuf:"varint,1,opt,name=compress,proto3"`
@@ -683,13 +894,18 @@ type RepoAnalysisConfig_Flatten struct {
 	xxx_hidden_LargeRepoIgnorePattern string                 `protobuf:"bytes,8,opt,name=large_repo_ignore_pattern,json=largeRepoIgnorePattern,proto3"`
 	xxx_hidden_CompressLarge          bool                   `protobuf:"varint,9,opt,name=compress_large,json=compressLarge,proto3"`
 	xxx_hidden_MaxFileSizeBytes       int32                  `protobuf:"varint,10,opt,name=max_file_size_bytes,json=maxFileSizeBytes,proto3"`
+	xxx_hidden_Flattener              string                 `protobuf:"bytes,11,opt,name=flattener,proto3"`
+	xxx_hidden_BloblessClone          bool                   `protobuf:"varint,12,opt,name=blobless_clone,json=bloblessClone,proto3"`
+	xxx_hidden_SparseCheckout         bool                   `protobuf:"varint,13,opt,name=sparse_checkout,json=sparseCheckout,proto3"`
+	xxx_hidden_CloneTimeoutSec        int32                  `protobuf:"varint,14,opt,name=clone_timeout_sec,json=cloneTimeoutSec,proto3"`
+	xxx_hidden_MaxDiffSizeBytes       int32                  `protobuf:"varint,15,opt,name=max_diff_size_bytes,json=maxDiffSizeBytes,proto3"`
 	unknownFields                     protoimpl.UnknownFields
 	sizeCache                         protoimpl.SizeCache
 }
 
 func (x *RepoAnalysisConfig_Flatten) Reset() {
 	*x = RepoAnalysisConfig_Flatten{}
-	mi := &file_dev_observer_api_types_config_proto_msgTypes[6]
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[7]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -701,7 +917,7 @@ func (x *RepoAnalysisConfig_Flatten) String() string {
 func (*RepoAnalysisConfig_Flatten) ProtoMessage() {}
 
 func (x *RepoAnalysisConfig_Flatten) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_config_proto_msgTypes[6]
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[7]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -782,6 +998,41 @@ func (x *RepoAnalysisConfig_Flatten) GetMaxFileSizeBytes() int32 {
 	return 0
 }
 
+func (x *RepoAnalysisConfig_Flatten) GetFlattener() string {
+	if x != nil {
+		return x.xxx_hidden_Flattener
+	}
+	return ""
+}
+
+func (x *RepoAnalysisConfig_Flatten) GetBloblessClone() bool {
+	if x != nil {
+		return x.xxx_hidden_BloblessClone
+	}
+	return false
+}
+
+func (x *RepoAnalysisConfig_Flatten) GetSparseCheckout() bool {
+	if x != nil {
+		return x.xxx_hidden_SparseCheckout
+	}
+	return false
+}
+
+func (x *RepoAnalysisConfig_Flatten) GetCloneTimeoutSec() int32 {
+	if x != nil {
+		return x.xxx_hidden_CloneTimeoutSec
+	}
+	return 0
+}
+
+func (x *RepoAnalysisConfig_Flatten) GetMaxDiffSizeBytes() int32 {
+	if x != nil {
+		return x.xxx_hidden_MaxDiffSizeBytes
+	}
+	return 0
+}
+
 func (x *RepoAnalysisConfig_Flatten) SetCompress(v bool) {
 	x.xxx_hidden_Compress = v
 }
@@ -822,6 +1073,26 @@ func (x *RepoAnalysisConfig_Flatten) SetMaxFileSizeBytes(v int32) {
 	x.xxx_hidden_MaxFileSizeBytes = v
 }
 
+func (x *RepoAnalysisConfig_Flatten) SetFlattener(v string) {
+	x.xxx_hidden_Flattener = v
+}
+
+func (x *RepoAnalysisConfig_Flatten) SetBloblessClone(v bool) {
+	x.xxx_hidden_BloblessClone = v
+}
+
+func (x *RepoAnalysisConfig_Flatten) SetSparseCheckout(v bool) {
+	x.xxx_hidden_SparseCheckout = v
+}
+
+func (x *RepoAnalysisConfig_Flatten) SetCloneTimeoutSec(v int32) {
+	x.xxx_hidden_CloneTimeoutSec = v
+}
+
+func (x *RepoAnalysisConfig_Flatten) SetMaxDiffSizeBytes(v int32) {
+	x.xxx_hidden_MaxDiffSizeBytes = v
+}
+
 type RepoAnalysisConfig_Flatten_builder struct {
 	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
 
@@ -837,6 +1108,16 @@ type RepoAnalysisConfig_Flatten_builder struct {
 	LargeRepoIgnorePattern string
 	CompressLarge          bool
 	MaxFileSizeBytes       int32
+	// "repomix" (default) or "native" for the in-process flattener.
+	Flattener string
+	// Clone without file contents and fetch only the checked out ones, see `git clone --filter=blob:none`.
+	BloblessClone bool
+	// Don't check out files matching ignore patterns. Most useful together with `blobless_clone`.
+	SparseCheckout bool
+	// Timeout of cloning a repository, 30 minutes by default.
+	CloneTimeoutSec int32
+	// Diffs of a single file in change summaries are truncated to this size, 20000 by default.
+	MaxDiffSizeBytes int32
 }
 
 func (b0 RepoAnalysisConfig_Flatten_builder) Build() *RepoAnalysisConfig_Flatten {
@@ -853,6 +1134,11 @@ func (b0 RepoAnalysisConfig_Flatten_builder) Build() *RepoAnalysisConfig_Flatten
 	x.xxx_hidden_LargeRepoIgnorePattern = b.LargeRepoIgnorePattern
 	x.xxx_hidden_CompressLarge = b.CompressLarge
 	x.xxx_hidden_MaxFileSizeBytes = b.MaxFileSizeBytes
+	x.xxx_hidden_Flattener = b.Flattener
+	x.xxx_hidden_BloblessClone = b.BloblessClone
+	x.xxx_hidden_SparseCheckout = b.SparseCheckout
+	x.xxx_hidden_CloneTimeoutSec = b.CloneTimeoutSec
+	x.xxx_hidden_MaxDiffSizeBytes = b.MaxDiffSizeBytes
 	return m0
 }
 
@@ -873,7 +1159,7 @@ type RepoAnalysisConfig_Research struct {
 
 func (x *RepoAnalysisConfig_Research) Reset() {
 	*x = RepoAnalysisConfig_Research{}
-	mi := &file_dev_observer_api_types_config_proto_msgTypes[7]
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[8]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -885,7 +1171,7 @@ func (x *RepoAnalysisConfig_Research) String() string {
 func (*RepoAnalysisConfig_Research) ProtoMessage() {}
 
 func (x *RepoAnalysisConfig_Research) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_config_proto_msgTypes[7]
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[8]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1041,7 +1327,7 @@ type RepoAnalysisConfig_ResearchHistoryLimits struct {
 
 func (x *RepoAnalysisConfig_ResearchHistoryLimits) Reset() {
 	*x = RepoAnalysisConfig_ResearchHistoryLimits{}
-	mi := &file_dev_observer_api_types_config_proto_msgTypes[8]
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[9]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1053,7 +1339,7 @@ func (x *RepoAnalysisConfig_ResearchHistoryLimits) String() string {
 func (*RepoAnalysisConfig_ResearchHistoryLimits) ProtoMessage() {}
 
 func (x *RepoAnalysisConfig_ResearchHistoryLimits) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_config_proto_msgTypes[8]
+	mi := &file_dev_observer_api_types_config_proto_msgTypes[9]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1111,26 +1397,40 @@ const file_dev_observer_api_types_config_proto_rawDesc = "" +
 	"\banalysis\x18\x01 \x01(\v2-.dev_observer.api.types.config.AnalysisConfigR\banalysis\x12V\n" +
 	"\rrepo_analysis\x18\x02 \x01(\v21.dev_observer.api.types.config.RepoAnalysisConfigR\frepoAnalysis\x12_\n" +
 	"\x10website_crawling\x18\x03 \x01(\v24.dev_observer.api.types.config.WebsiteCrawlingConfigR\x0fwebsiteCrawling\x12I\n" +
-	"\bperiodic\x18\x04 \x01(\v2-.dev_observer.api.types.config.PeriodicConfigR\bperiodic\"2\n" +
+	"\bperiodic\x18\x04 \x01(\v2-.dev_observer.api.types.config.PeriodicConfigR\bperiodic\"\xb6\x02\n" +
 	"\x0ePeriodicConfig\x12 \n" +
-	"\vconcurrency\x18\x01 \x01(\x05R\vconcurrency\"\xc6\x04\n" +
+	"\vconcurrency\x18\x01 \x01(\x05R\vconcurrency\x12,\n" +
+	"\x12lease_duration_sec\x18\x02 \x01(\x05R\x10leaseDurationSec\x12b\n" +
+	"\rentity_limits\x18\x03 \x03(\v2=.dev_observer.api.types.config.PeriodicConfig.EntityTypeLimitR\fentityLimits\x1ap\n" +
+	"\x0fEntityTypeLimit\x12\x1f\n" +
+	"\ventity_type\x18\x01 \x01(\tR\n" +
+	"entityType\x12 \n" +
+	"\vconcurrency\x18\x02 \x01(\x05R\vconcurrency\x12\x1a\n" +
+	"\bpriority\x18\x03 \x01(\x05R\bpriority\"\xe8\x06\n" +
 	"\x0eAnalysisConfig\x12T\n" +
 	"\x0erepo_analyzers\x18\x01 \x03(\v2-.dev_observer.api.types.observations.AnalyzerR\rrepoAnalyzers\x12T\n" +
 	"\x0esite_analyzers\x18\x02 \x03(\v2-.dev_observer.api.types.observations.AnalyzerR\rsiteAnalyzers\x12'\n" +
 	"\x0fdisable_masking\x18\x03 \x01(\bR\x0edisableMasking\x12s\n" +
 	"\x1cdefault_git_changes_analyzer\x18\x04 \x01(\v2-.dev_observer.api.types.observations.AnalyzerH\x00R\x19defaultGitChangesAnalyzer\x88\x01\x01\x12\x81\x01\n" +
-	"#default_aggregated_summary_analyzer\x18\x05 \x01(\v2-.dev_observer.api.types.observations.AnalyzerH\x01R defaultAggregatedSummaryAnalyzer\x88\x01\x01B\x1f\n" +
+	"#default_aggregated_summary_analyzer\x18\x05 \x01(\v2-.dev_observer.api.types.observations.AnalyzerH\x01R defaultAggregatedSummaryAnalyzer\x88\x01\x01\x121\n" +
+	"\x14analyzer_concurrency\x18\a \x01(\x05R\x13analyzerConcurrency\x12&\n" +
+	"\x0fcombine_fan_out\x18\b \x01(\x05R\rcombineFanOut\x12*\n" +
+	"\x11combine_max_depth\x18\t \x01(\x05R\x0fcombineMaxDepth\x12+\n" +
+	"\x11chunk_concurrency\x18\n" +
+	" \x01(\x05R\x10chunkConcurrency\x12-\n" +
+	"\x12pipelined_analysis\x18\v \x01(\bR\x11pipelinedAnalysis\x12=\n" +
+	"\x1bpipeline_max_pending_chunks\x18\f \x01(\x05R\x18pipelineMaxPendingChunksB\x1f\n" +
 	"\x1d_default_git_changes_analyzerB&\n" +
 	"$_default_aggregated_summary_analyzerJ\x04\b\x06\x10\aR\x17code_research_analyzers\"n\n" +
 	"\x14UserManagementStatus\x12\x18\n" +
 	"\aenabled\x18\x01 \x01(\bR\aenabled\x12)\n" +
 	"\x0epublic_api_key\x18\x02 \x01(\tH\x00R\fpublicApiKey\x88\x01\x01B\x11\n" +
-	"\x0f_public_api_key\"\xd8\t\n" +
+	"\x0f_public_api_key\"\xa1\v\n" +
 	"\x12RepoAnalysisConfig\x12S\n" +
 	"\aflatten\x18\x01 \x01(\v29.dev_observer.api.types.config.RepoAnalysisConfig.FlattenR\aflatten\x126\n" +
 	"\x17processing_interval_sec\x18\x02 \x01(\x05R\x15processingIntervalSec\x12\x1a\n" +
 	"\bdisabled\x18\x03 \x01(\bR\bdisabled\x12V\n" +
-	"\bresearch\x18\x04 \x01(\v2:.dev_observer.api.types.config.RepoAnalysisConfig.ResearchR\bresearch\x1a\xb9\x03\n" +
+	"\bresearch\x18\x04 \x01(\v2:.dev_observer.api.types.config.RepoAnalysisConfig.ResearchR\bresearch\x1a\x82\x05\n" +
 	"\aFlatten\x12\x1a\n" +
 	"\bcompress\x18\x01 \x01(\bR\bcompress\x12,\n" +
 	"\x12remove_empty_lines\x18\x02 \x01(\bR\x10removeEmptyLines\x12\x1b\n" +
@@ -1142,7 +1442,12 @@ const file_dev_observer_api_types_config_proto_rawDesc = "" +
 	"\x19large_repo_ignore_pattern\x18\b \x01(\tR\x16largeRepoIgnorePattern\x12%\n" +
 	"\x0ecompress_large\x18\t \x01(\bR\rcompressLarge\x12-\n" +
 	"\x13max_file_size_bytes\x18\n" +
-	" \x01(\x05R\x10maxFileSizeBytes\x1a\xb9\x03\n" +
+	" \x01(\x05R\x10maxFileSizeBytes\x12\x1c\n" +
+	"\tflattener\x18\v \x01(\tR\tflattener\x12%\n" +
+	"\x0eblobless_clone\x18\f \x01(\bR\rbloblessClone\x12'\n" +
+	"\x0fsparse_checkout\x18\r \x01(\bR\x0esparseCheckout\x12*\n" +
+	"\x11clone_timeout_sec\x18\x0e \x01(\x05R\x0fcloneTimeoutSec\x12-\n" +
+	"\x13max_diff_size_bytes\x18\x0f \x01(\x05R\x10maxDiffSizeBytes\x1a\xb9\x03\n" +
 	"\bResearch\x12'\n" +
 	"\x10max_repo_size_mb\x18\x01 \x01(\x05R\rmaxRepoSizeMb\x12%\n" +
 	"\x0emax_iterations\x18\x02 \x01(\x05R\rmaxIterations\x12*\n" +
@@ -1162,7 +1467,7 @@ const file_dev_observer_api_types_config_proto_rawDesc = "" +
 	"crawlDepth\x12?\n" +
 	"\x1ctimeout_without_data_seconds\x18\x04 \x01(\x05R\x19timeoutWithoutDataSecondsB8Z6github.com/devplaninc/contextify/clients/go/contextifyb\x06proto3"
 
-var file_dev_observer_api_types_config_proto_msgTypes = make([]protoimpl.MessageInfo, 9)
+var file_dev_observer_api_types_config_proto_msgTypes = make([]protoimpl.MessageInfo, 10)
 var file_dev_observer_api_types_config_proto_goTypes = []any{
 	(*GlobalConfig)(nil),                             // 0: dev_observer.api.types.config.GlobalConfig
 	(*PeriodicConfig)(nil),                           // 1: dev_observer.api.types.config.PeriodicConfig
@@ -1170,29 +1475,31 @@ var file_dev_observer_api_types_config_proto_goTypes = []any{
 	(*UserManagementStatus)(nil),                     // 3: dev_observer.api.types.config.UserManagementStatus
 	(*RepoAnalysisConfig)(nil),                       // 4: dev_observer.api.types.config.RepoAnalysisConfig
 	(*WebsiteCrawlingConfig)(nil),                    // 5: dev_observer.api.types.config.WebsiteCrawlingConfig
-	(*RepoAnalysisConfig_Flatten)(nil),               // 6: dev_observer.api.types.config.RepoAnalysisConfig.Flatten
-	(*RepoAnalysisConfig_Research)(nil),              // 7: dev_observer.api.types.config.RepoAnalysisConfig.Research
-	(*RepoAnalysisConfig_ResearchHistoryLimits)(nil), // 8: dev_observer.api.types.config.RepoAnalysisConfig.ResearchHistoryLimits
-	(*Analyzer)(nil),                                 // 9: dev_observer.api.types.observations.Analyzer
+	(*PeriodicConfig_EntityTypeLimit)(nil),           // 6: dev_observer.api.types.config.PeriodicConfig.EntityTypeLimit
+	(*RepoAnalysisConfig_Flatten)(nil),               // 7: dev_observer.api.types.config.RepoAnalysisConfig.Flatten
+	(*RepoAnalysisConfig_Research)(nil),              // 8: dev_observer.api.types.config.RepoAnalysisConfig.Research
+	(*RepoAnalysisConfig_ResearchHistoryLimits)(nil), // 9: dev_observer.api.types.config.RepoAnalysisConfig.ResearchHistoryLimits
+	(*Analyzer)(nil),                                 // 10: dev_observer.api.types.observations.Analyzer
 }
 var file_dev_observer_api_types_config_proto_depIdxs = []int32{
 	2,  // 0: dev_observer.api.types.config.GlobalConfig.analysis:type_name -> dev_observer.api.types.config.AnalysisConfig
 	4,  // 1: dev_observer.api.types.config.GlobalConfig.repo_analysis:type_name -> dev_observer.api.types.config.RepoAnalysisConfig
 	5,  // 2: dev_observer.api.types.config.GlobalConfig.website_crawling:type_name -> dev_observer.api.types.config.WebsiteCrawlingConfig
 	1,  // 3: dev_observer.api.types.config.GlobalConfig.periodic:type_name -> dev_observer.api.types.config.PeriodicConfig
-	9,  // 4: dev_observer.api.types.config.AnalysisConfig.repo_analyzers:type_name -> dev_observer.api.types.observations.Analyzer
-	9,  // 5: dev_observer.api.types.config.AnalysisConfig.site_analyzers:type_name -> dev_observer.api.types.observations.Analyzer
-	9,  // 6: dev_observer.api.types.config.AnalysisConfig.default_git_changes_analyzer:type_name -> dev_observer.api.types.observations.Analyzer
-	9,  // 7: dev_observer.api.types.config.AnalysisConfig.default_aggregated_summary_analyzer:type_name -> dev_observer.api.types.observations.Analyzer
-	6,  // 8: dev_observer.api.types.config.RepoAnalysisConfig.flatten:type_name -> dev_observer.api.types.config.RepoAnalysisConfig.Flatten
-	7,  // 9: dev_observer.api.types.config.RepoAnalysisConfig.research:type_name -> dev_observer.api.types.config.RepoAnalysisConfig.Research
-	9,  // 10: dev_observer.api.types.config.RepoAnalysisConfig.Research.analyzers:type_name -> dev_observer.api.types.observations.Analyzer
-	8,  // 11: dev_observer.api.types.config.RepoAnalysisConfig.Research.history_limits:type_name -> dev_observer.api.types.config.RepoAnalysisConfig.ResearchHistoryLimits
-	12, // [12:12] is the sub-list for method output_type
-	12, // [12:12] is the sub-list for method input_type
-	12, // [12:12] is the sub-list for extension type_name
-	12, // [12:12] is the sub-list for extension extendee
-	0,  // [0:12] is the sub-list for field type_name
+	6,  // 4: dev_observer.api.types.config.PeriodicConfig.entity_limits:type_name -> dev_observer.api.types.config.PeriodicConfig.EntityTypeLimit
+	10, // 5: dev_observer.api.types.config.AnalysisConfig.repo_analyzers:type_name -> dev_observer.api.types.observations.Analyzer
+	10, // 6: dev_observer.api.types.config.AnalysisConfig.site_analyzers:type_name -> dev_observer.api.types.observations.Analyzer
+	10, // 7: dev_observer.api.types.config.AnalysisConfig.default_git_changes_analyzer:type_name -> dev_observer.api.types.observations.Analyzer
+	10, // 8: dev_observer.api.types.config.AnalysisConfig.default_aggregated_summary_analyzer:type_name -> dev_observer.api.types.observations.Analyzer
+	7,  // 9: dev_observer.api.types.config.RepoAnalysisConfig.flatten:type_name -> dev_observer.api.types.config.RepoAnalysisConfig.Flatten
+	8,  // 10: dev_observer.api.types.config.RepoAnalysisConfig.research:type_name -> dev_observer.api.types.config.RepoAnalysisConfig.Research
+	10, // 11: dev_observer.api.types.config.RepoAnalysisConfig.Research.analyzers:type_name -> dev_observer.api.types.observations.Analyzer
+	9,  // 12: dev_observer.api.types.config.RepoAnalysisConfig.Research.history_limits:type_name -> dev_observer.api.types.config.RepoAnalysisConfig.ResearchHistoryLimits
+	13, // [13:13] is the sub-list for method output_type
+	13, // [13:13] is the sub-list for method input_type
+	13, // [13:13] is the sub-list for extension type_name
+	13, // [13:13] is the sub-list for extension extendee
+	0,  // [0:13] is the sub-list for field type_name
 }
 
 func init() { file_dev_observer_api_types_config_proto_init() }
@@ -1203,14 +1510,14 @@ func file_dev_observer_api_types_config_proto_init() {
 	file_dev_observer_api_types_observations_proto_init()
 	file_dev_observer_api_types_config_proto_msgTypes[2].OneofWrappers = []any{}
 	file_dev_observer_api_types_config_proto_msgTypes[3].OneofWrappers = []any{}
-	file_dev_observer_api_types_config_proto_msgTypes[7].OneofWrappers = []any{}
+	file_dev_observer_api_types_config_proto_msgTypes[8].OneofWrappers = []any{}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_dev_observer_api_types_config_proto_rawDesc), len(file_dev_observer_api_types_config_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   9,
+			NumMessages:   10,
 			NumExtensions: 0,
 			NumServices:   0,
 		},
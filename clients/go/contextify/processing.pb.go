@@ -321,6 +321,7 @@ type ProcessingItem struct {
 	xxx_hidden_NoProcessing        bool                   `protobuf:"varint,5,opt,name=no_processing,json=noProcessing,proto3"`
 	xxx_hidden_ProcessingStartedAt *timestamppb.Timestamp `protobuf:"bytes,7,opt,name=processing_started_at,json=processingStartedAt,proto3,oneof"`
 	xxx_hidden_Data                *ProcessingItemData    `protobuf:"bytes,8,opt,name=data,proto3,oneof"`
+	xxx_hidden_WorkerId            *string                `protobuf:"bytes,9,opt,name=worker_id,json=workerId,proto3,oneof"`
 	XXX_raceDetectHookData         protoimpl.RaceDetectHookData
 	XXX_presence                   [1]uint32
 	unknownFields                  protoimpl.UnknownFields
@@ -404,6 +405,16 @@ func (x *ProcessingItem) GetData() *ProcessingItemData {
 	return nil
 }
 
+func (x *ProcessingItem) GetWorkerId() string {
+	if x != nil {
+		if x.xxx_hidden_WorkerId != nil {
+			return *x.xxx_hidden_WorkerId
+		}
+		return ""
+	}
+	return ""
+}
+
 func (x *ProcessingItem) SetKey(v *ProcessingItemKey) {
 	x.xxx_hidden_Key = v
 }
@@ -418,7 +429,7 @@ func (x *ProcessingItem) SetLastProcessed(v *timestamppb.Timestamp) {
 
 func (x *ProcessingItem) SetLastError(v string) {
 	x.xxx_hidden_LastError = &v
-	protoimpl.X.SetPresent(&(x.XXX_presence[0]), 3, 7)
+	protoimpl.X.SetPresent(&(x.XXX_presence[0]), 3, 8)
 }
 
 func (x *ProcessingItem) SetNoProcessing(v bool) {
@@ -433,6 +444,11 @@ func (x *ProcessingItem) SetData(v *ProcessingItemData) {
 	x.xxx_hidden_Data = v
 }
 
+func (x *ProcessingItem) SetWorkerId(v string) {
+	x.xxx_hidden_WorkerId = &v
+	protoimpl.X.SetPresent(&(x.XXX_presence[0]), 7, 8)
+}
+
 func (x *ProcessingItem) HasKey() bool {
 	if x == nil {
 		return false
@@ -475,6 +491,13 @@ func (x *ProcessingItem) HasData() bool {
 	return x.xxx_hidden_Data != nil
 }
 
+func (x *ProcessingItem) HasWorkerId() bool {
+	if x == nil {
+		return false
+	}
+	return protoimpl.X.Present(&(x.XXX_presence[0]), 7)
+}
+
 func (x *ProcessingItem) ClearKey() {
 	x.xxx_hidden_Key = nil
 }
@@ -500,6 +523,11 @@ func (x *ProcessingItem) ClearData() {
 	x.xxx_hidden_Data = nil
 }
 
+func (x *ProcessingItem) ClearWorkerId() {
+	protoimpl.X.ClearPresent(&(x.XXX_presence[0]), 7)
+	x.xxx_hidden_WorkerId = nil
+}
+
 type ProcessingItem_builder struct {
 	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
 
@@ -510,6 +538,8 @@ type ProcessingItem_builder struct {
 	NoProcessing        bool
 	ProcessingStartedAt *timestamppb.Timestamp
 	Data                *ProcessingItemData
+	// Worker currently holding the lease on the item.
+	WorkerId *string
 }
 
 func (b0 ProcessingItem_builder) Build() *ProcessingItem {
@@ -520,12 +550,16 @@ func (b0 ProcessingItem_builder) Build() *ProcessingItem {
 	x.xxx_hidden_NextProcessing = b.NextProcessing
 	x.xxx_hidden_LastProcessed = b.LastProcessed
 	if b.LastError != nil {
-		protoimpl.X.SetPresentNonAtomic(&(x.XXX_presence[0]), 3, 7)
+		protoimpl.X.SetPresentNonAtomic(&(x.XXX_presence[0]), 3, 8)
 		x.xxx_hidden_LastError = b.LastError
 	}
 	x.xxx_hidden_NoProcessing = b.NoProcessing
 	x.xxx_hidden_ProcessingStartedAt = b.ProcessingStartedAt
 	x.xxx_hidden_Data = b.Data
+	if b.WorkerId != nil {
+		protoimpl.X.SetPresentNonAtomic(&(x.XXX_presence[0]), 7, 8)
+		x.xxx_hidden_WorkerId = b.WorkerId
+	}
 	return m0
 }
 
@@ -770,6 +804,15 @@ func (x *ProcessingRequest) GetGitChanges() *ProcessGitChangesRequest {
 	return nil
 }
 
+func (x *ProcessingRequest) GetAnalyzeTokens() *AnalyzeRepoTokensRequest {
+	if x != nil {
+		if x, ok := x.xxx_hidden_Type.(*processingRequest_AnalyzeTokens); ok {
+			return x.AnalyzeTokens
+		}
+	}
+	return nil
+}
+
 func (x *ProcessingRequest) SetGitChanges(v *ProcessGitChangesRequest) {
 	if v == nil {
 		x.xxx_hidden_Type = nil
@@ -778,6 +821,14 @@ func (x *ProcessingRequest) SetGitChanges(v *ProcessGitChangesRequest) {
 	x.xxx_hidden_Type = &processingRequest_GitChanges{v}
 }
 
+func (x *ProcessingRequest) SetAnalyzeTokens(v *AnalyzeRepoTokensRequest) {
+	if v == nil {
+		x.xxx_hidden_Type = nil
+		return
+	}
+	x.xxx_hidden_Type = &processingRequest_AnalyzeTokens{v}
+}
+
 func (x *ProcessingRequest) HasType() bool {
 	if x == nil {
 		return false
@@ -793,6 +844,14 @@ func (x *ProcessingRequest) HasGitChanges() bool {
 	return ok
 }
 
+func (x *ProcessingRequest) HasAnalyzeTokens() bool {
+	if x == nil {
+		return false
+	}
+	_, ok := x.xxx_hidden_Type.(*processingRequest_AnalyzeTokens)
+	return ok
+}
+
 func (x *ProcessingRequest) ClearType() {
 	x.xxx_hidden_Type = nil
 }
@@ -803,8 +862,15 @@ func (x *ProcessingRequest) ClearGitChanges() {
 	}
 }
 
+func (x *ProcessingRequest) ClearAnalyzeTokens() {
+	if _, ok := x.xxx_hidden_Type.(*processingRequest_AnalyzeTokens); ok {
+		x.xxx_hidden_Type = nil
+	}
+}
+
 const ProcessingRequest_Type_not_set_case case_ProcessingRequest_Type = 0
 const ProcessingRequest_GitChanges_case case_ProcessingRequest_Type = 100
+const ProcessingRequest_AnalyzeTokens_case case_ProcessingRequest_Type = 101
 
 func (x *ProcessingRequest) WhichType() case_ProcessingRequest_Type {
 	if x == nil {
@@ -813,6 +879,8 @@ func (x *ProcessingRequest) WhichType() case_ProcessingRequest_Type {
 	switch x.xxx_hidden_Type.(type) {
 	case *processingRequest_GitChanges:
 		return ProcessingRequest_GitChanges_case
+	case *processingRequest_AnalyzeTokens:
+		return ProcessingRequest_AnalyzeTokens_case
 	default:
 		return ProcessingRequest_Type_not_set_case
 	}
@@ -822,7 +890,8 @@ type ProcessingRequest_builder struct {
 	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
 
 	// Fields of oneof xxx_hidden_Type:
-	GitChanges *ProcessGitChangesRequest
+	GitChanges    *ProcessGitChangesRequest
+	AnalyzeTokens *AnalyzeRepoTokensRequest
 	// -- end of xxx_hidden_Type
 }
 
@@ -833,6 +902,9 @@ func (b0 ProcessingRequest_builder) Build() *ProcessingRequest {
 	if b.GitChanges != nil {
 		x.xxx_hidden_Type = &processingRequest_GitChanges{b.GitChanges}
 	}
+	if b.AnalyzeTokens != nil {
+		x.xxx_hidden_Type = &processingRequest_AnalyzeTokens{b.AnalyzeTokens}
+	}
 	return m0
 }
 
@@ -854,8 +926,14 @@ type processingRequest_GitChanges struct {
 	GitChanges *ProcessGitChangesRequest `protobuf:"bytes,100,opt,name=git_changes,json=gitChanges,proto3,oneof"`
 }
 
+type processingRequest_AnalyzeTokens struct {
+	AnalyzeTokens *AnalyzeRepoTokensRequest `protobuf:"bytes,101,opt,name=analyze_tokens,json=analyzeTokens,proto3,oneof"`
+}
+
 func (*processingRequest_GitChanges) isProcessingRequest_Type() {}
 
+func (*processingRequest_AnalyzeTokens) isProcessingRequest_Type() {}
+
 type ProcessGitChangesRequest struct {
 	state                   protoimpl.MessageState `protogen:"opaque.v1"`
 	xxx_hidden_GitRepoId    string                 `protobuf:"bytes,1,opt,name=git_repo_id,json=gitRepoId,proto3"`
@@ -927,6 +1005,78 @@ func (b0 ProcessGitChangesRequest_builder) Build() *ProcessGitChangesRequest {
 	return m0
 }
 
+type AnalyzeRepoTokensRequest struct {
+	state                protoimpl.MessageState `protogen:"opaque.v1"`
+	xxx_hidden_GitRepoId string                 `protobuf:"bytes,1,opt,name=git_repo_id,json=gitRepoId,proto3"`
+	xxx_hidden_Exact     bool                   `protobuf:"varint,2,opt,name=exact,proto3"`
+	unknownFields        protoimpl.UnknownFields
+	sizeCache            protoimpl.SizeCache
+}
+
+func (x *AnalyzeRepoTokensRequest) Reset() {
+	*x = AnalyzeRepoTokensRequest{}
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *AnalyzeRepoTokensRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AnalyzeRepoTokensRequest) ProtoMessage() {}
+
+func (x *AnalyzeRepoTokensRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+func (x *AnalyzeRepoTokensRequest) GetGitRepoId() string {
+	if x != nil {
+		return x.xxx_hidden_GitRepoId
+	}
+	return ""
+}
+
+func (x *AnalyzeRepoTokensRequest) GetExact() bool {
+	if x != nil {
+		return x.xxx_hidden_Exact
+	}
+	return false
+}
+
+func (x *AnalyzeRepoTokensRequest) SetGitRepoId(v string) {
+	x.xxx_hidden_GitRepoId = v
+}
+
+func (x *AnalyzeRepoTokensRequest) SetExact(v bool) {
+	x.xxx_hidden_Exact = v
+}
+
+type AnalyzeRepoTokensRequest_builder struct {
+	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
+
+	GitRepoId string
+	// Counts tokens by flattening and tokenizing the repository instead of estimating them from file sizes.
+	Exact bool
+}
+
+func (b0 AnalyzeRepoTokensRequest_builder) Build() *AnalyzeRepoTokensRequest {
+	m0 := &AnalyzeRepoTokensRequest{}
+	b, x := &b0, m0
+	_, _ = b, x
+	x.xxx_hidden_GitRepoId = b.GitRepoId
+	x.xxx_hidden_Exact = b.Exact
+	return m0
+}
+
 type ProcessingItemResult struct {
 	state                   protoimpl.MessageState    `protogen:"opaque.v1"`
 	xxx_hidden_Id           string                    `protobuf:"bytes,1,opt,name=id,proto3"`
@@ -943,7 +1093,7 @@ type ProcessingItemResult struct {
 
 func (x *ProcessingItemResult) Reset() {
 	*x = ProcessingItemResult{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[6]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[7]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -955,7 +1105,7 @@ func (x *ProcessingItemResult) String() string {
 func (*ProcessingItemResult) ProtoMessage() {}
 
 func (x *ProcessingItemResult) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[6]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[7]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1130,7 +1280,7 @@ type RepoObservation struct {
 
 func (x *RepoObservation) Reset() {
 	*x = RepoObservation{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[7]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[8]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1142,7 +1292,7 @@ func (x *RepoObservation) String() string {
 func (*RepoObservation) ProtoMessage() {}
 
 func (x *RepoObservation) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[7]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[8]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1202,7 +1352,7 @@ type PeriodicAggregationResult struct {
 
 func (x *PeriodicAggregationResult) Reset() {
 	*x = PeriodicAggregationResult{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[8]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[9]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1214,7 +1364,7 @@ func (x *PeriodicAggregationResult) String() string {
 func (*PeriodicAggregationResult) ProtoMessage() {}
 
 func (x *PeriodicAggregationResult) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[8]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[9]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1266,7 +1416,7 @@ type ProcessingItemData struct {
 
 func (x *ProcessingItemData) Reset() {
 	*x = ProcessingItemData{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[9]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[10]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1278,7 +1428,7 @@ func (x *ProcessingItemData) String() string {
 func (*ProcessingItemData) ProtoMessage() {}
 
 func (x *ProcessingItemData) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[9]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[10]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1502,7 +1652,7 @@ func (b0 ProcessingItemData_builder) Build() *ProcessingItemData {
 type case_ProcessingItemData_Type protoreflect.FieldNumber
 
 func (x case_ProcessingItemData_Type) String() string {
-	md := file_dev_observer_api_types_processing_proto_msgTypes[9].Descriptor()
+	md := file_dev_observer_api_types_processing_proto_msgTypes[10].Descriptor()
 	if x == 0 {
 		return "not set"
 	}
@@ -1525,9 +1675,97 @@ func (*processingItemData_Request) isProcessingItemData_Type() {}
 
 func (*processingItemData_PeriodicAggregation) isProcessingItemData_Type() {}
 
+// Files of flattened content that landed in a chunk analyzed separately.
+type FlattenChunk struct {
+	state             protoimpl.MessageState `protogen:"opaque.v1"`
+	xxx_hidden_Name   string                 `protobuf:"bytes,1,opt,name=name,proto3"`
+	xxx_hidden_Tokens int32                  `protobuf:"varint,2,opt,name=tokens,proto3"`
+	xxx_hidden_Files  []string               `protobuf:"bytes,3,rep,name=files,proto3"`
+	unknownFields     protoimpl.UnknownFields
+	sizeCache         protoimpl.SizeCache
+}
+
+func (x *FlattenChunk) Reset() {
+	*x = FlattenChunk{}
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[11]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *FlattenChunk) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*FlattenChunk) ProtoMessage() {}
+
+func (x *FlattenChunk) ProtoReflect() protoreflect.Message {
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[11]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+func (x *FlattenChunk) GetName() string {
+	if x != nil {
+		return x.xxx_hidden_Name
+	}
+	return ""
+}
+
+func (x *FlattenChunk) GetTokens() int32 {
+	if x != nil {
+		return x.xxx_hidden_Tokens
+	}
+	return 0
+}
+
+func (x *FlattenChunk) GetFiles() []string {
+	if x != nil {
+		return x.xxx_hidden_Files
+	}
+	return nil
+}
+
+func (x *FlattenChunk) SetName(v string) {
+	x.xxx_hidden_Name = v
+}
+
+func (x *FlattenChunk) SetTokens(v int32) {
+	x.xxx_hidden_Tokens = v
+}
+
+func (x *FlattenChunk) SetFiles(v []string) {
+	x.xxx_hidden_Files = v
+}
+
+type FlattenChunk_builder struct {
+	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
+
+	Name   string
+	Tokens int32
+	// Files split between chunks are listed in each of them. Empty name stands for content fitting a single chunk.
+	Files []string
+}
+
+func (b0 FlattenChunk_builder) Build() *FlattenChunk {
+	m0 := &FlattenChunk{}
+	b, x := &b0, m0
+	_, _ = b, x
+	x.xxx_hidden_Name = b.Name
+	x.xxx_hidden_Tokens = b.Tokens
+	x.xxx_hidden_Files = b.Files
+	return m0
+}
+
 type ProcessingItemResultData struct {
 	state                   protoimpl.MessageState          `protogen:"opaque.v1"`
 	xxx_hidden_Observations *[]*ObservationKey              `protobuf:"bytes,1,rep,name=observations,proto3"`
+	xxx_hidden_Chunks       *[]*FlattenChunk                `protobuf:"bytes,2,rep,name=chunks,proto3"`
 	xxx_hidden_Type         isProcessingItemResultData_Type `protobuf_oneof:"type"`
 	unknownFields           protoimpl.UnknownFields
 	sizeCache               protoimpl.SizeCache
@@ -1535,7 +1773,7 @@ type ProcessingItemResultData struct {
 
 func (x *ProcessingItemResultData) Reset() {
 	*x = ProcessingItemResultData{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[10]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[12]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1547,7 +1785,7 @@ func (x *ProcessingItemResultData) String() string {
 func (*ProcessingItemResultData) ProtoMessage() {}
 
 func (x *ProcessingItemResultData) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[10]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[12]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1567,6 +1805,15 @@ func (x *ProcessingItemResultData) GetObservations() []*ObservationKey {
 	return nil
 }
 
+func (x *ProcessingItemResultData) GetChunks() []*FlattenChunk {
+	if x != nil {
+		if x.xxx_hidden_Chunks != nil {
+			return *x.xxx_hidden_Chunks
+		}
+	}
+	return nil
+}
+
 func (x *ProcessingItemResultData) GetPeriodicAggregation() *PeriodicAggregationResult {
 	if x != nil {
 		if x, ok := x.xxx_hidden_Type.(*processingItemResultData_PeriodicAggregation); ok {
@@ -1580,6 +1827,10 @@ func (x *ProcessingItemResultData) SetObservations(v []*ObservationKey) {
 	x.xxx_hidden_Observations = &v
 }
 
+func (x *ProcessingItemResultData) SetChunks(v []*FlattenChunk) {
+	x.xxx_hidden_Chunks = &v
+}
+
 func (x *ProcessingItemResultData) SetPeriodicAggregation(v *PeriodicAggregationResult) {
 	if v == nil {
 		x.xxx_hidden_Type = nil
@@ -1632,6 +1883,7 @@ type ProcessingItemResultData_builder struct {
 	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
 
 	Observations []*ObservationKey
+	Chunks       []*FlattenChunk
 	// Fields of oneof xxx_hidden_Type:
 	PeriodicAggregation *PeriodicAggregationResult
 	// -- end of xxx_hidden_Type
@@ -1642,6 +1894,7 @@ func (b0 ProcessingItemResultData_builder) Build() *ProcessingItemResultData {
 	b, x := &b0, m0
 	_, _ = b, x
 	x.xxx_hidden_Observations = &b.Observations
+	x.xxx_hidden_Chunks = &b.Chunks
 	if b.PeriodicAggregation != nil {
 		x.xxx_hidden_Type = &processingItemResultData_PeriodicAggregation{b.PeriodicAggregation}
 	}
@@ -1651,7 +1904,7 @@ func (b0 ProcessingItemResultData_builder) Build() *ProcessingItemResultData {
 type case_ProcessingItemResultData_Type protoreflect.FieldNumber
 
 func (x case_ProcessingItemResultData_Type) String() string {
-	md := file_dev_observer_api_types_processing_proto_msgTypes[10].Descriptor()
+	md := file_dev_observer_api_types_processing_proto_msgTypes[12].Descriptor()
 	if x == 0 {
 		return "not set"
 	}
@@ -1682,7 +1935,7 @@ type ProcessingResultFilter struct {
 
 func (x *ProcessingResultFilter) Reset() {
 	*x = ProcessingResultFilter{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[11]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[13]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1694,7 +1947,7 @@ func (x *ProcessingResultFilter) String() string {
 func (*ProcessingResultFilter) ProtoMessage() {}
 
 func (x *ProcessingResultFilter) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[11]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[13]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1842,7 +2095,7 @@ type ProcessingItemsFilter struct {
 
 func (x *ProcessingItemsFilter) Reset() {
 	*x = ProcessingItemsFilter{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[12]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[14]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1854,7 +2107,7 @@ func (x *ProcessingItemsFilter) String() string {
 func (*ProcessingItemsFilter) ProtoMessage() {}
 
 func (x *ProcessingItemsFilter) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[12]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[14]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1997,7 +2250,7 @@ type AggregatedSummaryParams_Target struct {
 
 func (x *AggregatedSummaryParams_Target) Reset() {
 	*x = AggregatedSummaryParams_Target{}
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[13]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[15]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2009,7 +2262,7 @@ func (x *AggregatedSummaryParams_Target) String() string {
 func (*AggregatedSummaryParams_Target) ProtoMessage() {}
 
 func (x *AggregatedSummaryParams_Target) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_types_processing_proto_msgTypes[13]
+	mi := &file_dev_observer_api_types_processing_proto_msgTypes[15]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2058,7 +2311,7 @@ const file_dev_observer_api_types_processing_proto_rawDesc = "" +
 	"request_id\x18f \x01(\tH\x00R\trequestId\x128\n" +
 	"\x17periodic_aggregation_id\x18g \x01(\tH\x00R\x15periodicAggregationId\x121\n" +
 	"\x14research_git_repo_id\x18h \x01(\tH\x00R\x11researchGitRepoIdB\b\n" +
-	"\x06entity\"\xc0\x04\n" +
+	"\x06entity\"\xf0\x04\n" +
 	"\x0eProcessingItem\x12F\n" +
 	"\x03key\x18\x01 \x01(\v24.dev_observer.api.types.processing.ProcessingItemKeyR\x03key\x12H\n" +
 	"\x0fnext_processing\x18\x02 \x01(\v2\x1a.google.protobuf.TimestampH\x00R\x0enextProcessing\x88\x01\x01\x12F\n" +
@@ -2067,12 +2320,15 @@ const file_dev_observer_api_types_processing_proto_rawDesc = "" +
 	"last_error\x18\x04 \x01(\tH\x02R\tlastError\x88\x01\x01\x12#\n" +
 	"\rno_processing\x18\x05 \x01(\bR\fnoProcessing\x12S\n" +
 	"\x15processing_started_at\x18\a \x01(\v2\x1a.google.protobuf.TimestampH\x03R\x13processingStartedAt\x88\x01\x01\x12N\n" +
-	"\x04data\x18\b \x01(\v25.dev_observer.api.types.processing.ProcessingItemDataH\x04R\x04data\x88\x01\x01B\x12\n" +
+	"\x04data\x18\b \x01(\v25.dev_observer.api.types.processing.ProcessingItemDataH\x04R\x04data\x88\x01\x01\x12 \n" +
+	"\tworker_id\x18\t \x01(\tH\x05R\bworkerId\x88\x01\x01B\x12\n" +
 	"\x10_next_processingB\x11\n" +
 	"\x0f_last_processedB\r\n" +
 	"\v_last_errorB\x18\n" +
 	"\x16_processing_started_atB\a\n" +
-	"\x05_dataJ\x04\b\x06\x10\aR\arequest\"\xb0\x01\n" +
+	"\x05_dataB\f\n" +
+	"\n" +
+	"_worker_idJ\x04\b\x06\x10\aR\arequest\"\xb0\x01\n" +
 	"\x13PeriodicAggregation\x12R\n" +
 	"\x06params\x18\x01 \x01(\v2:.dev_observer.api.types.processing.AggregatedSummaryParamsR\x06params\x12E\n" +
 	"\bschedule\x18\x02 \x01(\v2).dev_observer.api.types.schedule.ScheduleR\bschedule\"\xfd\x01\n" +
@@ -2082,14 +2338,18 @@ const file_dev_observer_api_types_processing_proto_rawDesc = "" +
 	"\x06target\x18\x03 \x01(\v2A.dev_observer.api.types.processing.AggregatedSummaryParams.TargetR\x06target\x1a*\n" +
 	"\x06Target\x12 \n" +
 	"\fgit_repo_ids\x18\x01 \x03(\tR\n" +
-	"gitRepoIds\"{\n" +
+	"gitRepoIds\"\xe1\x01\n" +
 	"\x11ProcessingRequest\x12^\n" +
 	"\vgit_changes\x18d \x01(\v2;.dev_observer.api.types.processing.ProcessGitChangesRequestH\x00R\n" +
-	"gitChangesB\x06\n" +
+	"gitChanges\x12d\n" +
+	"\x0eanalyze_tokens\x18e \x01(\v2;.dev_observer.api.types.processing.AnalyzeRepoTokensRequestH\x00R\ranalyzeTokensB\x06\n" +
 	"\x04type\"`\n" +
 	"\x18ProcessGitChangesRequest\x12\x1e\n" +
 	"\vgit_repo_id\x18\x01 \x01(\tR\tgitRepoId\x12$\n" +
-	"\x0elook_back_days\x18\x02 \x01(\x05R\flookBackDays\"\xd4\x03\n" +
+	"\x0elook_back_days\x18\x02 \x01(\x05R\flookBackDays\"P\n" +
+	"\x18AnalyzeRepoTokensRequest\x12\x1e\n" +
+	"\vgit_repo_id\x18\x01 \x01(\tR\tgitRepoId\x12\x14\n" +
+	"\x05exact\x18\x02 \x01(\bR\x05exact\"\xd4\x03\n" +
 	"\x14ProcessingItemResult\x12\x0e\n" +
 	"\x02id\x18\x01 \x01(\tR\x02id\x12F\n" +
 	"\x03key\x18\x02 \x01(\v24.dev_observer.api.types.processing.ProcessingItemKeyR\x03key\x12(\n" +
@@ -2118,9 +2378,14 @@ const file_dev_observer_api_types_processing_proto_rawDesc = "" +
 	"\r_reference_idB\f\n" +
 	"\n" +
 	"_namespaceB\r\n" +
-	"\v_created_by\"\xee\x01\n" +
+	"\v_created_by\"P\n" +
+	"\fFlattenChunk\x12\x12\n" +
+	"\x04name\x18\x01 \x01(\tR\x04name\x12\x16\n" +
+	"\x06tokens\x18\x02 \x01(\x05R\x06tokens\x12\x14\n" +
+	"\x05files\x18\x03 \x03(\tR\x05files\"\xb7\x02\n" +
 	"\x18ProcessingItemResultData\x12W\n" +
-	"\fobservations\x18\x01 \x03(\v23.dev_observer.api.types.observations.ObservationKeyR\fobservations\x12q\n" +
+	"\fobservations\x18\x01 \x03(\v23.dev_observer.api.types.observations.ObservationKeyR\fobservations\x12G\n" +
+	"\x06chunks\x18\x02 \x03(\v2/.dev_observer.api.types.processing.FlattenChunkR\x06chunks\x12q\n" +
 	"\x14periodic_aggregation\x18d \x01(\v2<.dev_observer.api.types.processing.PeriodicAggregationResultH\x00R\x13periodicAggregationB\x06\n" +
 	"\x04type\"\x85\x02\n" +
 	"\x16ProcessingResultFilter\x12!\n" +
@@ -2142,7 +2407,7 @@ const file_dev_observer_api_types_processing_proto_rawDesc = "" +
 	"\r_reference_idB\x0f\n" +
 	"\r_request_typeB8Z6github.com/devplaninc/contextify/clients/go/contextifyb\x06proto3"
 
-var file_dev_observer_api_types_processing_proto_msgTypes = make([]protoimpl.MessageInfo, 14)
+var file_dev_observer_api_types_processing_proto_msgTypes = make([]protoimpl.MessageInfo, 16)
 var file_dev_observer_api_types_processing_proto_goTypes = []any{
 	(*ProcessingItemKey)(nil),              // 0: dev_observer.api.types.processing.ProcessingItemKey
 	(*ProcessingItem)(nil),                 // 1: dev_observer.api.types.processing.ProcessingItem
@@ -2150,46 +2415,50 @@ var file_dev_observer_api_types_processing_proto_goTypes = []any{
 	(*AggregatedSummaryParams)(nil),        // 3: dev_observer.api.types.processing.AggregatedSummaryParams
 	(*ProcessingRequest)(nil),              // 4: dev_observer.api.types.processing.ProcessingRequest
 	(*ProcessGitChangesRequest)(nil),       // 5: dev_observer.api.types.processing.ProcessGitChangesRequest
-	(*ProcessingItemResult)(nil),           // 6: dev_observer.api.types.processing.ProcessingItemResult
-	(*RepoObservation)(nil),                // 7: dev_observer.api.types.processing.RepoObservation
-	(*PeriodicAggregationResult)(nil),      // 8: dev_observer.api.types.processing.PeriodicAggregationResult
-	(*ProcessingItemData)(nil),             // 9: dev_observer.api.types.processing.ProcessingItemData
-	(*ProcessingItemResultData)(nil),       // 10: dev_observer.api.types.processing.ProcessingItemResultData
-	(*ProcessingResultFilter)(nil),         // 11: dev_observer.api.types.processing.ProcessingResultFilter
-	(*ProcessingItemsFilter)(nil),          // 12: dev_observer.api.types.processing.ProcessingItemsFilter
-	(*AggregatedSummaryParams_Target)(nil), // 13: dev_observer.api.types.processing.AggregatedSummaryParams.Target
-	(*timestamppb.Timestamp)(nil),          // 14: google.protobuf.Timestamp
-	(*Schedule)(nil),                       // 15: dev_observer.api.types.schedule.Schedule
-	(*ObservationKey)(nil),                 // 16: dev_observer.api.types.observations.ObservationKey
+	(*AnalyzeRepoTokensRequest)(nil),       // 6: dev_observer.api.types.processing.AnalyzeRepoTokensRequest
+	(*ProcessingItemResult)(nil),           // 7: dev_observer.api.types.processing.ProcessingItemResult
+	(*RepoObservation)(nil),                // 8: dev_observer.api.types.processing.RepoObservation
+	(*PeriodicAggregationResult)(nil),      // 9: dev_observer.api.types.processing.PeriodicAggregationResult
+	(*ProcessingItemData)(nil),             // 10: dev_observer.api.types.processing.ProcessingItemData
+	(*FlattenChunk)(nil),                   // 11: dev_observer.api.types.processing.FlattenChunk
+	(*ProcessingItemResultData)(nil),       // 12: dev_observer.api.types.processing.ProcessingItemResultData
+	(*ProcessingResultFilter)(nil),         // 13: dev_observer.api.types.processing.ProcessingResultFilter
+	(*ProcessingItemsFilter)(nil),          // 14: dev_observer.api.types.processing.ProcessingItemsFilter
+	(*AggregatedSummaryParams_Target)(nil), // 15: dev_observer.api.types.processing.AggregatedSummaryParams.Target
+	(*timestamppb.Timestamp)(nil),          // 16: google.protobuf.Timestamp
+	(*Schedule)(nil),                       // 17: dev_observer.api.types.schedule.Schedule
+	(*ObservationKey)(nil),                 // 18: dev_observer.api.types.observations.ObservationKey
 }
 var file_dev_observer_api_types_processing_proto_depIdxs = []int32{
 	0,  // 0: dev_observer.api.types.processing.ProcessingItem.key:type_name -> dev_observer.api.types.processing.ProcessingItemKey
-	14, // 1: dev_observer.api.types.processing.ProcessingItem.next_processing:type_name -> google.protobuf.Timestamp
-	14, // 2: dev_observer.api.types.processing.ProcessingItem.last_processed:type_name -> google.protobuf.Timestamp
-	14, // 3: dev_observer.api.types.processing.ProcessingItem.processing_started_at:type_name -> google.protobuf.Timestamp
-	9,  // 4: dev_observer.api.types.processing.ProcessingItem.data:type_name -> dev_observer.api.types.processing.ProcessingItemData
+	16, // 1: dev_observer.api.types.processing.ProcessingItem.next_processing:type_name -> google.protobuf.Timestamp
+	16, // 2: dev_observer.api.types.processing.ProcessingItem.last_processed:type_name -> google.protobuf.Timestamp
+	16, // 3: dev_observer.api.types.processing.ProcessingItem.processing_started_at:type_name -> google.protobuf.Timestamp
+	10, // 4: dev_observer.api.types.processing.ProcessingItem.data:type_name -> dev_observer.api.types.processing.ProcessingItemData
 	3,  // 5: dev_observer.api.types.processing.PeriodicAggregation.params:type_name -> dev_observer.api.types.processing.AggregatedSummaryParams
-	15, // 6: dev_observer.api.types.processing.PeriodicAggregation.schedule:type_name -> dev_observer.api.types.schedule.Schedule
-	14, // 7: dev_observer.api.types.processing.AggregatedSummaryParams.end_date:type_name -> google.protobuf.Timestamp
-	13, // 8: dev_observer.api.types.processing.AggregatedSummaryParams.target:type_name -> dev_observer.api.types.processing.AggregatedSummaryParams.Target
+	17, // 6: dev_observer.api.types.processing.PeriodicAggregation.schedule:type_name -> dev_observer.api.types.schedule.Schedule
+	16, // 7: dev_observer.api.types.processing.AggregatedSummaryParams.end_date:type_name -> google.protobuf.Timestamp
+	15, // 8: dev_observer.api.types.processing.AggregatedSummaryParams.target:type_name -> dev_observer.api.types.processing.AggregatedSummaryParams.Target
 	5,  // 9: dev_observer.api.types.processing.ProcessingRequest.git_changes:type_name -> dev_observer.api.types.processing.ProcessGitChangesRequest
-	0,  // 10: dev_observer.api.types.processing.ProcessingItemResult.key:type_name -> dev_observer.api.types.processing.ProcessingItemKey
-	14, // 11: dev_observer.api.types.processing.ProcessingItemResult.created_at:type_name -> google.protobuf.Timestamp
-	9,  // 12: dev_observer.api.types.processing.ProcessingItemResult.data:type_name -> dev_observer.api.types.processing.ProcessingItemData
-	10, // 13: dev_observer.api.types.processing.ProcessingItemResult.result_data:type_name -> dev_observer.api.types.processing.ProcessingItemResultData
-	16, // 14: dev_observer.api.types.processing.RepoObservation.observations:type_name -> dev_observer.api.types.observations.ObservationKey
-	7,  // 15: dev_observer.api.types.processing.PeriodicAggregationResult.repo_observations:type_name -> dev_observer.api.types.processing.RepoObservation
-	4,  // 16: dev_observer.api.types.processing.ProcessingItemData.request:type_name -> dev_observer.api.types.processing.ProcessingRequest
-	2,  // 17: dev_observer.api.types.processing.ProcessingItemData.periodic_aggregation:type_name -> dev_observer.api.types.processing.PeriodicAggregation
-	16, // 18: dev_observer.api.types.processing.ProcessingItemResultData.observations:type_name -> dev_observer.api.types.observations.ObservationKey
-	8,  // 19: dev_observer.api.types.processing.ProcessingItemResultData.periodic_aggregation:type_name -> dev_observer.api.types.processing.PeriodicAggregationResult
-	0,  // 20: dev_observer.api.types.processing.ProcessingResultFilter.keys:type_name -> dev_observer.api.types.processing.ProcessingItemKey
-	0,  // 21: dev_observer.api.types.processing.ProcessingItemsFilter.keys:type_name -> dev_observer.api.types.processing.ProcessingItemKey
-	22, // [22:22] is the sub-list for method output_type
-	22, // [22:22] is the sub-list for method input_type
-	22, // [22:22] is the sub-list for extension type_name
-	22, // [22:22] is the sub-list for extension extendee
-	0,  // [0:22] is the sub-list for field type_name
+	6,  // 10: dev_observer.api.types.processing.ProcessingRequest.analyze_tokens:type_name -> dev_observer.api.types.processing.AnalyzeRepoTokensRequest
+	0,  // 11: dev_observer.api.types.processing.ProcessingItemResult.key:type_name -> dev_observer.api.types.processing.ProcessingItemKey
+	16, // 12: dev_observer.api.types.processing.ProcessingItemResult.created_at:type_name -> google.protobuf.Timestamp
+	10, // 13: dev_observer.api.types.processing.ProcessingItemResult.data:type_name -> dev_observer.api.types.processing.ProcessingItemData
+	12, // 14: dev_observer.api.types.processing.ProcessingItemResult.result_data:type_name -> dev_observer.api.types.processing.ProcessingItemResultData
+	18, // 15: dev_observer.api.types.processing.RepoObservation.observations:type_name -> dev_observer.api.types.observations.ObservationKey
+	8,  // 16: dev_observer.api.types.processing.PeriodicAggregationResult.repo_observations:type_name -> dev_observer.api.types.processing.RepoObservation
+	4,  // 17: dev_observer.api.types.processing.ProcessingItemData.request:type_name -> dev_observer.api.types.processing.ProcessingRequest
+	2,  // 18: dev_observer.api.types.processing.ProcessingItemData.periodic_aggregation:type_name -> dev_observer.api.types.processing.PeriodicAggregation
+	18, // 19: dev_observer.api.types.processing.ProcessingItemResultData.observations:type_name -> dev_observer.api.types.observations.ObservationKey
+	11, // 20: dev_observer.api.types.processing.ProcessingItemResultData.chunks:type_name -> dev_observer.api.types.processing.FlattenChunk
+	9,  // 21: dev_observer.api.types.processing.ProcessingItemResultData.periodic_aggregation:type_name -> dev_observer.api.types.processing.PeriodicAggregationResult
+	0,  // 22: dev_observer.api.types.processing.ProcessingResultFilter.keys:type_name -> dev_observer.api.types.processing.ProcessingItemKey
+	0,  // 23: dev_observer.api.types.processing.ProcessingItemsFilter.keys:type_name -> dev_observer.api.types.processing.ProcessingItemKey
+	24, // [24:24] is the sub-list for method output_type
+	24, // [24:24] is the sub-list for method input_type
+	24, // [24:24] is the sub-list for extension type_name
+	24, // [24:24] is the sub-list for extension extendee
+	0,  // [0:24] is the sub-list for field type_name
 }
 
 func init() { file_dev_observer_api_types_processing_proto_init() }
@@ -2209,24 +2478,25 @@ func file_dev_observer_api_types_processing_proto_init() {
 	file_dev_observer_api_types_processing_proto_msgTypes[1].OneofWrappers = []any{}
 	file_dev_observer_api_types_processing_proto_msgTypes[4].OneofWrappers = []any{
 		(*processingRequest_GitChanges)(nil),
+		(*processingRequest_AnalyzeTokens)(nil),
 	}
-	file_dev_observer_api_types_processing_proto_msgTypes[6].OneofWrappers = []any{}
-	file_dev_observer_api_types_processing_proto_msgTypes[9].OneofWrappers = []any{
+	file_dev_observer_api_types_processing_proto_msgTypes[7].OneofWrappers = []any{}
+	file_dev_observer_api_types_processing_proto_msgTypes[10].OneofWrappers = []any{
 		(*processingItemData_Request)(nil),
 		(*processingItemData_PeriodicAggregation)(nil),
 	}
-	file_dev_observer_api_types_processing_proto_msgTypes[10].OneofWrappers = []any{
+	file_dev_observer_api_types_processing_proto_msgTypes[12].OneofWrappers = []any{
 		(*processingItemResultData_PeriodicAggregation)(nil),
 	}
-	file_dev_observer_api_types_processing_proto_msgTypes[11].OneofWrappers = []any{}
-	file_dev_observer_api_types_processing_proto_msgTypes[12].OneofWrappers = []any{}
+	file_dev_observer_api_types_processing_proto_msgTypes[13].OneofWrappers = []any{}
+	file_dev_observer_api_types_processing_proto_msgTypes[14].OneofWrappers = []any{}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_dev_observer_api_types_processing_proto_rawDesc), len(file_dev_observer_api_types_processing_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   14,
+			NumMessages:   16,
 			NumExtensions: 0,
 			NumServices:   0,
 		},
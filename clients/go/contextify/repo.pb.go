@@ -595,6 +595,7 @@ type TokensInfo struct {
 	state                  protoimpl.MessageState `protogen:"opaque.v1"`
 	xxx_hidden_CreatedAt   *timestamppb.Timestamp `protobuf:"bytes,1,opt,name=created_at,json=createdAt,proto3"`
 	xxx_hidden_TokensCount int32                  `protobuf:"varint,2,opt,name=tokens_count,json=tokensCount,proto3"`
+	xxx_hidden_Estimated   bool                   `protobuf:"varint,3,opt,name=estimated,proto3"`
 	unknownFields          protoimpl.UnknownFields
 	sizeCache              protoimpl.SizeCache
 }
@@ -638,6 +639,13 @@ func (x *TokensInfo) GetTokensCount() int32 {
 	return 0
 }
 
+func (x *TokensInfo) GetEstimated() bool {
+	if x != nil {
+		return x.xxx_hidden_Estimated
+	}
+	return false
+}
+
 func (x *TokensInfo) SetCreatedAt(v *timestamppb.Timestamp) {
 	x.xxx_hidden_CreatedAt = v
 }
@@ -646,6 +654,10 @@ func (x *TokensInfo) SetTokensCount(v int32) {
 	x.xxx_hidden_TokensCount = v
 }
 
+func (x *TokensInfo) SetEstimated(v bool) {
+	x.xxx_hidden_Estimated = v
+}
+
 func (x *TokensInfo) HasCreatedAt() bool {
 	if x == nil {
 		return false
@@ -662,6 +674,8 @@ type TokensInfo_builder struct {
 
 	CreatedAt   *timestamppb.Timestamp
 	TokensCount int32
+	// Whether the count is estimated from file sizes instead of tokenizing the repository.
+	Estimated bool
 }
 
 func (b0 TokensInfo_builder) Build() *TokensInfo {
@@ -670,6 +684,7 @@ func (b0 TokensInfo_builder) Build() *TokensInfo {
 	_, _ = b, x
 	x.xxx_hidden_CreatedAt = b.CreatedAt
 	x.xxx_hidden_TokensCount = b.TokensCount
+	x.xxx_hidden_Estimated = b.Estimated
 	return m0
 }
 
@@ -1600,12 +1615,13 @@ const file_dev_observer_api_types_repo_proto_rawDesc = "" +
 	"_clone_urlB\n" +
 	"\n" +
 	"\b_size_kbB\x0e\n" +
-	"\f_tokens_info\"j\n" +
+	"\f_tokens_info\"\x88\x01\n" +
 	"\n" +
 	"TokensInfo\x129\n" +
 	"\n" +
 	"created_at\x18\x01 \x01(\v2\x1a.google.protobuf.TimestampR\tcreatedAt\x12!\n" +
-	"\ftokens_count\x18\x02 \x01(\x05R\vtokensCount\"\x8d\x01\n" +
+	"\ftokens_count\x18\x02 \x01(\x05R\vtokensCount\x12\x1c\n" +
+	"\testimated\x18\x03 \x01(\bR\testimated\"\x8d\x01\n" +
 	"\n" +
 	"GitAppInfo\x12=\n" +
 	"\flast_refresh\x18\x01 \x01(\v2\x1a.google.protobuf.TimestampR\vlastRefresh\x12,\n" +
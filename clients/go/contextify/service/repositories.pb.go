@@ -397,6 +397,139 @@ func (b0 RescanRepositoryResponse_builder) Build() *RescanRepositoryResponse {
 	return m0
 }
 
+type AnalyzeRepoTokensRequest struct {
+	state                  protoimpl.MessageState `protogen:"opaque.v1"`
+	xxx_hidden_Exact       bool                   `protobuf:"varint,1,opt,name=exact,proto3,oneof"`
+	XXX_raceDetectHookData protoimpl.RaceDetectHookData
+	XXX_presence           [1]uint32
+	unknownFields          protoimpl.UnknownFields
+	sizeCache              protoimpl.SizeCache
+}
+
+func (x *AnalyzeRepoTokensRequest) Reset() {
+	*x = AnalyzeRepoTokensRequest{}
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[5]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *AnalyzeRepoTokensRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AnalyzeRepoTokensRequest) ProtoMessage() {}
+
+func (x *AnalyzeRepoTokensRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[5]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+func (x *AnalyzeRepoTokensRequest) GetExact() bool {
+	if x != nil {
+		return x.xxx_hidden_Exact
+	}
+	return false
+}
+
+func (x *AnalyzeRepoTokensRequest) SetExact(v bool) {
+	x.xxx_hidden_Exact = v
+	protoimpl.X.SetPresent(&(x.XXX_presence[0]), 0, 1)
+}
+
+func (x *AnalyzeRepoTokensRequest) HasExact() bool {
+	if x == nil {
+		return false
+	}
+	return protoimpl.X.Present(&(x.XXX_presence[0]), 0)
+}
+
+func (x *AnalyzeRepoTokensRequest) ClearExact() {
+	protoimpl.X.ClearPresent(&(x.XXX_presence[0]), 0)
+	x.xxx_hidden_Exact = false
+}
+
+type AnalyzeRepoTokensRequest_builder struct {
+	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
+
+	Exact *bool
+}
+
+func (b0 AnalyzeRepoTokensRequest_builder) Build() *AnalyzeRepoTokensRequest {
+	m0 := &AnalyzeRepoTokensRequest{}
+	b, x := &b0, m0
+	_, _ = b, x
+	if b.Exact != nil {
+		protoimpl.X.SetPresentNonAtomic(&(x.XXX_presence[0]), 0, 1)
+		x.xxx_hidden_Exact = *b.Exact
+	}
+	return m0
+}
+
+type AnalyzeRepoTokensResponse struct {
+	state                protoimpl.MessageState `protogen:"opaque.v1"`
+	xxx_hidden_RequestId string                 `protobuf:"bytes,1,opt,name=request_id,json=requestId,proto3"`
+	unknownFields        protoimpl.UnknownFields
+	sizeCache            protoimpl.SizeCache
+}
+
+func (x *AnalyzeRepoTokensResponse) Reset() {
+	*x = AnalyzeRepoTokensResponse{}
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *AnalyzeRepoTokensResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AnalyzeRepoTokensResponse) ProtoMessage() {}
+
+func (x *AnalyzeRepoTokensResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+func (x *AnalyzeRepoTokensResponse) GetRequestId() string {
+	if x != nil {
+		return x.xxx_hidden_RequestId
+	}
+	return ""
+}
+
+func (x *AnalyzeRepoTokensResponse) SetRequestId(v string) {
+	x.xxx_hidden_RequestId = v
+}
+
+type AnalyzeRepoTokensResponse_builder struct {
+	_ [0]func() // Prevents comparability and use of unkeyed literals for the builder.
+
+	// Id of the processing request, see `/processing/requests/runs/{request_id}`.
+	RequestId string
+}
+
+func (b0 AnalyzeRepoTokensResponse_builder) Build() *AnalyzeRepoTokensResponse {
+	m0 := &AnalyzeRepoTokensResponse{}
+	b, x := &b0, m0
+	_, _ = b, x
+	x.xxx_hidden_RequestId = b.RequestId
+	return m0
+}
+
 type GetRepositoryResponse struct {
 	state           protoimpl.MessageState    `protogen:"opaque.v1"`
 	xxx_hidden_Repo *contextify.GitRepository `protobuf:"bytes,1,opt,name=repo,proto3"`
@@ -406,7 +539,7 @@ type GetRepositoryResponse struct {
 
 func (x *GetRepositoryResponse) Reset() {
 	*x = GetRepositoryResponse{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[5]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[7]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -418,7 +551,7 @@ func (x *GetRepositoryResponse) String() string {
 func (*GetRepositoryResponse) ProtoMessage() {}
 
 func (x *GetRepositoryResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[5]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[7]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -474,7 +607,7 @@ type DeleteRepositoryResponse struct {
 
 func (x *DeleteRepositoryResponse) Reset() {
 	*x = DeleteRepositoryResponse{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[6]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[8]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -486,7 +619,7 @@ func (x *DeleteRepositoryResponse) String() string {
 func (*DeleteRepositoryResponse) ProtoMessage() {}
 
 func (x *DeleteRepositoryResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[6]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[8]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -533,7 +666,7 @@ type FilterRepositoriesRequest struct {
 
 func (x *FilterRepositoriesRequest) Reset() {
 	*x = FilterRepositoriesRequest{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[7]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[9]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -545,7 +678,7 @@ func (x *FilterRepositoriesRequest) String() string {
 func (*FilterRepositoriesRequest) ProtoMessage() {}
 
 func (x *FilterRepositoriesRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[7]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[9]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -601,7 +734,7 @@ type FilterRepositoriesResponse struct {
 
 func (x *FilterRepositoriesResponse) Reset() {
 	*x = FilterRepositoriesResponse{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[8]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[10]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -613,7 +746,7 @@ func (x *FilterRepositoriesResponse) String() string {
 func (*FilterRepositoriesResponse) ProtoMessage() {}
 
 func (x *FilterRepositoriesResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[8]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[10]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -660,7 +793,7 @@ type RescanAnalysisSummaryRequest struct {
 
 func (x *RescanAnalysisSummaryRequest) Reset() {
 	*x = RescanAnalysisSummaryRequest{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[9]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[11]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -672,7 +805,7 @@ func (x *RescanAnalysisSummaryRequest) String() string {
 func (*RescanAnalysisSummaryRequest) ProtoMessage() {}
 
 func (x *RescanAnalysisSummaryRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[9]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[11]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -716,7 +849,7 @@ type RescanAnalysisSummaryResponse struct {
 
 func (x *RescanAnalysisSummaryResponse) Reset() {
 	*x = RescanAnalysisSummaryResponse{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[10]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[12]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -728,7 +861,7 @@ func (x *RescanAnalysisSummaryResponse) String() string {
 func (*RescanAnalysisSummaryResponse) ProtoMessage() {}
 
 func (x *RescanAnalysisSummaryResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[10]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[12]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -761,7 +894,7 @@ type GetAuthenticatedRepoRequest struct {
 
 func (x *GetAuthenticatedRepoRequest) Reset() {
 	*x = GetAuthenticatedRepoRequest{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[11]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[13]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -773,7 +906,7 @@ func (x *GetAuthenticatedRepoRequest) String() string {
 func (*GetAuthenticatedRepoRequest) ProtoMessage() {}
 
 func (x *GetAuthenticatedRepoRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[11]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[13]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -831,7 +964,7 @@ type GetAuthenticatedRepoResponse struct {
 
 func (x *GetAuthenticatedRepoResponse) Reset() {
 	*x = GetAuthenticatedRepoResponse{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[12]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[14]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -843,7 +976,7 @@ func (x *GetAuthenticatedRepoResponse) String() string {
 func (*GetAuthenticatedRepoResponse) ProtoMessage() {}
 
 func (x *GetAuthenticatedRepoResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[12]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[14]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -889,7 +1022,7 @@ type GetRepoTokenRequest struct {
 
 func (x *GetRepoTokenRequest) Reset() {
 	*x = GetRepoTokenRequest{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[13]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[15]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -901,7 +1034,7 @@ func (x *GetRepoTokenRequest) String() string {
 func (*GetRepoTokenRequest) ProtoMessage() {}
 
 func (x *GetRepoTokenRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[13]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[15]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -959,7 +1092,7 @@ type GetRepoTokenResponse struct {
 
 func (x *GetRepoTokenResponse) Reset() {
 	*x = GetRepoTokenResponse{}
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[14]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[16]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -971,7 +1104,7 @@ func (x *GetRepoTokenResponse) String() string {
 func (*GetRepoTokenResponse) ProtoMessage() {}
 
 func (x *GetRepoTokenResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[14]
+	mi := &file_dev_observer_api_web_repositories_proto_msgTypes[16]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1026,7 +1159,13 @@ const file_dev_observer_api_web_repositories_proto_rawDesc = "" +
 	"\t_researchB\x0f\n" +
 	"\r_skip_summaryB\x11\n" +
 	"\x0f_force_research\"\x1a\n" +
-	"\x18RescanRepositoryResponse\"W\n" +
+	"\x18RescanRepositoryResponse\"?\n" +
+	"\x18AnalyzeRepoTokensRequest\x12\x19\n" +
+	"\x05exact\x18\x01 \x01(\bH\x00R\x05exact\x88\x01\x01B\b\n" +
+	"\x06_exact\":\n" +
+	"\x19AnalyzeRepoTokensResponse\x12\x1d\n" +
+	"\n" +
+	"request_id\x18\x01 \x01(\tR\trequestId\"W\n" +
 	"\x15GetRepositoryResponse\x12>\n" +
 	"\x04repo\x18\x01 \x01(\v2*.dev_observer.api.types.repo.GitRepositoryR\x04repo\"\\\n" +
 	"\x18DeleteRepositoryResponse\x12@\n" +
@@ -1049,37 +1188,39 @@ const file_dev_observer_api_web_repositories_proto_rawDesc = "" +
 	"\x14GetRepoTokenResponse\x12\x14\n" +
 	"\x05token\x18\x01 \x01(\tR\x05tokenB@Z>github.com/devplaninc/contextify/clients/go/contextify/serviceb\x06proto3"
 
-var file_dev_observer_api_web_repositories_proto_msgTypes = make([]protoimpl.MessageInfo, 15)
+var file_dev_observer_api_web_repositories_proto_msgTypes = make([]protoimpl.MessageInfo, 17)
 var file_dev_observer_api_web_repositories_proto_goTypes = []any{
 	(*ListRepositoriesResponse)(nil),      // 0: dev_observer.api.web.repositories.ListRepositoriesResponse
 	(*AddRepositoryRequest)(nil),          // 1: dev_observer.api.web.repositories.AddRepositoryRequest
 	(*AddRepositoryResponse)(nil),         // 2: dev_observer.api.web.repositories.AddRepositoryResponse
 	(*RescanRepositoryRequest)(nil),       // 3: dev_observer.api.web.repositories.RescanRepositoryRequest
 	(*RescanRepositoryResponse)(nil),      // 4: dev_observer.api.web.repositories.RescanRepositoryResponse
-	(*GetRepositoryResponse)(nil),         // 5: dev_observer.api.web.repositories.GetRepositoryResponse
-	(*DeleteRepositoryResponse)(nil),      // 6: dev_observer.api.web.repositories.DeleteRepositoryResponse
-	(*FilterRepositoriesRequest)(nil),     // 7: dev_observer.api.web.repositories.FilterRepositoriesRequest
-	(*FilterRepositoriesResponse)(nil),    // 8: dev_observer.api.web.repositories.FilterRepositoriesResponse
-	(*RescanAnalysisSummaryRequest)(nil),  // 9: dev_observer.api.web.repositories.RescanAnalysisSummaryRequest
-	(*RescanAnalysisSummaryResponse)(nil), // 10: dev_observer.api.web.repositories.RescanAnalysisSummaryResponse
-	(*GetAuthenticatedRepoRequest)(nil),   // 11: dev_observer.api.web.repositories.GetAuthenticatedRepoRequest
-	(*GetAuthenticatedRepoResponse)(nil),  // 12: dev_observer.api.web.repositories.GetAuthenticatedRepoResponse
-	(*GetRepoTokenRequest)(nil),           // 13: dev_observer.api.web.repositories.GetRepoTokenRequest
-	(*GetRepoTokenResponse)(nil),          // 14: dev_observer.api.web.repositories.GetRepoTokenResponse
-	(*contextify.GitRepository)(nil),      // 15: dev_observer.api.types.repo.GitRepository
-	(contextify.GitProvider)(0),           // 16: dev_observer.api.types.repo.GitProvider
-	(*contextify.ReposFilter)(nil),        // 17: dev_observer.api.types.repo.ReposFilter
+	(*AnalyzeRepoTokensRequest)(nil),      // 5: dev_observer.api.web.repositories.AnalyzeRepoTokensRequest
+	(*AnalyzeRepoTokensResponse)(nil),     // 6: dev_observer.api.web.repositories.AnalyzeRepoTokensResponse
+	(*GetRepositoryResponse)(nil),         // 7: dev_observer.api.web.repositories.GetRepositoryResponse
+	(*DeleteRepositoryResponse)(nil),      // 8: dev_observer.api.web.repositories.DeleteRepositoryResponse
+	(*FilterRepositoriesRequest)(nil),     // 9: dev_observer.api.web.repositories.FilterRepositoriesRequest
+	(*FilterRepositoriesResponse)(nil),    // 10: dev_observer.api.web.repositories.FilterRepositoriesResponse
+	(*RescanAnalysisSummaryRequest)(nil),  // 11: dev_observer.api.web.repositories.RescanAnalysisSummaryRequest
+	(*RescanAnalysisSummaryResponse)(nil), // 12: dev_observer.api.web.repositories.RescanAnalysisSummaryResponse
+	(*GetAuthenticatedRepoRequest)(nil),   // 13: dev_observer.api.web.repositories.GetAuthenticatedRepoRequest
+	(*GetAuthenticatedRepoResponse)(nil),  // 14: dev_observer.api.web.repositories.GetAuthenticatedRepoResponse
+	(*GetRepoTokenRequest)(nil),           // 15: dev_observer.api.web.repositories.GetRepoTokenRequest
+	(*GetRepoTokenResponse)(nil),          // 16: dev_observer.api.web.repositories.GetRepoTokenResponse
+	(*contextify.GitRepository)(nil),      // 17: dev_observer.api.types.repo.GitRepository
+	(contextify.GitProvider)(0),           // 18: dev_observer.api.types.repo.GitProvider
+	(*contextify.ReposFilter)(nil),        // 19: dev_observer.api.types.repo.ReposFilter
 }
 var file_dev_observer_api_web_repositories_proto_depIdxs = []int32{
-	15, // 0: dev_observer.api.web.repositories.ListRepositoriesResponse.repos:type_name -> dev_observer.api.types.repo.GitRepository
-	16, // 1: dev_observer.api.web.repositories.AddRepositoryRequest.provider:type_name -> dev_observer.api.types.repo.GitProvider
-	15, // 2: dev_observer.api.web.repositories.AddRepositoryResponse.repo:type_name -> dev_observer.api.types.repo.GitRepository
-	15, // 3: dev_observer.api.web.repositories.GetRepositoryResponse.repo:type_name -> dev_observer.api.types.repo.GitRepository
-	15, // 4: dev_observer.api.web.repositories.DeleteRepositoryResponse.repos:type_name -> dev_observer.api.types.repo.GitRepository
-	17, // 5: dev_observer.api.web.repositories.FilterRepositoriesRequest.filter:type_name -> dev_observer.api.types.repo.ReposFilter
-	15, // 6: dev_observer.api.web.repositories.FilterRepositoriesResponse.repos:type_name -> dev_observer.api.types.repo.GitRepository
-	16, // 7: dev_observer.api.web.repositories.GetAuthenticatedRepoRequest.provider:type_name -> dev_observer.api.types.repo.GitProvider
-	16, // 8: dev_observer.api.web.repositories.GetRepoTokenRequest.provider:type_name -> dev_observer.api.types.repo.GitProvider
+	17, // 0: dev_observer.api.web.repositories.ListRepositoriesResponse.repos:type_name -> dev_observer.api.types.repo.GitRepository
+	18, // 1: dev_observer.api.web.repositories.AddRepositoryRequest.provider:type_name -> dev_observer.api.types.repo.GitProvider
+	17, // 2: dev_observer.api.web.repositories.AddRepositoryResponse.repo:type_name -> dev_observer.api.types.repo.GitRepository
+	17, // 3: dev_observer.api.web.repositories.GetRepositoryResponse.repo:type_name -> dev_observer.api.types.repo.GitRepository
+	17, // 4: dev_observer.api.web.repositories.DeleteRepositoryResponse.repos:type_name -> dev_observer.api.types.repo.GitRepository
+	19, // 5: dev_observer.api.web.repositories.FilterRepositoriesRequest.filter:type_name -> dev_observer.api.types.repo.ReposFilter
+	17, // 6: dev_observer.api.web.repositories.FilterRepositoriesResponse.repos:type_name -> dev_observer.api.types.repo.GitRepository
+	18, // 7: dev_observer.api.web.repositories.GetAuthenticatedRepoRequest.provider:type_name -> dev_observer.api.types.repo.GitProvider
+	18, // 8: dev_observer.api.web.repositories.GetRepoTokenRequest.provider:type_name -> dev_observer.api.types.repo.GitProvider
 	9,  // [9:9] is the sub-list for method output_type
 	9,  // [9:9] is the sub-list for method input_type
 	9,  // [9:9] is the sub-list for extension type_name
@@ -1093,13 +1234,14 @@ func file_dev_observer_api_web_repositories_proto_init() {
 		return
 	}
 	file_dev_observer_api_web_repositories_proto_msgTypes[3].OneofWrappers = []any{}
+	file_dev_observer_api_web_repositories_proto_msgTypes[5].OneofWrappers = []any{}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_dev_observer_api_web_repositories_proto_rawDesc), len(file_dev_observer_api_web_repositories_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   15,
+			NumMessages:   17,
 			NumExtensions: 0,
 			NumServices:   0,
 		},
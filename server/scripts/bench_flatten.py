@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the native repository flattener against repomix.
+
+Generates a synthetic git repository, flattens and tokenizes it with both flatteners and prints wall times.
+repomix is skipped if it is not installed.
+
+Usage:
+    python bench_flatten.py [--files 20000] [--file-size 4000] [--runs 3]
+
+Example:
+    python bench_flatten.py --files 50000 --encoding o200k_base
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Callable, Awaitable
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, RepoAnalysisConfig
+from dev_observer.flatten.flatten import combine_repository, combine_repository_native, chunk_file, \
+    FileChunker, make_output_dir
+from dev_observer.repository.provider import RepositoryInfo
+from dev_observer.tokenizer.tiktoken import TiktokenTokenizerProvider
+
+_extensions = [".py", ".ts", ".go", ".md", ".json"]
+
+
+def generate_repo(root: str, files: int, file_size: int, seed: int = 0):
+    rnd = random.Random(seed)
+    words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(2, 10))) for _ in range(2000)]
+    for i in range(files):
+        path = os.path.join(root, f"pkg_{i % 50}", f"mod_{i % 500}", f"file_{i}{rnd.choice(_extensions)}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        lines: List[str] = []
+        size = 0
+        while size < file_size:
+            line = f"{' ' * rnd.choice([0, 4, 8])}{' '.join(rnd.choices(words, k=rnd.randint(3, 12)))}"
+            lines.append(line)
+            size += len(line) + 1
+        with open(path, "w") as f:
+            f.write("\n".join(lines))
+    # Ignored content, to exercise filtering.
+    os.makedirs(os.path.join(root, "node_modules", "dep"), exist_ok=True)
+    with open(os.path.join(root, "node_modules", "dep", "index.js"), "w") as f:
+        f.write("module.exports = {}\n" * 1000)
+    subprocess.run(["git", "init", "--quiet"], cwd=root, check=True)
+    subprocess.run(["git", "add", "."], cwd=root, check=True)
+
+
+async def run_repomix(repo: str, info: RepositoryInfo, config: GlobalConfig,
+                      tokenizer: TiktokenTokenizerProvider) -> int:
+    combined = await combine_repository(repo, info, config)
+    result = await chunk_file(combined.file_path, FileChunker(combined.output_dir, tokenizer, config))
+    shutil.rmtree(combined.output_dir)
+    return result.total_tokens
+
+
+async def run_native(repo: str, info: RepositoryInfo, config: GlobalConfig,
+                     tokenizer: TiktokenTokenizerProvider) -> int:
+    out_dir = make_output_dir(repo, "devplan_tmp_native")
+    chunker = FileChunker(out_dir, tokenizer, config)
+    await combine_repository_native(repo, info, config, out_dir, chunker.write)
+    result = await chunker.close()
+    shutil.rmtree(out_dir)
+    return result.total_tokens
+
+
+async def measure(name: str, runs: int, fn: Callable[[], Awaitable[int]]):
+    times: List[float] = []
+    tokens = 0
+    for _ in range(runs):
+        started = time.monotonic()
+        tokens = await fn()
+        times.append(time.monotonic() - started)
+    print(f"{name:>8}: median {statistics.median(times):.2f}s, min {min(times):.2f}s, tokens {tokens}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark repository flatteners.")
+    parser.add_argument("--files", type=int, default=20_000, help="Number of files in the synthetic repository.")
+    parser.add_argument("--file-size", type=int, default=4_000, help="Approximate file size in bytes.")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per flattener.")
+    parser.add_argument("--encoding", default="o200k_base", help="Tiktoken encoding.")
+    args = parser.parse_args()
+
+    tokenizer = TiktokenTokenizerProvider(encoding=args.encoding)
+    config = GlobalConfig()
+    config.repo_analysis.flatten.CopyFrom(RepoAnalysisConfig.Flatten(
+        max_tokens_per_chunk=100_000, max_file_size_bytes=1_000_000, ignore_pattern="",
+    ))
+    with tempfile.TemporaryDirectory() as repo:
+        started = time.monotonic()
+        generate_repo(repo, args.files, args.file_size)
+        print(f"Generated {args.files} files in {time.monotonic() - started:.2f}s")
+        info = RepositoryInfo(owner="bench", name="bench", clone_url="", size_kb=args.files * args.file_size // 1024)
+
+        await measure("native", args.runs, lambda: run_native(repo, info, config, tokenizer))
+        if shutil.which("repomix") is None:
+            print("repomix is not installed, skipping")
+            return 0
+        await measure("repomix", args.runs, lambda: run_repomix(repo, info, config, tokenizer))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
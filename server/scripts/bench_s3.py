@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark of S3 observation operations with a client per operation against a reused client.
+
+Runs exists/store/get/list/delete against an S3-compatible endpoint and prints per-operation latencies. The
+"per-op" mode closes the client after every operation, as the provider did before clients were reused.
+
+Start a local MinIO with:
+    docker run --rm -p 9000:9000 minio/minio server /data
+
+Usage:
+    python bench_s3.py [--endpoint http://localhost:9000] [--ops 200] [--size 4000]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import List, Callable, Awaitable, Dict
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
+from dev_observer.observations.s3 import S3ObservationsProvider
+
+
+async def ensure_bucket(provider: S3ObservationsProvider, bucket: str) -> bool:
+    client = await provider._get_client()
+    try:
+        await client.head_bucket(Bucket=bucket)
+    except ClientError:
+        await client.create_bucket(Bucket=bucket)
+    except (BotoCoreError, OSError) as e:
+        print(f"S3 endpoint is not reachable, skipping: {e}")
+        return False
+    return True
+
+
+async def measure(provider: S3ObservationsProvider, reuse: bool, ops: int, size: int) -> Dict[str, List[float]]:
+    times: Dict[str, List[float]] = {}
+    content = "x" * size
+    kind = f"bench-{uuid.uuid4().hex[:8]}"
+
+    async def timed(op: str, fn: Callable[[], Awaitable[object]]):
+        started = time.monotonic()
+        await fn()
+        if not reuse:
+            await provider.close()
+        times.setdefault(op, []).append(time.monotonic() - started)
+
+    for i in range(ops):
+        key = ObservationKey(kind=kind, name=f"o{i}", key=f"o{i}")
+        await timed("store", lambda: provider.store(Observation(key=key, content=content)))
+        await timed("exists", lambda: provider.exists(key))
+        await timed("get", lambda: provider.get(key))
+    for _ in range(max(1, ops // 20)):
+        await timed("list", lambda: provider.list(kind))
+    for i in range(ops):
+        key = ObservationKey(kind=kind, name=f"o{i}", key=f"o{i}")
+        await timed("delete", lambda: provider.delete(key))
+    await provider.close()
+    return times
+
+
+def report(name: str, times: Dict[str, List[float]]):
+    for op, values in times.items():
+        ms = [v * 1000 for v in values]
+        print(f"{name:>7} {op:>6}: median {statistics.median(ms):.2f}ms, p95 {_p95(ms):.2f}ms, n {len(ms)}")
+
+
+def _p95(values: List[float]) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * 0.95))]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark S3 observation operations.")
+    parser.add_argument("--endpoint", default="http://localhost:9000", help="S3-compatible endpoint.")
+    parser.add_argument("--access-key", default="minioadmin")
+    parser.add_argument("--secret-key", default="minioadmin")
+    parser.add_argument("--bucket", default="dev-observer-bench")
+    parser.add_argument("--region", default="us-east-1")
+    parser.add_argument("--ops", type=int, default=200, help="Observations to store, read and delete.")
+    parser.add_argument("--size", type=int, default=4_000, help="Observation size in bytes.")
+    parser.add_argument("--pool", type=int, default=50, help="Max pool connections of the reused client.")
+    args = parser.parse_args()
+
+    provider = S3ObservationsProvider(
+        endpoint=args.endpoint,
+        access_key=args.access_key,
+        secret_key=args.secret_key,
+        bucket=args.bucket,
+        region=args.region,
+        max_pool_connections=args.pool,
+    )
+    if not await ensure_bucket(provider, args.bucket):
+        await provider.close()
+        return 0
+    await provider.close()
+
+    report("per-op", await measure(provider, False, args.ops, args.size))
+    report("reused", await measure(provider, True, args.ops, args.size))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
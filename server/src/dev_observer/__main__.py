@@ -0,0 +1,19 @@
+import sys
+
+
+def main():
+    commands = ["server", "worker"]
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        print(f"usage: dev_observer {{{','.join(commands)}}} [args...]", file=sys.stderr)
+        sys.exit(2)
+    command, args = sys.argv[1], sys.argv[2:]
+    if command == "server":
+        from dev_observer.server.main import start_all
+        start_all()
+    elif command == "worker":
+        from dev_observer.worker.main import main as worker_main
+        worker_main(args)
+
+
+if __name__ == "__main__":
+    main()
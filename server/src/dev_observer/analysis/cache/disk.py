@@ -0,0 +1,23 @@
+import asyncio
+from typing import Optional
+
+from dev_observer.analysis.cache.provider import ResponseCacheBackend
+from dev_observer.common.disk_lru import DiskLRU
+
+
+class DiskResponseCacheBackend(ResponseCacheBackend):
+    """Stores responses as files under `root_dir`.
+
+    Entries older than `ttl_seconds` are ignored and removed on read. When the total size exceeds `max_bytes`,
+    least recently used entries are evicted, see `DiskLRU`.
+    """
+    _files: DiskLRU
+
+    def __init__(self, root_dir: str, ttl_seconds: int, max_bytes: int):
+        self._files = DiskLRU(root_dir, max_bytes, ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._files.get, f"{key}.json")
+
+    async def put(self, key: str, value: str):
+        await asyncio.to_thread(self._files.put, f"{key}.json", value)
@@ -0,0 +1,44 @@
+import datetime
+import json
+from typing import Optional
+
+from dev_observer.analysis.cache.provider import ResponseCacheBackend
+from dev_observer.api.types.observations_pb2 import ObservationKey, Observation
+from dev_observer.observations.provider import ObservationsProvider
+
+
+class ObservationsResponseCacheBackend(ResponseCacheBackend):
+    """Stores responses as observations of `kind`.
+
+    Expired entries are removed on read. Observation stores can't be cheaply scanned by size, so bounding the
+    total size is left to the store itself, e.g. bucket lifecycle rules for the cache prefix.
+    """
+    _observations: ObservationsProvider
+    _ttl_seconds: int
+    _kind: str
+
+    def __init__(self, observations: ObservationsProvider, ttl_seconds: int, kind: str = "llm_cache"):
+        self._observations = observations
+        self._ttl_seconds = ttl_seconds
+        self._kind = kind
+
+    async def get(self, key: str) -> Optional[str]:
+        obs_key = self._get_key(key)
+        if not await self._observations.exists(obs_key):
+            return None
+        data = json.loads((await self._observations.get(obs_key)).content)
+        if _now().timestamp() - data["created_at"] > self._ttl_seconds:
+            await self._observations.delete(obs_key)
+            return None
+        return data["value"]
+
+    async def put(self, key: str, value: str):
+        content = json.dumps({"created_at": _now().timestamp(), "value": value})
+        await self._observations.store(Observation(key=self._get_key(key), content=content))
+
+    def _get_key(self, key: str) -> ObservationKey:
+        return ObservationKey(kind=self._kind, name=f"{key}.json", key=f"{key[:2]}/{key}.json")
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(tz=datetime.timezone.utc)
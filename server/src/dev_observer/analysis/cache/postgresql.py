@@ -0,0 +1,92 @@
+import datetime
+import logging
+import threading
+from typing import Optional
+
+from sqlalchemy import update, select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.pool import NullPool
+
+from dev_observer.analysis.cache.provider import ResponseCacheBackend
+from dev_observer.log import s_
+from dev_observer.storage.postgresql.model import ModelResponseCacheEntity
+
+_log = logging.getLogger(__name__)
+
+
+class PostgresqlResponseCacheBackend(ResponseCacheBackend):
+    """Stores responses in the `model_response_cache` table.
+
+    Expired and least recently used entries over `max_bytes` are pruned every `prune_every` writes.
+    """
+    _engine: AsyncEngine
+    _ttl: datetime.timedelta
+    _max_bytes: int
+    _prune_every: int
+    _writes: int = 0
+
+    def __init__(self, url: str, ttl_seconds: int, max_bytes: int, prune_every: int = 100):
+        # The cache is shared between threads running their own event loops, so connections are not pooled:
+        # asyncpg connections can't be used from a loop other than the one that opened them.
+        self._engine = create_async_engine(url, poolclass=NullPool)
+        self._ttl = datetime.timedelta(seconds=ttl_seconds)
+        self._max_bytes = max_bytes
+        self._prune_every = prune_every
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        now = _now()
+        async with AsyncSession(self._engine) as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(ModelResponseCacheEntity)
+                    .where(ModelResponseCacheEntity.key == key)
+                    .where(ModelResponseCacheEntity.created_at > now - self._ttl)
+                    .values(accessed_at=now)
+                    .returning(ModelResponseCacheEntity.value)
+                )
+                return result.scalar_one_or_none()
+
+    async def put(self, key: str, value: str):
+        now = _now()
+        size = len(value.encode("utf-8"))
+        stmt = insert(ModelResponseCacheEntity).values(
+            key=key, value=value, size=size, created_at=now, accessed_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ModelResponseCacheEntity.key],
+            set_={"value": value, "size": size, "created_at": now, "accessed_at": now},
+        )
+        async with AsyncSession(self._engine) as session:
+            async with session.begin():
+                await session.execute(stmt)
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self._prune_every == 0
+        if prune:
+            await self.prune()
+
+    async def prune(self):
+        async with AsyncSession(self._engine) as session:
+            async with session.begin():
+                expired = await session.execute(
+                    delete(ModelResponseCacheEntity)
+                    .where(ModelResponseCacheEntity.created_at <= _now() - self._ttl)
+                )
+                total = (
+                    func.sum(ModelResponseCacheEntity.size)
+                    .over(order_by=ModelResponseCacheEntity.accessed_at.desc())
+                    .label("total")
+                )
+                ranked = select(ModelResponseCacheEntity.key, total).subquery()
+                evicted = await session.execute(
+                    delete(ModelResponseCacheEntity).where(ModelResponseCacheEntity.key.in_(
+                        select(ranked.c.key).where(ranked.c.total > self._max_bytes)
+                    ))
+                )
+        _log.debug(s_("Pruned cached model responses", expired=expired.rowcount, evicted=evicted.rowcount))
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(tz=datetime.timezone.utc)
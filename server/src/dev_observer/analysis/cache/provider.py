@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from typing import Protocol, Optional
+
+
+class ResponseCacheBackend(Protocol):
+    """Storage for serialized model responses keyed by content hash.
+
+    Backends are responsible for expiring and evicting entries, and must be safe to share between threads
+    running their own event loops.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def put(self, key: str, value: str):
+        ...
@@ -0,0 +1,112 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+from typing import List, Optional, Sequence, Callable, Awaitable
+
+from google.protobuf import json_format
+from langchain_core.load import dumpd, load
+from langchain_core.messages import BaseMessage
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from dev_observer.analysis.cache.provider import ResponseCacheBackend
+from dev_observer.api.types.ai_pb2 import ModelConfig
+from dev_observer.log import s_
+
+_log = logging.getLogger(__name__)
+
+# Bump to invalidate all cached responses, e.g. when the key or value format changes.
+_version = 1
+# Responses callers retry on, caching them would return the same failure on every retry.
+_uncacheable_finish_reasons = {"MALFORMED_FUNCTION_CALL"}
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class ResponseCache:
+    """Content-addressed cache of model responses.
+
+    Entries are keyed by a hash of the model config, the rendered messages and the bound tools, so identical
+    prompts, e.g. analyses of unchanged content, are answered without calling the model. Backend failures are
+    logged and treated as misses.
+    """
+    _backend: ResponseCacheBackend
+    _stats: CacheStats
+
+    def __init__(self, backend: ResponseCacheBackend):
+        self._backend = backend
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    async def get_or_invoke(
+            self, key: str, fn: Callable[[], Awaitable[BaseMessage]],
+    ) -> BaseMessage:
+        cached = await self._get(key)
+        if cached is not None:
+            return cached
+        response = await fn()
+        if response.response_metadata.get("finish_reason") in _uncacheable_finish_reasons:
+            return response
+        try:
+            await self._backend.put(key, json.dumps(dumpd(response)))
+        except Exception as e:
+            self._record(errors=1)
+            _log.warning(s_("Failed to store cached model response", key=key, error=e))
+        return response
+
+    async def _get(self, key: str) -> Optional[BaseMessage]:
+        try:
+            value = await self._backend.get(key)
+            response = load(json.loads(value), allowed_objects="messages") if value is not None else None
+        except Exception as e:
+            self._record(errors=1)
+            _log.warning(s_("Failed to read cached model response", key=key, error=e))
+            response = None
+        if response is None:
+            stats = self._record(misses=1)
+        else:
+            stats = self._record(hits=1)
+        _log.debug(s_("Model response cache lookup", key=key, hit=response is not None,
+                      hits=stats.hits, misses=stats.misses, hit_rate=round(stats.hit_rate, 3)))
+        return response
+
+    def _record(self, hits: int = 0, misses: int = 0, errors: int = 0) -> CacheStats:
+        with self._lock:
+            self._stats.hits += hits
+            self._stats.misses += misses
+            self._stats.errors += errors
+            return dataclasses.replace(self._stats)
+
+
+def cache_key(model: ModelConfig, messages: List[BaseMessage], tools: Optional[Sequence[BaseTool]] = None) -> str:
+    data = {
+        "version": _version,
+        "model": json_format.MessageToDict(model, preserving_proto_field_name=True),
+        # Only the parts sent to the model, ids and response metadata vary between otherwise identical messages.
+        "messages": [{
+            "type": m.type,
+            "content": m.content,
+            "tool_calls": getattr(m, "tool_calls", None),
+            "tool_call_id": getattr(m, "tool_call_id", None),
+        } for m in messages],
+        "tools": [convert_to_openai_tool(t) for t in tools or []],
+    }
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
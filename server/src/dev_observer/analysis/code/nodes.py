@@ -10,8 +10,8 @@ from langgraph.types import Command
 
 from dev_observer.analysis.code.tools import bash_tools, bash_tool_names, execute_bash_command
 from dev_observer.analysis.util import models
-from dev_observer.analysis.util.models import extract_xml, chunk_messages, count_messages_tokens, \
-    to_tool_result, clean_tools, to_str_content, Truncate
+from dev_observer.analysis.util.models import extract_xml, achunk_messages, acount_messages_tokens, \
+    to_tool_result, aclean_tools, to_str_content, Truncate
 from dev_observer.analysis.util.usage import extract_usage, sum_usage
 from dev_observer.api.types.config_pb2 import GlobalConfig
 from dev_observer.api.types.repo_pb2 import ResearchLog, ResearchLogItem, ToolCallResult
@@ -124,7 +124,7 @@ class CodeResearchNodes:
                     max_iterations=max_iterations,
                     repo_url=state["repo_url"],
                     repo_name=state["repo_name"],
-                    history=clean_tools(messages, self._tokenizer, 4, max_tool_content),
+                    history=await aclean_tools(messages, self._tokenizer, 4, max_tool_content),
                 )
                 step_result = await self._do_research_iteration(state, config, step, max_tool_content, global_config)
                 if step_result.plan_response:
@@ -154,7 +154,7 @@ class CodeResearchNodes:
                 max_iterations=max_iterations,
                 repo_url=state["repo_url"],
                 repo_name=state["repo_name"],
-                history=clean_tools(messages, self._tokenizer, -1, max_tool_content),
+                history=await aclean_tools(messages, self._tokenizer, -1, max_tool_content),
             )
 
             chunks_size = global_config.repo_analysis.research.report_chunk_size
@@ -217,7 +217,7 @@ class CodeResearchNodes:
         sum_tokens_limit = global_config.repo_analysis.research.history_limits.summarize
         sum_truncate = None if sum_tokens_limit <= 0 else Truncate(tokenizer=self._tokenizer, limit=sum_tokens_limit)
         sum_response = await models.ainvoke(config, sum_prompt, models.InvokeParams(
-            history=clean_tools(updated_history, self._tokenizer, -1, max_tool_content),
+            history=await aclean_tools(updated_history, self._tokenizer, -1, max_tool_content),
             history_truncate=sum_truncate,
         ), log_params=p)
         sum_response.response_metadata["iteration"] = step.iteration
@@ -267,7 +267,7 @@ class CodeResearchNodes:
     ) -> AnalysisResult:
         p = {"op": "code_research", "node": "produce_analysis", "iteration": step.iteration, **_st(state)}
         # Check if history needs chunking
-        total_tokens = count_messages_tokens(step.history, self._tokenizer)
+        total_tokens = await acount_messages_tokens(step.history, self._tokenizer)
         _log.debug(s_("History token count", total_tokens=total_tokens, **p))
 
         # no need to chunk if total size is under 1.5 chunk size
@@ -288,7 +288,7 @@ class CodeResearchNodes:
             )
 
         _log.info(s_("History exceeds token limit, chunking", total_tokens=total_tokens, **p))
-        chunks = chunk_messages(step.history, self._tokenizer, chunk_threshold_tokens)
+        chunks = await achunk_messages(step.history, self._tokenizer, chunk_threshold_tokens)
         chunk_responses: List[ChunkResponse] = await asyncio.gather(
             *[self._process_chunk(state, config, step, i, chunk) for i, chunk in enumerate(chunks)]
         )
@@ -0,0 +1,179 @@
+import asyncio
+import dataclasses
+import logging
+import threading
+import time
+from typing import Optional, Dict, Callable, Awaitable, TypeVar
+
+from dev_observer.api.types.ai_pb2 import ModelConfig
+from dev_observer.log import s_
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_min_backoff_sec = 1.0
+_max_backoff_sec = 60.0
+_concurrency_poll_sec = 0.05
+
+
+@dataclasses.dataclass
+class ModelLimits:
+    """Budgets for a model or a provider. Zero means unlimited."""
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    max_concurrency: int = 0
+
+
+class _MinuteBudget:
+    """Spreads spending of a per-minute budget over time, allowing to use up to a full minute of it at once."""
+    _per_minute: int
+    # Time at which the already reserved budget is paid off.
+    _paid_off_at: float = 0.0
+
+    def __init__(self, per_minute: int):
+        self._per_minute = per_minute
+
+    def reserve(self, now: float, amount: int, scale: float) -> float:
+        """Reserves `amount` and returns the earliest time it can be spent at."""
+        cost = min(amount, self._per_minute) * 60.0 / (self._per_minute * scale)
+        paid_off_at = max(self._paid_off_at, now)
+        self._paid_off_at = paid_off_at + cost
+        return max(now, paid_off_at + cost - 60.0)
+
+
+class _ModelLimiter:
+    _limits: ModelLimits
+    _requests: Optional[_MinuteBudget] = None
+    _tokens: Optional[_MinuteBudget] = None
+    _running: int = 0
+    # Fraction of the configured budgets in use, lowered on rate limit errors and slowly restored on success.
+    _scale: float = 1.0
+    _blocked_until: float = 0.0
+    _backoff: float = 0.0
+
+    def __init__(self, limits: ModelLimits):
+        self._limits = limits
+        self._lock = threading.Lock()
+        if limits.requests_per_minute > 0:
+            self._requests = _MinuteBudget(limits.requests_per_minute)
+        if limits.tokens_per_minute > 0:
+            self._tokens = _MinuteBudget(limits.tokens_per_minute)
+
+    async def acquire(self, tokens: int):
+        while True:
+            with self._lock:
+                if self._limits.max_concurrency <= 0 or self._running < self._limits.max_concurrency:
+                    self._running += 1
+                    break
+            await asyncio.sleep(_concurrency_poll_sec)
+        try:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._blocked_until)
+                if self._requests is not None:
+                    start = max(start, self._requests.reserve(now, 1, self._scale))
+                if self._tokens is not None:
+                    start = max(start, self._tokens.reserve(now, tokens, self._scale))
+            if start > now:
+                await asyncio.sleep(start - now)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            self._running -= 1
+
+    def charge_tokens(self, tokens: int):
+        with self._lock:
+            if self._tokens is not None and tokens > 0:
+                self._tokens.reserve(time.monotonic(), tokens, self._scale)
+
+    def on_success(self):
+        with self._lock:
+            self._backoff = 0.0
+            self._scale = min(1.0, self._scale * 1.05)
+
+    def on_rate_limited(self, retry_after: Optional[float]) -> float:
+        with self._lock:
+            self._backoff = min(_max_backoff_sec, max(_min_backoff_sec, self._backoff * 2))
+            delay = max(self._backoff, retry_after or 0.0)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            self._scale = max(0.1, self._scale / 2)
+            return delay
+
+
+class RateLimiter:
+    """Process-wide limiter for LLM calls, keyed by model provider and name.
+
+    Limits are looked up by "<provider>:<model_name>", then by "<provider>", then fall back to `default`.
+    Calls hitting provider rate limits are retried with exponential backoff, which also blocks and temporarily
+    slows down other calls to the same model. Safe to share between threads running their own event loops.
+    """
+    _limits: Dict[str, ModelLimits]
+    _default: ModelLimits
+    _max_retries: int
+    _models: Dict[str, _ModelLimiter]
+
+    def __init__(self, limits: Optional[Dict[str, ModelLimits]] = None, default: Optional[ModelLimits] = None,
+                 max_retries: int = 3):
+        self._limits = limits or {}
+        self._default = default or ModelLimits()
+        self._max_retries = max_retries
+        self._models = {}
+        self._lock = threading.Lock()
+
+    async def run(self, model: ModelConfig, input_tokens: int, fn: Callable[[], Awaitable[T]],
+                  output_tokens: Optional[Callable[[T], int]] = None) -> T:
+        limiter = self._get(model)
+        attempt = 0
+        while True:
+            await limiter.acquire(input_tokens)
+            try:
+                result = await fn()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self._max_retries:
+                    raise
+                attempt += 1
+                delay = limiter.on_rate_limited(_retry_after(e))
+                _log.warning(s_("Model rate limited, backing off",
+                                provider=model.provider, model=model.model_name, attempt=attempt, delay=delay))
+                continue
+            finally:
+                limiter.release()
+            limiter.on_success()
+            if output_tokens is not None:
+                limiter.charge_tokens(output_tokens(result))
+            return result
+
+    def _get(self, model: ModelConfig) -> _ModelLimiter:
+        key = f"{model.provider}:{model.model_name}"
+        with self._lock:
+            limiter = self._models.get(key)
+            if limiter is None:
+                limits = self._limits.get(key, self._limits.get(model.provider, self._default))
+                limiter = _ModelLimiter(limits)
+                self._models[key] = limiter
+            return limiter
+
+
+def is_rate_limit_error(e: BaseException) -> bool:
+    # Providers use different client libraries, so detect by status code and naming instead of exception types.
+    for obj in [e, getattr(e, "response", None)]:
+        for attr in ["status_code", "code", "status"]:
+            if getattr(obj, attr, None) == 429:
+                return True
+    name = type(e).__name__
+    return "RateLimit" in name or "ResourceExhausted" in name or "TooManyRequests" in name
+
+
+def _retry_after(e: BaseException) -> Optional[float]:
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
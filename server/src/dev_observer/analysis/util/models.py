@@ -4,7 +4,7 @@ import json
 import logging
 import os
 import re
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Callable
 
 import vertexai
 from google.oauth2 import service_account
@@ -15,6 +15,8 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
 
+from dev_observer.analysis.cache.response_cache import ResponseCache, cache_key
+from dev_observer.analysis.util.limiter import RateLimiter
 from dev_observer.analysis.util.usage import extract_usage
 from dev_observer.api.types.ai_pb2 import ModelConfig
 from dev_observer.api.types.repo_pb2 import ToolCallResult
@@ -43,6 +45,39 @@ else:
     _log.info("Vertex AI init skipped")
 
 
+_rate_limiter: RateLimiter = RateLimiter()
+_limiter_tokenizer: Optional[TokenizerProvider] = None
+_response_cache: Optional[ResponseCache] = None
+
+
+def configure_rate_limiter(limiter: RateLimiter, tokenizer: Optional[TokenizerProvider] = None):
+    """Sets the limiter applied to all model calls. `tokenizer` is used to estimate input tokens."""
+    global _rate_limiter, _limiter_tokenizer
+    _rate_limiter = limiter
+    _limiter_tokenizer = tokenizer
+
+
+def configure_response_cache(cache: Optional[ResponseCache]):
+    """Sets the cache consulted before all model calls, `None` disables caching."""
+    global _response_cache
+    _response_cache = cache
+
+
+async def estimate_input_tokens(messages: List[BaseMessage]) -> int:
+    texts = [_text_parts(m.content) for m in messages]
+    tokenizer = _limiter_tokenizer
+    if tokenizer is None:
+        # Rough estimate of ~4 characters per token.
+        return sum(len(t) for t in texts) // 4
+    return sum(await tokenizer.acount(texts))
+
+
+def _text_parts(content: Union[str, list[Union[str, dict]]]) -> str:
+    if isinstance(content, str):
+        return content
+    return "\n".join(p if isinstance(p, str) else str(p.get("text", "")) for p in content)
+
+
 def model_from_config(config: ModelConfig) -> BaseChatModel:
     return init_chat_model(f"{config.provider}:{config.model_name}")
 
@@ -100,7 +135,7 @@ async def ainvoke(
         history = params.history
         if len(history) > 0 and params.history_truncate is not None:
             tr = params.history_truncate
-            history = truncate_history(history, tr.tokenizer, tr.limit)
+            history = await atruncate_history(history, tr.tokenizer, tr.limit)
         messages = [*messages, *history]
         log_extra.update({"prompt_config": prompt.config, "prompt_name": prompt_name})
         _log.debug(s_("Creating prompt", **log_extra))
@@ -109,7 +144,21 @@ async def ainvoke(
             pt.metadata = {"langfuse_prompt": prompt.langfuse_prompt}
         pv = await pt.ainvoke(params.input, config=config)
         _log.debug(s_("Invoking model", **log_extra))
-        response = await model.ainvoke(pv, config=config)
+        rendered = pv.to_messages()
+
+        async def invoke() -> BaseMessage:
+            return await _rate_limiter.run(
+                prompt_config.model,
+                await estimate_input_tokens(rendered),
+                lambda: model.ainvoke(pv, config=config),
+                output_tokens=lambda r: extract_usage(r).output_tokens,
+            )
+
+        cache = _response_cache
+        if cache is None:
+            response = await invoke()
+        else:
+            response = await cache.get_or_invoke(cache_key(prompt_config.model, rendered, params.tools), invoke)
         _log.debug(s_("Model replied", usage=extract_usage(response), **log_extra))
         return response
     except BaseException as e:
@@ -141,6 +190,14 @@ def count_messages_tokens(messages: List[BaseMessage], tokenizer: TokenizerProvi
     return total_tokens
 
 
+async def acount_messages_tokens(messages: List[BaseMessage], tokenizer: TokenizerProvider) -> int:
+    return sum(await _acount_each(messages, tokenizer))
+
+
+async def _acount_each(messages: List[BaseMessage], tokenizer: TokenizerProvider) -> List[int]:
+    return await tokenizer.acount([to_str_content(m.content) for m in messages])
+
+
 def chunk_messages(
         messages: List[BaseMessage],
         tokenizer: TokenizerProvider,
@@ -148,6 +205,21 @@ def chunk_messages(
         boundary_tag: str = "iteration",
 ) -> List[List[BaseMessage]]:
     """Chunk messages into groups, splitting when token limit is exceeded but only at tag boundaries."""
+    return _chunk_counted(messages, [count_message_tokens(m, tokenizer) for m in messages], max_tokens, boundary_tag)
+
+
+async def achunk_messages(
+        messages: List[BaseMessage],
+        tokenizer: TokenizerProvider,
+        max_tokens: int = 200000,
+        boundary_tag: str = "iteration",
+) -> List[List[BaseMessage]]:
+    return _chunk_counted(messages, await _acount_each(messages, tokenizer), max_tokens, boundary_tag)
+
+
+def _chunk_counted(
+        messages: List[BaseMessage], counts: List[int], max_tokens: int, boundary_tag: str,
+) -> List[List[BaseMessage]]:
     if not messages:
         return []
     chunks = []
@@ -156,8 +228,7 @@ def chunk_messages(
     current_tag = None
     needs_split = False  # Flag to track when we need to split at next tag boundary
 
-    for message in messages:
-        message_tokens = count_message_tokens(message, tokenizer)
+    for message, message_tokens in zip(messages, counts):
         message_tag = message.response_metadata.get(boundary_tag, None)
         at_boundary = current_tag is not None and message_tag != current_tag
 
@@ -223,6 +294,16 @@ def truncate_history(history: List[BaseMessage], tokenizer: TokenizerProvider, m
     Returns:
         New list of messages with ToolMessage content truncated when necessary
     """
+    return _truncate_counted(history, [count_message_tokens(m, tokenizer) for m in history], max_tokens)
+
+
+async def atruncate_history(
+        history: List[BaseMessage], tokenizer: TokenizerProvider, max_tokens: int,
+) -> List[BaseMessage]:
+    return _truncate_counted(history, await _acount_each(history, tokenizer), max_tokens)
+
+
+def _truncate_counted(history: List[BaseMessage], counts: List[int], max_tokens: int) -> List[BaseMessage]:
     if not history:
         return []
     
@@ -231,12 +312,9 @@ def truncate_history(history: List[BaseMessage], tokenizer: TokenizerProvider, m
     tool_message_indices = []
     for i, msg in enumerate(history):
         result.append(msg)
+        current_tokens += counts[i]
         if isinstance(msg, ToolMessage):
-            str_content = to_str_content(msg.content)
-            current_tokens += len(tokenizer.encode(str_content))
             tool_message_indices.append(i)
-        else:
-            current_tokens += count_message_tokens(msg, tokenizer)
     
     if current_tokens <= max_tokens:
         return result
@@ -248,7 +326,7 @@ def truncate_history(history: List[BaseMessage], tokenizer: TokenizerProvider, m
             
         original_msg = result[i]
         if isinstance(original_msg, ToolMessage):
-            old_tokens = len(tokenizer.encode(to_str_content(original_msg.content)))
+            old_tokens = counts[i]
             
             truncated_msg = ToolMessage(
                 content=_truncated_str,
@@ -293,56 +371,66 @@ def clean_tools(
         New list of messages with ToolMessage content truncated when necessary
     """
 
-    if not messages:
-        return []
+    boundary = _clean_boundary(messages, depth)
+    if boundary is None:
+        return messages[:]  # Return a shallow copy
+    max_tool_tokens = _tool_tokens_limit(max_tool_tokens)
+    return [
+        _clean_or(msg, i, boundary, lambda m: truncate_tool_msg(m, tokenizer, max_tool_tokens))
+        for i, msg in enumerate(messages)
+    ]
 
-    if max_tool_tokens <= 0:
-        max_tool_tokens = None
 
-    result = []
+async def aclean_tools(
+        messages: List[BaseMessage],
+        tokenizer: TokenizerProvider,
+        depth: int = 0,
+        max_tool_tokens: Optional[int] = None,
+) -> List[BaseMessage]:
+    boundary = _clean_boundary(messages, depth)
+    if boundary is None:
+        return messages[:]
+    to_truncate = [m for i, m in enumerate(messages) if isinstance(m, ToolMessage) and i >= boundary]
+    truncated = await atruncate_tool_msgs(to_truncate, tokenizer, _tool_tokens_limit(max_tool_tokens))
+    by_id = {id(m): t for m, t in zip(to_truncate, truncated)}
+    return [_clean_or(msg, i, boundary, lambda m: by_id[id(m)]) for i, msg in enumerate(messages)]
 
+
+def _clean_boundary(messages: List[BaseMessage], depth: int) -> Optional[int]:
+    """Returns the index before which ToolMessages are cleaned and after which they are truncated.
+
+    `None` means that messages should be returned as is.
+    """
     if depth < 0:
         # Do not clean but truncate every message
-        for msg in messages:
-            if isinstance(msg, ToolMessage):
-                result.append(truncate_tool_msg(msg, tokenizer, max_tool_tokens))
-            else:
-                result.append(msg)
-        return result
-
+        return 0
     if depth == 0:
-        for msg in messages:
-            if isinstance(msg, ToolMessage):
-                result.append(clean_tool_msg(msg))
-            else:
-                result.append(msg)
-        return result
+        return len(messages)
 
     # Find the latest AIMessage at the specified depth
-    ai_message_indices = []
-    for i, msg in enumerate(messages):
-        if isinstance(msg, AIMessage):
-            ai_message_indices.append(i)
+    ai_message_indices = [i for i, msg in enumerate(messages) if isinstance(msg, AIMessage)]
 
     # If we don't have enough AIMessages for the specified depth, clean nothing
     if len(ai_message_indices) < depth:
-        return messages[:]  # Return a shallow copy
+        return None
 
     # Get the index of the latest AIMessage at the specified depth
     # depth=1 means the latest AIMessage, depth=2 means the second-to-latest, etc.
-    latest_ai_index = ai_message_indices[-depth]
+    return ai_message_indices[-depth]
 
-    # Clean ToolMessages only before this AIMessage
-    for i, msg in enumerate(messages):
-        if isinstance(msg, ToolMessage):
-            if i < latest_ai_index:
-                result.append(clean_tool_msg(msg))
-            else:
-                result.append(truncate_tool_msg(msg, tokenizer, max_tool_tokens))
-        else:
-            result.append(msg)
 
-    return result
+def _clean_or(
+        msg: BaseMessage, index: int, boundary: int, truncate: Callable[[ToolMessage], ToolMessage],
+) -> BaseMessage:
+    if not isinstance(msg, ToolMessage):
+        return msg
+    return clean_tool_msg(msg) if index < boundary else truncate(msg)
+
+
+def _tool_tokens_limit(max_tool_tokens: Optional[int]) -> Optional[int]:
+    if max_tool_tokens is None or max_tool_tokens <= 0:
+        return None
+    return max_tool_tokens
 
 
 def truncate_tool_msg(
@@ -368,6 +456,25 @@ def truncate_tool_msg(
     return ToolMessage(content=str_content, tool_call_id=msg.tool_call_id, status=msg.status)
 
 
+async def atruncate_tool_msgs(
+        msgs: List[ToolMessage],
+        tokenizer: TokenizerProvider,
+        max_tool_tokens: Optional[int] = None,
+) -> List[ToolMessage]:
+    """Same as `truncate_tool_msg` for every message, encoding all of them in a single batch."""
+    if max_tool_tokens is None:
+        return msgs
+    contents = [to_str_content(m.content) for m in msgs]
+    encoded = await tokenizer.aencode_batch(contents)
+    result: List[ToolMessage] = []
+    for msg, str_content, tokens in zip(msgs, contents, encoded):
+        if len(tokens) > (max_tool_tokens + 500):
+            truncated_content = await tokenizer.adecode(tokens[:max_tool_tokens])
+            str_content = truncated_content + " [REDACTED: CONTENT TOO LONG]"
+        result.append(ToolMessage(content=str_content, tool_call_id=msg.tool_call_id, status=msg.status))
+    return result
+
+
 def clean_tool_msg(msg: ToolMessage, threshold: int = 0) -> ToolMessage:
     str_content = to_str_content(msg.content)
     if len(str_content) > threshold:
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from dev_observer.api.types import observations_pb2 as dev__observer_dot_api_dot_types_dot_observations__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#dev_observer/api/types/config.proto\x12\x1d\x64\x65v_observer.api.types.config\x1a)dev_observer/api/types/observations.proto\"\xaa\x02\n\x0cGlobalConfig\x12?\n\x08\x61nalysis\x18\x01 \x01(\x0b\x32-.dev_observer.api.types.config.AnalysisConfig\x12H\n\rrepo_analysis\x18\x02 \x01(\x0b\x32\x31.dev_observer.api.types.config.RepoAnalysisConfig\x12N\n\x10website_crawling\x18\x03 \x01(\x0b\x32\x34.dev_observer.api.types.config.WebsiteCrawlingConfig\x12?\n\x08periodic\x18\x04 \x01(\x0b\x32-.dev_observer.api.types.config.PeriodicConfig\"%\n\x0ePeriodicConfig\x12\x13\n\x0b\x63oncurrency\x18\x01 \x01(\x05\"\xda\x03\n\x0e\x41nalysisConfig\x12\x45\n\x0erepo_analyzers\x18\x01 \x03(\x0b\x32-.dev_observer.api.types.observations.Analyzer\x12\x45\n\x0esite_analyzers\x18\x02 \x03(\x0b\x32-.dev_observer.api.types.observations.Analyzer\x12\x17\n\x0f\x64isable_masking\x18\x03 \x01(\x08\x12X\n\x1c\x64\x65\x66\x61ult_git_changes_analyzer\x18\x04 \x01(\x0b\x32-.dev_observer.api.types.observations.AnalyzerH\x00\x88\x01\x01\x12_\n#default_aggregated_summary_analyzer\x18\x05 \x01(\x0b\x32-.dev_observer.api.types.observations.AnalyzerH\x01\x88\x01\x01\x42\x1f\n\x1d_default_git_changes_analyzerB&\n$_default_aggregated_summary_analyzerJ\x04\x08\x06\x10\x07R\x17\x63ode_research_analyzers\"W\n\x14UserManagementStatus\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x1b\n\x0epublic_api_key\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x11\n\x0f_public_api_key\"\xff\x06\n\x12RepoAnalysisConfig\x12J\n\x07\x66latten\x18\x01 \x01(\x0b\x32\x39.dev_observer.api.types.config.RepoAnalysisConfig.Flatten\x12\x1f\n\x17processing_interval_sec\x18\x02 \x01(\x05\x12\x10\n\x08\x64isabled\x18\x03 \x01(\x08\x12L\n\x08research\x18\x04 \x01(\x0b\x32:.dev_observer.api.types.config.RepoAnalysisConfig.Research\x1a\x93\x02\n\x07\x46latten\x12\x10\n\x08\x63ompress\x18\x01 \x01(\x08\x12\x1a\n\x12remove_empty_lines\x18\x02 \x01(\x08\x12\x11\n\tout_style\x18\x03 \x01(\t\x12\x1c\n\x14max_tokens_per_chunk\x18\x04 \x01(\x05\x12\x18\n\x10max_repo_size_mb\x18\x05 \x01(\x05\x12\x16\n\x0eignore_pattern\x18\x06 \x01(\t\x12\x1f\n\x17large_repo_threshold_mb\x18\x07 \x01(\x05\x12!\n\x19large_repo_ignore_pattern\x18\x08 \x01(\t\x12\x16\n\x0e\x63ompress_large\x18\t \x01(\x08\x12\x1b\n\x13max_file_size_bytes\x18\n \x01(\x05\x1a\xcb\x02\n\x08Research\x12\x18\n\x10max_repo_size_mb\x18\x01 \x01(\x05\x12\x16\n\x0emax_iterations\x18\x02 \x01(\x05\x12\x1b\n\x0egeneral_prefix\x18\x03 \x01(\tH\x00\x88\x01\x01\x12@\n\tanalyzers\x18\x04 \x03(\x0b\x32-.dev_observer.api.types.observations.Analyzer\x12\x19\n\x11report_chunk_size\x18\x05 \x01(\x05\x12\x1f\n\x17max_tool_content_tokens\x18\x06 \x01(\x05\x12_\n\x0ehistory_limits\x18\x07 \x01(\x0b\x32G.dev_observer.api.types.config.RepoAnalysisConfig.ResearchHistoryLimitsB\x11\n\x0f_general_prefix\x1a\x38\n\x15ResearchHistoryLimits\x12\x0c\n\x04plan\x18\x01 \x01(\x05\x12\x11\n\tsummarize\x18\x02 \x01(\x05\"\xa1\x01\n\x15WebsiteCrawlingConfig\x12$\n\x1cwebsite_scan_timeout_seconds\x18\x01 \x01(\x05\x12\'\n\x1fscrapy_response_timeout_seconds\x18\x02 \x01(\x05\x12\x13\n\x0b\x63rawl_depth\x18\x03 \x01(\x05\x12$\n\x1ctimeout_without_data_seconds\x18\x04 \x01(\x05\x42\x38Z6github.com/devplaninc/contextify/clients/go/contextifyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#dev_observer/api/types/config.proto\x12\x1d\x64\x65v_observer.api.types.config\x1a)dev_observer/api/types/observations.proto\"\xaa\x02\n\x0cGlobalConfig\x12?\n\x08\x61nalysis\x18\x01 \x01(\x0b\x32-.dev_observer.api.types.config.AnalysisConfig\x12H\n\rrepo_analysis\x18\x02 \x01(\x0b\x32\x31.dev_observer.api.types.config.RepoAnalysisConfig\x12N\n\x10website_crawling\x18\x03 \x01(\x0b\x32\x34.dev_observer.api.types.config.WebsiteCrawlingConfig\x12?\n\x08periodic\x18\x04 \x01(\x0b\x32-.dev_observer.api.types.config.PeriodicConfig\"\xe6\x01\n\x0ePeriodicConfig\x12\x13\n\x0b\x63oncurrency\x18\x01 \x01(\x05\x12\x1a\n\x12lease_duration_sec\x18\x02 \x01(\x05\x12T\n\rentity_limits\x18\x03 \x03(\x0b\x32=.dev_observer.api.types.config.PeriodicConfig.EntityTypeLimit\x1aM\n\x0f\x45ntityTypeLimit\x12\x13\n\x0b\x65ntity_type\x18\x01 \x01(\t\x12\x13\n\x0b\x63oncurrency\x18\x02 \x01(\x05\x12\x10\n\x08priority\x18\x03 \x01(\x05\"\x88\x05\n\x0e\x41nalysisConfig\x12\x45\n\x0erepo_analyzers\x18\x01 \x03(\x0b\x32-.dev_observer.api.types.observations.Analyzer\x12\x45\n\x0esite_analyzers\x18\x02 \x03(\x0b\x32-.dev_observer.api.types.observations.Analyzer\x12\x17\n\x0f\x64isable_masking\x18\x03 \x01(\x08\x12X\n\x1c\x64\x65\x66\x61ult_git_changes_analyzer\x18\x04 \x01(\x0b\x32-.dev_observer.api.types.observations.AnalyzerH\x00\x88\x01\x01\x12_\n#default_aggregated_summary_analyzer\x18\x05 \x01(\x0b\x32-.dev_observer.api.types.observations.AnalyzerH\x01\x88\x01\x01\x12\x1c\n\x14\x61nalyzer_concurrency\x18\x07 \x01(\x05\x12\x17\n\x0f\x63ombine_fan_out\x18\x08 \x01(\x05\x12\x19\n\x11\x63ombine_max_depth\x18\t \x01(\x05\x12\x19\n\x11\x63hunk_concurrency\x18\n \x01(\x05\x12\x1a\n\x12pipelined_analysis\x18\x0b \x01(\x08\x12#\n\x1bpipeline_max_pending_chunks\x18\x0c \x01(\x05\x42\x1f\n\x1d_default_git_changes_analyzerB&\n$_default_aggregated_summary_analyzerJ\x04\x08\x06\x10\x07R\x17\x63ode_research_analyzers\"W\n\x14UserManagementStatus\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x1b\n\x0epublic_api_key\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x11\n\x0f_public_api_key\"\xfb\x07\n\x12RepoAnalysisConfig\x12J\n\x07\x66latten\x18\x01 \x01(\x0b\x32\x39.dev_observer.api.types.config.RepoAnalysisConfig.Flatten\x12\x1f\n\x17processing_interval_sec\x18\x02 \x01(\x05\x12\x10\n\x08\x64isabled\x18\x03 \x01(\x08\x12L\n\x08research\x18\x04 \x01(\x0b\x32:.dev_observer.api.types.config.RepoAnalysisConfig.Research\x1a\x8f\x03\n\x07\x46latten\x12\x10\n\x08\x63ompress\x18\x01 \x01(\x08\x12\x1a\n\x12remove_empty_lines\x18\x02 \x01(\x08\x12\x11\n\tout_style\x18\x03 \x01(\t\x12\x1c\n\x14max_tokens_per_chunk\x18\x04 \x01(\x05\x12\x18\n\x10max_repo_size_mb\x18\x05 \x01(\x05\x12\x16\n\x0eignore_pattern\x18\x06 \x01(\t\x12\x1f\n\x17large_repo_threshold_mb\x18\x07 \x01(\x05\x12!\n\x19large_repo_ignore_pattern\x18\x08 \x01(\t\x12\x16\n\x0e\x63ompress_large\x18\t \x01(\x08\x12\x1b\n\x13max_file_size_bytes\x18\n \x01(\x05\x12\x11\n\tflattener\x18\x0b \x01(\t\x12\x16\n\x0e\x62lobless_clone\x18\x0c \x01(\x08\x12\x17\n\x0fsparse_checkout\x18\r \x01(\x08\x12\x19\n\x11\x63lone_timeout_sec\x18\x0e \x01(\x05\x12\x1b\n\x13max_diff_size_bytes\x18\x0f \x01(\x05\x1a\xcb\x02\n\x08Research\x12\x18\n\x10max_repo_size_mb\x18\x01 \x01(\x05\x12\x16\n\x0emax_iterations\x18\x02 \x01(\x05\x12\x1b\n\x0egeneral_prefix\x18\x03 \x01(\tH\x00\x88\x01\x01\x12@\n\tanalyzers\x18\x04 \x03(\x0b\x32-.dev_observer.api.types.observations.Analyzer\x12\x19\n\x11report_chunk_size\x18\x05 \x01(\x05\x12\x1f\n\x17max_tool_content_tokens\x18\x06 \x01(\x05\x12_\n\x0ehistory_limits\x18\x07 \x01(\x0b\x32G.dev_observer.api.types.config.RepoAnalysisConfig.ResearchHistoryLimitsB\x11\n\x0f_general_prefix\x1a\x38\n\x15ResearchHistoryLimits\x12\x0c\n\x04plan\x18\x01 \x01(\x05\x12\x11\n\tsummarize\x18\x02 \x01(\x05\"\xa1\x01\n\x15WebsiteCrawlingConfig\x12$\n\x1cwebsite_scan_timeout_seconds\x18\x01 \x01(\x05\x12\'\n\x1fscrapy_response_timeout_seconds\x18\x02 \x01(\x05\x12\x13\n\x0b\x63rawl_depth\x18\x03 \x01(\x05\x12$\n\x1ctimeout_without_data_seconds\x18\x04 \x01(\x05\x42\x38Z6github.com/devplaninc/contextify/clients/go/contextifyb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,20 +35,22 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._serialized_options = b'Z6github.com/devplaninc/contextify/clients/go/contextify'
   _globals['_GLOBALCONFIG']._serialized_start=114
   _globals['_GLOBALCONFIG']._serialized_end=412
-  _globals['_PERIODICCONFIG']._serialized_start=414
-  _globals['_PERIODICCONFIG']._serialized_end=451
-  _globals['_ANALYSISCONFIG']._serialized_start=454
-  _globals['_ANALYSISCONFIG']._serialized_end=928
-  _globals['_USERMANAGEMENTSTATUS']._serialized_start=930
-  _globals['_USERMANAGEMENTSTATUS']._serialized_end=1017
-  _globals['_REPOANALYSISCONFIG']._serialized_start=1020
-  _globals['_REPOANALYSISCONFIG']._serialized_end=1915
-  _globals['_REPOANALYSISCONFIG_FLATTEN']._serialized_start=1248
-  _globals['_REPOANALYSISCONFIG_FLATTEN']._serialized_end=1523
-  _globals['_REPOANALYSISCONFIG_RESEARCH']._serialized_start=1526
-  _globals['_REPOANALYSISCONFIG_RESEARCH']._serialized_end=1857
-  _globals['_REPOANALYSISCONFIG_RESEARCHHISTORYLIMITS']._serialized_start=1859
-  _globals['_REPOANALYSISCONFIG_RESEARCHHISTORYLIMITS']._serialized_end=1915
-  _globals['_WEBSITECRAWLINGCONFIG']._serialized_start=1918
-  _globals['_WEBSITECRAWLINGCONFIG']._serialized_end=2079
+  _globals['_PERIODICCONFIG']._serialized_start=415
+  _globals['_PERIODICCONFIG']._serialized_end=645
+  _globals['_PERIODICCONFIG_ENTITYTYPELIMIT']._serialized_start=568
+  _globals['_PERIODICCONFIG_ENTITYTYPELIMIT']._serialized_end=645
+  _globals['_ANALYSISCONFIG']._serialized_start=648
+  _globals['_ANALYSISCONFIG']._serialized_end=1296
+  _globals['_USERMANAGEMENTSTATUS']._serialized_start=1298
+  _globals['_USERMANAGEMENTSTATUS']._serialized_end=1385
+  _globals['_REPOANALYSISCONFIG']._serialized_start=1388
+  _globals['_REPOANALYSISCONFIG']._serialized_end=2407
+  _globals['_REPOANALYSISCONFIG_FLATTEN']._serialized_start=1616
+  _globals['_REPOANALYSISCONFIG_FLATTEN']._serialized_end=2015
+  _globals['_REPOANALYSISCONFIG_RESEARCH']._serialized_start=2018
+  _globals['_REPOANALYSISCONFIG_RESEARCH']._serialized_end=2349
+  _globals['_REPOANALYSISCONFIG_RESEARCHHISTORYLIMITS']._serialized_start=2351
+  _globals['_REPOANALYSISCONFIG_RESEARCHHISTORYLIMITS']._serialized_end=2407
+  _globals['_WEBSITECRAWLINGCONFIG']._serialized_start=2410
+  _globals['_WEBSITECRAWLINGCONFIG']._serialized_end=2571
 # @@protoc_insertion_point(module_scope)
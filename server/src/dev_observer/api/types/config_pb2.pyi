@@ -20,24 +20,49 @@ class GlobalConfig(_message.Message):
     def __init__(self, analysis: _Optional[_Union[AnalysisConfig, _Mapping]] = ..., repo_analysis: _Optional[_Union[RepoAnalysisConfig, _Mapping]] = ..., website_crawling: _Optional[_Union[WebsiteCrawlingConfig, _Mapping]] = ..., periodic: _Optional[_Union[PeriodicConfig, _Mapping]] = ...) -> None: ...
 
 class PeriodicConfig(_message.Message):
-    __slots__ = ("concurrency",)
+    __slots__ = ("concurrency", "lease_duration_sec", "entity_limits")
+    class EntityTypeLimit(_message.Message):
+        __slots__ = ("entity_type", "concurrency", "priority")
+        ENTITY_TYPE_FIELD_NUMBER: _ClassVar[int]
+        CONCURRENCY_FIELD_NUMBER: _ClassVar[int]
+        PRIORITY_FIELD_NUMBER: _ClassVar[int]
+        entity_type: str
+        concurrency: int
+        priority: int
+        def __init__(self, entity_type: _Optional[str] = ..., concurrency: _Optional[int] = ..., priority: _Optional[int] = ...) -> None: ...
     CONCURRENCY_FIELD_NUMBER: _ClassVar[int]
+    LEASE_DURATION_SEC_FIELD_NUMBER: _ClassVar[int]
+    ENTITY_LIMITS_FIELD_NUMBER: _ClassVar[int]
     concurrency: int
-    def __init__(self, concurrency: _Optional[int] = ...) -> None: ...
+    lease_duration_sec: int
+    entity_limits: _containers.RepeatedCompositeFieldContainer[PeriodicConfig.EntityTypeLimit]
+    def __init__(self, concurrency: _Optional[int] = ..., lease_duration_sec: _Optional[int] = ..., entity_limits: _Optional[_Iterable[_Union[PeriodicConfig.EntityTypeLimit, _Mapping]]] = ...) -> None: ...
 
 class AnalysisConfig(_message.Message):
-    __slots__ = ("repo_analyzers", "site_analyzers", "disable_masking", "default_git_changes_analyzer", "default_aggregated_summary_analyzer")
+    __slots__ = ("repo_analyzers", "site_analyzers", "disable_masking", "default_git_changes_analyzer", "default_aggregated_summary_analyzer", "analyzer_concurrency", "combine_fan_out", "combine_max_depth", "chunk_concurrency", "pipelined_analysis", "pipeline_max_pending_chunks")
     REPO_ANALYZERS_FIELD_NUMBER: _ClassVar[int]
     SITE_ANALYZERS_FIELD_NUMBER: _ClassVar[int]
     DISABLE_MASKING_FIELD_NUMBER: _ClassVar[int]
     DEFAULT_GIT_CHANGES_ANALYZER_FIELD_NUMBER: _ClassVar[int]
     DEFAULT_AGGREGATED_SUMMARY_ANALYZER_FIELD_NUMBER: _ClassVar[int]
+    ANALYZER_CONCURRENCY_FIELD_NUMBER: _ClassVar[int]
+    COMBINE_FAN_OUT_FIELD_NUMBER: _ClassVar[int]
+    COMBINE_MAX_DEPTH_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_CONCURRENCY_FIELD_NUMBER: _ClassVar[int]
+    PIPELINED_ANALYSIS_FIELD_NUMBER: _ClassVar[int]
+    PIPELINE_MAX_PENDING_CHUNKS_FIELD_NUMBER: _ClassVar[int]
     repo_analyzers: _containers.RepeatedCompositeFieldContainer[_observations_pb2.Analyzer]
     site_analyzers: _containers.RepeatedCompositeFieldContainer[_observations_pb2.Analyzer]
     disable_masking: bool
     default_git_changes_analyzer: _observations_pb2.Analyzer
     default_aggregated_summary_analyzer: _observations_pb2.Analyzer
-    def __init__(self, repo_analyzers: _Optional[_Iterable[_Union[_observations_pb2.Analyzer, _Mapping]]] = ..., site_analyzers: _Optional[_Iterable[_Union[_observations_pb2.Analyzer, _Mapping]]] = ..., disable_masking: bool = ..., default_git_changes_analyzer: _Optional[_Union[_observations_pb2.Analyzer, _Mapping]] = ..., default_aggregated_summary_analyzer: _Optional[_Union[_observations_pb2.Analyzer, _Mapping]] = ...) -> None: ...
+    analyzer_concurrency: int
+    combine_fan_out: int
+    combine_max_depth: int
+    chunk_concurrency: int
+    pipelined_analysis: bool
+    pipeline_max_pending_chunks: int
+    def __init__(self, repo_analyzers: _Optional[_Iterable[_Union[_observations_pb2.Analyzer, _Mapping]]] = ..., site_analyzers: _Optional[_Iterable[_Union[_observations_pb2.Analyzer, _Mapping]]] = ..., disable_masking: bool = ..., default_git_changes_analyzer: _Optional[_Union[_observations_pb2.Analyzer, _Mapping]] = ..., default_aggregated_summary_analyzer: _Optional[_Union[_observations_pb2.Analyzer, _Mapping]] = ..., analyzer_concurrency: _Optional[int] = ..., combine_fan_out: _Optional[int] = ..., combine_max_depth: _Optional[int] = ..., chunk_concurrency: _Optional[int] = ..., pipelined_analysis: bool = ..., pipeline_max_pending_chunks: _Optional[int] = ...) -> None: ...
 
 class UserManagementStatus(_message.Message):
     __slots__ = ("enabled", "public_api_key")
@@ -50,7 +75,7 @@ class UserManagementStatus(_message.Message):
 class RepoAnalysisConfig(_message.Message):
     __slots__ = ("flatten", "processing_interval_sec", "disabled", "research")
     class Flatten(_message.Message):
-        __slots__ = ("compress", "remove_empty_lines", "out_style", "max_tokens_per_chunk", "max_repo_size_mb", "ignore_pattern", "large_repo_threshold_mb", "large_repo_ignore_pattern", "compress_large", "max_file_size_bytes")
+        __slots__ = ("compress", "remove_empty_lines", "out_style", "max_tokens_per_chunk", "max_repo_size_mb", "ignore_pattern", "large_repo_threshold_mb", "large_repo_ignore_pattern", "compress_large", "max_file_size_bytes", "flattener", "blobless_clone", "sparse_checkout", "clone_timeout_sec", "max_diff_size_bytes")
         COMPRESS_FIELD_NUMBER: _ClassVar[int]
         REMOVE_EMPTY_LINES_FIELD_NUMBER: _ClassVar[int]
         OUT_STYLE_FIELD_NUMBER: _ClassVar[int]
@@ -61,6 +86,11 @@ class RepoAnalysisConfig(_message.Message):
         LARGE_REPO_IGNORE_PATTERN_FIELD_NUMBER: _ClassVar[int]
         COMPRESS_LARGE_FIELD_NUMBER: _ClassVar[int]
         MAX_FILE_SIZE_BYTES_FIELD_NUMBER: _ClassVar[int]
+        FLATTENER_FIELD_NUMBER: _ClassVar[int]
+        BLOBLESS_CLONE_FIELD_NUMBER: _ClassVar[int]
+        SPARSE_CHECKOUT_FIELD_NUMBER: _ClassVar[int]
+        CLONE_TIMEOUT_SEC_FIELD_NUMBER: _ClassVar[int]
+        MAX_DIFF_SIZE_BYTES_FIELD_NUMBER: _ClassVar[int]
         compress: bool
         remove_empty_lines: bool
         out_style: str
@@ -71,7 +101,12 @@ class RepoAnalysisConfig(_message.Message):
         large_repo_ignore_pattern: str
         compress_large: bool
         max_file_size_bytes: int
-        def __init__(self, compress: bool = ..., remove_empty_lines: bool = ..., out_style: _Optional[str] = ..., max_tokens_per_chunk: _Optional[int] = ..., max_repo_size_mb: _Optional[int] = ..., ignore_pattern: _Optional[str] = ..., large_repo_threshold_mb: _Optional[int] = ..., large_repo_ignore_pattern: _Optional[str] = ..., compress_large: bool = ..., max_file_size_bytes: _Optional[int] = ...) -> None: ...
+        flattener: str
+        blobless_clone: bool
+        sparse_checkout: bool
+        clone_timeout_sec: int
+        max_diff_size_bytes: int
+        def __init__(self, compress: bool = ..., remove_empty_lines: bool = ..., out_style: _Optional[str] = ..., max_tokens_per_chunk: _Optional[int] = ..., max_repo_size_mb: _Optional[int] = ..., ignore_pattern: _Optional[str] = ..., large_repo_threshold_mb: _Optional[int] = ..., large_repo_ignore_pattern: _Optional[str] = ..., compress_large: bool = ..., max_file_size_bytes: _Optional[int] = ..., flattener: _Optional[str] = ..., blobless_clone: bool = ..., sparse_checkout: bool = ..., clone_timeout_sec: _Optional[int] = ..., max_diff_size_bytes: _Optional[int] = ...) -> None: ...
     class Research(_message.Message):
         __slots__ = ("max_repo_size_mb", "max_iterations", "general_prefix", "analyzers", "report_chunk_size", "max_tool_content_tokens", "history_limits")
         MAX_REPO_SIZE_MB_FIELD_NUMBER: _ClassVar[int]
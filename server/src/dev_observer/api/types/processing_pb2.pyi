@@ -26,7 +26,7 @@ class ProcessingItemKey(_message.Message):
     def __init__(self, github_repo_id: _Optional[str] = ..., website_url: _Optional[str] = ..., request_id: _Optional[str] = ..., periodic_aggregation_id: _Optional[str] = ..., research_git_repo_id: _Optional[str] = ...) -> None: ...
 
 class ProcessingItem(_message.Message):
-    __slots__ = ("key", "next_processing", "last_processed", "last_error", "no_processing", "processing_started_at", "data")
+    __slots__ = ("key", "next_processing", "last_processed", "last_error", "no_processing", "processing_started_at", "data", "worker_id")
     KEY_FIELD_NUMBER: _ClassVar[int]
     NEXT_PROCESSING_FIELD_NUMBER: _ClassVar[int]
     LAST_PROCESSED_FIELD_NUMBER: _ClassVar[int]
@@ -34,6 +34,7 @@ class ProcessingItem(_message.Message):
     NO_PROCESSING_FIELD_NUMBER: _ClassVar[int]
     PROCESSING_STARTED_AT_FIELD_NUMBER: _ClassVar[int]
     DATA_FIELD_NUMBER: _ClassVar[int]
+    WORKER_ID_FIELD_NUMBER: _ClassVar[int]
     key: ProcessingItemKey
     next_processing: _timestamp_pb2.Timestamp
     last_processed: _timestamp_pb2.Timestamp
@@ -41,7 +42,8 @@ class ProcessingItem(_message.Message):
     no_processing: bool
     processing_started_at: _timestamp_pb2.Timestamp
     data: ProcessingItemData
-    def __init__(self, key: _Optional[_Union[ProcessingItemKey, _Mapping]] = ..., next_processing: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_processed: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_error: _Optional[str] = ..., no_processing: bool = ..., processing_started_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., data: _Optional[_Union[ProcessingItemData, _Mapping]] = ...) -> None: ...
+    worker_id: str
+    def __init__(self, key: _Optional[_Union[ProcessingItemKey, _Mapping]] = ..., next_processing: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_processed: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_error: _Optional[str] = ..., no_processing: bool = ..., processing_started_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., data: _Optional[_Union[ProcessingItemData, _Mapping]] = ..., worker_id: _Optional[str] = ...) -> None: ...
 
 class PeriodicAggregation(_message.Message):
     __slots__ = ("params", "schedule")
@@ -67,10 +69,12 @@ class AggregatedSummaryParams(_message.Message):
     def __init__(self, look_back_days: _Optional[int] = ..., end_date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., target: _Optional[_Union[AggregatedSummaryParams.Target, _Mapping]] = ...) -> None: ...
 
 class ProcessingRequest(_message.Message):
-    __slots__ = ("git_changes",)
+    __slots__ = ("git_changes", "analyze_tokens")
     GIT_CHANGES_FIELD_NUMBER: _ClassVar[int]
+    ANALYZE_TOKENS_FIELD_NUMBER: _ClassVar[int]
     git_changes: ProcessGitChangesRequest
-    def __init__(self, git_changes: _Optional[_Union[ProcessGitChangesRequest, _Mapping]] = ...) -> None: ...
+    analyze_tokens: AnalyzeRepoTokensRequest
+    def __init__(self, git_changes: _Optional[_Union[ProcessGitChangesRequest, _Mapping]] = ..., analyze_tokens: _Optional[_Union[AnalyzeRepoTokensRequest, _Mapping]] = ...) -> None: ...
 
 class ProcessGitChangesRequest(_message.Message):
     __slots__ = ("git_repo_id", "look_back_days")
@@ -80,6 +84,14 @@ class ProcessGitChangesRequest(_message.Message):
     look_back_days: int
     def __init__(self, git_repo_id: _Optional[str] = ..., look_back_days: _Optional[int] = ...) -> None: ...
 
+class AnalyzeRepoTokensRequest(_message.Message):
+    __slots__ = ("git_repo_id", "exact")
+    GIT_REPO_ID_FIELD_NUMBER: _ClassVar[int]
+    EXACT_FIELD_NUMBER: _ClassVar[int]
+    git_repo_id: str
+    exact: bool
+    def __init__(self, git_repo_id: _Optional[str] = ..., exact: bool = ...) -> None: ...
+
 class ProcessingItemResult(_message.Message):
     __slots__ = ("id", "key", "error_message", "created_at", "data", "result_data")
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -124,13 +136,25 @@ class ProcessingItemData(_message.Message):
     periodic_aggregation: PeriodicAggregation
     def __init__(self, reference_id: _Optional[str] = ..., namespace: _Optional[str] = ..., created_by: _Optional[str] = ..., request: _Optional[_Union[ProcessingRequest, _Mapping]] = ..., periodic_aggregation: _Optional[_Union[PeriodicAggregation, _Mapping]] = ...) -> None: ...
 
+class FlattenChunk(_message.Message):
+    __slots__ = ("name", "tokens", "files")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TOKENS_FIELD_NUMBER: _ClassVar[int]
+    FILES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    tokens: int
+    files: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, name: _Optional[str] = ..., tokens: _Optional[int] = ..., files: _Optional[_Iterable[str]] = ...) -> None: ...
+
 class ProcessingItemResultData(_message.Message):
-    __slots__ = ("observations", "periodic_aggregation")
+    __slots__ = ("observations", "chunks", "periodic_aggregation")
     OBSERVATIONS_FIELD_NUMBER: _ClassVar[int]
+    CHUNKS_FIELD_NUMBER: _ClassVar[int]
     PERIODIC_AGGREGATION_FIELD_NUMBER: _ClassVar[int]
     observations: _containers.RepeatedCompositeFieldContainer[_observations_pb2.ObservationKey]
+    chunks: _containers.RepeatedCompositeFieldContainer[FlattenChunk]
     periodic_aggregation: PeriodicAggregationResult
-    def __init__(self, observations: _Optional[_Iterable[_Union[_observations_pb2.ObservationKey, _Mapping]]] = ..., periodic_aggregation: _Optional[_Union[PeriodicAggregationResult, _Mapping]] = ...) -> None: ...
+    def __init__(self, observations: _Optional[_Iterable[_Union[_observations_pb2.ObservationKey, _Mapping]]] = ..., chunks: _Optional[_Iterable[_Union[FlattenChunk, _Mapping]]] = ..., periodic_aggregation: _Optional[_Union[PeriodicAggregationResult, _Mapping]] = ...) -> None: ...
 
 class ProcessingResultFilter(_message.Message):
     __slots__ = ("namespace", "reference_id", "request_type", "keys")
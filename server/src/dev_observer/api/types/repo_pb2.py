@@ -27,7 +27,7 @@ from dev_observer.api.types import ai_pb2 as dev__observer_dot_api_dot_types_dot
 from dev_observer.api.types import observations_pb2 as dev__observer_dot_api_dot_types_dot_observations__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!dev_observer/api/types/repo.proto\x12\x1b\x64\x65v_observer.api.types.repo\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1f\x64\x65v_observer/api/types/ai.proto\x1a)dev_observer/api/types/observations.proto\"\xee\x01\n\rGitRepository\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tfull_name\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12:\n\x08provider\x18\x06 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\x12\x43\n\nproperties\x18\x07 \x01(\x0b\x32*.dev_observer.api.types.repo.GitPropertiesH\x00\x88\x01\x01\x42\r\n\x0b_properties\"\xfc\x01\n\rGitProperties\x12>\n\x08\x61pp_info\x18\x01 \x01(\x0b\x32\'.dev_observer.api.types.repo.GitAppInfoH\x00\x88\x01\x01\x12\x37\n\x04meta\x18\x02 \x01(\x0b\x32$.dev_observer.api.types.repo.GitMetaH\x01\x88\x01\x01\x12H\n\x0f\x62it_bucket_info\x18\x03 \x01(\x0b\x32*.dev_observer.api.types.repo.BitBucketInfoH\x02\x88\x01\x01\x42\x0b\n\t_app_infoB\x07\n\x05_metaB\x12\n\x10_bit_bucket_info\"\'\n\rBitBucketInfo\x12\x16\n\x0eworkspace_uuid\x18\x01 \x01(\t\"\xd6\x01\n\x07GitMeta\x12\x30\n\x0clast_refresh\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x16\n\tclone_url\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07size_kb\x18\x03 \x01(\x05H\x01\x88\x01\x01\x12\x41\n\x0btokens_info\x18\x04 \x01(\x0b\x32\'.dev_observer.api.types.repo.TokensInfoH\x02\x88\x01\x01\x42\x0c\n\n_clone_urlB\n\n\x08_size_kbB\x0e\n\x0c_tokens_info\"R\n\nTokensInfo\x12.\n\ncreated_at\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0ctokens_count\x18\x02 \x01(\x05\"p\n\nGitAppInfo\x12\x30\n\x0clast_refresh\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1c\n\x0finstallation_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x12\n\x10_installation_id\"y\n\x0bReposFilter\x12?\n\x08provider\x18\x01 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProviderH\x00\x88\x01\x01\x12\x12\n\x05owner\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x0b\n\t_providerB\x08\n\x06_owner\"\xd7\x01\n\x10\x43odeResearchMeta\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12.\n\ncreated_at\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x16\n\x0erepo_full_name\x18\x03 \x01(\t\x12\x10\n\x08repo_url\x18\x04 \x01(\t\x12\x12\n\narea_title\x18\x05 \x01(\t\x12\x44\n\x07\x64ir_key\x18\x06 \x01(\x0b\x32\x33.dev_observer.api.types.observations.ObservationKey\"\x9e\x01\n\x14\x43odeResearchAreaMeta\x12I\n\x0cresearch_key\x18\x01 \x01(\x0b\x32\x33.dev_observer.api.types.observations.ObservationKey\x12;\n\x04meta\x18\x02 \x01(\x0b\x32-.dev_observer.api.types.repo.CodeResearchMeta\"e\n\x1c\x43odeResearchOrganizationMeta\x12\x45\n\narea_metas\x18\x01 \x03(\x0b\x32\x31.dev_observer.api.types.repo.CodeResearchAreaMeta\"\xff\x01\n\x0bResearchLog\x12;\n\x05items\x18\x01 \x03(\x0b\x32,.dev_observer.api.types.repo.ResearchLogItem\x12.\n\nstarted_at\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0b\x66inished_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x42\n\x0btotal_usage\x18\x06 \x01(\x0b\x32(.dev_observer.api.types.ai.UsageMetadataH\x00\x88\x01\x01\x42\x0e\n\x0c_total_usage\"\xa2\x02\n\x0fResearchLogItem\x12\x14\n\x0cobservations\x18\x01 \x01(\t\x12?\n\ntool_calls\x18\x02 \x03(\x0b\x32+.dev_observer.api.types.repo.ToolCallResult\x12.\n\nstarted_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0b\x66inished_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07summary\x18\x05 \x01(\t\x12<\n\x05usage\x18\x06 \x01(\x0b\x32(.dev_observer.api.types.ai.UsageMetadataH\x00\x88\x01\x01\x42\x08\n\x06_usage\"\xc6\x01\n\x0eToolCallResult\x12\x1b\n\x13requested_tool_call\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\t\x12J\n\x06status\x18\x03 \x01(\x0e\x32:.dev_observer.api.types.repo.ToolCallResult.ToolCallStatus\";\n\x0eToolCallStatus\x12\x0f\n\x0bUNPROCESSED\x10\x00\x12\x0b\n\x07SUCCESS\x10\x01\x12\x0b\n\x07\x46\x41ILURE\x10\x02*)\n\x0bGitProvider\x12\n\n\x06GITHUB\x10\x00\x12\x0e\n\nBIT_BUCKET\x10\x01\x42\x38Z6github.com/devplaninc/contextify/clients/go/contextifyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!dev_observer/api/types/repo.proto\x12\x1b\x64\x65v_observer.api.types.repo\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1f\x64\x65v_observer/api/types/ai.proto\x1a)dev_observer/api/types/observations.proto\"\xee\x01\n\rGitRepository\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tfull_name\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12:\n\x08provider\x18\x06 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\x12\x43\n\nproperties\x18\x07 \x01(\x0b\x32*.dev_observer.api.types.repo.GitPropertiesH\x00\x88\x01\x01\x42\r\n\x0b_properties\"\xfc\x01\n\rGitProperties\x12>\n\x08\x61pp_info\x18\x01 \x01(\x0b\x32\'.dev_observer.api.types.repo.GitAppInfoH\x00\x88\x01\x01\x12\x37\n\x04meta\x18\x02 \x01(\x0b\x32$.dev_observer.api.types.repo.GitMetaH\x01\x88\x01\x01\x12H\n\x0f\x62it_bucket_info\x18\x03 \x01(\x0b\x32*.dev_observer.api.types.repo.BitBucketInfoH\x02\x88\x01\x01\x42\x0b\n\t_app_infoB\x07\n\x05_metaB\x12\n\x10_bit_bucket_info\"\'\n\rBitBucketInfo\x12\x16\n\x0eworkspace_uuid\x18\x01 \x01(\t\"\xd6\x01\n\x07GitMeta\x12\x30\n\x0clast_refresh\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x16\n\tclone_url\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07size_kb\x18\x03 \x01(\x05H\x01\x88\x01\x01\x12\x41\n\x0btokens_info\x18\x04 \x01(\x0b\x32\'.dev_observer.api.types.repo.TokensInfoH\x02\x88\x01\x01\x42\x0c\n\n_clone_urlB\n\n\x08_size_kbB\x0e\n\x0c_tokens_info\"e\n\nTokensInfo\x12.\n\ncreated_at\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0ctokens_count\x18\x02 \x01(\x05\x12\x11\n\testimated\x18\x03 \x01(\x08\"p\n\nGitAppInfo\x12\x30\n\x0clast_refresh\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1c\n\x0finstallation_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x12\n\x10_installation_id\"y\n\x0bReposFilter\x12?\n\x08provider\x18\x01 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProviderH\x00\x88\x01\x01\x12\x12\n\x05owner\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x0b\n\t_providerB\x08\n\x06_owner\"\xd7\x01\n\x10\x43odeResearchMeta\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12.\n\ncreated_at\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x16\n\x0erepo_full_name\x18\x03 \x01(\t\x12\x10\n\x08repo_url\x18\x04 \x01(\t\x12\x12\n\narea_title\x18\x05 \x01(\t\x12\x44\n\x07\x64ir_key\x18\x06 \x01(\x0b\x32\x33.dev_observer.api.types.observations.ObservationKey\"\x9e\x01\n\x14\x43odeResearchAreaMeta\x12I\n\x0cresearch_key\x18\x01 \x01(\x0b\x32\x33.dev_observer.api.types.observations.ObservationKey\x12;\n\x04meta\x18\x02 \x01(\x0b\x32-.dev_observer.api.types.repo.CodeResearchMeta\"e\n\x1c\x43odeResearchOrganizationMeta\x12\x45\n\narea_metas\x18\x01 \x03(\x0b\x32\x31.dev_observer.api.types.repo.CodeResearchAreaMeta\"\xff\x01\n\x0bResearchLog\x12;\n\x05items\x18\x01 \x03(\x0b\x32,.dev_observer.api.types.repo.ResearchLogItem\x12.\n\nstarted_at\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0b\x66inished_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x42\n\x0btotal_usage\x18\x06 \x01(\x0b\x32(.dev_observer.api.types.ai.UsageMetadataH\x00\x88\x01\x01\x42\x0e\n\x0c_total_usage\"\xa2\x02\n\x0fResearchLogItem\x12\x14\n\x0cobservations\x18\x01 \x01(\t\x12?\n\ntool_calls\x18\x02 \x03(\x0b\x32+.dev_observer.api.types.repo.ToolCallResult\x12.\n\nstarted_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0b\x66inished_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07summary\x18\x05 \x01(\t\x12<\n\x05usage\x18\x06 \x01(\x0b\x32(.dev_observer.api.types.ai.UsageMetadataH\x00\x88\x01\x01\x42\x08\n\x06_usage\"\xc6\x01\n\x0eToolCallResult\x12\x1b\n\x13requested_tool_call\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\t\x12J\n\x06status\x18\x03 \x01(\x0e\x32:.dev_observer.api.types.repo.ToolCallResult.ToolCallStatus\";\n\x0eToolCallStatus\x12\x0f\n\x0bUNPROCESSED\x10\x00\x12\x0b\n\x07SUCCESS\x10\x01\x12\x0b\n\x07\x46\x41ILURE\x10\x02*)\n\x0bGitProvider\x12\n\n\x06GITHUB\x10\x00\x12\x0e\n\nBIT_BUCKET\x10\x01\x42\x38Z6github.com/devplaninc/contextify/clients/go/contextifyb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,8 +35,8 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dev_observer.api.types.repo
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'Z6github.com/devplaninc/contextify/clients/go/contextify'
-  _globals['_GITPROVIDER']._serialized_start=2484
-  _globals['_GITPROVIDER']._serialized_end=2525
+  _globals['_GITPROVIDER']._serialized_start=2503
+  _globals['_GITPROVIDER']._serialized_end=2544
   _globals['_GITREPOSITORY']._serialized_start=176
   _globals['_GITREPOSITORY']._serialized_end=414
   _globals['_GITPROPERTIES']._serialized_start=417
@@ -46,23 +46,23 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GITMETA']._serialized_start=713
   _globals['_GITMETA']._serialized_end=927
   _globals['_TOKENSINFO']._serialized_start=929
-  _globals['_TOKENSINFO']._serialized_end=1011
-  _globals['_GITAPPINFO']._serialized_start=1013
-  _globals['_GITAPPINFO']._serialized_end=1125
-  _globals['_REPOSFILTER']._serialized_start=1127
-  _globals['_REPOSFILTER']._serialized_end=1248
-  _globals['_CODERESEARCHMETA']._serialized_start=1251
-  _globals['_CODERESEARCHMETA']._serialized_end=1466
-  _globals['_CODERESEARCHAREAMETA']._serialized_start=1469
-  _globals['_CODERESEARCHAREAMETA']._serialized_end=1627
-  _globals['_CODERESEARCHORGANIZATIONMETA']._serialized_start=1629
-  _globals['_CODERESEARCHORGANIZATIONMETA']._serialized_end=1730
-  _globals['_RESEARCHLOG']._serialized_start=1733
-  _globals['_RESEARCHLOG']._serialized_end=1988
-  _globals['_RESEARCHLOGITEM']._serialized_start=1991
-  _globals['_RESEARCHLOGITEM']._serialized_end=2281
-  _globals['_TOOLCALLRESULT']._serialized_start=2284
-  _globals['_TOOLCALLRESULT']._serialized_end=2482
-  _globals['_TOOLCALLRESULT_TOOLCALLSTATUS']._serialized_start=2423
-  _globals['_TOOLCALLRESULT_TOOLCALLSTATUS']._serialized_end=2482
+  _globals['_TOKENSINFO']._serialized_end=1030
+  _globals['_GITAPPINFO']._serialized_start=1032
+  _globals['_GITAPPINFO']._serialized_end=1144
+  _globals['_REPOSFILTER']._serialized_start=1146
+  _globals['_REPOSFILTER']._serialized_end=1267
+  _globals['_CODERESEARCHMETA']._serialized_start=1270
+  _globals['_CODERESEARCHMETA']._serialized_end=1485
+  _globals['_CODERESEARCHAREAMETA']._serialized_start=1488
+  _globals['_CODERESEARCHAREAMETA']._serialized_end=1646
+  _globals['_CODERESEARCHORGANIZATIONMETA']._serialized_start=1648
+  _globals['_CODERESEARCHORGANIZATIONMETA']._serialized_end=1749
+  _globals['_RESEARCHLOG']._serialized_start=1752
+  _globals['_RESEARCHLOG']._serialized_end=2007
+  _globals['_RESEARCHLOGITEM']._serialized_start=2010
+  _globals['_RESEARCHLOGITEM']._serialized_end=2300
+  _globals['_TOOLCALLRESULT']._serialized_start=2303
+  _globals['_TOOLCALLRESULT']._serialized_end=2501
+  _globals['_TOOLCALLRESULT_TOOLCALLSTATUS']._serialized_start=2442
+  _globals['_TOOLCALLRESULT_TOOLCALLSTATUS']._serialized_end=2501
 # @@protoc_insertion_point(module_scope)
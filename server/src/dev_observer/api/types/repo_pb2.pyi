@@ -66,12 +66,14 @@ class GitMeta(_message.Message):
     def __init__(self, last_refresh: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., clone_url: _Optional[str] = ..., size_kb: _Optional[int] = ..., tokens_info: _Optional[_Union[TokensInfo, _Mapping]] = ...) -> None: ...
 
 class TokensInfo(_message.Message):
-    __slots__ = ("created_at", "tokens_count")
+    __slots__ = ("created_at", "tokens_count", "estimated")
     CREATED_AT_FIELD_NUMBER: _ClassVar[int]
     TOKENS_COUNT_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATED_FIELD_NUMBER: _ClassVar[int]
     created_at: _timestamp_pb2.Timestamp
     tokens_count: int
-    def __init__(self, created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., tokens_count: _Optional[int] = ...) -> None: ...
+    estimated: bool
+    def __init__(self, created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., tokens_count: _Optional[int] = ..., estimated: bool = ...) -> None: ...
 
 class GitAppInfo(_message.Message):
     __slots__ = ("last_refresh", "installation_id")
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from dev_observer.api.types import repo_pb2 as dev__observer_dot_api_dot_types_dot_repo__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'dev_observer/api/web/repositories.proto\x12!dev_observer.api.web.repositories\x1a!dev_observer/api/types/repo.proto\"U\n\x18ListRepositoriesResponse\x12\x39\n\x05repos\x18\x01 \x03(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"_\n\x14\x41\x64\x64RepositoryRequest\x12\x0b\n\x03url\x18\x01 \x01(\t\x12:\n\x08provider\x18\x02 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\"Q\n\x15\x41\x64\x64RepositoryResponse\x12\x38\n\x04repo\x18\x01 \x01(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"\x99\x01\n\x17RescanRepositoryRequest\x12\x15\n\x08research\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12\x19\n\x0cskip_summary\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12\x1b\n\x0e\x66orce_research\x18\x03 \x01(\x08H\x02\x88\x01\x01\x42\x0b\n\t_researchB\x0f\n\r_skip_summaryB\x11\n\x0f_force_research\"\x1a\n\x18RescanRepositoryResponse\"Q\n\x15GetRepositoryResponse\x12\x38\n\x04repo\x18\x01 \x01(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"U\n\x18\x44\x65leteRepositoryResponse\x12\x39\n\x05repos\x18\x01 \x03(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"U\n\x19\x46ilterRepositoriesRequest\x12\x38\n\x06\x66ilter\x18\x01 \x01(\x0b\x32(.dev_observer.api.types.repo.ReposFilter\"W\n\x1a\x46ilterRepositoriesResponse\x12\x39\n\x05repos\x18\x01 \x03(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"-\n\x1cRescanAnalysisSummaryRequest\x12\r\n\x05\x66orce\x18\x01 \x01(\x08\"\x1f\n\x1dRescanAnalysisSummaryResponse\"q\n\x1bGetAuthenticatedRepoRequest\x12\x16\n\x0erepo_full_name\x18\x01 \x01(\t\x12:\n\x08provider\x18\x02 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\"9\n\x1cGetAuthenticatedRepoResponse\x12\x19\n\x11\x61uthenticated_url\x18\x01 \x01(\t\"i\n\x13GetRepoTokenRequest\x12\x16\n\x0erepo_full_name\x18\x01 \x01(\t\x12:\n\x08provider\x18\x02 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\"%\n\x14GetRepoTokenResponse\x12\r\n\x05token\x18\x01 \x01(\tB@Z>github.com/devplaninc/contextify/clients/go/contextify/serviceb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'dev_observer/api/web/repositories.proto\x12!dev_observer.api.web.repositories\x1a!dev_observer/api/types/repo.proto\"U\n\x18ListRepositoriesResponse\x12\x39\n\x05repos\x18\x01 \x03(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"_\n\x14\x41\x64\x64RepositoryRequest\x12\x0b\n\x03url\x18\x01 \x01(\t\x12:\n\x08provider\x18\x02 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\"Q\n\x15\x41\x64\x64RepositoryResponse\x12\x38\n\x04repo\x18\x01 \x01(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"\x99\x01\n\x17RescanRepositoryRequest\x12\x15\n\x08research\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12\x19\n\x0cskip_summary\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12\x1b\n\x0e\x66orce_research\x18\x03 \x01(\x08H\x02\x88\x01\x01\x42\x0b\n\t_researchB\x0f\n\r_skip_summaryB\x11\n\x0f_force_research\"\x1a\n\x18RescanRepositoryResponse\"8\n\x18\x41nalyzeRepoTokensRequest\x12\x12\n\x05\x65xact\x18\x01 \x01(\x08H\x00\x88\x01\x01\x42\x08\n\x06_exact\"/\n\x19\x41nalyzeRepoTokensResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\t\"Q\n\x15GetRepositoryResponse\x12\x38\n\x04repo\x18\x01 \x01(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"U\n\x18\x44\x65leteRepositoryResponse\x12\x39\n\x05repos\x18\x01 \x03(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"U\n\x19\x46ilterRepositoriesRequest\x12\x38\n\x06\x66ilter\x18\x01 \x01(\x0b\x32(.dev_observer.api.types.repo.ReposFilter\"W\n\x1a\x46ilterRepositoriesResponse\x12\x39\n\x05repos\x18\x01 \x03(\x0b\x32*.dev_observer.api.types.repo.GitRepository\"-\n\x1cRescanAnalysisSummaryRequest\x12\r\n\x05\x66orce\x18\x01 \x01(\x08\"\x1f\n\x1dRescanAnalysisSummaryResponse\"q\n\x1bGetAuthenticatedRepoRequest\x12\x16\n\x0erepo_full_name\x18\x01 \x01(\t\x12:\n\x08provider\x18\x02 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\"9\n\x1cGetAuthenticatedRepoResponse\x12\x19\n\x11\x61uthenticated_url\x18\x01 \x01(\t\"i\n\x13GetRepoTokenRequest\x12\x16\n\x0erepo_full_name\x18\x01 \x01(\t\x12:\n\x08provider\x18\x02 \x01(\x0e\x32(.dev_observer.api.types.repo.GitProvider\"%\n\x14GetRepoTokenResponse\x12\r\n\x05token\x18\x01 \x01(\tB@Z>github.com/devplaninc/contextify/clients/go/contextify/serviceb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -43,24 +43,28 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_RESCANREPOSITORYREQUEST']._serialized_end=534
   _globals['_RESCANREPOSITORYRESPONSE']._serialized_start=536
   _globals['_RESCANREPOSITORYRESPONSE']._serialized_end=562
-  _globals['_GETREPOSITORYRESPONSE']._serialized_start=564
-  _globals['_GETREPOSITORYRESPONSE']._serialized_end=645
-  _globals['_DELETEREPOSITORYRESPONSE']._serialized_start=647
-  _globals['_DELETEREPOSITORYRESPONSE']._serialized_end=732
-  _globals['_FILTERREPOSITORIESREQUEST']._serialized_start=734
-  _globals['_FILTERREPOSITORIESREQUEST']._serialized_end=819
-  _globals['_FILTERREPOSITORIESRESPONSE']._serialized_start=821
-  _globals['_FILTERREPOSITORIESRESPONSE']._serialized_end=908
-  _globals['_RESCANANALYSISSUMMARYREQUEST']._serialized_start=910
-  _globals['_RESCANANALYSISSUMMARYREQUEST']._serialized_end=955
-  _globals['_RESCANANALYSISSUMMARYRESPONSE']._serialized_start=957
-  _globals['_RESCANANALYSISSUMMARYRESPONSE']._serialized_end=988
-  _globals['_GETAUTHENTICATEDREPOREQUEST']._serialized_start=990
-  _globals['_GETAUTHENTICATEDREPOREQUEST']._serialized_end=1103
-  _globals['_GETAUTHENTICATEDREPORESPONSE']._serialized_start=1105
-  _globals['_GETAUTHENTICATEDREPORESPONSE']._serialized_end=1162
-  _globals['_GETREPOTOKENREQUEST']._serialized_start=1164
-  _globals['_GETREPOTOKENREQUEST']._serialized_end=1269
-  _globals['_GETREPOTOKENRESPONSE']._serialized_start=1271
-  _globals['_GETREPOTOKENRESPONSE']._serialized_end=1308
+  _globals['_ANALYZEREPOTOKENSREQUEST']._serialized_start=564
+  _globals['_ANALYZEREPOTOKENSREQUEST']._serialized_end=620
+  _globals['_ANALYZEREPOTOKENSRESPONSE']._serialized_start=622
+  _globals['_ANALYZEREPOTOKENSRESPONSE']._serialized_end=669
+  _globals['_GETREPOSITORYRESPONSE']._serialized_start=671
+  _globals['_GETREPOSITORYRESPONSE']._serialized_end=752
+  _globals['_DELETEREPOSITORYRESPONSE']._serialized_start=754
+  _globals['_DELETEREPOSITORYRESPONSE']._serialized_end=839
+  _globals['_FILTERREPOSITORIESREQUEST']._serialized_start=841
+  _globals['_FILTERREPOSITORIESREQUEST']._serialized_end=926
+  _globals['_FILTERREPOSITORIESRESPONSE']._serialized_start=928
+  _globals['_FILTERREPOSITORIESRESPONSE']._serialized_end=1015
+  _globals['_RESCANANALYSISSUMMARYREQUEST']._serialized_start=1017
+  _globals['_RESCANANALYSISSUMMARYREQUEST']._serialized_end=1062
+  _globals['_RESCANANALYSISSUMMARYRESPONSE']._serialized_start=1064
+  _globals['_RESCANANALYSISSUMMARYRESPONSE']._serialized_end=1095
+  _globals['_GETAUTHENTICATEDREPOREQUEST']._serialized_start=1097
+  _globals['_GETAUTHENTICATEDREPOREQUEST']._serialized_end=1210
+  _globals['_GETAUTHENTICATEDREPORESPONSE']._serialized_start=1212
+  _globals['_GETAUTHENTICATEDREPORESPONSE']._serialized_end=1269
+  _globals['_GETREPOTOKENREQUEST']._serialized_start=1271
+  _globals['_GETREPOTOKENREQUEST']._serialized_end=1376
+  _globals['_GETREPOTOKENRESPONSE']._serialized_start=1378
+  _globals['_GETREPOTOKENRESPONSE']._serialized_end=1415
 # @@protoc_insertion_point(module_scope)
@@ -41,6 +41,18 @@ class RescanRepositoryResponse(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
+class AnalyzeRepoTokensRequest(_message.Message):
+    __slots__ = ("exact",)
+    EXACT_FIELD_NUMBER: _ClassVar[int]
+    exact: bool
+    def __init__(self, exact: bool = ...) -> None: ...
+
+class AnalyzeRepoTokensResponse(_message.Message):
+    __slots__ = ("request_id",)
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    def __init__(self, request_id: _Optional[str] = ...) -> None: ...
+
 class GetRepositoryResponse(_message.Message):
     __slots__ = ("repo",)
     REPO_FIELD_NUMBER: _ClassVar[int]
@@ -0,0 +1,135 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Optional, List, Tuple
+
+from dev_observer.log import s_
+
+_log = logging.getLogger(__name__)
+
+
+class DiskLRU:
+    """Text files under `root_dir`, bounded by `max_bytes` in total.
+
+    When the total size exceeds `max_bytes`, least recently used files are evicted, access time is tracked via
+    file access time, set explicitly on reads. If `ttl_seconds` is set, files written earlier than that are ignored
+    and removed, the modification time is left as of the write for that. Files are stored in subdirectories by
+    the first two characters of their names.
+
+    Methods do blocking IO and may be called from several threads, e.g. with `asyncio.to_thread`.
+    """
+    _dir: str
+    _max_bytes: int
+    _ttl_seconds: Optional[float]
+    # Total size of the files, computed on first write.
+    _size: Optional[int] = None
+
+    def __init__(self, root_dir: str, max_bytes: int, ttl_seconds: Optional[float] = None):
+        self._dir = root_dir
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> Optional[int]:
+        """Total size of the files, None until something was written."""
+        with self._lock:
+            return self._size
+
+    def get(self, name: str) -> Optional[str]:
+        path = self._get_path(name)
+        try:
+            mtime = os.path.getmtime(path)
+            now = time.time()
+            if self._ttl_seconds is not None and now - mtime > self._ttl_seconds:
+                self._remove_tracked(path)
+                return None
+            with open(path, 'r', encoding='utf-8', newline='') as in_file:
+                content = in_file.read()
+            os.utime(path, (now, mtime))
+            return content
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+
+    def put(self, name: str, content: str):
+        path = self._get_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Unique across threads and processes sharing the directory, `_scan` skips it by the suffix.
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path))
+        try:
+            with open(fd, 'w', encoding='utf-8', newline='') as out_file:
+                out_file.write(content)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        size = os.path.getsize(tmp_path)
+        if size > self._max_bytes:
+            self._remove(tmp_path)
+            # The previous value must not outlive the write that replaced it.
+            self._remove_tracked(path)
+            return
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._size is None:
+                self._size = sum(s for _, _, _, s in self._scan())
+            else:
+                self._size += size - old_size
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def remove(self, name: str):
+        self._remove_tracked(self._get_path(name))
+
+    def _remove_tracked(self, path: str):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        if self._remove(path):
+            with self._lock:
+                if self._size is not None:
+                    self._size -= size
+
+    def _evict(self):
+        entries = sorted(self._scan())
+        now = time.time()
+        total = sum(s for _, _, _, s in entries)
+        removed = 0
+        for _, mtime, path, size in entries:
+            expired = self._ttl_seconds is not None and now - mtime > self._ttl_seconds
+            if total <= self._max_bytes and not expired:
+                # Order is by access, expired files may still follow.
+                continue
+            if self._remove(path):
+                total -= size
+                removed += 1
+        self._size = total
+        _log.debug(s_("Evicted cached files", dir=self._dir, removed=removed, size=total))
+
+    def _scan(self) -> List[Tuple[float, float, str, int]]:
+        """Returns access time, modification time, path and size of every file."""
+        result: List[Tuple[float, float, str, int]] = []
+        for dir_path, _, files in os.walk(self._dir):
+            for file in files:
+                if file.endswith(".tmp"):
+                    continue
+                path = os.path.join(dir_path, file)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                result.append((st.st_atime, st.st_mtime, path, st.st_size))
+        return result
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def _get_path(self, name: str) -> str:
+        return os.path.join(self._dir, name[:2], name)
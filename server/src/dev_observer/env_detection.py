@@ -1,13 +1,23 @@
+import concurrent.futures
 import logging
+import multiprocessing
 from typing import Optional, Tuple, Dict
 
+from dev_observer.analysis.cache.disk import DiskResponseCacheBackend
+from dev_observer.analysis.cache.observations import ObservationsResponseCacheBackend
+from dev_observer.analysis.cache.postgresql import PostgresqlResponseCacheBackend
+from dev_observer.analysis.cache.provider import ResponseCacheBackend
+from dev_observer.analysis.cache.response_cache import ResponseCache
 from dev_observer.analysis.code.graph import create_code_research_graph
 from dev_observer.analysis.langgraph_provider import LanggraphAnalysisProvider
 from dev_observer.analysis.provider import AnalysisProvider
 from dev_observer.analysis.stub import StubAnalysisProvider
+from dev_observer.analysis.util import models
+from dev_observer.analysis.util.limiter import RateLimiter, ModelLimits
 from dev_observer.api.types.repo_pb2 import GitProvider
 from dev_observer.common.crypto import Encryptor
 from dev_observer.log import s_
+from dev_observer.observations.cache import CachingObservationsProvider
 from dev_observer.observations.local import LocalObservationsProvider
 from dev_observer.observations.provider import ObservationsProvider
 from dev_observer.observations.s3 import S3ObservationsProvider
@@ -18,6 +28,7 @@ from dev_observer.processors.git.changes import GitChangesHandler
 from dev_observer.processors.git_changes import GitChangesProcessor
 from dev_observer.processors.periodic import PeriodicProcessor
 from dev_observer.processors.repos import ReposProcessor
+from dev_observer.processors.tokens import RepoTokensProcessor
 from dev_observer.processors.websites import WebsitesProcessor
 from dev_observer.prompts.langfuse import LangfusePromptsProvider, LangfuseAuthProps
 from dev_observer.prompts.local import LocalPromptsProvider, PromptTemplateParser, TomlPromptTemplateParser, \
@@ -30,9 +41,11 @@ from dev_observer.repository.copying import CopyingGitRepositoryProvider
 from dev_observer.repository.delegating import DelegatingGitRepositoryProvider
 from dev_observer.repository.federated import FederatedGitProvider
 from dev_observer.repository.github import GithubProvider, GithubAuthProvider
+from dev_observer.repository.mirror import MirroringGitRepositoryProvider
 from dev_observer.repository.provider import GitRepositoryProvider
 from dev_observer.server.env import ServerEnv
-from dev_observer.settings import Settings, LocalPrompts, Github, LangfusePrompts, Git
+from dev_observer.settings import Settings, LocalPrompts, Github, LangfusePrompts, Git, RateLimit, TokenizerPool, \
+    Observations
 from dev_observer.storage.local import LocalStorageProvider
 from dev_observer.storage.memory import MemoryStorageProvider
 from dev_observer.storage.postgresql.provider import PostgresqlStorageProvider
@@ -53,6 +66,14 @@ def detect_git_provider(settings: Settings, storage: StorageProvider) -> GitRepo
     git_sett = settings.git
     if git_sett is None:
         raise ValueError("Git settings are not provided")
+    provider = _detect_base_git_provider(git_sett, storage)
+    mc = git_sett.mirror_cache
+    if mc is not None:
+        return MirroringGitRepositoryProvider(provider, mc.dir, mc.max_size_mb * 1024 * 1024)
+    return provider
+
+
+def _detect_base_git_provider(git_sett: Git, storage: StorageProvider) -> GitRepositoryProvider:
     match git_sett.provider:
         case "github":
             return create_github_provider(git_sett.github, storage)
@@ -108,6 +129,50 @@ def detect_analysis_provider(settings: Settings, storage: StorageProvider) -> An
     raise ValueError(f"Unsupported analysis provider: {a.provider}")
 
 
+def detect_rate_limiter(settings: Settings) -> RateLimiter:
+    a = settings.analysis
+    rl = a.rate_limits if a is not None else None
+    if rl is None:
+        return RateLimiter()
+
+    def to_limits(r: RateLimit) -> ModelLimits:
+        return ModelLimits(
+            requests_per_minute=r.requests_per_minute,
+            tokens_per_minute=r.tokens_per_minute,
+            max_concurrency=r.max_concurrency,
+        )
+
+    return RateLimiter(
+        limits={k: to_limits(v) for k, v in rl.models.items()},
+        default=to_limits(rl.default) if rl.default is not None else None,
+        max_retries=rl.max_retries,
+    )
+
+
+def detect_response_cache(settings: Settings, observations: ObservationsProvider) -> Optional[ResponseCache]:
+    a = settings.analysis
+    rc = a.response_cache if a is not None else None
+    if rc is None:
+        return None
+    backend: ResponseCacheBackend
+    match rc.provider:
+        case "disk":
+            if rc.disk is None:
+                raise ValueError("Missing disk config for disk response cache")
+            backend = DiskResponseCacheBackend(rc.disk.dir, rc.ttl_seconds, rc.max_bytes)
+        case "postgresql":
+            s = settings.storage
+            if s is None or s.postgresql is None:
+                raise ValueError("Missing postgresql storage config for postgresql response cache")
+            backend = PostgresqlResponseCacheBackend(s.postgresql.db_url, rc.ttl_seconds, rc.max_bytes)
+        case "observations":
+            backend = ObservationsResponseCacheBackend(observations, rc.ttl_seconds)
+        case _:
+            raise ValueError(f"Unsupported response cache provider: {rc.provider}")
+    _log.info(s_("Model response cache enabled", provider=rc.provider))
+    return ResponseCache(backend)
+
+
 def detect_prompts_provider(settings: Settings) -> PromptsProvider:
     p = settings.prompts
     if p is None:
@@ -145,11 +210,26 @@ def detect_observer(settings: Settings) -> ObservationsProvider:
     o = settings.observations
     if o is None:
         raise ValueError("Observations settings are not defined")
+    provider = _detect_observations_provider(o)
+    if o.cache is None:
+        return provider
+    _log.info(s_("Observations cache enabled", max_memory_bytes=o.cache.max_memory_bytes, disk_dir=o.cache.disk_dir))
+    return CachingObservationsProvider(
+        provider,
+        max_memory_bytes=o.cache.max_memory_bytes,
+        disk_dir=o.cache.disk_dir,
+        max_disk_bytes=o.cache.max_disk_bytes,
+    )
+
+
+def _detect_observations_provider(o: Observations) -> ObservationsProvider:
     match o.provider:
         case "local":
             if o.local is None:
                 raise ValueError("Missing local config for local observations provider")
-            return LocalObservationsProvider(root_dir=o.local.dir)
+            return LocalObservationsProvider(
+                root_dir=o.local.dir, compression=o.compression, compression_level=o.compression_level,
+            )
         case "s3":
             if o.s3 is None:
                 raise ValueError("Missing S3 config for S3 observations provider")
@@ -159,7 +239,11 @@ def detect_observer(settings: Settings) -> ObservationsProvider:
                     access_key=o.s3.access_key,
                     secret_key=o.s3.secret_key,
                     bucket=o.s3.bucket,
-                    region=o.s3.region
+                    region=o.s3.region,
+                    max_pool_connections=o.s3.max_pool_connections,
+                    keepalive_timeout_sec=o.s3.keepalive_timeout_sec,
+                    compression=o.compression,
+                    compression_level=o.compression_level,
                 )
             except ValueError as e:
                 # Re-raise with more context
@@ -168,7 +252,12 @@ def detect_observer(settings: Settings) -> ObservationsProvider:
             if o.gcs is None:
                 raise ValueError("Missing GCS config for GCS observations provider")
             try:
-                return GCSObservationsProvider(bucket=o.gcs.bucket)
+                return GCSObservationsProvider(
+                    bucket=o.gcs.bucket,
+                    max_connections=o.gcs.max_connections,
+                    compression=o.compression,
+                    compression_level=o.compression_level,
+                )
             except ValueError as e:
                 # Re-raise with more context
                 raise ValueError(f"Failed to initialize GCS observations provider: {str(e)}") from e
@@ -179,12 +268,26 @@ def detect_tokenizer(settings: Settings) -> TokenizerProvider:
     tok = settings.tokenizer
     match tok.provider:
         case "tiktoken":
-            return TiktokenTokenizerProvider(encoding=tok.tiktoken.encoding)
+            return TiktokenTokenizerProvider(
+                encoding=tok.tiktoken.encoding,
+                executor=detect_tokenizer_executor(tok.pool),
+                batch_threads=tok.pool.max_workers,
+            )
         case "stub":
             return StubTokenizerProvider()
     raise ValueError(f"Unsupported tokenizer provider: {tok.provider}")
 
 
+def detect_tokenizer_executor(pool: TokenizerPool) -> concurrent.futures.Executor:
+    match pool.kind:
+        case "thread":
+            return concurrent.futures.ThreadPoolExecutor(max_workers=pool.max_workers, thread_name_prefix="tokenizer")
+        case "process":
+            return concurrent.futures.ProcessPoolExecutor(
+                max_workers=pool.max_workers, mp_context=multiprocessing.get_context("spawn"))
+    raise ValueError(f"Unsupported tokenizer pool: {pool.kind}")
+
+
 def detect_storage_provider(settings: Settings) -> StorageProvider:
     s = settings.storage
     if s is None:
@@ -225,6 +328,8 @@ def detect_server_env(settings: Settings) -> ServerEnv:
     prompts = detect_prompts_provider(settings)
     observations = detect_observer(settings)
     tokenizer = detect_tokenizer(settings)
+    models.configure_rate_limiter(detect_rate_limiter(settings), tokenizer)
+    models.configure_response_cache(detect_response_cache(settings, observations))
     storage = detect_storage_provider(settings)
     analysis = detect_analysis_provider(settings, storage)
     git_repository = detect_git_provider(settings, storage)
@@ -265,6 +370,7 @@ def detect_server_env(settings: Settings) -> ServerEnv:
             bg_git_changes_handler,
             websites_processor=bg_sites_processor,
             research_processor=bg_research_processor,
+            tokens_processor=RepoTokensProcessor(bg_storage, bg_repository, tokenizer, observations),
         ),
         users=users,
         api_keys=api_keys or [],
@@ -0,0 +1,167 @@
+import logging
+import re
+from datetime import datetime
+from typing import Optional, Callable, Awaitable, List, TextIO
+
+from dev_observer.api.types.config_pb2 import GlobalConfig
+from dev_observer.flatten.native import get_ignore_patterns, compile_patterns
+from dev_observer.log import s_
+from dev_observer.repository.git import stream_command
+from dev_observer.repository.provider import RepositoryInfo
+
+_log = logging.getLogger(__name__)
+
+_flush_chars = 64 * 1024
+# Separates fields of commit headers, never appears in text diffs.
+_separator = "\x00"
+_pretty_format = "tformat:%x00%h%x00%an <%ae>%x00%ad%x00%s"
+
+# Diffs of generated files say little about the change, in addition to the flatten ignore patterns.
+_generated_ignore = [
+    "**/*.min.js",
+    "**/*.min.css",
+    "**/*.map",
+    "**/*_pb2.py",
+    "**/*_pb2.pyi",
+    "**/*_pb2_grpc.py",
+    "**/*.pb.go",
+    "**/*.generated.*",
+    "**/generated/**",
+    "**/__snapshots__/**",
+    "**/*.snap",
+]
+
+
+async def write_commits(
+        repo_path: str,
+        info: RepositoryInfo,
+        config: GlobalConfig,
+        from_date: datetime,
+        to_date: datetime,
+        output_file: str,
+        on_content: Optional[Callable[[str], Awaitable[None]]] = None,
+):
+    """Writes commits of the checked out branch between the dates with their diffs as markdown.
+
+    Output of `git log -p` is streamed to the file and `on_content` as it is produced. Every commit gets a
+    `## Commit: ` header. Diffs of ignored, lock and generated files are omitted, and diffs of a single file are
+    truncated to `max_diff_size_bytes` of the flatten config.
+    """
+    ignore = compile_patterns([*get_ignore_patterns(config, info), *_generated_ignore])
+    max_diff_size = config.repo_analysis.flatten.max_diff_size_bytes or 20_000
+    cmd = [
+        "git", "log", "--no-color", "--no-ext-diff", f"--pretty={_pretty_format}", "--date=short",
+        f"--since={format_datetime_for_git(from_date)}", f"--until={format_datetime_for_git(to_date)}", "-p",
+    ]
+    _log.debug(s_("Executing git log...", output_file=output_file, cmd=cmd))
+    with open(output_file, "w", encoding="utf-8") as out:
+        writer = _LogWriter(out, on_content, ignore, max_diff_size)
+        try:
+            await stream_command(cmd, writer.feed, cwd=repo_path)
+        except RuntimeError as e:
+            _log.error(s_("Failed to get log for repository.", error=str(e)))
+            writer.emit(f"\nFailed to get commits: {e}\n")
+        await writer.close()
+    _log.debug(s_("Done.", output_file=output_file, commits=writer.commits, omitted=writer.omitted_files,
+                  truncated=writer.truncated_files))
+
+
+def format_datetime_for_git(dt: datetime) -> str:
+    """Format datetime for git --since/--until parameters"""
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+class _LogWriter:
+    """Formats streamed `git log -p` output line by line, keeping at most `max_diff_size` bytes per file diff."""
+    commits: int = 0
+    omitted_files: int = 0
+    truncated_files: int = 0
+
+    def __init__(
+            self,
+            out: TextIO,
+            on_content: Optional[Callable[[str], Awaitable[None]]],
+            ignore: re.Pattern,
+            max_diff_size: int,
+    ):
+        self._out = out
+        self._on_content = on_content
+        self._ignore = ignore
+        self._max_diff_size = max_diff_size
+        self._tail = b""
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        # State of the current file diff.
+        self._omitted = False
+        self._diff_size = 0
+        self._dropped_lines = 0
+
+    async def feed(self, data: bytes):
+        data = self._tail + data
+        end = data.rfind(b"\n") + 1
+        self._tail = data[end:]
+        for line in data[:end].split(b"\n")[:-1]:
+            self._line(line.decode("utf-8", errors="replace"), len(line) + 1)
+        if self._pending_chars >= _flush_chars:
+            await self._flush()
+
+    async def close(self):
+        if len(self._tail) > 0:
+            self._line(self._tail.decode("utf-8", errors="replace"), len(self._tail))
+            self._tail = b""
+        self._end_diff()
+        await self._flush()
+
+    def emit(self, text: str):
+        self._pending.append(text)
+        self._pending_chars += len(text)
+
+    def _line(self, line: str, size: int):
+        if line.startswith(_separator):
+            self._end_diff()
+            sha, author, date, subject = (line[1:].split(_separator, 3) + ["", "", ""])[:4]
+            prefix = "" if self.commits == 0 else "\n"
+            self.emit(f"{prefix}## Commit: {sha} by {author} on {date}\n{subject}\n")
+            self.commits += 1
+            return
+        if line.startswith("diff --git "):
+            self._end_diff()
+            self._omitted = self._ignore.fullmatch(_diff_path(line)) is not None
+            if self._omitted:
+                self.omitted_files += 1
+                self.emit(f"{line}\n(diff omitted)\n")
+                return
+        elif self._omitted:
+            return
+        elif self._diff_size + size > self._max_diff_size:
+            self._dropped_lines += 1
+            return
+        self._diff_size += size
+        self.emit(f"{line}\n")
+
+    def _end_diff(self):
+        if self._dropped_lines > 0:
+            self.truncated_files += 1
+            self.emit(f"(diff truncated, {self._dropped_lines} more lines)\n")
+        self._omitted = False
+        self._diff_size = 0
+        self._dropped_lines = 0
+
+    async def _flush(self):
+        if self._pending_chars == 0:
+            return
+        text = "".join(self._pending)
+        self._pending = []
+        self._pending_chars = 0
+        self._out.write(text)
+        if self._on_content is not None:
+            await self._on_content(text)
+
+
+def _diff_path(line: str) -> str:
+    """Path of the changed file from a `diff --git a/<old> b/<new>` line."""
+    path = line[len("diff --git "):].rsplit(" b/", 1)[-1]
+    if path.endswith('"'):
+        # Quoted paths with special characters, only used for matching.
+        path = line.rsplit(' "b/', 1)[-1][:-1]
+    return path
@@ -3,20 +3,23 @@ import dataclasses
 import logging
 import os
 import random
+import re
 import shutil
 import string
 from datetime import datetime
-from typing import List, Callable, Optional, Tuple
+from typing import List, Callable, Optional, Tuple, Awaitable, Union, Dict
 import shlex
 
 from pydantic import BaseModel
 
 from dev_observer.api.types.config_pb2 import GlobalConfig, RepoAnalysisConfig
 from dev_observer.api.types.observations_pb2 import ObservationKey
-from dev_observer.api.types.processing_pb2 import ProcessingItemResultData
+from dev_observer.api.types.processing_pb2 import ProcessingItemResultData, FlattenChunk
+from dev_observer.flatten.commits import write_commits
+from dev_observer.flatten.native import write_repository, get_sparse_exclude
 from dev_observer.log import s_
-from dev_observer.repository.cloner import clone_repository
-from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo
+from dev_observer.repository.cloner import clone_repository, get_head_sha
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
 from dev_observer.repository.types import ObservedRepo, ObservedGitChanges
 from dev_observer.tokenizer.provider import TokenizerProvider
 
@@ -31,6 +34,17 @@ class CombineResult:
     output_dir: str
 
 
+@dataclasses.dataclass
+class TokenStats:
+    """Size of tokenized content in bytes and tokens."""
+    bytes: int = 0
+    tokens: int = 0
+
+    def add(self, other: "TokenStats"):
+        self.bytes += other.bytes
+        self.tokens += other.tokens
+
+
 @dataclasses.dataclass
 class FlattenResult:
     full_file_path: str
@@ -39,6 +53,10 @@ class FlattenResult:
     total_tokens: int
     clean_up: Callable[[], bool]
     result_data: Optional[ProcessingItemResultData] = None
+    # Commit the content was flattened from, if it comes from a git repository.
+    commit_sha: Optional[str] = None
+    # Tokenized files by extension, see `file_extension`.
+    token_stats: Dict[str, TokenStats] = dataclasses.field(default_factory=dict)
 
 
 class RepomixInput(BaseModel):
@@ -95,9 +113,7 @@ class RepomixConfig(BaseModel):
 async def combine_repository(repo_path: str, info: RepositoryInfo, config: GlobalConfig) -> CombineResult:
     flatten_config = config.repo_analysis.flatten if config.repo_analysis.HasField("flatten") \
         else RepoAnalysisConfig.Flatten()
-    suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-    folder_path = os.path.join(repo_path, f"devplan_tmp_repomix_{suffix}")
-    os.makedirs(folder_path)
+    folder_path = make_output_dir(repo_path, "devplan_tmp_repomix")
     output_file = os.path.join(folder_path, "full.md")
 
     large_threshold_kb = (flatten_config.large_repo_threshold_mb or 500) * 1024
@@ -146,49 +162,360 @@ async def combine_repository(repo_path: str, info: RepositoryInfo, config: Globa
     return CombineResult(file_path=output_file, size_bytes=size_bytes, output_dir=folder_path)
 
 
+async def combine_repository_native(
+        repo_path: str,
+        info: RepositoryInfo,
+        config: GlobalConfig,
+        output_dir: str,
+        on_content: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_file: Optional[Callable[[Optional[str], str], Awaitable[None]]] = None,
+) -> CombineResult:
+    """Same as `combine_repository`, but flattens the repository in-process instead of running repomix.
+
+    Combined content is passed to `on_content` and `on_file` as it is written, see `write_repository`.
+    """
+    output_file = os.path.join(output_dir, "full.md")
+    await write_repository(repo_path, info, config, output_file, on_content, on_file)
+    size_bytes = os.path.getsize(output_file)
+    return CombineResult(file_path=output_file, size_bytes=size_bytes, output_dir=output_dir)
+
+
+def make_output_dir(repo_path: str, prefix: str) -> str:
+    suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    folder_path = os.path.join(repo_path, f"{prefix}_{suffix}")
+    os.makedirs(folder_path)
+    return folder_path
+
+
 @dataclasses.dataclass
 class TokenizeResult:
     """Result of breaking down a file into smaller files based on token count."""
     file_paths: List[str]
     total_tokens: int
+    # Files in each chunk, if the content was chunked at file boundaries.
+    chunks: List[FlattenChunk] = dataclasses.field(default_factory=list)
+    # Tokenized files by extension, if the content was chunked at file boundaries.
+    token_stats: Dict[str, TokenStats] = dataclasses.field(default_factory=dict)
 
 
-def tokenize_file(
+async def tokenize_file(
         file_path: str,
         out_dir: str,
         tokenizer: TokenizerProvider,
         config: GlobalConfig,
 ) -> TokenizeResult:
+    """Splits the file into `chunk_<token offset>.md` files of `max_tokens_per_chunk` tokens.
+
+    The file is read and encoded in windows, so memory use is bounded by the chunk size rather than the file size.
+    No files are written if the whole file fits into a single chunk.
+    """
+    return await chunk_file(file_path, TokenChunker(out_dir, tokenizer, config))
+
+
+async def chunk_file(file_path: str, chunker: Union["TokenChunker", "FileChunker"]) -> TokenizeResult:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
-    max_tokens_per_file = 100_000
-    if config.repo_analysis.HasField("flatten"):
-        max_tokens_per_file = config.repo_analysis.flatten.max_tokens_per_chunk
-    if max_tokens_per_file <= 0:
-        raise ValueError("max_tokens_per_file must be greater than 0")
-
-    # Read the input file
     with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+        while True:
+            data = f.read(chunker.window_chars)
+            if not data:
+                break
+            await chunker.write(data)
+    return await chunker.close()
+
+
+_min_read_window_chars = 64 * 1024
+
+
+class TokenChunker:
+    """Splits streamed text into `chunk_<token offset>.md` files of `max_tokens_per_chunk` tokens.
+
+    Produces the same chunks as `tokenize_file` on the concatenated text. Text is encoded in segments ending on a
+    pre-tokenization boundary, which yields the same tokens as encoding it as a whole. A newline followed by an ASCII
+    letter or digit is one for regex based BPE tokenizers, e.g. all tiktoken encodings, as no pre-token spans it.
+    Text without such boundaries, e.g. minified lines, is accumulated until one is found.
+    """
+    window_chars: int
+    _out_dir: str
+    _tokenizer: TokenizerProvider
+    _max_tokens: int
+    _pending: List[str]
+    _pending_chars: int = 0
+    _tokens: List[int]
+    _written_tokens: int = 0
+    _output_files: List[str]
+
+    def __init__(self, out_dir: str, tokenizer: TokenizerProvider, config: GlobalConfig):
+        max_tokens = _get_max_tokens_per_chunk(config)
+        self._out_dir = out_dir
+        self._tokenizer = tokenizer
+        self._max_tokens = max_tokens
+        # Roughly a chunk worth of text per encoding call.
+        self.window_chars = max(max_tokens * 4, _min_read_window_chars)
+        self._pending = []
+        self._tokens = []
+        self._output_files = []
+
+    async def write(self, text: str):
+        if len(text) == 0:
+            return
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if self._pending_chars < self.window_chars:
+            return
+        # Earlier pending text has no boundaries, only the new text is searched.
+        cut = _last_safe_cut(text)
+        if cut < 0:
+            return
+        head = "".join([*self._pending[:-1], text[:cut]])
+        self._pending = [text[cut:]]
+        self._pending_chars = len(text) - cut
+        await self._encode(head)
+
+    async def close(self) -> TokenizeResult:
+        await self._encode("".join(self._pending))
+        self._pending = []
+        self._pending_chars = 0
+        if len(self._output_files) > 0:
+            text = await self._tokenizer.adecode(self._tokens)
+            self._output_files.append(_write_chunk(self._out_dir, self._written_tokens, text))
+        return TokenizeResult(file_paths=self._output_files, total_tokens=self._written_tokens + len(self._tokens))
+
+    async def _encode(self, segment: str):
+        if len(segment) == 0:
+            return
+        self._tokens.extend(await self._tokenizer.aencode(segment))
+        # Only cut when more tokens follow, so text that fits into a single chunk produces no files.
+        while len(self._tokens) > self._max_tokens:
+            chunk_text = await self._tokenizer.adecode(self._tokens[:self._max_tokens])
+            self._output_files.append(_write_chunk(self._out_dir, self._written_tokens, chunk_text))
+            self._written_tokens += self._max_tokens
+            del self._tokens[:self._max_tokens]
+
+
+def _last_safe_cut(data: str) -> int:
+    i = data.rfind("\n", 0, len(data) - 1)
+    while i >= 0:
+        c = data[i + 1]
+        if c.isascii() and c.isalnum():
+            return i + 1
+        i = data.rfind("\n", 0, i)
+    return -1
+
+
+# Lines starting and ending files in the markdown and xml output styles of repomix: file headers, code fences and
+# closing tags.
+_file_marker = re.compile(
+    r'^(?:## File: (?P<md>.+)|<file path="(?P<xml>.+)">|(?P<fence>`{3,})[^`\n]*|</file>)$', re.MULTILINE,
+)
 
-    # Tokenize the content
-    tokens = tokenizer.encode(content)
-    total_tokens = len(tokens)
-    if total_tokens <= max_tokens_per_file:
-        return TokenizeResult(file_paths=[], total_tokens=total_tokens)
 
-    # Create output files
-    output_files = []
-    for i in range(0, total_tokens, max_tokens_per_file):
-        chunk_tokens = tokens[i:i + max_tokens_per_file]
-        chunk_text = tokenizer.decode(chunk_tokens)
-        out_file = os.path.join(out_dir, f"chunk_{i}.md")
-        with open(out_file, 'w', encoding='utf-8') as f:
-            f.write(chunk_text)
+@dataclasses.dataclass
+class _Section:
+    """Content of a single file with its header, or content preceding the first file if `path` is None."""
+    path: Optional[str]
+    text: str
+
+
+class FileChunker:
+    """Splits streamed combined repository content into chunk files at file boundaries.
+
+    Whole files are packed into `chunk_<token offset>.md` files of up to `max_tokens_per_chunk` tokens, only files
+    larger than a chunk are split. Files are either written one by one with `write_file`, or recognized in content
+    passed to `write` by the headers of the markdown and xml output styles of repomix. A header only starts a file
+    before the first file or after the closing fence or tag of the previous one, so headers quoted in file content
+    are kept as content. Content without headers is chunked like in `TokenChunker`. Files are tokenized
+    separately, so the token count of a chunk may differ slightly from the count of its content as a whole.
+
+    Paths of chunk files are passed to `on_chunk` as soon as they are written, nothing is passed if the content
+    fits into a single chunk.
+    """
+    window_chars: int
+    _out_dir: str
+    _tokenizer: TokenizerProvider
+    _max_tokens: int
+    # Incomplete trailing line of the written content.
+    _tail: str = ""
+    # Whether `write` is inside a file, i.e. a header was seen but not yet the line closing the file.
+    _in_file: bool = False
+    # Line closing the current file, None until the opening fence of a markdown file is seen.
+    _closing: Optional[str] = None
+    _section_path: Optional[str] = None
+    _section_parts: List[str]
+    # Complete sections waiting to be counted.
+    _ready: List[_Section]
+    _ready_chars: int = 0
+    _chunk_parts: List[str]
+    _chunk_files: List[str]
+    _chunk_tokens: int = 0
+    _written_tokens: int = 0
+    _output_files: List[str]
+    _chunks: List[FlattenChunk]
+    _token_stats: Dict[str, TokenStats]
+    _on_chunk: Optional[Callable[[str], Awaitable[None]]]
+    _published: int = 0
+
+    def __init__(
+            self,
+            out_dir: str,
+            tokenizer: TokenizerProvider,
+            config: GlobalConfig,
+            on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+    ):
+        max_tokens = _get_max_tokens_per_chunk(config)
+        self._out_dir = out_dir
+        self._tokenizer = tokenizer
+        self._max_tokens = max_tokens
+        self._on_chunk = on_chunk
+        self.window_chars = max(max_tokens * 4, _min_read_window_chars)
+        self._section_parts = []
+        self._ready = []
+        self._chunk_parts = []
+        self._chunk_files = []
+        self._output_files = []
+        self._chunks = []
+        self._token_stats = {}
+
+    async def write(self, text: str):
+        data = self._tail + text
+        end = data.rfind("\n") + 1
+        self._tail = data[end:]
+        start = 0
+        for m in _file_marker.finditer(data, 0, end):
+            path = m.group("md") or m.group("xml")
+            if path is not None and not self._in_file:
+                self._append(data[start:m.start()])
+                self._finish_section()
+                self._section_path = path
+                self._in_file = True
+                self._closing = "</file>" if m.group("xml") is not None else None
+                start = m.start()
+            elif self._in_file and self._closing is None and m.group("fence") is not None:
+                self._closing = m.group("fence")
+            elif self._in_file and m.group(0) == self._closing:
+                self._in_file = False
+                self._closing = None
+        self._append(data[start:end])
+        await self._pack_if_ready()
+
+    async def write_file(self, path: Optional[str], text: str):
+        """Writes the rendered content of a whole file, or content that belongs to no file if `path` is None."""
+        self._append(self._tail)
+        self._tail = ""
+        self._finish_section()
+        self._section_path = path
+        self._append(text)
+        self._finish_section()
+        await self._pack_if_ready()
+
+    async def close(self) -> TokenizeResult:
+        self._append(self._tail)
+        self._tail = ""
+        self._finish_section()
+        await self._pack_ready()
+        if len(self._output_files) > 0:
+            self._flush_chunk()
+            await self._publish()
+            return TokenizeResult(
+                file_paths=self._output_files, total_tokens=self._written_tokens, chunks=self._chunks,
+                token_stats=self._token_stats,
+            )
+        chunk = FlattenChunk(name="", tokens=self._chunk_tokens, files=self._chunk_files)
+        return TokenizeResult(
+            file_paths=[], total_tokens=self._chunk_tokens, chunks=[chunk], token_stats=self._token_stats,
+        )
+
+    def _append(self, text: str):
+        if len(text) > 0:
+            self._section_parts.append(text)
+
+    async def _pack_if_ready(self):
+        if self._ready_chars >= self.window_chars:
+            await self._pack_ready()
+            await self._publish()
+
+    async def _publish(self):
+        while self._published < len(self._output_files):
+            path = self._output_files[self._published]
+            self._published += 1
+            if self._on_chunk is not None:
+                await self._on_chunk(path)
+
+    def _finish_section(self):
+        text = "".join(self._section_parts)
+        if len(text) > 0:
+            self._ready.append(_Section(path=self._section_path, text=text))
+            self._ready_chars += len(text)
+        self._section_path = None
+        self._section_parts = []
+
+    async def _pack_ready(self):
+        sections = self._ready
+        self._ready = []
+        self._ready_chars = 0
+        if len(sections) == 0:
+            return
+        counts = await self._tokenizer.acount([section.text for section in sections])
+        for section, tokens in zip(sections, counts):
+            if section.path is not None:
+                stats = self._token_stats.setdefault(file_extension(section.path), TokenStats())
+                stats.add(TokenStats(bytes=len(section.text.encode("utf-8")), tokens=tokens))
+            if tokens > self._max_tokens:
+                await self._split(section)
+                continue
+            if self._chunk_tokens + tokens > self._max_tokens:
+                self._flush_chunk()
+            self._add_to_chunk(section, section.text, tokens)
+
+    async def _split(self, section: _Section):
+        """Splits a section larger than a chunk, the remainder starts the next chunk."""
+        self._flush_chunk()
+        tokens = await self._tokenizer.aencode(section.text)
+        for i in range(0, len(tokens), self._max_tokens):
+            piece = tokens[i:i + self._max_tokens]
+            self._add_to_chunk(section, await self._tokenizer.adecode(piece), len(piece))
+            if len(piece) == self._max_tokens:
+                self._flush_chunk()
+
+    def _add_to_chunk(self, section: _Section, text: str, tokens: int):
+        self._chunk_parts.append(text)
+        self._chunk_tokens += tokens
+        if section.path is not None:
+            self._chunk_files.append(section.path)
+
+    def _flush_chunk(self):
+        if len(self._chunk_parts) == 0:
+            return
+        path = _write_chunk(self._out_dir, self._written_tokens, "".join(self._chunk_parts))
+        self._output_files.append(path)
+        self._chunks.append(FlattenChunk(
+            name=os.path.basename(path), tokens=self._chunk_tokens, files=self._chunk_files,
+        ))
+        self._written_tokens += self._chunk_tokens
+        self._chunk_parts = []
+        self._chunk_files = []
+        self._chunk_tokens = 0
+
+
+def file_extension(path: str) -> str:
+    """Lower case extension of the file including the dot, empty if it has none."""
+    return os.path.splitext(path)[1].lower()
+
+
+def _get_max_tokens_per_chunk(config: GlobalConfig) -> int:
+    max_tokens = 100_000
+    if config.repo_analysis.HasField("flatten"):
+        max_tokens = config.repo_analysis.flatten.max_tokens_per_chunk
+    if max_tokens <= 0:
+        raise ValueError("max_tokens_per_file must be greater than 0")
+    return max_tokens
 
-        output_files.append(out_file)
 
-    return TokenizeResult(file_paths=output_files, total_tokens=total_tokens)
+def _write_chunk(out_dir: str, offset: int, text: str) -> str:
+    out_file = os.path.join(out_dir, f"chunk_{offset}.md")
+    with open(out_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return out_file
 
 
 @dataclasses.dataclass
@@ -202,11 +529,22 @@ async def flatten_repository(
         provider: GitRepositoryProvider,
         tokenizer: TokenizerProvider,
         config: GlobalConfig,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
 ) -> FlattenRepoResult:
+    """Clones, flattens and chunks the repository. Chunk files are passed to `on_chunk` as they are written."""
+    flatten_config = config.repo_analysis.flatten
+    options = CloneOptions(
+        blobless=flatten_config.blobless_clone,
+        single_branch=True,
+        timeout_sec=flatten_config.clone_timeout_sec or None,
+    )
+    if flatten_config.sparse_checkout:
+        options.sparse_exclude = get_sparse_exclude(config, await provider.get_repo(repo))
     clone_result = await clone_repository(
         repo, provider,
-        max_size_mb=config.repo_analysis.flatten.max_repo_size_mb,
+        max_size_mb=flatten_config.max_repo_size_mb,
         depth="1",
+        options=options,
     )
     repo_path = clone_result.path
     combined_file_path: Optional[str] = None
@@ -216,22 +554,40 @@ async def flatten_repository(
         if os.path.exists(repo_path):
             shutil.rmtree(repo_path)
             cleaned = True
-        if clean_up is not None and os.path.exists(combined_file_path):
+        if combined_file_path is not None and os.path.exists(combined_file_path):
             os.remove(combined_file_path)
             cleaned = True
         return cleaned
 
-    combine_result = await combine_repository(repo_path, clone_result.repo, config)
-    combined_file_path = combine_result.file_path
-    out_dir = combine_result.output_dir
-    _log.debug(s_("Tokenizing..."))
-    tokenize_result = tokenize_file(combined_file_path, out_dir, tokenizer, config)
-    _log.debug(s_("File tokenized"))
+    try:
+        commit_sha = await get_head_sha(repo_path)
+        if config.repo_analysis.flatten.flattener == "native":
+            out_dir = make_output_dir(repo_path, "devplan_tmp_native")
+            chunker = FileChunker(out_dir, tokenizer, config, on_chunk)
+            # Tokenized while flattening, the combined file is not read again.
+            combine_result = await combine_repository_native(
+                repo_path, clone_result.repo, config, out_dir, on_file=chunker.write_file)
+            combined_file_path = combine_result.file_path
+            tokenize_result = await chunker.close()
+        else:
+            combine_result = await combine_repository(repo_path, clone_result.repo, config)
+            combined_file_path = combine_result.file_path
+            out_dir = combine_result.output_dir
+            _log.debug(s_("Tokenizing..."))
+            tokenize_result = await chunk_file(combined_file_path, FileChunker(out_dir, tokenizer, config, on_chunk))
+    except BaseException:
+        # Including cancellation, e.g. when analyses of a pipelined flatten fail.
+        clean_up()
+        raise
+    _log.debug(s_("File tokenized", chunks=len(tokenize_result.file_paths)))
     flatten_result = FlattenResult(
         full_file_path=combined_file_path,
         file_paths=tokenize_result.file_paths,
         total_tokens=tokenize_result.total_tokens,
         clean_up=clean_up,
+        result_data=ProcessingItemResultData(chunks=tokenize_result.chunks),
+        commit_sha=commit_sha,
+        token_stats=tokenize_result.token_stats,
     )
     return FlattenRepoResult(
         flatten_result=flatten_result,
@@ -248,6 +604,10 @@ async def flatten_repo_changes(
     clone_result = await clone_repository(
         params.repo, provider,
         max_size_mb=config.repo_analysis.flatten.max_repo_size_mb,
+        # History of the default branch only, files of all its commits are needed for diffs.
+        options=CloneOptions(
+            single_branch=True, timeout_sec=config.repo_analysis.flatten.clone_timeout_sec or None,
+        ),
     )
     repo_path = clone_result.path
     combined_file_path: Optional[str] = None
@@ -257,16 +617,22 @@ async def flatten_repo_changes(
         if os.path.exists(repo_path):
             shutil.rmtree(repo_path)
             cleaned = True
-        if clean_up is not None and os.path.exists(combined_file_path):
+        if combined_file_path is not None and os.path.exists(combined_file_path):
             os.remove(combined_file_path)
             cleaned = True
         return cleaned
 
-    combine_result = await combine_commits(repo_path, params.from_date, params.to_date)
-    combined_file_path = combine_result.file_path
-    out_dir = combine_result.output_dir
-    _log.debug(s_("Tokenizing...", combine_result=combine_result))
-    tokenize_result = tokenize_file(combined_file_path, out_dir, tokenizer, config)
+    try:
+        out_dir = make_output_dir(repo_path, "devplan_tmp_commits_summary")
+        chunker = TokenChunker(out_dir, tokenizer, config)
+        # Tokenized while the log is written, the combined file is not read again.
+        combine_result = await combine_commits(
+            repo_path, clone_result.repo, config, params.from_date, params.to_date, out_dir, chunker.write)
+        combined_file_path = combine_result.file_path
+        tokenize_result = await chunker.close()
+    except BaseException:
+        clean_up()
+        raise
     _log.debug(s_("File tokenized", tokenize_result=tokenize_result))
     flatten_result = FlattenResult(
         full_file_path=combined_file_path,
@@ -280,37 +646,23 @@ async def flatten_repo_changes(
     )
 
 
-async def combine_commits(repo_path: str, from_date: datetime, to_date: datetime) -> CombineResult:
-    suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-    folder_path = os.path.join(repo_path, f"devplan_tmp_commits_summary_{suffix}")
-    os.makedirs(folder_path)
-    output_file = os.path.join(folder_path, "full.txt")
-
-    # Run repomix to combine the repository into a single file
-    from_str = format_datetime_for_git(from_date)
-    to_str = format_datetime_for_git(to_date)
-    cmd = f'git log --pretty=format:"%h %an <%ae> %s" --since="{from_str}" --until="{to_str}" -p'
-    _log.debug(s_("Executing git log...", output_file=output_file, cmd=cmd))
-    out, err, code = await run_shell_command_async(cmd, cwd=repo_path)
-    if code == 0:
-        with open(output_file, "w") as f:
-            f.write(out.decode("utf-8"))
-    else:
-        _log.error(s_("Failed to get log for repository.", out=out, code=code))
-        with open(output_file, "w") as f:
-            f.write(f"Failed to get commits: {err}")
-
-    _log.debug(s_("Done.", output_file=output_file, code=code))
-
-    # Get the size of the combined file
+async def combine_commits(
+        repo_path: str,
+        info: RepositoryInfo,
+        config: GlobalConfig,
+        from_date: datetime,
+        to_date: datetime,
+        output_dir: str,
+        on_content: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> CombineResult:
+    """Combines commits between the dates with their diffs into a single file.
+
+    The log is passed to `on_content` as it is written, see `write_commits`.
+    """
+    output_file = os.path.join(output_dir, "full.md")
+    await write_commits(repo_path, info, config, from_date, to_date, output_file, on_content)
     size_bytes = os.path.getsize(output_file)
-
-    return CombineResult(file_path=output_file, size_bytes=size_bytes, output_dir=folder_path)
-
-
-def format_datetime_for_git(dt: datetime) -> str:
-    """Format datetime for git --since/--until parameters"""
-    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+    return CombineResult(file_path=output_file, size_bytes=size_bytes, output_dir=output_dir)
 
 
 async def run_shell_command_async(command: str, cwd: Optional[str] = None) -> Tuple[bytes, bytes, int]:
@@ -0,0 +1,267 @@
+import asyncio
+import collections
+import logging
+import os
+import re
+from typing import List, Optional, Callable, Awaitable, Deque, Tuple
+
+from dev_observer.api.types.config_pb2 import GlobalConfig
+from dev_observer.log import s_
+from dev_observer.repository.provider import RepositoryInfo
+
+_log = logging.getLogger(__name__)
+
+# Files read ahead of the one being written.
+_read_ahead = 32
+_binary_sniff_bytes = 8 * 1024
+
+# Similar to the default patterns of repomix.
+_default_ignore = [
+    ".git/**",
+    "**/node_modules/**",
+    "**/__pycache__/**",
+    "**/.venv/**",
+    "**/venv/**",
+    "**/.DS_Store",
+    "**/*.log",
+    "**/package-lock.json",
+    "**/yarn.lock",
+    "**/pnpm-lock.yaml",
+    "**/bun.lockb",
+    "**/poetry.lock",
+    "**/uv.lock",
+    "**/Pipfile.lock",
+    "**/Cargo.lock",
+    "**/Gemfile.lock",
+    "**/composer.lock",
+    "**/go.sum",
+]
+
+
+async def write_repository(
+        repo_path: str,
+        info: RepositoryInfo,
+        config: GlobalConfig,
+        output_file: str,
+        on_content: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_file: Optional[Callable[[Optional[str], str], Awaitable[None]]] = None,
+):
+    """Combines repository files into a markdown file similar to the one produced by repomix.
+
+    Files are listed with `git ls-files`, so `.gitignore` rules apply to git repositories, and filtered with the
+    `ignore_pattern` of the flatten config and default patterns for dependencies and lock files. Files larger than
+    `max_file_size_bytes` and binary files are skipped. Files are read in parallel and written in path order, every
+    written piece of content is also passed to `on_content`, e.g. to tokenize it without reading the file again.
+    `on_file` gets the same content along with the path of the file it renders, None for the header, so that file
+    boundaries don't have to be parsed back out of the content. Compression is not supported.
+    """
+    max_file_size = get_max_file_size(config)
+    ignore = get_ignore_matcher(config, info)
+    _log.info(s_("Starting native repo flatten", size_kb=info.size_kb))
+
+    rel_output_dir = os.path.relpath(os.path.dirname(output_file), repo_path).replace(os.sep, "/")
+    files = [
+        path for path in await list_files(repo_path)
+        if not ignore.fullmatch(path) and not path.startswith(f"{rel_output_dir}/")
+    ]
+
+    skipped = 0
+    with open(output_file, "w", encoding="utf-8") as out:
+        async def write(path: Optional[str], text: str):
+            out.write(text)
+            if on_content is not None:
+                await on_content(text)
+            if on_file is not None:
+                await on_file(path, text)
+
+        await write(None, _header(files))
+        pending: Deque[Tuple[str, asyncio.Future[Optional[str]]]] = collections.deque()
+        index = 0
+        while index < len(files) or len(pending) > 0:
+            while index < len(files) and len(pending) < _read_ahead:
+                path = files[index]
+                pending.append((path, asyncio.ensure_future(
+                    asyncio.to_thread(_read_file, os.path.join(repo_path, path), max_file_size))))
+                index += 1
+            path, future = pending.popleft()
+            content = await future
+            if content is None:
+                skipped += 1
+                continue
+            await write(path, _render_file(path, content))
+
+    _log.debug(s_("Done.", output_file=output_file, files=len(files), skipped=skipped))
+
+
+def get_ignore_patterns(config: GlobalConfig, info: RepositoryInfo) -> List[str]:
+    """Patterns of files excluded from flattening by default or by the flatten config."""
+    flatten_config = config.repo_analysis.flatten
+    patterns = [*_default_ignore, *split_patterns(flatten_config.ignore_pattern)]
+    large_threshold_kb = (flatten_config.large_repo_threshold_mb or 500) * 1024
+    if info.size_kb > large_threshold_kb:
+        patterns.extend(split_patterns(flatten_config.large_repo_ignore_pattern))
+    return patterns
+
+
+def get_ignore_matcher(config: GlobalConfig, info: RepositoryInfo) -> re.Pattern:
+    """Matches paths of files excluded from flattening by default or by the flatten config."""
+    return compile_patterns(get_ignore_patterns(config, info))
+
+
+def get_sparse_exclude(config: GlobalConfig, info: RepositoryInfo) -> List[str]:
+    """Ignore patterns that can be excluded from a sparse checkout, see `CloneOptions.sparse_exclude`.
+
+    Patterns are matched the same way as `.gitignore` ones, except for braces and negations which git doesn't
+    support. Such patterns are left to the flattener.
+    """
+    return [
+        p for p in get_ignore_patterns(config, info)
+        if p != ".git/**" and not p.startswith("!") and "{" not in p
+    ]
+
+
+def get_max_file_size(config: GlobalConfig) -> int:
+    return config.repo_analysis.flatten.max_file_size_bytes or 50_000
+
+
+async def list_files(repo_path: str) -> List[str]:
+    """Returns paths of files relative to `repo_path`, honoring `.gitignore` if it is a git work tree."""
+    process = await asyncio.create_subprocess_exec(
+        "git", "ls-files", "-z", "--cached", "--others", "--exclude-standard",
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=repo_path,
+    )
+    out, err = await process.communicate()
+    if process.returncode == 0:
+        paths = {p for p in out.decode("utf-8").split("\0") if len(p) > 0}
+        # Deleted but not yet staged files are still listed by the index.
+        return sorted(p for p in paths if os.path.isfile(os.path.join(repo_path, p)))
+    _log.debug(s_("Not a git work tree, listing all files", error=err.decode("utf-8").strip()))
+    return await asyncio.to_thread(_walk, repo_path)
+
+
+def split_patterns(value: str) -> List[str]:
+    """Splits comma separated patterns, keeping commas inside braces."""
+    result: List[str] = []
+    depth = 0
+    current: List[str] = []
+    for c in value:
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth = max(0, depth - 1)
+        elif c == "," and depth == 0:
+            result.append("".join(current))
+            current = []
+            continue
+        current.append(c)
+    result.append("".join(current))
+    return [p.strip() for p in result if len(p.strip()) > 0]
+
+
+def compile_patterns(patterns: List[str]) -> re.Pattern:
+    """Compiles glob patterns into a regex matching relative paths with `/` separators.
+
+    Supports `*`, `**`, `?`, `[...]` and `{a,b}`. Patterns without a slash match at any depth unless they start
+    with one, and patterns matching a directory also match everything in it, like in `.gitignore`.
+    """
+    if len(patterns) == 0:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{_translate(p)})" for p in patterns))
+
+
+def _translate(pattern: str) -> str:
+    anchored = pattern.startswith("/")
+    pattern = pattern.strip("/")
+    if not anchored and "/" not in pattern and not pattern.startswith("**"):
+        pattern = f"**/{pattern}"
+    result: List[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            result.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            result.append(".*")
+            i += 2
+        elif c == "*":
+            result.append("[^/]*")
+            i += 1
+        elif c == "?":
+            result.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end < 0:
+                result.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = f"^{body[1:]}"
+            result.append(f"[{body}]")
+            i = end + 1
+        elif c == "{":
+            end = pattern.find("}", i + 1)
+            if end < 0:
+                result.append(re.escape(c))
+                i += 1
+                continue
+            options = pattern[i + 1:end].split(",")
+            result.append(f"(?:{'|'.join(_translate_part(o) for o in options)})")
+            i = end + 1
+        else:
+            result.append(re.escape(c))
+            i += 1
+    return f"{''.join(result)}(?:/.*)?"
+
+
+def _translate_part(part: str) -> str:
+    return "".join("[^/]*" if c == "*" else "[^/]" if c == "?" else re.escape(c) for c in part)
+
+
+def _walk(repo_path: str) -> List[str]:
+    result: List[str] = []
+    for dir_path, dir_names, file_names in os.walk(repo_path):
+        dir_names[:] = [d for d in dir_names if d != ".git"]
+        for name in file_names:
+            path = os.path.join(dir_path, name)
+            if os.path.isfile(path):
+                result.append(os.path.relpath(path, repo_path).replace(os.sep, "/"))
+    return sorted(result)
+
+
+def _read_file(path: str, max_size: int) -> Optional[str]:
+    """Returns the file content, or None if it is too large or binary."""
+    try:
+        if os.path.getsize(path) > max_size:
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        _log.debug(s_("Failed to read file", path=path, error=e))
+        return None
+    if b"\0" in data[:_binary_sniff_bytes]:
+        return None
+    return data.decode("utf-8", errors="replace")
+
+
+def _header(files: List[str]) -> str:
+    tree = "\n".join(files)
+    return (
+        "This file is a merged representation of the repository files, combined into a single document.\n\n"
+        "# Directory Structure\n"
+        f"```\n{tree}\n```\n\n"
+        "# Files\n\n"
+    )
+
+
+def _render_file(path: str, content: str) -> str:
+    fence = "```"
+    while fence in content:
+        fence += "`"
+    if not content.endswith("\n"):
+        content += "\n"
+    ext = os.path.splitext(path)[1].lstrip(".")
+    return f"## File: {path}\n{fence}{ext}\n{content}{fence}\n\n"
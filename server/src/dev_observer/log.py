@@ -84,6 +84,19 @@ def configure_logging(default_level: str = "INFO") -> None:
     root_logger.addHandler(stderr_handler)
 
 
+# Libraries that are too verbose below warnings.
+_quiet_loggers = ["boto3", "botocore", "aiobotocore", "httpcore", "openai"]
+
+
+def configure_app_logging() -> None:
+    """Logging of the server and worker entry points."""
+    global encoder
+    encoder = PlainTextEncoder(color=os.getenv("PYTHON_ENV") == "development")
+    configure_logging()
+    for name in _quiet_loggers:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+
 class StructuredMessage:
     message: str
     kwargs: dict
@@ -0,0 +1,226 @@
+import asyncio
+import collections
+import dataclasses
+import hashlib
+import logging
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
+from dev_observer.common.disk_lru import DiskLRU
+from dev_observer.log import s_
+from dev_observer.observations.provider import ObservationsProvider, VersionedObservation, \
+    default_batch_concurrency
+
+_log = logging.getLogger(__name__)
+
+# Lookups between stats log lines.
+_stats_log_interval = 1000
+
+
+@dataclasses.dataclass
+class ObservationsCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_bytes: int = 0
+    # Known once something was written to the disk tier.
+    disk_bytes: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+@dataclasses.dataclass
+class _Entry:
+    content: str
+    version: str
+    size: int
+
+
+class CachingObservationsProvider(ObservationsProvider):
+    """Read-through cache of observations in front of another provider.
+
+    Contents are kept in memory, least recently used ones are evicted once they take more than `max_memory_bytes`.
+    Evicted entries move to files under `disk_dir` if set, bounded by `max_disk_bytes` in the same way, the version
+    on the first line followed by the content. Disk access runs in worker threads. Every `get`
+    revalidates the cached version, e.g. ETag or generation, with the provider, so changes made by other processes
+    are seen, and only the content transfer is saved. Providers without versions are not cached. `store` and
+    `delete` invalidate cached entries.
+    """
+    _provider: ObservationsProvider
+    _max_memory_bytes: int
+    _memory: "collections.OrderedDict[str, _Entry]"
+    _disk: Optional[DiskLRU]
+    _stats: ObservationsCacheStats
+
+    def __init__(
+            self,
+            provider: ObservationsProvider,
+            max_memory_bytes: int,
+            disk_dir: Optional[str] = None,
+            max_disk_bytes: int = 0,
+    ):
+        self._provider = provider
+        self._max_memory_bytes = max_memory_bytes
+        self._memory = collections.OrderedDict()
+        self._disk = DiskLRU(disk_dir, max_disk_bytes) if disk_dir is not None and max_disk_bytes > 0 else None
+        self._stats = ObservationsCacheStats()
+        # Shared by the event loops of the server and its embedded processing.
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> ObservationsCacheStats:
+        with self._lock:
+            stats = dataclasses.replace(self._stats)
+        if self._disk is not None:
+            stats.disk_bytes = self._disk.size or 0
+        return stats
+
+    async def get(self, key: ObservationKey) -> Observation:
+        cache_key = _cache_key(key)
+        entry, tier = await self._lookup(cache_key)
+        result = await self._provider.get_versioned(key, entry.version if entry is not None else None)
+        if result.observation is None:
+            self._record(tier)
+            return Observation(key=key, content=entry.content)
+        self._record(None)
+        observation = result.observation
+        if result.version is not None:
+            await self._put(cache_key, _Entry(observation.content, result.version, _size(observation.content)))
+        return observation
+
+    async def get_versioned(self, key: ObservationKey, known_version: Optional[str] = None) -> VersionedObservation:
+        return await self._provider.get_versioned(key, known_version)
+
+    async def store(self, o: Observation):
+        await self._invalidate(_cache_key(o.key))
+        await self._provider.store(o)
+        # Reads of the old version that were in flight may have put it back.
+        await self._invalidate(_cache_key(o.key))
+
+    async def store_many(self, observations: Sequence[Observation], concurrency: int = default_batch_concurrency):
+        cache_keys = [_cache_key(o.key) for o in observations]
+        await self._invalidate(*cache_keys)
+        await self._provider.store_many(observations, concurrency)
+        await self._invalidate(*cache_keys)
+
+    async def delete(self, key: ObservationKey) -> bool:
+        await self._invalidate(_cache_key(key))
+        deleted = await self._provider.delete(key)
+        await self._invalidate(_cache_key(key))
+        return deleted
+
+    async def list(self, kind: str, path: Optional[str] = None) -> List[ObservationKey]:
+        return await self._provider.list(kind, path)
+
+    async def exists(self, key: ObservationKey) -> bool:
+        return await self._provider.exists(key)
+
+    async def exists_many(
+            self, keys: Sequence[ObservationKey], concurrency: int = default_batch_concurrency,
+    ) -> List[bool]:
+        return await self._provider.exists_many(keys, concurrency)
+
+    async def close(self):
+        await self._provider.close()
+
+    async def _lookup(self, cache_key: str) -> Tuple[Optional[_Entry], Optional[str]]:
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                self._memory.move_to_end(cache_key)
+                return entry, "memory"
+        if self._disk is None:
+            return None, None
+        data = await asyncio.to_thread(self._disk.get, _disk_name(cache_key))
+        if data is None:
+            return None, None
+        version, _, content = data.partition("\n")
+        entry = _Entry(content, version, _size(content))
+        await self._put(cache_key, entry)
+        return entry, "disk"
+
+    async def _put(self, cache_key: str, entry: _Entry):
+        if entry.size > self._max_memory_bytes:
+            # Too large for memory, a previous version kept there would otherwise shadow it.
+            with self._lock:
+                old = self._memory.pop(cache_key, None)
+                if old is not None:
+                    self._stats.memory_bytes -= old.size
+            await self._put_disk([(cache_key, entry)])
+            return
+        evicted: List[Tuple[str, _Entry]] = []
+        with self._lock:
+            old = self._memory.pop(cache_key, None)
+            if old is not None:
+                self._stats.memory_bytes -= old.size
+            self._memory[cache_key] = entry
+            self._stats.memory_bytes += entry.size
+            while self._stats.memory_bytes > self._max_memory_bytes:
+                evicted_key, evicted_entry = self._memory.popitem(last=False)
+                self._stats.memory_bytes -= evicted_entry.size
+                evicted.append((evicted_key, evicted_entry))
+        await self._put_disk(evicted)
+
+    async def _put_disk(self, entries: List[Tuple[str, _Entry]]):
+        disk = self._disk
+        if disk is None or len(entries) == 0:
+            return
+
+        def put():
+            for cache_key, entry in entries:
+                disk.put(_disk_name(cache_key), f"{entry.version}\n{entry.content}")
+
+        await asyncio.to_thread(put)
+
+    async def _invalidate(self, *cache_keys: str):
+        with self._lock:
+            for cache_key in cache_keys:
+                entry = self._memory.pop(cache_key, None)
+                if entry is not None:
+                    self._stats.memory_bytes -= entry.size
+        disk = self._disk
+        if disk is None:
+            return
+
+        def remove():
+            for cache_key in cache_keys:
+                disk.remove(_disk_name(cache_key))
+
+        await asyncio.to_thread(remove)
+
+    def _record(self, tier: Optional[str]):
+        with self._lock:
+            match tier:
+                case "memory":
+                    self._stats.memory_hits += 1
+                case "disk":
+                    self._stats.disk_hits += 1
+                case _:
+                    self._stats.misses += 1
+            stats = self._stats
+            log_stats = (stats.hits + stats.misses) % _stats_log_interval == 0
+        if log_stats:
+            stats = self.stats
+            _log.info(s_("Observations cache stats", hit_rate=round(stats.hit_rate, 3), memory_hits=stats.memory_hits,
+                         disk_hits=stats.disk_hits, misses=stats.misses, memory_bytes=stats.memory_bytes,
+                         disk_bytes=stats.disk_bytes))
+
+
+def _cache_key(key: ObservationKey) -> str:
+    return f"{key.kind}/{key.key}"
+
+
+def _disk_name(cache_key: str) -> str:
+    return hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+
+
+def _size(content: str) -> int:
+    return len(content.encode("utf-8"))
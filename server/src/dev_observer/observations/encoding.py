@@ -0,0 +1,102 @@
+import codecs
+import gzip
+import zlib
+from typing import Optional, List, Literal, Callable, Awaitable
+
+import zstandard
+
+Compression = Literal["none", "zstd", "gzip"]
+
+# Magic numbers the compressed frames start with mark the encoding of stored content. Neither is a valid start of
+# UTF-8 text, so observations stored uncompressed are read as before.
+_zstd_magic = b"\x28\xb5\x2f\xfd"
+_gzip_magic = b"\x1f\x8b"
+_content_types = {"zstd": "application/zstd", "gzip": "application/gzip"}
+# Smaller content, e.g. flags and metas, isn't worth compressing.
+_min_compressed_size = 512
+_read_size = 64 * 1024
+
+
+def encode_content(content: str, compression: Compression = "none", level: Optional[int] = None) -> bytes:
+    data = content.encode("utf-8")
+    if len(data) < _min_compressed_size:
+        return data
+    match compression:
+        case "zstd":
+            return zstandard.ZstdCompressor(level=level if level is not None else 3).compress(data)
+        case "gzip":
+            return gzip.compress(data, compresslevel=level if level is not None else 6, mtime=0)
+    return data
+
+
+def get_content_encoding(data: bytes) -> Optional[str]:
+    """Compression of encoded content, None if it's plain UTF-8 text."""
+    if data.startswith(_zstd_magic):
+        return "zstd"
+    if data.startswith(_gzip_magic):
+        return "gzip"
+    return None
+
+
+def get_content_type(data: bytes) -> Optional[str]:
+    """Content type to store encoded content with, None to keep the default of the store."""
+    encoding = get_content_encoding(data)
+    return _content_types[encoding] if encoding is not None else None
+
+
+def decode_content(data: bytes) -> str:
+    decoder = ContentDecoder()
+    decoder.feed(data)
+    return decoder.finish()
+
+
+async def read_content(read: Callable[[int], Awaitable[bytes]]) -> str:
+    """Decodes content from a stream, `read` returns up to the given number of bytes and empty bytes at the end."""
+    decoder = ContentDecoder()
+    while True:
+        data = await read(_read_size)
+        if len(data) == 0:
+            return decoder.finish()
+        decoder.feed(data)
+
+
+class ContentDecoder:
+    """Decompresses and decodes content fed in chunks, the encoding is detected from the first bytes."""
+
+    def __init__(self):
+        self._head = b""
+        self._detected = False
+        self._decompressor = None
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._parts: List[str] = []
+
+    def feed(self, data: bytes):
+        if not self._detected:
+            self._head += data
+            if len(self._head) < len(_zstd_magic):
+                return
+            data = self._detect()
+        self._decode(data)
+
+    def finish(self) -> str:
+        if not self._detected:
+            self._decode(self._detect())
+        if self._decompressor is not None and not self._decompressor.eof:
+            raise ValueError("Compressed content is truncated")
+        self._parts.append(self._text.decode(b"", final=True))
+        return "".join(self._parts)
+
+    def _detect(self) -> bytes:
+        self._detected = True
+        match get_content_encoding(self._head):
+            case "zstd":
+                self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+            case "gzip":
+                self._decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        data, self._head = self._head, b""
+        return data
+
+    def _decode(self, data: bytes):
+        if self._decompressor is not None:
+            data = self._decompressor.decompress(data)
+        self._parts.append(self._text.decode(data))
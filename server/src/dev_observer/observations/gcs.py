@@ -1,11 +1,15 @@
+import asyncio
 import os
 import logging
+import weakref
 from typing import List, Optional
 import aiohttp
 from gcloud.aio.storage import Storage
 
 from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
-from dev_observer.observations.provider import ObservationsProvider
+from dev_observer.log import s_
+from dev_observer.observations.encoding import Compression, encode_content, get_content_type, read_content
+from dev_observer.observations.provider import ObservationsProvider, VersionedObservation
 
 
 _log = logging.getLogger(__name__)
@@ -13,13 +17,49 @@ _log = logging.getLogger(__name__)
 
 class GCSObservationsProvider(ObservationsProvider):
     _bucket: str
+    _max_connections: int
+    _compression: Compression
+    _compression_level: Optional[int]
+    # Sessions are bound to the event loop they were created in, the server and its embedded processing run
+    # separate loops.
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient]"
     """
     Implementation of ObservationsProvider that stores observations in Google Cloud Storage (GCS).
-    Uses Application Default Credentials for authentication.
+    Uses Application Default Credentials for authentication, or the emulator set by `STORAGE_EMULATOR_HOST`.
+
+    A single session and client are lazily created per event loop and reused by all operations, so connections
+    and access tokens are shared between them. They are closed with `close`.
     """
 
-    def __init__(self, bucket: str):
+    def __init__(
+            self,
+            bucket: str,
+            max_connections: int = 50,
+            compression: Compression = "none",
+            compression_level: Optional[int] = None,
+    ):
         self._bucket = bucket
+        self._max_connections = max_connections
+        self._compression = compression
+        self._compression_level = compression_level
+        self._clients = weakref.WeakKeyDictionary()
+
+    async def close(self):
+        """Closes the client of the running event loop, a new one is created if the provider is used again."""
+        entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry.storage.close()
+            await entry.session.close()
+
+    def _get_client(self) -> Storage:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is None:
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._max_connections))
+            entry = _LoopClient(session, Storage(session=session))
+            self._clients[loop] = entry
+            _log.debug(s_("Created GCS client", bucket=self._bucket))
+        return entry.storage
 
     def _get_object_key(self, key: ObservationKey) -> str:
         return f"{key.kind}/{key.key}"
@@ -27,10 +67,8 @@ class GCSObservationsProvider(ObservationsProvider):
     async def exists(self, key: ObservationKey) -> bool:
         object_key = self._get_object_key(key)
         try:
-            async with aiohttp.ClientSession() as session:
-                client = Storage(session=session)
-                # Try to get object metadata - if it exists, this will succeed
-                await client.download(self._bucket, object_key, timeout=5)
+            # Metadata only, the content is not transferred.
+            await self._get_client().download_metadata(self._bucket, object_key, timeout=5)
             return True
         except aiohttp.ClientResponseError as e:
             if e.status == 404:
@@ -49,15 +87,13 @@ class GCSObservationsProvider(ObservationsProvider):
         object_key = self._get_object_key(o.key)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                client = Storage(session=session)
-                # Convert content to bytes if it's a string
-                content_bytes = o.content.encode('utf-8') if isinstance(o.content, str) else o.content
-                await client.upload(
-                    self._bucket,
-                    object_key,
-                    content_bytes
-                )
+            content_bytes = encode_content(o.content, self._compression, self._compression_level)
+            await self._get_client().upload(
+                self._bucket,
+                object_key,
+                content_bytes,
+                content_type=get_content_type(content_bytes),
+            )
             _log.debug(f"Stored observation {o.key.kind}/{o.key.key} in GCS")
         except aiohttp.ClientResponseError as e:
             error_msg = f"Error storing observation {o.key.kind}/{o.key.key} in GCS: {str(e)}"
@@ -76,25 +112,24 @@ class GCSObservationsProvider(ObservationsProvider):
             prefix = f"{kind}/{path}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                client = Storage(session=session)
-                # List all objects with the given prefix
-                kind_prefix = f"{kind}/"
-
-                # Use list_objects with prefix parameter
-                response = await client.list_objects(self._bucket, params={'prefix': prefix})
-
-                # Parse the response to extract object names
-                items = response.get('items', [])
-                for item in items:
-                    full_key = item['name']
-                    if full_key.startswith(kind_prefix):
-                        key_part = full_key[len(kind_prefix):]
-                        # Use the last part of the path as the name
-                        name = os.path.basename(key_part)
-                        result.append(ObservationKey(kind=kind, key=key_part, name=name))
-
-                return result
+            client = self._get_client()
+            # List all objects with the given prefix
+            kind_prefix = f"{kind}/"
+
+            # Use list_objects with prefix parameter
+            response = await client.list_objects(self._bucket, params={'prefix': prefix})
+
+            # Parse the response to extract object names
+            items = response.get('items', [])
+            for item in items:
+                full_key = item['name']
+                if full_key.startswith(kind_prefix):
+                    key_part = full_key[len(kind_prefix):]
+                    # Use the last part of the path as the name
+                    name = os.path.basename(key_part)
+                    result.append(ObservationKey(kind=kind, key=key_part, name=name))
+
+            return result
         except aiohttp.ClientResponseError as e:
             error_msg = f"Error listing observations of kind '{kind}' from GCS: {str(e)}"
             _log.error(error_msg)
@@ -120,11 +155,8 @@ class GCSObservationsProvider(ObservationsProvider):
         object_key = self._get_object_key(key)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                client = Storage(session=session)
-                content_bytes = await client.download(self._bucket, object_key)
-                content = content_bytes.decode("utf-8")
-                return Observation(key=key, content=content)
+            content = await self._download(self._get_client(), object_key)
+            return Observation(key=key, content=content)
         except aiohttp.ClientResponseError as e:
             if e.status == 404:
                 error_msg = f"Observation {key.kind}/{key.key} not found in GCS"
@@ -138,20 +170,49 @@ class GCSObservationsProvider(ObservationsProvider):
             _log.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    async def get_versioned(self, key: ObservationKey, known_version: Optional[str] = None) -> VersionedObservation:
+        """Compares the generation from the object metadata before downloading the content.
+
+        The content may be newer than the returned generation if the object is replaced in between, which only
+        causes an extra download on the next check.
+        """
+        object_key = self._get_object_key(key)
+        try:
+            client = self._get_client()
+            metadata = await client.download_metadata(self._bucket, object_key)
+            version = metadata.get("generation")
+            if known_version is not None and version == known_version:
+                return VersionedObservation(observation=None, version=version)
+            content = await self._download(client, object_key)
+            return VersionedObservation(observation=Observation(key=key, content=content), version=version)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                error_msg = f"Observation {key.kind}/{key.key} not found in GCS"
+                _log.error(error_msg)
+                raise RuntimeError(error_msg) from e
+            error_msg = f"Error getting observation {key.kind}/{key.key} from GCS: {str(e)}"
+            _log.error(error_msg)
+            raise RuntimeError(error_msg) from e
+        except Exception as e:
+            error_msg = f"Error getting observation {key.kind}/{key.key} from GCS: {str(e)}"
+            _log.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def _download(self, client: Storage, object_key: str) -> str:
+        stream = await client.download_stream(self._bucket, object_key)
+        async with stream:
+            return await read_content(stream.read)
+
     async def delete(self, key: ObservationKey) -> bool:
         object_key = self._get_object_key(key)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                client = Storage(session=session)
-                # Check if object exists first
-                if not await self.exists(key):
-                    return False
-
-                await client.delete(self._bucket, object_key)
-                _log.debug(f"Deleted observation {key.kind}/{key.key} from GCS")
-                return True
+            await self._get_client().delete(self._bucket, object_key)
+            _log.debug(f"Deleted observation {key.kind}/{key.key} from GCS")
+            return True
         except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                return False
             error_msg = f"Error deleting observation {key.kind}/{key.key} from GCS: {str(e)}"
             _log.error(error_msg)
             raise RuntimeError(error_msg) from e
@@ -159,3 +220,12 @@ class GCSObservationsProvider(ObservationsProvider):
             error_msg = f"Error deleting observation {key.kind}/{key.key} from GCS: {str(e)}"
             _log.error(error_msg)
             raise RuntimeError(error_msg) from e
+
+
+class _LoopClient:
+    session: aiohttp.ClientSession
+    storage: Storage
+
+    def __init__(self, session: aiohttp.ClientSession, storage: Storage):
+        self.session = session
+        self.storage = storage
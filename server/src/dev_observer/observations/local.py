@@ -1,21 +1,28 @@
 import os
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
+from dev_observer.observations.encoding import Compression, encode_content, ContentDecoder
 from dev_observer.observations.provider import ObservationsProvider
 
+_read_size = 64 * 1024
+
 
 class LocalObservationsProvider(ObservationsProvider):
     _dir: str
+    _compression: Compression
+    _compression_level: Optional[int]
 
-    def __init__(self, root_dir: str):
+    def __init__(self, root_dir: str, compression: Compression = "none", compression_level: Optional[int] = None):
         self._dir = root_dir
+        self._compression = compression
+        self._compression_level = compression_level
 
     async def store(self, o: Observation):
         file_path = self._get_key_path(o.key)
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w') as out_file:
-            out_file.write(o.content)
+        with open(file_path, 'wb') as out_file:
+            out_file.write(encode_content(o.content, self._compression, self._compression_level))
 
     async def list(self, kind: str, path: Optional[str] = None) -> List[ObservationKey]:
         result: List[ObservationKey] = []
@@ -37,6 +44,17 @@ class LocalObservationsProvider(ObservationsProvider):
         file_path = self._get_key_path(key)
         return os.path.exists(file_path)
 
+    # Operations are local, batches run one by one and `concurrency` is ignored.
+    async def get_many(self, keys: Sequence[ObservationKey], concurrency: int = 0) -> List[Observation]:
+        return [Observation(key=key, content=self._read_content(key)) for key in keys]
+
+    async def exists_many(self, keys: Sequence[ObservationKey], concurrency: int = 0) -> List[bool]:
+        return [os.path.exists(self._get_key_path(key)) for key in keys]
+
+    async def store_many(self, observations: Sequence[Observation], concurrency: int = 0):
+        for o in observations:
+            await self.store(o)
+
     async def delete(self, key: ObservationKey) -> bool:
         file_path = self._get_key_path(key)
         if os.path.exists(file_path):
@@ -59,5 +77,8 @@ class LocalObservationsProvider(ObservationsProvider):
         return os.path.join(self._get_root(key.kind), key.key)
 
     def _read_content(self, key: ObservationKey) -> str:
-        with open(self._get_key_path(key), 'r') as in_file:
-            return in_file.read()
+        decoder = ContentDecoder()
+        with open(self._get_key_path(key), 'rb') as in_file:
+            while data := in_file.read(_read_size):
+                decoder.feed(data)
+        return decoder.finish()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from dev_observer.api.types.observations_pb2 import ObservationKey, Observation
 from dev_observer.observations.provider import ObservationsProvider
@@ -9,6 +9,8 @@ class MemoryObservationsProvider(ObservationsProvider):
         self._observations: List[Observation] = []
 
     async def store(self, o: Observation):
+        # Overwrites like other providers do.
+        await self.delete(o.key)
         self._observations.append(o)
 
     async def list(self, kind: str, path: Optional[str] = None) -> List[ObservationKey]:
@@ -35,9 +37,20 @@ class MemoryObservationsProvider(ObservationsProvider):
                 return True
         return False
 
+    # Operations are local, batches run one by one and `concurrency` is ignored.
+    async def get_many(self, keys: Sequence[ObservationKey], concurrency: int = 0) -> List[Observation]:
+        return [await self.get(key) for key in keys]
+
+    async def exists_many(self, keys: Sequence[ObservationKey], concurrency: int = 0) -> List[bool]:
+        return [await self.exists(key) for key in keys]
+
+    async def store_many(self, observations: Sequence[Observation], concurrency: int = 0):
+        for o in observations:
+            await self.store(o)
+
     async def delete(self, key: ObservationKey) -> bool:
         for i, o in enumerate(self._observations):
             if o.key == key:
                 del self._observations[i]
                 return True
-        return False
\ No newline at end of file
+        return False
@@ -1,8 +1,24 @@
+import asyncio
+import dataclasses
 from abc import abstractmethod
-from typing import Protocol, List, Optional
+from typing import Protocol, List, Optional, Sequence, Callable, Awaitable, TypeVar
 
 from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Requests in flight for a batch operation of remote providers.
+default_batch_concurrency = 16
+
+
+@dataclasses.dataclass
+class VersionedObservation:
+    # None if the stored object still has the known version.
+    observation: Optional[Observation]
+    # Version of the stored object, e.g. an ETag or a generation, None if the provider doesn't track versions.
+    version: Optional[str]
+
 
 class ObservationsProvider(Protocol):
     @abstractmethod
@@ -24,3 +40,37 @@ class ObservationsProvider(Protocol):
     @abstractmethod
     async def delete(self, key: ObservationKey) -> bool:
         ...
+
+    async def get_versioned(self, key: ObservationKey, known_version: Optional[str] = None) -> VersionedObservation:
+        """Observation with the version of its stored object, without the content if it still has `known_version`."""
+        return VersionedObservation(observation=await self.get(key), version=None)
+
+    async def get_many(
+            self, keys: Sequence[ObservationKey], concurrency: int = default_batch_concurrency,
+    ) -> List[Observation]:
+        """Observations of the keys in the same order, fails like `get` if any of them fails."""
+        return await gather_bounded(keys, self.get, concurrency)
+
+    async def exists_many(
+            self, keys: Sequence[ObservationKey], concurrency: int = default_batch_concurrency,
+    ) -> List[bool]:
+        """Whether each of the keys exists, in the same order."""
+        return await gather_bounded(keys, self.exists, concurrency)
+
+    async def store_many(self, observations: Sequence[Observation], concurrency: int = default_batch_concurrency):
+        await gather_bounded(observations, self.store, concurrency)
+
+    async def close(self):
+        """Releases connections held by the provider, it may still be used afterwards."""
+        pass
+
+
+async def gather_bounded(items: Sequence[T], fn: Callable[[T], Awaitable[R]], concurrency: int) -> List[R]:
+    """Results of `fn` for each item in the same order, with at most `concurrency` calls running at once."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    return list(await asyncio.gather(*[run(item) for item in items]))
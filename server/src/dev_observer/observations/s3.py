@@ -1,12 +1,17 @@
+import asyncio
 import os
 import logging
+import weakref
 from typing import List, Optional
 from botocore.exceptions import ClientError
 from types_aiobotocore_s3 import S3Client
 
 from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
-from dev_observer.observations.provider import ObservationsProvider
-from aiobotocore.session import get_session
+from dev_observer.log import s_
+from dev_observer.observations.encoding import Compression, encode_content, get_content_type, read_content
+from dev_observer.observations.provider import ObservationsProvider, VersionedObservation
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session, ClientCreatorContext
 
 
 _log = logging.getLogger(__name__)
@@ -18,33 +23,81 @@ class S3ObservationsProvider(ObservationsProvider):
     _access_key: str
     _secret_key: str
     _region: str
+    _config: AioConfig
+    _compression: Compression
+    _compression_level: Optional[int]
+    # Clients are bound to the event loop they were created in, the server and its embedded processing run
+    # separate loops.
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient]"
     """
     Implementation of ObservationsProvider that stores observations in an S3-compatible storage.
+
+    A single client is lazily created per event loop and reused by all operations, so connections, TLS sessions
+    and resolved credentials are shared between them. Clients are closed with `close`.
     """
     
-    def __init__(self, endpoint: str, access_key: str, secret_key: str, bucket: str, region: str = "us-east-1"):
+    def __init__(
+            self,
+            endpoint: str,
+            access_key: str,
+            secret_key: str,
+            bucket: str,
+            region: str = "us-east-1",
+            max_pool_connections: int = 50,
+            keepalive_timeout_sec: float = 60,
+            compression: Compression = "none",
+            compression_level: Optional[int] = None,
+    ):
         self._endpoint = endpoint
         self._bucket = bucket
         self._access_key = access_key
         self._secret_key = secret_key
         self._region = region
+        self._config = AioConfig(
+            max_pool_connections=max_pool_connections,
+            connector_args={"keepalive_timeout": keepalive_timeout_sec},
+        )
+        self._clients = weakref.WeakKeyDictionary()
+        self._compression = compression
+        self._compression_level = compression_level
 
-    def _get_object_key(self, key: ObservationKey) -> str:
-        return f"{key.kind}/{key.key}"
+    async def close(self):
+        """Closes the client of the running event loop, a new one is created if the provider is used again."""
+        entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None and entry.client is not None:
+            await entry.context.__aexit__(None, None, None)
 
-    async def exists(self, key: ObservationKey) -> bool:
-        object_key = self._get_object_key(key)
-        try:
-            session = get_session()
-            async with session.create_client(
+    async def _get_client(self) -> S3Client:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is None:
+            entry = _LoopClient()
+            self._clients[loop] = entry
+        if entry.client is not None:
+            return entry.client
+        async with entry.lock:
+            if entry.client is None:
+                context = get_session().create_client(
                     's3',
                     region_name=self._region,
                     endpoint_url=self._endpoint,
                     aws_access_key_id=self._access_key,
                     aws_secret_access_key=self._secret_key,
-            ) as client:
-                client: S3Client
-                await client.head_object(Bucket=self._bucket, Key=object_key)
+                    config=self._config,
+                )
+                entry.client = await context.__aenter__()
+                entry.context = context
+                _log.debug(s_("Created S3 client", endpoint=self._endpoint, bucket=self._bucket))
+            return entry.client
+
+    def _get_object_key(self, key: ObservationKey) -> str:
+        return f"{key.kind}/{key.key}"
+
+    async def exists(self, key: ObservationKey) -> bool:
+        object_key = self._get_object_key(key)
+        try:
+            client = await self._get_client()
+            await client.head_object(Bucket=self._bucket, Key=object_key)
             return True
         except ClientError as e:
             if _is_not_found_err(e):
@@ -68,20 +121,14 @@ class S3ObservationsProvider(ObservationsProvider):
         object_key = self._get_object_key(o.key)
         
         try:
-            session = get_session()
-            async with session.create_client(
-                    's3',
-                    region_name=self._region,
-                    endpoint_url=self._endpoint,
-                    aws_access_key_id=self._access_key,
-                    aws_secret_access_key=self._secret_key,
-            ) as client:
-                client: S3Client
-                await client.put_object(
-                    Bucket=self._bucket,
-                    Key=object_key,
-                    Body=o.content
-                )
+            client = await self._get_client()
+            body = encode_content(o.content, self._compression, self._compression_level)
+            await client.put_object(
+                Bucket=self._bucket,
+                Key=object_key,
+                Body=body,
+                ContentType=get_content_type(body) or "text/plain; charset=utf-8",
+            )
             _log.debug(f"Stored observation {o.key.kind}/{o.key.key} in S3")
         except ClientError as e:
             error_msg = f"Error storing observation {o.key.kind}/{o.key.key} in S3: {str(e)}"
@@ -109,29 +156,21 @@ class S3ObservationsProvider(ObservationsProvider):
             prefix = f"{kind}/{path}"
         
         try:
-            session = get_session()
-            async with session.create_client(
-                    's3',
-                    region_name=self._region,
-                    endpoint_url=self._endpoint,
-                    aws_access_key_id=self._access_key,
-                    aws_secret_access_key=self._secret_key,
-            ) as client:
-                client: S3Client
-                # List all objects with the given prefix
-                paginator = client.get_paginator('list_objects_v2')
-                kind_prefix = f"{kind}/"
-                async for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
-                    for obj in page.get('Contents', []):
-                        # Extract the key part after the kind prefix
-                        full_key = obj['Key']
-                        if full_key.startswith(kind_prefix):
-                            key_part = full_key[len(kind_prefix):]
-                            # Use the last part of the path as the name
-                            name = os.path.basename(key_part)
-                            result.append(ObservationKey(kind=kind, key=key_part, name=name))
-
-                return result
+            client = await self._get_client()
+            # List all objects with the given prefix
+            paginator = client.get_paginator('list_objects_v2')
+            kind_prefix = f"{kind}/"
+            async for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    # Extract the key part after the kind prefix
+                    full_key = obj['Key']
+                    if full_key.startswith(kind_prefix):
+                        key_part = full_key[len(kind_prefix):]
+                        # Use the last part of the path as the name
+                        name = os.path.basename(key_part)
+                        result.append(ObservationKey(kind=kind, key=key_part, name=name))
+
+            return result
         except ClientError as e:
             error_msg = f"Error listing observations of kind '{kind}' from S3: {str(e)}"
             _log.error(error_msg)
@@ -153,19 +192,11 @@ class S3ObservationsProvider(ObservationsProvider):
         object_key = self._get_object_key(key)
         
         try:
-            session = get_session()
-            async with session.create_client(
-                    's3',
-                    region_name=self._region,
-                    endpoint_url=self._endpoint,
-                    aws_access_key_id=self._access_key,
-                    aws_secret_access_key=self._secret_key,
-            ) as client:
-                client: S3Client
-                response = await client.get_object(Bucket=self._bucket, Key=object_key)
-                body = await response['Body'].read()
-                content = body.decode("utf-8")
-                return Observation(key=key, content=content)
+            client = await self._get_client()
+            response = await client.get_object(Bucket=self._bucket, Key=object_key)
+            async with response['Body'] as body:
+                content = await read_content(body.read)
+            return Observation(key=key, content=content)
         except ClientError as e:
             if _is_not_found_err(e):
                 error_msg = f"Observation {key.kind}/{key.key} not found in S3"
@@ -175,32 +206,55 @@ class S3ObservationsProvider(ObservationsProvider):
             _log.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    async def get_versioned(self, key: ObservationKey, known_version: Optional[str] = None) -> VersionedObservation:
+        object_key = self._get_object_key(key)
+        try:
+            client = await self._get_client()
+            if known_version is None:
+                response = await client.get_object(Bucket=self._bucket, Key=object_key)
+            else:
+                response = await client.get_object(Bucket=self._bucket, Key=object_key, IfNoneMatch=known_version)
+            async with response['Body'] as body:
+                content = await read_content(body.read)
+            return VersionedObservation(observation=Observation(key=key, content=content), version=response.get('ETag'))
+        except ClientError as e:
+            if _is_not_modified_err(e):
+                return VersionedObservation(observation=None, version=known_version)
+            error_msg = f"Error getting observation {key.kind}/{key.key} from S3: {str(e)}"
+            _log.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     async def delete(self, key: ObservationKey) -> bool:
         object_key = self._get_object_key(key)
         
         try:
-            session = get_session()
-            async with session.create_client(
-                    's3',
-                    region_name=self._region,
-                    endpoint_url=self._endpoint,
-                    aws_access_key_id=self._access_key,
-                    aws_secret_access_key=self._secret_key,
-            ) as client:
-                client: S3Client
-                # Check if object exists first
-                if not await self.exists(key):
-                    return False
-                
-                await client.delete_object(Bucket=self._bucket, Key=object_key)
-                _log.debug(f"Deleted observation {key.kind}/{key.key} from S3")
-                return True
+            client = await self._get_client()
+            # Check if object exists first
+            if not await self.exists(key):
+                return False
+            
+            await client.delete_object(Bucket=self._bucket, Key=object_key)
+            _log.debug(f"Deleted observation {key.kind}/{key.key} from S3")
+            return True
         except ClientError as e:
             error_msg = f"Error deleting observation {key.kind}/{key.key} from S3: {str(e)}"
             _log.error(error_msg)
             raise RuntimeError(error_msg) from e
 
 
+class _LoopClient:
+    client: Optional[S3Client] = None
+    context: Optional[ClientCreatorContext] = None
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+
+
 def _is_not_found_err(err: ClientError) -> bool:
     code = err.response.get('Error', {}).get('Code', 'Unknown')
-    return code == 'NoSuchKey' or code == '404'
\ No newline at end of file
+    return code == 'NoSuchKey' or code == '404'
+
+
+def _is_not_modified_err(err: ClientError) -> bool:
+    code = err.response.get('Error', {}).get('Code', 'Unknown')
+    return code == '304' or code == 'NotModified'
@@ -1,4 +1,3 @@
-import asyncio
 import dataclasses
 import datetime
 import logging
@@ -9,7 +8,7 @@ from typing import List, Sequence
 
 from dev_observer.analysis.provider import AnalysisProvider
 from dev_observer.api.types.config_pb2 import GlobalConfig
-from dev_observer.api.types.observations_pb2 import ObservationKey, Observation
+from dev_observer.api.types.observations_pb2 import ObservationKey
 from dev_observer.api.types.processing_pb2 import AggregatedSummaryParams, ProcessingItemResultData, \
     PeriodicAggregationResult, RepoObservation
 from dev_observer.common.schedule import pb_to_datetime
@@ -77,15 +76,13 @@ class AggregatedSummaryProcessor(FlatteningProcessor[AggregatedSummaryParams]):
             except Exception as e:
                 _log.error(s_("Failed to process repo", repo_id=repo_id, exc_info=e))
 
-        # Download all observations in parallel
-        async def process_item(item: AggregatedItem):
-            obs: List[Observation] = []
-            for key in item.keys:
-                obs.append(await self.observations.get(key))
-            content = "\n\n".join([o.content for o in obs])
-            return f"# {item.header}\n\n{content}"
-
-        parts = await asyncio.gather(*[process_item(item) for item in items])
+        # Download all observations in one batch
+        obs = await self.observations.get_many([key for item in items for key in item.keys])
+        parts: List[str] = []
+        for item in items:
+            item_obs, obs = obs[:len(item.keys)], obs[len(item.keys):]
+            content = "\n\n".join([o.content for o in item_obs])
+            parts.append(f"# {item.header}\n\n{content}")
 
         temp_dir = tempfile.mkdtemp(prefix="aggregated_summary_")
         combined_file_path = os.path.join(temp_dir, "combined_observations.md")
@@ -98,7 +95,7 @@ class AggregatedSummaryProcessor(FlatteningProcessor[AggregatedSummaryParams]):
                 f.write("\n\n---\n\n")
 
         # Tokenize the combined file
-        tokenize_result = tokenize_file(combined_file_path, temp_dir, self.tokenizer, config)
+        tokenize_result = await tokenize_file(combined_file_path, temp_dir, self.tokenizer, config)
 
         # Create cleanup function
         def clean_up():
@@ -3,7 +3,7 @@ import dataclasses
 import logging
 import os
 import shutil
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.utils.config import ensure_config
@@ -98,13 +98,12 @@ class CodeResearchProcessor:
 
         try:
             tasks: List[CodeResearchTask] = []
-            for analyzer in analyzers:
-                key = f"{get_repo_key_pref(repo.git_repo)}/{analyzer.file_name}"
-                
-                # Check if research already exists for this analyzer
-                research_key = ObservationKey(kind=REPO_RESEARCH_KIND, name="research.md", key=f"{key}/research.md")
-                research_exists = await self._observations.exists(research_key)
-                
+            keys = [f"{get_repo_key_pref(repo.git_repo)}/{analyzer.file_name}" for analyzer in analyzers]
+            # Check if research already exists for the analyzers
+            research_exists_list = await self._observations.exists_many([
+                ObservationKey(kind=REPO_RESEARCH_KIND, name="research.md", key=f"{key}/research.md") for key in keys
+            ])
+            for analyzer, key, research_exists in zip(analyzers, keys, research_exists_list):
                 # Skip if research exists and no force flag
                 if research_exists and not force_research:
                     _log.info(f"Skipping research for {analyzer.name} - already exists and no force flag")
@@ -186,14 +185,20 @@ class CodeResearchProcessor:
         # Filter for meta.json files only
         meta_keys = [key for key in observation_keys if key.name == "meta.json"]
 
+        # Only areas with research
+        keys_by_path = {k.key: k for k in observation_keys}
+        research_keys = [_find_corresponding_key(keys_by_path, k, "research.md") for k in meta_keys]
+        area_keys = [(m, r) for m, r in zip(meta_keys, research_keys) if r is not None]
+        try:
+            observations = await self._observations.get_many([meta_key for meta_key, _ in area_keys])
+        except Exception as e:
+            _log.warning(f"Failed to get meta observations for {repo_owner}, keeping aggregated summaries: {e}")
+            return
+
         # Collect all area metas
         area_metas = []
-        for meta_key in meta_keys:
+        for (meta_key, research_key), observation in zip(area_keys, observations):
             try:
-                research_key = _find_corresponding_key(observation_keys, meta_key, "research.md")
-                if not research_key:
-                    continue
-                observation = await self._observations.get(meta_key)
                 meta = parse_json_pb(observation.content, CodeResearchMeta())
                 area_meta = CodeResearchAreaMeta(research_key=research_key, meta=meta)
                 area_metas.append(area_meta)
@@ -221,14 +226,10 @@ class CodeResearchProcessor:
 
 
 def _find_corresponding_key(
-        observation_keys: List[ObservationKey], key: ObservationKey, name: str,
+        keys_by_path: Dict[str, ObservationKey], key: ObservationKey, name: str,
 ) -> Optional[ObservationKey]:
     key_base = '/'.join(key.key.split('/')[:-1])  # Get path without last part
-    expected_key = f"{key_base}/{name}"
-    for obs_key in observation_keys:
-        if obs_key.key == expected_key:
-            return obs_key
-    return None
+    return keys_by_path.get(f"{key_base}/{name}")
 
 
 def get_force_key(repo: GitRepository) -> ObservationKey:
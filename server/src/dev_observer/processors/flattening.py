@@ -1,9 +1,12 @@
 import abc
+import asyncio
 import dataclasses
+import json
 import logging
+import uuid
 from abc import abstractmethod
 from datetime import date
-from typing import TypeVar, Generic, List, Optional
+from typing import TypeVar, Generic, List, Optional, Dict, Union, Callable, Awaitable
 
 from dev_observer.analysis.provider import AnalysisProvider
 from dev_observer.api.types.config_pb2 import GlobalConfig
@@ -12,6 +15,7 @@ from dev_observer.api.types.processing_pb2 import ProcessingItemResultData
 from dev_observer.flatten.flatten import FlattenResult
 from dev_observer.log import s_
 from dev_observer.observations.provider import ObservationsProvider
+from dev_observer.processors.stream import ChunkStream
 from dev_observer.processors.tokenized import TokenizedAnalyzer
 from dev_observer.prompts.provider import PromptsProvider
 from dev_observer.tokenizer.provider import TokenizerProvider
@@ -20,6 +24,8 @@ E = TypeVar("E")
 
 _log = logging.getLogger(__name__)
 
+ANALYSIS_STATE_KIND = "analysis_state"
+
 
 @dataclasses.dataclass
 class ObservationRequest:
@@ -28,11 +34,23 @@ class ObservationRequest:
     summary_key: Optional[ObservationKey] = None  # If set, instructs to also produce a summary for the observation.
 
 
+@dataclasses.dataclass
+class ObservationState:
+    """What an observation was produced from, stored next to it by incremental processors."""
+    commit_sha: Optional[str] = None
+    # Analyses keyed by prompt hash, see `TokenizedAnalyzer`.
+    analyses: Dict[str, str] = dataclasses.field(default_factory=dict)
+    # Whether a summary was stored under the request's `summary_key`.
+    summarized: bool = False
+
+
 class FlatteningProcessor(abc.ABC, Generic[E]):
     analysis: AnalysisProvider
     prompts: PromptsProvider
     observations: ObservationsProvider
     tokenizer: TokenizerProvider
+    # If set, analyses of unchanged content are reused between runs, see `ObservationState`.
+    incremental: bool = False
 
     def __init__(
             self,
@@ -49,62 +67,211 @@ class FlatteningProcessor(abc.ABC, Generic[E]):
     async def process(
             self, entity: E, requests: List[ObservationRequest], config: GlobalConfig, clean: bool = True,
     ) -> ProcessingItemResultData:
+        """Runs analyzers of `requests` on the flattened entity, up to `analyzer_concurrency` at a time.
+
+        A failed request is logged and skipped without affecting the others. The flattened content is cleaned up
+        once all of them finish. With `pipelined_analysis`, chunks are analyzed while the entity is still being
+        flattened, see `get_flatten_stream`.
+        """
+        if config.analysis.pipelined_analysis:
+            return await self._process_pipelined(entity, requests, config, clean)
         res = await self.get_flatten(entity, config)
         _log.debug(s_("Got flatten result", result=res))
         try:
-            keys: List[ObservationKey] = []
-            for request in requests:
-                try:
-                    prompts_prefix = request.prompt_prefix
-                    key = request.key
-                    summary_tokens_limit = await self.get_summary_tokens_limit(config)
-                    analyzer = TokenizedAnalyzer(
-                        prompts_prefix=prompts_prefix,
-                        analysis=self.analysis,
-                        prompts=self.prompts,
-                        summary_tokens_limit=summary_tokens_limit,
-                        tokenizer=self.tokenizer,
-                    )
-                    content = await analyzer.analyze_flatten(res)
-                    await self.observations.store(Observation(key=key, content=content))
-                    keys.append(key)
-                    sum_key = await self._summarize(request, content, res)
-                    if sum_key:
-                        keys.append(sum_key)
-                except Exception as e:
-                    _log.exception(s_("Analysis failed.", request=request), exc_info=e)
-            result_data = res.result_data
-            if result_data is None:
-                result_data = ProcessingItemResultData()
-            result_data.observations.extend(keys)
-            return result_data
+            results = await self._process_requests(requests, res, config)
+            return _get_result_data(res, results)
         finally:
             if clean:
                 res.clean_up()
 
+    async def _process_pipelined(
+            self, entity: E, requests: List[ObservationRequest], config: GlobalConfig, clean: bool,
+    ) -> ProcessingItemResultData:
+        stream = ChunkStream(name=str(uuid.uuid4()), max_pending=config.analysis.pipeline_max_pending_chunks or 4)
+
+        async def produce() -> FlattenResult:
+            try:
+                res = await self.get_flatten_stream(entity, config, stream.publish)
+            except BaseException as e:
+                await stream.fail(e)
+                raise
+            _log.debug(s_("Got flatten result", result=res))
+            await stream.finish(res)
+            return res
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            results = await self._process_requests(requests, stream, config)
+            return _get_result_data(await producer, results)
+        finally:
+            # Stops flattening if analyses failed, its result may still arrive if it was about to finish.
+            producer.cancel()
+            await asyncio.wait([producer])
+            if clean and not producer.cancelled() and producer.exception() is None:
+                producer.result().clean_up()
+
+    async def _process_requests(
+            self, requests: List[ObservationRequest], source: Union[FlattenResult, ChunkStream], config: GlobalConfig,
+    ) -> List[List[ObservationKey]]:
+        semaphore = asyncio.Semaphore(get_analyzer_concurrency(config))
+
+        async def process_request(request: ObservationRequest) -> List[ObservationKey]:
+            async with semaphore:
+                return await self._process_request(request, source, config)
+
+        return list(await asyncio.gather(*[process_request(request) for request in requests]))
+
+    async def _process_request(
+            self, request: ObservationRequest, source: Union[FlattenResult, ChunkStream], config: GlobalConfig,
+    ) -> List[ObservationKey]:
+        keys: List[ObservationKey] = []
+        try:
+            prompts_prefix = request.prompt_prefix
+            key = request.key
+            summary_tokens_limit = await self.get_summary_tokens_limit(config)
+            state = await self.get_state(key) if self.incremental else None
+            analyzer = TokenizedAnalyzer(
+                prompts_prefix=prompts_prefix,
+                analysis=self.analysis,
+                prompts=self.prompts,
+                summary_tokens_limit=summary_tokens_limit,
+                tokenizer=self.tokenizer,
+                previous_analyses=state.analyses if state is not None else None,
+                fan_out=config.analysis.combine_fan_out,
+                max_depth=config.analysis.combine_max_depth or 3,
+                concurrency=config.analysis.chunk_concurrency or 10,
+            )
+            if isinstance(source, ChunkStream):
+                content = await analyzer.analyze_stream(source)
+                res = await source.result()
+            else:
+                content = await analyzer.analyze_flatten(source)
+                res = source
+            await self.observations.store(Observation(key=key, content=content))
+            keys.append(key)
+            summary_failed = False
+            try:
+                sum_key = await self._summarize(request, content, res)
+            except Exception as e:
+                _log.exception(s_("Summarization failed.", request=request), exc_info=e)
+                sum_key, summary_failed = None, True
+            if sum_key:
+                keys.append(sum_key)
+            if self.incremental:
+                reused = len(analyzer.analyses.keys() & (state.analyses.keys() if state else set()))
+                _log.info(s_("Analysis done", key=key, analyses=len(analyzer.analyses), reused=reused))
+                await self._store_state(key, ObservationState(
+                    # Not bound to the commit if the summary failed, so that the next run doesn't skip it.
+                    commit_sha=None if summary_failed else res.commit_sha,
+                    analyses=analyzer.analyses,
+                    summarized=sum_key is not None,
+                ))
+        except Exception as e:
+            _log.exception(s_("Analysis failed.", request=request), exc_info=e)
+        return keys
+
     async def _summarize(
             self, request: ObservationRequest, content: str, flatten_result: FlattenResult,
     ) -> Optional[ObservationKey]:
         sum_key = request.summary_key
         if not sum_key:
             return None
+        prompt_name = f"{request.prompt_prefix}_summarize_analysis"
+        prompt = await self.prompts.get_optional(prompt_name, {"content": content})
+        if prompt is None:
+            _log.debug(s_("No analysis summary configured", prompt_name=prompt_name))
+            return None
+        session_id = f"{date.today().strftime("%Y-%m-%d")}.{flatten_result.full_file_path}"
+        result = await self.analysis.analyze(prompt, session_id)
+        await self.observations.store(Observation(key=sum_key, content=result.analysis))
+        return sum_key
+
+    async def get_state(self, key: ObservationKey) -> Optional[ObservationState]:
+        state_key = get_state_key(key)
         try:
-            prompt_name = f"{request.prompt_prefix}_summarize_analysis"
-            prompt = await self.prompts.get_optional(prompt_name, {"content": content})
-            if prompt is None:
-                _log.debug(s_("No analysis summary configured", prompt_name=prompt_name))
+            if not await self.observations.exists(state_key):
                 return None
-            session_id = f"{date.today().strftime("%Y-%m-%d")}.{flatten_result.full_file_path}"
-            result = await self.analysis.analyze(prompt, session_id)
-            await self.observations.store(Observation(key=sum_key, content=result.analysis))
-            return sum_key
+            data = json.loads((await self.observations.get(state_key)).content)
+            return ObservationState(
+                commit_sha=data.get("commit_sha"),
+                analyses=data.get("analyses", {}),
+                summarized=data.get("summarized", False),
+            )
         except Exception as e:
-            _log.exception(s_("Summarization failed.", request=request), exc_info=e)
+            _log.warning(s_("Failed to read observation state, analyzing from scratch", key=key, error=e))
             return None
 
+    async def get_up_to_date_keys(
+            self, requests: List[ObservationRequest], commit_sha: str,
+    ) -> Optional[List[ObservationKey]]:
+        """Keys of the requested observations and their summaries, if all were produced from `commit_sha`.
+
+        Returns None if anything has to be analyzed again.
+        """
+        keys = [request.key for request in requests]
+        state_keys = [get_state_key(key) for key in keys]
+        try:
+            if not all(await self.observations.exists_many([*state_keys, *keys])):
+                return None
+            states = [json.loads(state.content) for state in await self.observations.get_many(state_keys)]
+            if not all(state.get("commit_sha") == commit_sha for state in states):
+                return None
+            result: List[ObservationKey] = []
+            summary_keys: List[ObservationKey] = []
+            for request, state in zip(requests, states):
+                result.append(request.key)
+                if request.summary_key and state.get("summarized", False):
+                    result.append(request.summary_key)
+                    summary_keys.append(request.summary_key)
+            if not all(await self.observations.exists_many(summary_keys)):
+                return None
+            return result
+        except Exception as e:
+            _log.warning(s_("Failed to read observation states, analyzing from scratch", error=str(e)))
+            return None
+
+    async def _store_state(self, key: ObservationKey, state: ObservationState):
+        try:
+            await self.observations.store(Observation(key=get_state_key(key), content=json.dumps({
+                "commit_sha": state.commit_sha,
+                "analyses": state.analyses,
+                "summarized": state.summarized,
+            })))
+        except Exception as e:
+            _log.warning(s_("Failed to store observation state", key=key, error=e))
+
     async def get_summary_tokens_limit(self, config: GlobalConfig) -> int:
         return 920000
 
     @abstractmethod
     async def get_flatten(self, entity: E, config: GlobalConfig) -> FlattenResult:
         pass
+
+    async def get_flatten_stream(
+            self, entity: E, config: GlobalConfig, on_chunk: Callable[[str], Awaitable[None]],
+    ) -> FlattenResult:
+        """Same as `get_flatten`, but also passes chunk files to `on_chunk`, in order of `FlattenResult.file_paths`.
+
+        Processors that can produce chunks incrementally pass them as soon as they are written, the default
+        implementation passes them once flattening is done.
+        """
+        res = await self.get_flatten(entity, config)
+        for path in res.file_paths:
+            await on_chunk(path)
+        return res
+
+
+def _get_result_data(res: FlattenResult, results: List[List[ObservationKey]]) -> ProcessingItemResultData:
+    result_data = res.result_data
+    if result_data is None:
+        result_data = ProcessingItemResultData()
+    result_data.observations.extend(key for keys in results for key in keys)
+    return result_data
+
+
+def get_analyzer_concurrency(config: GlobalConfig) -> int:
+    return max(1, config.analysis.analyzer_concurrency or 3)
+
+
+def get_state_key(key: ObservationKey) -> ObservationKey:
+    return ObservationKey(kind=ANALYSIS_STATE_KIND, name=f"{key.name}.json", key=f"{key.kind}/{key.key}.json")
@@ -1,8 +1,13 @@
 import asyncio
 import logging
+import os
+import socket
+import uuid
+from collections import Counter
 from datetime import timedelta
-from typing import List, Optional
+from typing import List, Optional, Awaitable, Dict, Tuple
 
+from dev_observer.api.types.config_pb2 import PeriodicConfig
 from dev_observer.api.types.observations_pb2 import ObservationKey
 from dev_observer.api.types.processing_pb2 import ProcessingItem, ProcessingRequest, ProcessGitChangesRequest, \
     ProcessingItemResult, ProcessingItemKey, PeriodicAggregation, ProcessingItemResultData
@@ -15,14 +20,26 @@ from dev_observer.processors.flattening import ObservationRequest
 from dev_observer.processors.git.changes import GitChangesHandler, ProcessGitChangesParams
 from dev_observer.processors.observations import get_repo_key_pref
 from dev_observer.processors.repos import ReposProcessor
+from dev_observer.processors.tokens import RepoTokensProcessor
 from dev_observer.processors.websites import WebsitesProcessor, ObservedWebsite
 from dev_observer.repository.types import ObservedRepo
-from dev_observer.storage.provider import StorageProvider
+from dev_observer.storage.provider import StorageProvider, ProcessingQuota
 from dev_observer.util import Clock, RealClock
 from dev_observer.website.cloner import normalize_domain, normalize_name
 
 _log = logging.getLogger(__name__)
 
+# Upper bound for sleeping between claims, so that config changes and missed notifications are picked up.
+_max_wait = timedelta(minutes=1)
+_min_wait = timedelta(seconds=1)
+_default_lease = timedelta(seconds=60)
+# Delay before an item that failed or produced no result is picked up again.
+_retry_delay = timedelta(minutes=30)
+
+
+class _LeaseLostError(Exception):
+    """The lease on an item expired and the item may be claimed by another worker."""
+
 
 class PeriodicProcessor:
     _storage: StorageProvider
@@ -31,10 +48,12 @@ class PeriodicProcessor:
     _git_changes_handler: GitChangesHandler
     _websites_processor: Optional[WebsitesProcessor]
     _research_processor: Optional[CodeResearchProcessor]
+    _tokens_processor: Optional[RepoTokensProcessor]
     _clock: Clock
-
-    _lock: asyncio.Lock = asyncio.Lock()
-    _running: int = 0
+    _worker_id: str
+    _stopping: asyncio.Event
+    # Running tasks with the entity type of their items.
+    _in_flight: Dict[asyncio.Task, str]
 
     def __init__(self,
                  storage: StorageProvider,
@@ -43,7 +62,9 @@ class PeriodicProcessor:
                  git_changes_handler: GitChangesHandler,
                  websites_processor: Optional[WebsitesProcessor] = None,
                  research_processor: Optional[CodeResearchProcessor] = None,
+                 tokens_processor: Optional[RepoTokensProcessor] = None,
                  clock: Clock = RealClock(),
+                 worker_id: Optional[str] = None,
                  ):
         self._storage = storage
         self._repos_processor = repos_processor
@@ -51,92 +72,193 @@ class PeriodicProcessor:
         self._aggregated_summary_processor = aggregated_summary_processor
         self._websites_processor = websites_processor
         self._research_processor = research_processor
+        self._tokens_processor = tokens_processor
         self._clock = clock
+        self._worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._stopping = asyncio.Event()
+        self._in_flight = {}
 
     async def run(self):
+        """Processes items until `stop` is called, then waits for in-flight items to finish."""
 
         _log.info(s_("Starting periodic processor"))
+        slot_freed = asyncio.Event()
 
-        async def process_item():
+        async def process_item(item: ProcessingItem, lease: timedelta):
             try:
-                await self.process_next()
+                await self._process_claimed(item, lease)
             except Exception as e:
                 _log.error(s_("Failed to process next item"), exc_info=e)
             finally:
-                async with self._lock:
-                    self._running -= 1
+                self._in_flight.pop(asyncio.current_task(), None)
+                slot_freed.set()
 
-        while True:
+        while not self._stopping.is_set():
             try:
-                await asyncio.sleep(2)
+                slot_freed.clear()
                 config = await self._storage.get_global_config()
                 concurrency = config.periodic.concurrency
-                async with self._lock:
-                    if self._running >= concurrency:
-                        _log.debug(
-                            s_(
-                                "Periodic processing at concurrency limit",
-                                running=self._running,
-                                concurrency=concurrency,
-                            )
-                        )
-                        continue
-                    asyncio.create_task(process_item())
-                    self._running += 1
+                available = concurrency - len(self._in_flight)
+                lease = _default_lease
+                if config.periodic.lease_duration_sec > 0:
+                    lease = timedelta(seconds=config.periodic.lease_duration_sec)
+                items = await self._storage.claim_processing_items(
+                    available, lease, self._worker_id, self._claim_quotas(config.periodic, available),
+                )
+                for item in items:
+                    task = asyncio.create_task(process_item(item, lease))
+                    self._in_flight[task] = item.key.WhichOneof("entity")
+                if len(items) >= available:
+                    _log.debug(s_("Periodic processing at concurrency limit", concurrency=concurrency))
+                    await self._wait_any(_max_wait, slot_freed.wait())
+                    continue
+                # Nothing more can be claimed: sleep until the earliest scheduled item, a change notification or,
+                # when some types are at their limit, until a slot frees up. Items of those types are left out of
+                # the next time, as they may already be due and can't be claimed before a slot frees up anyway.
+                wait = _max_wait
+                next_time = await self._storage.get_next_processing_time(self._saturated_types(config.periodic))
+                if next_time is not None:
+                    wait = max(_min_wait, min(wait, next_time - self._clock.now()))
+                await self._wait_any(wait, self._storage.wait_processing_changes(wait), slot_freed.wait())
             except Exception as e:
                 _log.error(s_("Failed to process next item", err=e))
-                await asyncio.sleep(2)
+                await self._wait_any(timedelta(seconds=2))
+
+        _log.info(s_("Stopping periodic processor, finishing in-flight items", running=len(self._in_flight)))
+        if len(self._in_flight) > 0:
+            await asyncio.wait(list(self._in_flight))
+        _log.info(s_("Periodic processor stopped"))
+
+    def _claim_quotas(self, config: PeriodicConfig, available: int) -> List[ProcessingQuota]:
+        running = Counter(self._in_flight.values())
+        quotas: List[Tuple[int, ProcessingQuota]] = [(0, ProcessingQuota(limit=available))]
+        for limit in config.entity_limits:
+            quota = available
+            if limit.concurrency > 0:
+                quota = min(available, max(0, limit.concurrency - running[limit.entity_type]))
+            quotas.append((limit.priority, ProcessingQuota(limit=quota, entity_type=limit.entity_type)))
+        # Stable sort keeps configured order for equal priorities, with unlisted types first.
+        quotas.sort(key=lambda q: -q[0])
+        return [q for _, q in quotas]
+
+    def _saturated_types(self, config: PeriodicConfig) -> List[str]:
+        running = Counter(self._in_flight.values())
+        return [l.entity_type for l in config.entity_limits if
+                l.concurrency > 0 and running[l.entity_type] >= l.concurrency]
+
+    def stop(self):
+        """Makes `run` stop claiming new items. Must be called from the loop running the processor."""
+        self._stopping.set()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    async def _wait_any(self, timeout: timedelta, *aws: Awaitable):
+        tasks = [asyncio.ensure_future(aw) for aw in (*aws, self._stopping.wait())]
+        try:
+            await asyncio.wait(tasks, timeout=timeout.total_seconds(), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for t in tasks:
+                t.cancel()
 
     async def process_next(self) -> Optional[ProcessingItem]:
         item = await self._storage.next_processing_item()
         if item is None:
             return None
+        return await self._process_claimed(item)
+
+    async def _process_claimed(self, item: ProcessingItem, lease: Optional[timedelta] = None) -> ProcessingItem:
         _log.info(s_("Processing item", item=item))
+        # Items processed under a lease are finalized only while the lease is still held by this worker.
+        worker_id = self._worker_id if lease is not None else None
         try:
-            result = await self._process_item(item)
+            result = await self._process_with_lease(item, lease)
             _log.info(s_("Item processed", item=item))
+        except _LeaseLostError:
+            _log.warning(s_("Processing lease lost, cancelled processing", item=item, worker_id=self._worker_id))
+            return item
         except TerminalError as e:
             _log.exception(s_("Failed to process item due to terminal error, deleting", item=item, err=e))
-            await self._finalize_execution(item, ProcessingItemResultData(), error=f"Terminal error: {e}")
+            await self._finalize_execution(item, ProcessingItemResultData(), error=f"Terminal error: {e}",
+                                           worker_id=worker_id)
             raise
         except Exception as e:
-            await self._finalize_execution(item, None, error=f"{e}")
+            await self._finalize_execution(item, None, error=f"{e}", worker_id=worker_id)
             raise
-        await self._finalize_execution(item, result)
+        await self._finalize_execution(item, result, worker_id=worker_id)
         _log.debug(s_("Item execution finalized", item=item, result=result))
         return item
 
+    async def _process_with_lease(
+            self, item: ProcessingItem, lease: Optional[timedelta],
+    ) -> Optional[ProcessingItemResultData]:
+        if lease is None:
+            return await self._process_item(item)
+        processing = asyncio.create_task(self._process_item(item))
+        heartbeat = asyncio.create_task(self._renew_lease(item.key, lease))
+        try:
+            await asyncio.wait([processing, heartbeat], return_when=asyncio.FIRST_COMPLETED)
+            if not processing.done():
+                # Another worker may have claimed the item, its results must not be overwritten.
+                raise _LeaseLostError()
+            return processing.result()
+        finally:
+            heartbeat.cancel()
+            if not processing.done():
+                processing.cancel()
+                await asyncio.wait([processing])
+
+    async def _renew_lease(self, key: ProcessingItemKey, lease: timedelta):
+        """Extends the lease until cancelled, returns once the lease is lost."""
+        while True:
+            await asyncio.sleep(lease.total_seconds() / 3)
+            try:
+                renewed = await self._storage.renew_processing_lease(key, self._worker_id, self._clock.now() + lease)
+            except Exception as e:
+                _log.warning(s_("Failed to renew processing lease", key=key), exc_info=e)
+                continue
+            if not renewed:
+                return
+
     async def _finalize_execution(
             self,
             item: ProcessingItem,
             result_data: Optional[ProcessingItemResultData],
             error: Optional[str] = None,
+            worker_id: Optional[str] = None,
     ):
         ent_type = item.key.WhichOneof("entity")
         try:
             if result_data is not None:
-                await self._storage.add_processing_result(ProcessingItemResult(
+                result_id = await self._storage.add_processing_result(ProcessingItemResult(
                     id=item.key.request_id,
                     key=item.key,
                     error_message=error,
                     result_data=result_data,
                     data=item.data,
-                ))
+                ), worker_id=worker_id)
+                if result_id is None:
+                    _log.warning(s_("Processing lease lost, discarding result", item=item, worker_id=worker_id))
+                    return
                 if ent_type == "request_id":
-                    await self._storage.delete_processing_item(item.key)
+                    await self._storage.delete_processing_item(item.key, worker_id=worker_id)
                 if ent_type == "periodic_aggregation_id":
-                    await self._finalize_periodic_aggregation(item.key, item.data.periodic_aggregation)
+                    await self._finalize_periodic_aggregation(item.key, item.data.periodic_aggregation, worker_id)
                 else:
-                    await self._storage.set_next_processing_time(item.key, None, error)
+                    await self._storage.set_next_processing_time(item.key, None, error, worker_id=worker_id)
             else:
                 # If result_data is none, keep retrying periodically. That means processing is not enabled yet.
-                if error:
-                    await self._storage.set_processing_error(item.key, error)
+                await self._storage.set_next_processing_time(
+                    item.key, self._clock.now() + _retry_delay, error, worker_id=worker_id,
+                )
         except TerminalError as e:
             _log.exception(s_("Failed to finalize execution due to terminal error, deleting", item=item, err=e))
-            await self._storage.set_next_processing_time(item.key, None, f"{e}")
+            await self._storage.set_next_processing_time(item.key, None, f"{e}", worker_id=worker_id)
 
-    async def _finalize_periodic_aggregation(self, key: ProcessingItemKey, aggregation: PeriodicAggregation):
+    async def _finalize_periodic_aggregation(
+            self, key: ProcessingItemKey, aggregation: PeriodicAggregation, worker_id: Optional[str] = None,
+    ):
         if not aggregation.HasField("schedule"):
             raise TerminalError("Schedule not provided")
         old_end = pb_to_datetime(aggregation.params.end_date)
@@ -150,7 +272,7 @@ class PeriodicProcessor:
             db_item.data.periodic_aggregation.params.end_date = next_date
             return db_item
 
-        await self._storage.update_processing_item(key, updater, next_processing)
+        await self._storage.update_processing_item(key, updater, next_processing, worker_id=worker_id)
 
     async def _process_item(self, item: ProcessingItem) -> Optional[ProcessingItemResultData]:
         ent_type = item.key.WhichOneof("entity")
@@ -240,6 +362,10 @@ class PeriodicProcessor:
         req_type = req.WhichOneof("type")
         if req_type == "git_changes":
             return await self._process_git_changes(req.git_changes)
+        elif req_type == "analyze_tokens":
+            if self._tokens_processor is None:
+                raise ValueError(f"Tokens processor is not configured")
+            return await self._tokens_processor.analyze_tokens(req.analyze_tokens)
         else:
             raise ValueError(f"[{req_type}] is not supported")
 
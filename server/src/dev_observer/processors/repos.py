@@ -1,21 +1,36 @@
-from typing import Optional
+import logging
+from typing import Optional, List, Callable, Awaitable
 
 from dev_observer.analysis.provider import AnalysisProvider
 from dev_observer.api.types.config_pb2 import GlobalConfig
+from dev_observer.api.types.observations_pb2 import ObservationKey, Observation
+from dev_observer.api.types.processing_pb2 import ProcessingItemResultData
+from dev_observer.api.types.repo_pb2 import GitRepository
 from dev_observer.flatten.flatten import flatten_repository, FlattenResult
+from dev_observer.log import s_
 from dev_observer.observations.provider import ObservationsProvider
-from dev_observer.processors.flattening import FlatteningProcessor
+from dev_observer.processors.flattening import FlatteningProcessor, ObservationRequest, ANALYSIS_STATE_KIND
+from dev_observer.processors.observations import get_repo_key_pref
 from dev_observer.prompts.provider import PromptsProvider
+from dev_observer.repository.cloner import get_remote_head_sha
 from dev_observer.repository.provider import GitRepositoryProvider
-from dev_observer.repository.tokens import persist_repo_tokens_info_async
+from dev_observer.repository.tokens import persist_repo_tokens_info_async, calibrate_token_ratios
 from dev_observer.repository.types import ObservedRepo
 from dev_observer.storage.provider import StorageProvider
 from dev_observer.tokenizer.provider import TokenizerProvider
 
+_log = logging.getLogger(__name__)
+
 
 class ReposProcessor(FlatteningProcessor[ObservedRepo]):
+    """Analyzes repositories incrementally.
+
+    A run is skipped if all observations were produced from the current remote HEAD, unless forced with
+    `mark_forced_analysis`. Otherwise, analyses of unchanged chunks are reused.
+    """
     repository: GitRepositoryProvider
     storage: Optional[StorageProvider]
+    incremental = True
 
     def __init__(
             self,
@@ -30,7 +45,45 @@ class ReposProcessor(FlatteningProcessor[ObservedRepo]):
         self.repository = repository
         self.storage = storage
 
+    async def process(
+            self, repo: ObservedRepo, requests: List[ObservationRequest], config: GlobalConfig, clean: bool = True,
+    ) -> ProcessingItemResultData:
+        force_key = get_force_key(repo.git_repo)
+        forced = await self.observations.exists(force_key)
+        if not forced:
+            head = await get_remote_head_sha(repo, self.repository)
+            keys = await self.get_up_to_date_keys(requests, head) if head is not None else None
+            if keys is not None:
+                _log.info(s_("Repository not changed since last analysis, skipping", repo=repo.url, commit_sha=head))
+                return ProcessingItemResultData(observations=keys)
+        result = await super().process(repo, requests, config, clean)
+        if forced:
+            await self.observations.delete(force_key)
+        return result
+
     async def get_flatten(self, repo: ObservedRepo, config: GlobalConfig) -> FlattenResult:
-        res = await flatten_repository(repo, self.repository, self.tokenizer, config)
+        return await self._flatten(repo, config)
+
+    async def get_flatten_stream(
+            self, repo: ObservedRepo, config: GlobalConfig, on_chunk: Callable[[str], Awaitable[None]],
+    ) -> FlattenResult:
+        return await self._flatten(repo, config, on_chunk)
+
+    async def _flatten(
+            self, repo: ObservedRepo, config: GlobalConfig, on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> FlattenResult:
+        res = await flatten_repository(repo, self.repository, self.tokenizer, config, on_chunk)
         persist_repo_tokens_info_async(self.storage, repo.git_repo, res.flatten_result.total_tokens)
+        await calibrate_token_ratios(self.observations, res.flatten_result.token_stats)
         return res.flatten_result
+
+
+def get_force_key(repo: GitRepository) -> ObservationKey:
+    return ObservationKey(
+        kind=ANALYSIS_STATE_KIND, name="__force__", key=f"repos/{get_repo_key_pref(repo)}/__force__",
+    )
+
+
+async def mark_forced_analysis(repo: GitRepository, observations: ObservationsProvider):
+    """Makes the next analysis of the repository run even if it hasn't changed."""
+    await observations.store(Observation(key=get_force_key(repo), content="FORCE"))
@@ -0,0 +1,101 @@
+import asyncio
+from typing import List, Dict, Optional
+
+from dev_observer.flatten.flatten import FlattenResult
+
+
+class ChunkStream:
+    """Paths of chunk files published while content is being flattened, every subscriber reads all of them in order.
+
+    `publish` waits while a subscriber lags more than `max_pending` chunks behind, so slow analyses hold flattening
+    back instead of letting chunks pile up. Subscribers start from the first chunk and only hold the producer back
+    while subscribed. The stream ends with the flatten result, or with the error of the producer.
+    """
+    name: str
+    _max_pending: int
+    _paths: List[str]
+    # Number of chunks taken by each subscriber.
+    _positions: Dict[int, int]
+    _next_id: int = 0
+    _done: bool = False
+    _result: Optional[FlattenResult] = None
+    _error: Optional[BaseException] = None
+
+    def __init__(self, name: str, max_pending: int):
+        self.name = name
+        self._max_pending = max(1, max_pending)
+        self._paths = []
+        self._positions = {}
+        self._changed = asyncio.Condition()
+
+    async def publish(self, path: str):
+        async with self._changed:
+            self._paths.append(path)
+            self._changed.notify_all()
+            await self._changed.wait_for(
+                lambda: all(len(self._paths) - p <= self._max_pending for p in self._positions.values()))
+
+    async def finish(self, result: FlattenResult):
+        async with self._changed:
+            self._done = True
+            self._result = result
+            self._changed.notify_all()
+
+    async def fail(self, error: BaseException):
+        async with self._changed:
+            self._done = True
+            self._error = error
+            self._changed.notify_all()
+
+    async def result(self) -> FlattenResult:
+        """Waits for the producer and returns its result."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._done)
+        if self._error is not None:
+            raise RuntimeError("Flattening failed") from self._error
+        return self._result
+
+    def subscribe(self) -> "ChunkSubscription":
+        sub_id = self._next_id
+        self._next_id += 1
+        return ChunkSubscription(self, sub_id)
+
+    async def _register(self, sub_id: int):
+        async with self._changed:
+            self._positions[sub_id] = 0
+
+    async def _unregister(self, sub_id: int):
+        async with self._changed:
+            self._positions.pop(sub_id, None)
+            self._changed.notify_all()
+
+    async def _next(self, sub_id: int) -> Optional[str]:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._positions[sub_id] < len(self._paths) or self._done)
+            position = self._positions[sub_id]
+            if position < len(self._paths):
+                self._positions[sub_id] = position + 1
+                self._changed.notify_all()
+                return self._paths[position]
+        if self._error is not None:
+            raise RuntimeError("Flattening failed") from self._error
+        return None
+
+
+class ChunkSubscription:
+    """Reads chunks of a `ChunkStream`, must be used as an async context manager."""
+
+    def __init__(self, stream: ChunkStream, sub_id: int):
+        self._stream = stream
+        self._id = sub_id
+
+    async def __aenter__(self) -> "ChunkSubscription":
+        await self._stream._register(self._id)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._stream._unregister(self._id)
+
+    async def next(self) -> Optional[str]:
+        """Returns the path of the next chunk, or None once all chunks were read and the stream is finished."""
+        return await self._stream._next(self._id)
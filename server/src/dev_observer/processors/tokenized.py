@@ -1,22 +1,46 @@
+import hashlib
+import json
 import logging
 import asyncio
 from datetime import date
-from typing import List
+from typing import List, Dict, Optional, Tuple, Callable, Awaitable, TypeVar
+
+from google.protobuf import json_format
 
 from dev_observer.analysis.provider import AnalysisProvider
 from dev_observer.flatten.flatten import FlattenResult
 from dev_observer.log import s_
-from dev_observer.prompts.provider import PromptsProvider
+from dev_observer.processors.stream import ChunkStream
+from dev_observer.prompts.provider import PromptsProvider, FormattedPrompt
 from dev_observer.tokenizer.provider import TokenizerProvider
 
 _log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
 class TokenizedAnalyzer:
+    """Analyzes flattened content, chunk by chunk if it was split.
+
+    Chunk analyses are combined with a tree reduction: while they don't fit a single prompt of
+    `summary_tokens_limit` tokens and `fan_out` summaries, consecutive summaries are grouped into prompts that fit
+    and combined, and the combined results take their place.
+    """
     prompts_prefix: str
     analysis: AnalysisProvider
     prompts: PromptsProvider
     summary_tokens_limit: int
     tokenizer: TokenizerProvider
+    # Analyses from a previous run keyed by prompt hash, reused instead of analyzing identical prompts again.
+    previous_analyses: Dict[str, str]
+    # Analyses produced or reused by this analyzer keyed by prompt hash.
+    analyses: Dict[str, str]
+    # Max number of summaries combined by a single prompt, 0 for no limit besides `summary_tokens_limit`.
+    fan_out: int
+    # Max number of levels of combining summaries that don't fit a single prompt before the rest are omitted.
+    max_depth: int
+    # Max number of prompts analyzed concurrently.
+    concurrency: int
 
     def __init__(
             self,
@@ -25,12 +49,21 @@ class TokenizedAnalyzer:
             prompts: PromptsProvider,
             summary_tokens_limit: int,
             tokenizer: TokenizerProvider,
+            previous_analyses: Optional[Dict[str, str]] = None,
+            fan_out: int = 0,
+            max_depth: int = 3,
+            concurrency: int = 10,
     ):
         self.prompts_prefix = prompts_prefix
         self.analysis = analysis
         self.prompts = prompts
         self.summary_tokens_limit = summary_tokens_limit
         self.tokenizer = tokenizer
+        self.previous_analyses = previous_analyses or {}
+        self.analyses = {}
+        self.fan_out = fan_out
+        self.max_depth = max_depth
+        self.concurrency = max(1, concurrency)
 
     async def analyze_flatten(self, flatten_result: FlattenResult) -> str:
         session_id = f"{date.today().strftime("%Y-%m-%d")}.{flatten_result.full_file_path}"
@@ -43,57 +76,130 @@ class TokenizedAnalyzer:
             return await self._analyze_file(
                 flatten_result.full_file_path, f"{self.prompts_prefix}_analyze_full", session_id)
 
+    async def analyze_stream(self, stream: ChunkStream) -> str:
+        """Same as `analyze_flatten`, but analyzes chunks as soon as they are published to the stream.
+
+        A chunk is only taken from the stream when one of `concurrency` slots is free, which holds back the producer
+        when analysis is slower. Summaries are combined the same way once all chunks are analyzed.
+        """
+        session_id = f"{date.today().strftime("%Y-%m-%d")}.{stream.name}"
+        semaphore = asyncio.Semaphore(self.concurrency)
+        paths: List[str] = []
+        tasks: List[asyncio.Future[str]] = []
+
+        async def run(path: str) -> str:
+            try:
+                return await self._analyze_file(path, f"{self.prompts_prefix}_analyze_chunk", session_id)
+            finally:
+                semaphore.release()
+
+        try:
+            async with stream.subscribe() as chunks:
+                while True:
+                    await semaphore.acquire()
+                    for task in tasks:
+                        if task.done() and not task.cancelled() and task.exception() is not None:
+                            # Fails before reading the rest of the stream.
+                            task.result()
+                    path = await chunks.next()
+                    if path is None:
+                        semaphore.release()
+                        break
+                    paths.append(path)
+                    tasks.append(asyncio.ensure_future(run(path)))
+            summaries = list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        if len(paths) == 0:
+            flatten_result = await stream.result()
+            _log.debug(s_("Analyzing flatten (single)", file=flatten_result.full_file_path))
+            return await self._analyze_file(
+                flatten_result.full_file_path, f"{self.prompts_prefix}_analyze_full", session_id)
+        return await self._reduce_summaries(summaries, paths, session_id)
+
     async def _analyze_tokenized(self, paths: List[str], session_id: str) -> str:
-        summaries: List[str] = []
-        total_tokens = 0
-        batch_size = 10
-        included_files = 0
-
-        for i in range(0, len(paths), batch_size):
-            batch = paths[i:i + batch_size]
-            # Analyze up to 10 paths in parallel per batch
-            batch_results = await asyncio.gather(
-                *(
-                    self._analyze_file(p, f"{self.prompts_prefix}_analyze_chunk", session_id)
-                    for p in batch
-                ),
-                return_exceptions=True,
-            )
-
-            exceeded = False
-            for p, s in zip(batch, batch_results):
-                if isinstance(s, BaseException):
-                    _log.error(s_("Failed to analyze file", path=p, err=s))
-                    raise s
-                tokens = len(self.tokenizer.encode(s))
-                if total_tokens + tokens > self.summary_tokens_limit:
-                    _log.warning(s_("Total summary exceeds limit, omitting some summaries",
-                                    total_tokens=total_tokens + tokens,
-                                    limit=self.summary_tokens_limit,
-                                    paths=paths
-                                    ))
-                    exceeded = True
-                    break
-                included_files += 1
-                summaries.append(s)
-                total_tokens += tokens
-
-            if exceeded:
+        summaries = await self._map_window(
+            paths, lambda p: self._analyze_file(p, f"{self.prompts_prefix}_analyze_chunk", session_id))
+        return await self._reduce_summaries(summaries, paths, session_id)
+
+    async def _reduce_summaries(self, summaries: List[str], paths: List[str], session_id: str) -> str:
+        tokens = await self.tokenizer.acount(summaries)
+        depth = 0
+        while not self._fits(tokens):
+            if depth >= self.max_depth:
+                summaries, tokens = self._truncate(summaries, tokens, paths)
                 break
+            groups = _group(tokens, self.summary_tokens_limit, self.fan_out)
+            _log.info(s_("Combining summaries", depth=depth, summaries=len(summaries), groups=len(groups),
+                         total_tokens=sum(tokens), limit=self.summary_tokens_limit, session_id=session_id))
+            grouped = [[summaries[i] for i in g] for g in groups]
+            summaries = await self._map_window(grouped, lambda group: self._reduce(group, session_id))
+            tokens = await self.tokenizer.acount(summaries)
+            depth += 1
 
-        summary = "\n\n-------\n\n".join(summaries)
         _log.info(s_("Analysing combined summaries",
-                     total_tokens=total_tokens,
+                     total_tokens=sum(tokens),
                      limit=self.summary_tokens_limit,
                      session_id=session_id,
                      paths_len=len(paths),
-                     included_files=included_files
+                     depth=depth,
                      ))
+        return await self._combine(summaries, session_id)
+
+    def _fits(self, tokens: List[int]) -> bool:
+        if self.fan_out > 0 and len(tokens) > self.fan_out:
+            return False
+        return sum(tokens) <= self.summary_tokens_limit
+
+    def _truncate(self, summaries: List[str], tokens: List[int], paths: List[str]) -> Tuple[List[str], List[int]]:
+        total_tokens = 0
+        count = 0
+        for t in tokens:
+            if total_tokens + t > self.summary_tokens_limit or (0 < self.fan_out <= count):
+                break
+            total_tokens += t
+            count += 1
+        _log.warning(s_("Total summary exceeds limit at max depth, omitting some summaries",
+                        total_tokens=sum(tokens),
+                        limit=self.summary_tokens_limit,
+                        max_depth=self.max_depth,
+                        included=count,
+                        paths=paths,
+                        ))
+        return summaries[:count], tokens[:count]
+
+    async def _reduce(self, summaries: List[str], session_id: str) -> str:
+        if len(summaries) == 1:
+            return summaries[0]
+        return await self._combine(summaries, session_id)
+
+    async def _combine(self, summaries: List[str], session_id: str) -> str:
         prompt = await self.prompts.get_formatted(f"{self.prompts_prefix}_analyze_combined_chunks", {
-            "content": summary,
+            "content": "\n\n-------\n\n".join(summaries),
         })
-        result = await self.analysis.analyze(prompt, session_id)
-        return result.analysis
+        return await self._analyze(prompt, session_id)
+
+    async def _map_window(self, items: List[T], fn: Callable[[T], Awaitable[str]]) -> List[str]:
+        """Applies `fn` to items keeping up to `concurrency` calls in flight, results are in the order of items.
+
+        Fails with the first error, cancelling calls still in flight.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(item: T) -> str:
+            async with semaphore:
+                return await fn(item)
+
+        tasks = [asyncio.ensure_future(run(item)) for item in items]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException as e:
+            _log.error(s_("Failed to analyze", err=str(e)))
+            for task in tasks:
+                task.cancel()
+            raise
 
     async def _analyze_file(self, path: str, prompt_name: str, session_id: str) -> str:
         with open(path, 'r', encoding='utf-8') as f:
@@ -102,5 +208,41 @@ class TokenizedAnalyzer:
             "content": content,
         })
         _log.debug(s_("Analyzing file", path=path, content_len=len(content)))
-        result = await self.analysis.analyze(prompt, session_id)
-        return result.analysis
+        return await self._analyze(prompt, session_id)
+
+    async def _analyze(self, prompt: FormattedPrompt, session_id: str) -> str:
+        key = prompt_hash(prompt)
+        analysis = self.previous_analyses.get(key)
+        if analysis is not None:
+            _log.debug(s_("Reusing previous analysis", prompt_name=prompt.prompt_name, key=key))
+        else:
+            analysis = (await self.analysis.analyze(prompt, session_id)).analysis
+        self.analyses[key] = analysis
+        return analysis
+
+
+def prompt_hash(prompt: FormattedPrompt) -> str:
+    data = {
+        "name": prompt.prompt_name,
+        "config": json_format.MessageToDict(prompt.config) if prompt.config is not None else None,
+        "system": json_format.MessageToDict(prompt.system) if prompt.system is not None else None,
+        "user": json_format.MessageToDict(prompt.user) if prompt.user is not None else None,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _group(tokens: List[int], limit: int, fan_out: int) -> List[List[int]]:
+    """Groups indexes of consecutive items so that every group fits the limits, oversized items are grouped alone."""
+    groups: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for i, t in enumerate(tokens):
+        if len(current) > 0 and (current_tokens + t > limit or (0 < fan_out <= len(current))):
+            groups.append(current)
+            current = []
+            current_tokens = 0
+        current.append(i)
+        current_tokens += t
+    if len(current) > 0:
+        groups.append(current)
+    return groups
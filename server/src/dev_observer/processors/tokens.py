@@ -0,0 +1,64 @@
+import logging
+
+from dev_observer.api.types.processing_pb2 import AnalyzeRepoTokensRequest, ProcessingItemResultData
+from dev_observer.common.errors import TerminalError
+from dev_observer.flatten.flatten import flatten_repository
+from dev_observer.log import s_
+from dev_observer.observations.provider import ObservationsProvider
+from dev_observer.repository.cloner import list_remote_files
+from dev_observer.repository.provider import GitRepositoryProvider
+from dev_observer.repository.tokens import persist_repo_tokens_info, calibrate_token_ratios, load_token_ratios
+from dev_observer.repository.types import ObservedRepo
+from dev_observer.storage.provider import StorageProvider
+from dev_observer.tokenizer.provider import TokenizerProvider
+from dev_observer.util import Clock, RealClock
+
+_log = logging.getLogger(__name__)
+
+
+class RepoTokensProcessor:
+    """Counts tokens of flattened repositories, see `AnalyzeRepoTokensRequest`.
+
+    Estimates are based on file sizes and per-extension ratios calibrated from exact counts, they only need
+    the tree of the latest commit. Exact counts flatten and tokenize the repository, and calibrate the ratios.
+    """
+    _storage: StorageProvider
+    _repository: GitRepositoryProvider
+    _tokenizer: TokenizerProvider
+    _observations: ObservationsProvider
+    _clock: Clock
+
+    def __init__(
+            self,
+            storage: StorageProvider,
+            repository: GitRepositoryProvider,
+            tokenizer: TokenizerProvider,
+            observations: ObservationsProvider,
+            clock: Clock = RealClock(),
+    ):
+        self._storage = storage
+        self._repository = repository
+        self._tokenizer = tokenizer
+        self._observations = observations
+        self._clock = clock
+
+    async def analyze_tokens(self, req: AnalyzeRepoTokensRequest) -> ProcessingItemResultData:
+        repo = await self._storage.get_git_repo(req.git_repo_id)
+        if repo is None:
+            raise TerminalError(f"Repo with id [{req.git_repo_id}] is not found")
+        config = await self._storage.get_global_config()
+        observed = ObservedRepo(url=repo.url, git_repo=repo)
+        extra = {"repo_id": repo.id, "exact": req.exact}
+        if req.exact:
+            result = await flatten_repository(observed, self._repository, self._tokenizer, config)
+            result.flatten_result.clean_up()
+            tokens_count = result.flatten_result.total_tokens
+            await calibrate_token_ratios(self._observations, result.flatten_result.token_stats, self._clock)
+        else:
+            info = await self._repository.get_repo(observed)
+            files = await list_remote_files(observed, self._repository)
+            ratios = await load_token_ratios(self._observations)
+            tokens_count = ratios.estimate(files, config, info)
+        _log.info(s_("Repo tokens analyzed", tokens_count=tokens_count, **extra))
+        await persist_repo_tokens_info(self._storage, repo, tokens_count, self._clock, estimated=not req.exact)
+        return ProcessingItemResultData()
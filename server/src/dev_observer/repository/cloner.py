@@ -1,12 +1,15 @@
+import asyncio
 import dataclasses
 import logging
+import shutil
 import tempfile
-from typing import Optional
+from typing import Optional, List
 
 from dev_observer.api.types.config_pb2 import GlobalConfig
 from dev_observer.log import s_
 from dev_observer.repository.types import ObservedRepo
-from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo
+from dev_observer.repository.git import run_git
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
 
 _log = logging.getLogger(__name__)
 
@@ -23,6 +26,7 @@ async def clone_repository(
         provider: GitRepositoryProvider,
         max_size_mb: Optional[int] = None,
         depth: Optional[str] = None,
+        options: Optional[CloneOptions] = None,
 ) -> CloneResult:
     max_size_kb = 100_000
     if max_size_mb is not None and max_size_mb > 0:
@@ -37,6 +41,74 @@ async def clone_repository(
     temp_dir = tempfile.mkdtemp(prefix=f"git_repo_{info.name}")
     extra = {"repo": repo, "info": info, "dest": temp_dir, "depth": depth}
     _log.debug(s_("Cloning...", **extra))
-    await provider.clone(repo, info, temp_dir, depth)
+    try:
+        await provider.clone(repo, info, temp_dir, depth, options)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
     _log.debug(s_("Cloned.", **extra))
     return CloneResult(path=temp_dir, repo=info)
+
+
+async def get_head_sha(repo_path: str) -> Optional[str]:
+    """Returns the commit SHA checked out at `repo_path`, or None if it can't be determined."""
+    return await _git_sha(["git", "rev-parse", "HEAD"], cwd=repo_path)
+
+
+async def get_remote_head_sha(repo: ObservedRepo, provider: GitRepositoryProvider) -> Optional[str]:
+    """Returns the commit SHA of the remote default branch without cloning, or None if it can't be determined."""
+    try:
+        url = await provider.get_authenticated_url(repo)
+    except Exception as e:
+        _log.warning(s_("Failed to get repository url", repo=repo, error=e))
+        return None
+    return await _git_sha(["git", "ls-remote", url, "HEAD"])
+
+
+@dataclasses.dataclass
+class RemoteFile:
+    path: str
+    size_bytes: int
+
+
+async def list_remote_files(repo: ObservedRepo, provider: GitRepositoryProvider) -> List[RemoteFile]:
+    """Lists files at the remote default branch with their sizes, without checking them out.
+
+    Uses a shallow bare clone, which transfers compressed objects of a single commit. Partial clones are not used,
+    as `git ls-tree -l` fetches missing blobs one by one to get their sizes.
+    """
+    url = await provider.get_authenticated_url(repo)
+    temp_dir = tempfile.mkdtemp(prefix="git_tree_")
+    try:
+        await run_git(["clone", "--bare", "--depth", "1", "--single-branch", "--quiet", url, temp_dir])
+        out = await run_git(["ls-tree", "-r", "-l", "-z", "HEAD"], cwd=temp_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    result: List[RemoteFile] = []
+    # Paths are only matched against patterns and extensions, a non UTF-8 name must not fail the whole listing.
+    for entry in out.decode("utf-8", errors="replace").split("\0"):
+        if len(entry) == 0:
+            continue
+        meta, path = entry.split("\t", 1)
+        # <mode> <type> <object> <size>, submodules are commits without size.
+        _, obj_type, _, size = meta.split()
+        if obj_type == "blob":
+            result.append(RemoteFile(path=path, size_bytes=int(size)))
+    return result
+
+
+async def _git_sha(cmd: List[str], cwd: Optional[str] = None) -> Optional[str]:
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd,
+        )
+        out, err = await process.communicate()
+    except OSError as e:
+        _log.warning(s_("Failed to run git", cmd=cmd[:2], error=e))
+        return None
+    if process.returncode != 0:
+        # Not logging the command or stderr as they may contain an authenticated url.
+        _log.warning(s_("Failed to get commit sha", cmd=cmd[:2], code=process.returncode))
+        return None
+    parts = out.decode("utf-8").split()
+    return parts[0] if len(parts) > 0 else None
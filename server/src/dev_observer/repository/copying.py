@@ -1,10 +1,11 @@
 import os.path
-import subprocess
 from typing import Optional
 
 from dev_observer.repository.types import ObservedRepo
 from dev_observer.repository.parser import parse_repository_url
-from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo
+from dev_observer.repository.delegating import get_git_root
+from dev_observer.repository.git import run_command
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
 
 
 class CopyingGitRepositoryProvider(GitRepositoryProvider):
@@ -24,31 +25,19 @@ class CopyingGitRepositoryProvider(GitRepositoryProvider):
             size_kb=500,
         )
 
-    async def clone(self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None):
-        repo_root = _get_git_root()
+    async def clone(
+            self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None,
+            options: Optional[CloneOptions] = None,
+    ):
+        repo_root = await get_git_root()
+        timeout_sec = options.timeout_sec if options is not None else None
         if self._shallow:
-            subprocess.run(
-                ["cp", "-r", os.path.join(repo_root, ".git"), os.path.join(dest, ".git")],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            result = subprocess.run(
-                ["cp", os.path.join(repo_root, "README.md"), dest],
-                capture_output=True,
-                text=True,
-                check=False
+            await run_command(
+                ["cp", "-r", os.path.join(repo_root, ".git"), os.path.join(dest, ".git")], timeout_sec=timeout_sec,
             )
+            await run_command(["cp", os.path.join(repo_root, "README.md"), dest], timeout_sec=timeout_sec)
         else:
-            result = subprocess.run(
-                ["cp", "-r", repo_root, dest],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to copy repository: {result.stderr}")
+            await run_command(["cp", "-r", repo_root, dest], timeout_sec=timeout_sec)
 
     async def get_authenticated_url(self, repo: ObservedRepo) -> str:
         return repo.url
@@ -56,13 +45,3 @@ class CopyingGitRepositoryProvider(GitRepositoryProvider):
     async def get_repo_token(self, repo: ObservedRepo) -> str:
         return ""
 
-
-def _get_git_root() -> str:
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=True
-    )
-    return result.stdout.strip()
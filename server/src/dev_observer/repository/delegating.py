@@ -1,8 +1,8 @@
-import subprocess
 from typing import Optional
 
 from dev_observer.repository.parser import parse_repository_url
-from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo
+from dev_observer.repository.git import git_clone, run_git
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
 from dev_observer.repository.types import ObservedRepo
 
 
@@ -17,17 +17,13 @@ class DelegatingGitRepositoryProvider(GitRepositoryProvider):
             size_kb=500,
         )
 
-    async def clone(self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None):
-        repo_root = _get_git_root()
-        cmd = ["git", "clone"]
-        if depth is not None:
-            cmd.append(f"--depth={depth}")
-        cmd.append(repo_root)
-        cmd.append(dest)
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to clone repository: {result.stderr}")
+    async def clone(
+            self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None,
+            options: Optional[CloneOptions] = None,
+    ):
+        repo_root = await get_git_root()
+        # Over the file protocol, so that depth and filters apply to the local clone.
+        await git_clone(f"file://{repo_root}", dest, depth, options)
 
     async def get_authenticated_url(self, repo: ObservedRepo) -> str:
         return repo.url
@@ -36,12 +32,5 @@ class DelegatingGitRepositoryProvider(GitRepositoryProvider):
         return ""
 
 
-def _get_git_root() -> str:
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=True
-    )
-    return result.stdout.strip()
+async def get_git_root() -> str:
+    return (await run_git(["rev-parse", "--show-toplevel"])).decode("utf-8").strip()
@@ -1,7 +1,7 @@
 from typing import Optional, Dict
 
 from dev_observer.api.types.repo_pb2 import GitProvider
-from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
 from dev_observer.repository.types import ObservedRepo
 
 
@@ -14,8 +14,11 @@ class FederatedGitProvider(GitRepositoryProvider):
     async def get_repo(self, repo: ObservedRepo) -> RepositoryInfo:
         return await self._get(repo.git_repo.provider).get_repo(repo)
 
-    async def clone(self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None):
-        await self._get(repo.git_repo.provider).clone(repo, info, dest, depth)
+    async def clone(
+            self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None,
+            options: Optional[CloneOptions] = None,
+    ):
+        await self._get(repo.git_repo.provider).clone(repo, info, dest, depth, options)
 
     async def get_authenticated_url(self, repo: ObservedRepo) -> str:
         return await self._get(repo.git_repo.provider).get_authenticated_url(repo)
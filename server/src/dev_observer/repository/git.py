@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import re
+import time
+from typing import List, Optional, Callable, Awaitable
+
+from dev_observer.log import s_
+from dev_observer.repository.provider import CloneOptions
+
+_log = logging.getLogger(__name__)
+
+_default_timeout_sec = 30 * 60
+_read_size = 64 * 1024
+_url_credentials = re.compile(r"(\w+://)[^/@\s]+@")
+
+
+async def run_command(cmd: List[str], cwd: Optional[str] = None, timeout_sec: Optional[float] = None) -> bytes:
+    """Runs the command without blocking the event loop and returns its stdout.
+
+    The process is killed if it doesn't finish within `timeout_sec` or the calling task is cancelled. Errors only
+    report the command name and stderr with credentials removed from urls, as arguments may contain them.
+    """
+    timeout = timeout_sec if timeout_sec is not None else _default_timeout_sec
+    started = time.monotonic()
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd,
+    )
+    name = " ".join(cmd[:2])
+    try:
+        out, err = await asyncio.wait_for(process.communicate(), timeout)
+    except TimeoutError:
+        await _kill(process)
+        raise TimeoutError(f"{name} timed out after {timeout} seconds")
+    except asyncio.CancelledError:
+        await _kill(process)
+        raise
+    if process.returncode != 0:
+        message = redact_credentials(err.decode("utf-8", errors="replace").strip())
+        raise RuntimeError(f"{name} failed with code {process.returncode}: {message}")
+    _log.debug(s_("Command done", command=name, duration=round(time.monotonic() - started, 3)))
+    return out
+
+
+async def stream_command(
+        cmd: List[str],
+        on_stdout: Callable[[bytes], Awaitable[None]],
+        cwd: Optional[str] = None,
+        timeout_sec: Optional[float] = None,
+):
+    """Same as `run_command`, but passes stdout to `on_stdout` in pieces as it is produced instead of buffering it.
+
+    The process is also killed if `on_stdout` fails.
+    """
+    timeout = timeout_sec if timeout_sec is not None else _default_timeout_sec
+    started = time.monotonic()
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd,
+    )
+    name = " ".join(cmd[:2])
+    stderr = asyncio.ensure_future(process.stderr.read())
+
+    async def pump():
+        while True:
+            data = await process.stdout.read(_read_size)
+            if len(data) == 0:
+                break
+            await on_stdout(data)
+        await process.wait()
+
+    try:
+        await asyncio.wait_for(pump(), timeout)
+    except TimeoutError:
+        await _kill(process)
+        stderr.cancel()
+        raise TimeoutError(f"{name} timed out after {timeout} seconds")
+    except BaseException:
+        await _kill(process)
+        stderr.cancel()
+        raise
+    err = await stderr
+    if process.returncode != 0:
+        message = redact_credentials(err.decode("utf-8", errors="replace").strip())
+        raise RuntimeError(f"{name} failed with code {process.returncode}: {message}")
+    _log.debug(s_("Command done", command=name, duration=round(time.monotonic() - started, 3)))
+
+
+async def run_git(args: List[str], cwd: Optional[str] = None, timeout_sec: Optional[float] = None) -> bytes:
+    return await run_command(["git", *args], cwd=cwd, timeout_sec=timeout_sec)
+
+
+async def git_clone(url: str, dest: str, depth: Optional[str] = None, options: Optional[CloneOptions] = None):
+    options = options or CloneOptions()
+    sparse = len(options.sparse_exclude) > 0
+    args = ["clone", "--quiet"]
+    if depth is not None:
+        args.append(f"--depth={depth}")
+    if options.single_branch:
+        args.append("--single-branch")
+    if options.blobless:
+        args.append("--filter=blob:none")
+    if sparse:
+        # Checked out after setting up the sparse checkout, so excluded blobs are never fetched.
+        args.append("--no-checkout")
+    await run_git([*args, url, dest], timeout_sec=options.timeout_sec)
+    if sparse:
+        patterns = ["/*", *[f"!{p}" for p in options.sparse_exclude]]
+        await run_git(["sparse-checkout", "set", "--no-cone", *patterns], cwd=dest, timeout_sec=options.timeout_sec)
+        await run_git(["checkout", "--quiet"], cwd=dest, timeout_sec=options.timeout_sec)
+
+
+def redact_credentials(text: str) -> str:
+    return _url_credentials.sub(r"\1***@", text)
+
+
+async def _kill(process: asyncio.subprocess.Process):
+    try:
+        process.kill()
+    except ProcessLookupError:
+        return
+    await process.wait()
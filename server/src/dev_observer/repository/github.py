@@ -1,5 +1,4 @@
 import logging
-import subprocess
 from abc import abstractmethod
 from typing import Protocol, Optional
 
@@ -7,7 +6,8 @@ from github import Github
 from github.Auth import Auth
 
 from dev_observer.api.types.repo_pb2 import GitProperties, GitMeta
-from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo
+from dev_observer.repository.git import git_clone
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
 from dev_observer.repository.types import ObservedRepo
 from dev_observer.repository.util import get_valid_repo_meta
 from dev_observer.storage.provider import StorageProvider
@@ -76,18 +76,13 @@ class GithubProvider(GitRepositoryProvider):
             size_kb=meta.size_kb,
         )
 
-    async def clone(self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None):
+    async def clone(
+            self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None,
+            options: Optional[CloneOptions] = None,
+    ):
         token = await self._auth_provider.get_cli_token_prefix(repo)
         clone_url = info.clone_url.replace("https://", f"https://{token}@")
-        cmd = ["git", "clone"]
-        if depth is not None:
-            cmd.append(f"--depth={depth}")
-        cmd.append(clone_url)
-        cmd.append(dest)
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to clone repository: {result.stderr}")
+        await git_clone(clone_url, dest, depth, options)
 
     async def get_authenticated_url(self, repo: ObservedRepo) -> str:
         info = await self.get_repo(repo)
@@ -0,0 +1,159 @@
+import asyncio
+import contextlib
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+from typing import Optional, List, Tuple, AsyncIterator
+
+from dev_observer.log import s_
+from dev_observer.repository.git import run_git
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
+from dev_observer.repository.types import ObservedRepo
+
+_log = logging.getLogger(__name__)
+
+_lock_poll_sec = 0.1
+_fetch_refspecs = ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+
+
+class MirroringGitRepositoryProvider(GitRepositoryProvider):
+    """Clones repositories from local bare mirrors kept under `cache_dir`.
+
+    A mirror is created on first use and updated with `git fetch` afterwards, so repeated clones only transfer new
+    commits. Clones are `git worktree` checkouts of the mirror and share its objects, they contain full history
+    regardless of the requested depth.
+
+    Mirrors are keyed by clone URL and guarded by file locks, so the cache can be shared by worker processes.
+    Authenticated URLs are only passed on the command line and never stored in the mirrors. When the total size
+    exceeds `max_size_bytes`, least recently used mirrors without live worktrees are evicted.
+    """
+    _delegate: GitRepositoryProvider
+    _dir: str
+    _max_size_bytes: int
+
+    def __init__(self, delegate: GitRepositoryProvider, cache_dir: str, max_size_bytes: int):
+        self._delegate = delegate
+        self._dir = cache_dir
+        self._max_size_bytes = max_size_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    async def get_repo(self, repo: ObservedRepo) -> RepositoryInfo:
+        return await self._delegate.get_repo(repo)
+
+    async def clone(
+            self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None,
+            options: Optional[CloneOptions] = None,
+    ):
+        # Mirrors are complete, partial and sparse clone options only apply to the timeout.
+        timeout_sec = options.timeout_sec if options is not None else None
+        mirror = self._get_mirror_path(info.clone_url)
+        url = await self._delegate.get_authenticated_url(repo)
+        async with _file_lock(f"{mirror}.lock"):
+            await self._update_mirror(mirror, url, info, timeout_sec)
+            await run_git(["worktree", "add", "--detach", dest, "HEAD"], cwd=mirror)
+            # Last use time for eviction.
+            os.utime(mirror)
+        await self._evict()
+
+    async def get_authenticated_url(self, repo: ObservedRepo) -> str:
+        return await self._delegate.get_authenticated_url(repo)
+
+    async def get_repo_token(self, repo: ObservedRepo) -> str:
+        return await self._delegate.get_repo_token(repo)
+
+    async def _update_mirror(self, mirror: str, url: str, info: RepositoryInfo, timeout_sec: Optional[float]):
+        extra = {"repo": f"{info.owner}/{info.name}", "mirror": mirror}
+        if os.path.exists(mirror):
+            try:
+                # Drop worktrees of clones that were deleted by their users.
+                await run_git(["worktree", "prune"], cwd=mirror)
+                await run_git(
+                    ["fetch", "--prune", "--quiet", url, *_fetch_refspecs], cwd=mirror, timeout_sec=timeout_sec,
+                )
+                _log.debug(s_("Mirror updated", **extra))
+                return
+            except RuntimeError as e:
+                _log.warning(s_("Failed to update mirror, re-creating", error=e, **extra))
+                shutil.rmtree(mirror, ignore_errors=True)
+        tmp = f"{mirror}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        await run_git(["clone", "--mirror", "--quiet", url, tmp], timeout_sec=timeout_sec)
+        await run_git(["remote", "set-url", "origin", info.clone_url], cwd=tmp)
+        os.replace(tmp, mirror)
+        _log.info(s_("Mirror created", **extra))
+
+    async def _evict(self):
+        async with _file_lock(os.path.join(self._dir, ".evict.lock")):
+            mirrors = await asyncio.to_thread(self._scan)
+            total = sum(size for _, _, size in mirrors)
+            for _, mirror, size in sorted(mirrors):
+                if total <= self._max_size_bytes:
+                    break
+                if await self._try_remove(mirror):
+                    total -= size
+                    _log.info(s_("Evicted mirror", mirror=mirror, size=size, total=total))
+            if total > self._max_size_bytes:
+                _log.warning(s_("Mirror cache exceeds quota, all mirrors are in use", total=total,
+                                max_size=self._max_size_bytes))
+
+    async def _try_remove(self, mirror: str) -> bool:
+        lock_path = f"{mirror}.lock"
+        with open(lock_path, "a") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            try:
+                await run_git(["worktree", "prune"], cwd=mirror)
+                worktrees = os.path.join(mirror, "worktrees")
+                if os.path.isdir(worktrees) and len(os.listdir(worktrees)) > 0:
+                    return False
+                # The lock file is kept, removing it would let two processes lock different files for the same mirror.
+                await asyncio.to_thread(shutil.rmtree, mirror, True)
+                return True
+            except RuntimeError as e:
+                _log.warning(s_("Failed to check mirror worktrees", mirror=mirror, error=e))
+                return False
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _scan(self) -> List[Tuple[float, str, int]]:
+        result: List[Tuple[float, str, int]] = []
+        for name in os.listdir(self._dir):
+            path = os.path.join(self._dir, name)
+            if not name.endswith(".git") or not os.path.isdir(path):
+                continue
+            size = 0
+            for dir_path, _, files in os.walk(path):
+                for file in files:
+                    try:
+                        size += os.lstat(os.path.join(dir_path, file)).st_size
+                    except FileNotFoundError:
+                        pass
+            try:
+                result.append((os.path.getmtime(path), path, size))
+            except FileNotFoundError:
+                pass
+        return result
+
+    def _get_mirror_path(self, clone_url: str) -> str:
+        return os.path.join(self._dir, f"{hashlib.sha256(clone_url.encode('utf-8')).hexdigest()[:32]}.git")
+
+
+@contextlib.asynccontextmanager
+async def _file_lock(path: str) -> AsyncIterator[None]:
+    """Exclusive lock shared by threads and processes. Polls instead of blocking to keep the loop responsive."""
+    with open(path, "a") as f:
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(_lock_poll_sec)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
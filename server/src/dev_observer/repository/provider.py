@@ -1,6 +1,6 @@
 import dataclasses
 from abc import abstractmethod
-from typing import Protocol, Optional
+from typing import Protocol, Optional, List
 
 from dev_observer.repository.types import ObservedRepo
 
@@ -13,13 +13,27 @@ class RepositoryInfo:
     size_kb: int
 
 
+@dataclasses.dataclass
+class CloneOptions:
+    """Options reducing what is transferred and checked out by clones. Providers may ignore them."""
+    # Fetches blobs only when they are checked out, `--filter=blob:none`.
+    blobless: bool = False
+    single_branch: bool = False
+    # Gitignore style patterns of paths excluded from the checkout with a sparse checkout.
+    sparse_exclude: List[str] = dataclasses.field(default_factory=list)
+    timeout_sec: Optional[float] = None
+
+
 class GitRepositoryProvider(Protocol):
     @abstractmethod
     async def get_repo(self, repo: ObservedRepo) -> RepositoryInfo:
         ...
 
     @abstractmethod
-    async def clone(self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None):
+    async def clone(
+            self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None,
+            options: Optional[CloneOptions] = None,
+    ):
         ...
 
     @abstractmethod
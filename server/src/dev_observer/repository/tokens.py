@@ -1,18 +1,54 @@
 import asyncio
+import json
 import logging
+import uuid
+from typing import Dict, List
 
+from dev_observer.api.types.config_pb2 import GlobalConfig
+from dev_observer.api.types.observations_pb2 import ObservationKey, Observation
 from dev_observer.api.types.repo_pb2 import GitRepository, GitProperties, GitMeta, TokensInfo
+from dev_observer.flatten.flatten import TokenStats, file_extension
+from dev_observer.flatten.native import get_ignore_matcher, get_max_file_size
 from dev_observer.log import s_
+from dev_observer.observations.provider import ObservationsProvider
+from dev_observer.repository.cloner import RemoteFile
+from dev_observer.repository.provider import RepositoryInfo
 from dev_observer.storage.provider import StorageProvider
 from dev_observer.util import RealClock, Clock
 
 _log = logging.getLogger(__name__)
 
+# Ratios stored by earlier versions, still used as the base of calibrations.
+TOKEN_RATIOS_KEY = ObservationKey(kind="tokens", name="ratios.json", key="ratios.json")
+# Stats of every exact count are stored under their own key and combined on load, so that concurrent counts don't
+# overwrite each other.
+_calibrations_kind = "tokens"
+_calibrations_path = "calibrations/"
+# Calibrations kept, older ones weigh less than 0.2% with the decay.
+_max_calibrations = 30
 
-def persist_repo_tokens_info_async(store, repo: GitRepository, tokens_count: int, clock: Clock = RealClock()):
+# Roughly 4 bytes per token for source code.
+_default_ratio = 0.25
+# Bytes of an extension needed before its own ratio is trusted over the overall one.
+_min_calibration_bytes = 10_000
+# Weight of previous stats when calibrating, so that ratios follow changes in the analyzed code.
+_calibration_decay = 0.8
+# Header written before every file by flatteners, e.g. "## File: <path>" and code fences.
+_file_header_bytes = 24
+_binary_extensions = {
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".tiff", ".psd",
+    ".pdf", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".jar", ".war",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot", ".mp3", ".mp4", ".mov", ".avi", ".wav", ".ogg",
+    ".exe", ".dll", ".so", ".dylib", ".o", ".a", ".class", ".pyc", ".wasm", ".bin", ".dat", ".db", ".sqlite",
+}
+
+
+def persist_repo_tokens_info_async(
+        store, repo: GitRepository, tokens_count: int, clock: Clock = RealClock(), estimated: bool = False,
+):
     async def _store():
         try:
-            await persist_repo_tokens_info(store, repo, tokens_count, clock)
+            await persist_repo_tokens_info(store, repo, tokens_count, clock, estimated)
         except Exception as e:
             _log.error(s_("Failed to persist repo tokens info", repo=repo, err=e, exc_info=e))
 
@@ -20,13 +56,100 @@ def persist_repo_tokens_info_async(store, repo: GitRepository, tokens_count: int
 
 
 async def persist_repo_tokens_info(
-        store: StorageProvider, repo: GitRepository, tokens_count: int, clock: Clock = RealClock()):
+        store: StorageProvider, repo: GitRepository, tokens_count: int, clock: Clock = RealClock(),
+        estimated: bool = False,
+):
     props = GitProperties()
     if repo.HasField("properties"):
         props.CopyFrom(repo.properties)
     meta = GitMeta()
     if props.HasField("meta"):
         meta.CopyFrom(props.meta)
-    meta.tokens_info.CopyFrom(TokensInfo(created_at=clock.now(), tokens_count=tokens_count))
+    meta.tokens_info.CopyFrom(TokensInfo(created_at=clock.now(), tokens_count=tokens_count, estimated=estimated))
     props.meta.CopyFrom(meta)
     await store.update_repo_properties(repo.id, props)
+
+
+class TokenRatios:
+    """Tokens per byte of files by extension, calibrated from exact token counts of flattened repositories."""
+    stats: Dict[str, TokenStats]
+
+    def __init__(self, stats: Dict[str, TokenStats]):
+        self.stats = stats
+        total = TokenStats()
+        for s in stats.values():
+            total.add(s)
+        self._overall = total.tokens / total.bytes if total.bytes >= _min_calibration_bytes else _default_ratio
+
+    def ratio(self, ext: str) -> float:
+        s = self.stats.get(ext)
+        if s is None or s.bytes < _min_calibration_bytes:
+            return self._overall
+        return s.tokens / s.bytes
+
+    def estimate(self, files: List[RemoteFile], config: GlobalConfig, info: RepositoryInfo) -> int:
+        """Estimates tokens of the flattened repository, skipping files the flatteners skip."""
+        ignore = get_ignore_matcher(config, info)
+        max_file_size = get_max_file_size(config)
+        tokens = 0.0
+        for f in files:
+            ext = file_extension(f.path)
+            if f.size_bytes > max_file_size or ext in _binary_extensions or ignore.fullmatch(f.path):
+                continue
+            tokens += (f.size_bytes + len(f.path) + _file_header_bytes) * self.ratio(ext)
+        return round(tokens)
+
+    def calibrated(self, stats: Dict[str, TokenStats]) -> "TokenRatios":
+        """Returns ratios updated with stats of an exact count."""
+        result: Dict[str, TokenStats] = {}
+        for ext in self.stats.keys() | stats.keys():
+            old = self.stats.get(ext, TokenStats())
+            new = stats.get(ext, TokenStats())
+            result[ext] = TokenStats(
+                bytes=round(old.bytes * _calibration_decay) + new.bytes,
+                tokens=round(old.tokens * _calibration_decay) + new.tokens,
+            )
+        return TokenRatios({ext: s for ext, s in result.items() if s.bytes > 0})
+
+
+async def load_token_ratios(observations: ObservationsProvider) -> TokenRatios:
+    """Combines stored calibrations, oldest first, into ratios."""
+    try:
+        ratios = TokenRatios({})
+        if await observations.exists(TOKEN_RATIOS_KEY):
+            ratios = TokenRatios(_parse_stats((await observations.get(TOKEN_RATIOS_KEY)).content))
+        keys = await _list_calibrations(observations)
+        for o in await observations.get_many(keys[-_max_calibrations:]):
+            ratios = ratios.calibrated(_parse_stats(o.content))
+        return ratios
+    except Exception as e:
+        _log.warning(s_("Failed to load token ratios, using defaults", error=str(e)))
+        return TokenRatios({})
+
+
+async def calibrate_token_ratios(
+        observations: ObservationsProvider, stats: Dict[str, TokenStats], clock: Clock = RealClock(),
+):
+    """Stores stats of an exact count to calibrate ratios with, dropping the oldest calibrations."""
+    if len(stats) == 0:
+        return
+    try:
+        # Keys sort in the order of calibrations.
+        name = f"{int(clock.now().timestamp() * 1_000_000):017d}-{uuid.uuid4().hex[:8]}.json"
+        content = json.dumps({ext: {"bytes": s.bytes, "tokens": s.tokens} for ext, s in stats.items()})
+        await observations.store(Observation(
+            key=ObservationKey(kind=_calibrations_kind, name=name, key=f"{_calibrations_path}{name}"),
+            content=content,
+        ))
+        for key in (await _list_calibrations(observations))[:-_max_calibrations]:
+            await observations.delete(key)
+    except Exception as e:
+        _log.warning(s_("Failed to calibrate token ratios", error=str(e)))
+
+
+async def _list_calibrations(observations: ObservationsProvider) -> List[ObservationKey]:
+    return sorted(await observations.list(_calibrations_kind, _calibrations_path), key=lambda k: k.key)
+
+
+def _parse_stats(content: str) -> Dict[str, TokenStats]:
+    return {ext: TokenStats(bytes=s["bytes"], tokens=s["tokens"]) for ext, s in json.loads(content).items()}
@@ -8,19 +8,10 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 
-import dev_observer
-from dev_observer.log import PlainTextEncoder, configure_logging, s_
+from dev_observer.log import configure_app_logging, s_
 from dev_observer.server.services.health import HealthService
 
-dev_observer.log.encoder = PlainTextEncoder(color=os.getenv("PYTHON_ENV") == "development")
-configure_logging()
-
-# Or suppress all AWS-related debug messages
-logging.getLogger('boto3').setLevel(logging.WARNING)
-logging.getLogger('botocore').setLevel(logging.WARNING)
-logging.getLogger('aiobotocore').setLevel(logging.WARNING)
-logging.getLogger('httpcore').setLevel(logging.WARNING)
-logging.getLogger('openai').setLevel(logging.WARNING)
+configure_app_logging()
 
 from dev_observer.server import detect
 from dev_observer.server.middleware.auth import AuthMiddleware
@@ -43,9 +34,14 @@ def start_bg_processing():
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    thread = threading.Thread(target=start_bg_processing, daemon=True)
-    thread.start()
+    worker = detect.settings.worker
+    if worker is None or worker.embedded:
+        thread = threading.Thread(target=start_bg_processing, daemon=True)
+        thread.start()
+    else:
+        _log.info(s_("Embedded processing disabled, items are processed by separate workers"))
     yield
+    await env.observations.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -55,7 +51,7 @@ auth_middleware = AuthMiddleware(env.users, env.api_keys)
 
 # Create services
 config_service = ConfigService(env.storage, env.users)
-repos_service = RepositoriesService(env.storage, env.observations, env.prompts, env.analysis, env.git_repository, env.tokenizer)
+repos_service = RepositoriesService(env.storage, env.observations, env.prompts, env.analysis, env.git_repository)
 observations_service = ObservationsService(env.observations, env.storage)
 websites_service = WebSitesService(env.storage)
 tokens_service = TokensService(env.storage)
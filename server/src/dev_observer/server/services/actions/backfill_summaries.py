@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from datetime import date
-from typing import Sequence
+from typing import Sequence, List
 
 from dev_observer.analysis.provider import AnalysisProvider
 from dev_observer.api.types.observations_pb2 import Analyzer, ObservationKey, Observation
@@ -55,29 +55,33 @@ async def _process_repo_summaries(
 
     repo_key_prefix = get_repo_key_pref(repo)
 
-    # Process each analyzer
+    # Analysis file key and summary file key of each analyzer
+    analysis_keys: List[ObservationKey] = []
+    summary_keys: List[ObservationKey] = []
     for analyzer in analyzers:
-        # Analysis file key and summary file key
         analysis_file = analyzer.file_name
         summary_file = f"__summary__{analysis_file}"
+        analysis_keys.append(ObservationKey(kind="repos", name=analysis_file, key=f"{repo_key_prefix}/{analysis_file}"))
+        summary_keys.append(ObservationKey(kind="repos", name=summary_file, key=f"{repo_key_prefix}/{summary_file}"))
+    exists = await observations.exists_many([*analysis_keys, *summary_keys])
+    analysis_exists, summary_exists = exists[:len(analyzers)], exists[len(analyzers):]
 
-        analysis_key = f"{repo_key_prefix}/{analysis_file}"
-        summary_key = f"{repo_key_prefix}/{summary_file}"
-
-        analysis_obs_key = ObservationKey(kind="repos", name=analysis_file, key=analysis_key)
-        if not await observations.exists(analysis_obs_key):
-            _log.debug(s_("Analysis file not found, skipping", repo_id=repo_id, analysis_file=analysis_file))
+    # Process each analyzer
+    for i, analyzer in enumerate(analyzers):
+        analysis_obs_key = analysis_keys[i]
+        summary_obs_key = summary_keys[i]
+        if not analysis_exists[i]:
+            _log.debug(s_("Analysis file not found, skipping", repo_id=repo_id, analysis_file=analysis_obs_key.name))
             continue
 
-        summary_obs_key = ObservationKey(kind="repos", name=summary_file, key=summary_key)
         if not force:
-            if await observations.exists(summary_obs_key):
-                _log.debug(s_("Summary already exists, skipping", repo_id=repo_id, summary_file=summary_file))
+            if summary_exists[i]:
+                _log.debug(s_("Summary already exists, skipping", repo_id=repo_id, summary_file=summary_obs_key.name))
                 continue
 
         generated = await _generate_summary(analysis_obs_key, summary_obs_key, analyzer, observations, prompts,
                                             analysis)
-        _log.info(s_("Summary processed", repo_id=repo_id, summary_file=summary_file, generated=generated))
+        _log.info(s_("Summary processed", repo_id=repo_id, summary_file=summary_obs_key.name, generated=generated))
 
 
 async def _generate_summary(
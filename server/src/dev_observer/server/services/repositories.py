@@ -1,28 +1,28 @@
 import logging
+import uuid
 
 from fastapi import APIRouter, HTTPException
 from starlette.requests import Request
 
 from dev_observer.analysis.provider import AnalysisProvider
-from dev_observer.api.types.processing_pb2 import ProcessingItemKey
+from dev_observer.api.types.processing_pb2 import ProcessingItemKey, ProcessingItemData, ProcessingRequest, \
+    AnalyzeRepoTokensRequest as AnalyzeRepoTokensRequestPb
 from dev_observer.api.types.repo_pb2 import GitRepository
 from dev_observer.api.web.repositories_pb2 import AddRepositoryRequest, AddRepositoryResponse, \
     ListRepositoriesResponse, RescanRepositoryResponse, GetRepositoryResponse, DeleteRepositoryResponse, \
     FilterRepositoriesRequest, FilterRepositoriesResponse, RescanRepositoryRequest, RescanAnalysisSummaryResponse, \
     RescanAnalysisSummaryRequest, GetAuthenticatedRepoRequest, GetAuthenticatedRepoResponse, GetRepoTokenRequest, \
-    GetRepoTokenResponse
+    GetRepoTokenResponse, AnalyzeRepoTokensRequest, AnalyzeRepoTokensResponse
 from dev_observer.log import s_
 from dev_observer.observations.provider import ObservationsProvider
 from dev_observer.processors.code_research import mark_forced_research
+from dev_observer.processors.repos import mark_forced_analysis
 from dev_observer.prompts.provider import PromptsProvider
 from dev_observer.repository.parser import parse_repository_url
-from dev_observer.repository.tokens import persist_repo_tokens_info_async
 from dev_observer.server.services.actions.backfill_summaries import backfill_analysis_summaries
 from dev_observer.storage.provider import StorageProvider
 from dev_observer.util import parse_dict_pb, Clock, RealClock, pb_to_dict
-from dev_observer.tokenizer.provider import TokenizerProvider
 from dev_observer.repository.provider import GitRepositoryProvider
-from dev_observer.flatten.flatten import flatten_repository
 from dev_observer.repository.types import ObservedRepo
 
 _log = logging.getLogger(__name__)
@@ -35,7 +35,6 @@ class RepositoriesService:
     _analysis: AnalysisProvider
     _clock: Clock
     _repository: GitRepositoryProvider
-    _tokenizer: TokenizerProvider
 
     router: APIRouter
 
@@ -46,14 +45,12 @@ class RepositoriesService:
             prompts: PromptsProvider,
             analysis: AnalysisProvider,
             repository: GitRepositoryProvider,
-            tokenizer: TokenizerProvider,
             clock: Clock = RealClock()):
         self._store = store
         self._observations = observations
         self._prompts = prompts
         self._analysis = analysis
         self._repository = repository
-        self._tokenizer = tokenizer
         self._clock = clock
         self.router = APIRouter()
 
@@ -120,15 +117,18 @@ class RepositoriesService:
 
     async def rescan(self, repo_id: str, req: Request):
         request = parse_dict_pb(await req.json(), RescanRepositoryRequest())
+        if not request.skip_summary or (request.research and request.force_research):
+            repo = await self._store.get_git_repo(repo_id)
+            if repo is None:
+                raise ValueError(f"Repo with id [{repo_id}] is not found")
         if not request.skip_summary:
+            # Explicit rescans re-analyze the repository even if it hasn't changed, e.g. to pick up new prompts.
+            await mark_forced_analysis(repo, self._observations)
             await self._store.set_next_processing_time(
                 ProcessingItemKey(github_repo_id=repo_id), self._clock.now(),
             )
         if request.research:
             if request.force_research:
-                repo = await self._store.get_git_repo(repo_id)
-                if repo is None:
-                    raise ValueError(f"Repo with id [{repo_id}] is not found")
                 await mark_forced_research(repo, self._observations)
             await self._store.set_next_processing_time(
                 ProcessingItemKey(research_git_repo_id=repo_id), self._clock.now(),
@@ -146,15 +146,21 @@ class RepositoriesService:
         )
         return pb_to_dict(RescanAnalysisSummaryResponse())
 
-    async def analyze_tokens(self, repo_id: str, _: Request):
-        # Trigger tokens count analysis by cloning + flattening the repository and persisting the tokens count
+    async def analyze_tokens(self, repo_id: str, req: Request):
+        # Tokens are counted by a worker, the result is stored in the repo properties.
+        request = parse_dict_pb(await req.json(), AnalyzeRepoTokensRequest())
         repo = await self._store.get_git_repo(repo_id)
         if repo is None:
             raise ValueError(f"Repo with id [{repo_id}] is not found")
-        config = await self._store.get_global_config()
-        observed = ObservedRepo(url=repo.url, git_repo=repo)
-        result = await flatten_repository(observed, self._repository, self._tokenizer, config)
-        result.flatten_result.clean_up()
-        persist_repo_tokens_info_async(self._store, repo, result.flatten_result.total_tokens)
-        updated = await self._store.get_git_repo(repo_id)
-        return pb_to_dict(GetRepositoryResponse(repo=updated))
+        request_id = str(uuid.uuid4())
+        await self._store.create_processing_time(
+            ProcessingItemKey(request_id=request_id),
+            ProcessingItemData(
+                reference_id=repo_id,
+                request=ProcessingRequest(analyze_tokens=AnalyzeRepoTokensRequestPb(
+                    git_repo_id=repo_id, exact=request.exact,
+                )),
+            ),
+            next_time=self._clock.now(),
+        )
+        return pb_to_dict(AnalyzeRepoTokensResponse(request_id=request_id))
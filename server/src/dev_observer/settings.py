@@ -1,6 +1,8 @@
 import logging
-from typing import Optional, Tuple, Literal, ClassVar, List
+import os
+from typing import Optional, Tuple, Literal, ClassVar, List, Dict
 
+from dotenv import load_dotenv
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict, PydanticBaseSettingsSource, TomlConfigSettingsSource
 
@@ -16,10 +18,17 @@ class Github(BaseModel):
     private_key: Optional[str] = None
 
 
+class GitMirrorCache(BaseModel):
+    dir: str
+    max_size_mb: int = 20 * 1024
+
+
 class Git(BaseModel):
     provider: Literal["github", "copying", "delegating", "federated"] = "github"
 
     github: Optional[Github] = None
+    # If set, clones are checked out from local mirrors updated with `git fetch`.
+    mirror_cache: Optional[GitMirrorCache] = None
 
 
 class LangfuseAuth(BaseModel):
@@ -49,10 +58,41 @@ class LanggraphAnalysis(BaseModel):
     ...
 
 
+class RateLimit(BaseModel):
+    # Zero means unlimited.
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    max_concurrency: int = 0
+
+
+class RateLimits(BaseModel):
+    default: Optional[RateLimit] = None
+    # Keyed by "<provider>" or "<provider>:<model_name>", e.g. "google_genai:gemini-2.5-pro".
+    models: Dict[str, RateLimit] = {}
+    # Retries of calls rejected by the provider with a rate limit error.
+    max_retries: int = 3
+
+
+class DiskResponseCache(BaseModel):
+    dir: str
+
+
+class ResponseCache(BaseModel):
+    # "postgresql" uses the database configured in `storage.postgresql`.
+    provider: Literal["disk", "postgresql", "observations"]
+    ttl_seconds: int = 30 * 24 * 60 * 60
+    # Not enforced by the "observations" provider, use the store's own retention rules instead.
+    max_bytes: int = 1024 * 1024 * 1024
+
+    disk: Optional[DiskResponseCache] = None
+
+
 class Analysis(BaseModel):
     provider: Literal["langgraph", "stub"] = "langgraph"
 
     langgrpah: Optional[LanggraphAnalysis] = None
+    rate_limits: Optional[RateLimits] = None
+    response_cache: Optional[ResponseCache] = None
 
 
 class LocalObservations(BaseModel):
@@ -65,10 +105,22 @@ class S3Observations(BaseModel):
     secret_key: str
     bucket: str
     region: str
+    # Connections kept by the client of an event loop.
+    max_pool_connections: int = 50
+    keepalive_timeout_sec: float = 60
 
 
 class GCSObservations(BaseModel):
     bucket: str
+    # Connections kept by the session of an event loop.
+    max_connections: int = 50
+
+
+class ObservationsCache(BaseModel):
+    max_memory_bytes: int = 256 * 1024 * 1024
+    # Entries evicted from memory are kept on disk if set.
+    disk_dir: Optional[str] = None
+    max_disk_bytes: int = 2 * 1024 * 1024 * 1024
 
 
 class Observations(BaseModel):
@@ -77,6 +129,10 @@ class Observations(BaseModel):
     local: Optional[LocalObservations] = None
     s3: Optional[S3Observations] = None
     gcs: Optional[GCSObservations] = None
+    cache: Optional[ObservationsCache] = None
+    # Compression of stored observations, existing uncompressed ones are still read.
+    compression: Literal["none", "zstd", "gzip"] = "none"
+    compression_level: Optional[int] = None
 
 
 class SettingsProps(BaseModel):
@@ -87,10 +143,18 @@ class Tiktoken(BaseModel):
     encoding: str = "cl100k_base"
 
 
+class TokenizerPool(BaseModel):
+    # Threads are usually enough as tiktoken releases the GIL, processes avoid contention with the rest of the app
+    # at the cost of copying content between processes.
+    kind: Literal["thread", "process"] = "thread"
+    max_workers: int = 4
+
+
 class Tokenizer(BaseModel):
     provider: Literal["tiktoken", "stub"] = "tiktoken"
 
     tiktoken: Optional[Tiktoken] = None
+    pool: TokenizerPool = TokenizerPool()
 
 
 class LocalStorage(BaseModel):
@@ -130,6 +194,13 @@ class Crypto(BaseModel):
     secret: str
 
 
+class Worker(BaseModel):
+    # Runs the periodic processor inside the API process. Disable when items are processed by `dev_observer worker`.
+    embedded: bool = True
+    # Number of worker processes started by `dev_observer worker`.
+    processes: int = 1
+
+
 class Settings(BaseSettings):
     props: ClassVar[SettingsProps] = SettingsProps()
 
@@ -143,6 +214,7 @@ class Settings(BaseSettings):
     api_keys: Optional[ApiKeys] = None
     web_scraping: Optional[WebScraping] = WebScraping()
     crypto: Optional[Crypto] = None
+    worker: Optional[Worker] = Worker()
 
     def __init__(self) -> None:
         toml_file = Settings.model_config.get("toml_file", None)
@@ -168,3 +240,14 @@ class Settings(BaseSettings):
             toml_provider = TomlConfigSettingsSource(Settings, toml_file)
             return init_settings, toml_provider, env_settings, dotenv_settings, file_secret_settings
         return init_settings, env_settings, dotenv_settings, file_secret_settings
+
+
+def load_settings() -> Settings:
+    """Loads settings from the files pointed to by DEV_OBSERVER_* environment variables."""
+    for var in ["DEV_OBSERVER_SECRETS_FILE", "DEV_OBSERVER_ENV_FILE"]:
+        file = os.environ.get(var, None)
+        if file is not None and len(file.strip()) > 0 and os.path.exists(file) and os.path.isfile(file):
+            load_dotenv(file)
+
+    Settings.model_config["toml_file"] = os.environ.get("DEV_OBSERVER_CONFIG_FILE", None)
+    return Settings()
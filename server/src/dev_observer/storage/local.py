@@ -1,4 +1,5 @@
 import os.path
+from typing import Optional, Tuple
 
 from google.protobuf import json_format
 
@@ -9,6 +10,8 @@ from dev_observer.util import Clock, RealClock
 
 class LocalStorageProvider(SingleBlobStorageProvider):
     _dir: str
+    # Parsed file contents, keyed by file modification time and size.
+    _cache: Optional[Tuple[Tuple[int, int], LocalStorageData]] = None
 
     def __init__(self, root_dir: str, clock: Clock = RealClock()):
         super().__init__(clock)
@@ -22,11 +25,24 @@ class LocalStorageProvider(SingleBlobStorageProvider):
         path = self._get_path()
         if not os.path.exists(path):
             return LocalStorageData()
-        with open(path, 'r') as in_file:
-            data = in_file.read()
-            res = LocalStorageData()
-            return json_format.Parse(data, res, ignore_unknown_fields=True)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cache = self._cache
+        if cache is None or cache[0] != version:
+            with open(path, 'r') as in_file:
+                data = in_file.read()
+                cache = (version, json_format.Parse(data, LocalStorageData(), ignore_unknown_fields=True))
+            self._cache = cache
+        # Callers modify the returned data in place, so they always get their own copy.
+        res = LocalStorageData()
+        res.CopyFrom(cache[1])
+        return res
 
     def _store(self, data: LocalStorageData):
-        with open(self._get_path(), 'w') as out_file:
+        path = self._get_path()
+        with open(path, 'w') as out_file:
             out_file.write(json_format.MessageToJson(data))
+        stat = os.stat(path)
+        stored = LocalStorageData()
+        stored.CopyFrom(data)
+        self._cache = ((stat.st_mtime_ns, stat.st_size), stored)
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+from typing import Dict
+
+
+class ProcessingNotifier:
+    """Thread-safe wakeup channel for loops waiting on processing item changes.
+
+    Notifications are latched per event loop: a notification that arrives while nobody is waiting
+    wakes up the next `wait` call immediately, so changes made between a claim and a wait are not lost.
+    """
+    _lock: threading.Lock
+    _events: Dict[asyncio.AbstractEventLoop, asyncio.Event]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = {}
+
+    def notify(self):
+        with self._lock:
+            for loop in [lp for lp in self._events.keys() if lp.is_closed()]:
+                del self._events[loop]
+            events = list(self._events.items())
+        for loop, event in events:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop was closed concurrently.
+                pass
+
+    async def wait(self, timeout: float) -> bool:
+        """Waits for a notification for up to `timeout` seconds. Returns True if notified."""
+        event = self._get_event()
+        try:
+            await asyncio.wait_for(event.wait(), timeout=max(timeout, 0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            event.clear()
+
+    def _get_event(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            event = self._events.get(loop)
+            if event is None:
+                event = asyncio.Event()
+                self._events[loop] = event
+            return event
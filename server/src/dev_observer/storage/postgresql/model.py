@@ -101,6 +101,8 @@ class ProcessingItemEntity(Base):
     created_by: Mapped[Optional[str]] = mapped_column(index=True, default=None)
     reference_id: Mapped[Optional[str]] = mapped_column(index=True, default=None)
     request_type: Mapped[Optional[str]] = mapped_column(index=True, default=None)
+    # Name of the entity field set in the key, used for per-type claim quotas.
+    entity_type: Mapped[Optional[str]] = mapped_column(index=True, default=None)
     no_processing: Mapped[bool] = mapped_column(default=False)
 
     created_at: Mapped[datetime.datetime] = mapped_column(
@@ -118,6 +120,7 @@ class ProcessingItemEntity(Base):
         DateTime(timezone=True),
         nullable=True
     )
+    worker_id: Mapped[Optional[str]] = mapped_column(default=None)
 
     def __repr__(self):
         return f"ProcessingItemEntity(key={self.key}, json_data={self.json_data}, next_processing={self.next_processing}, last_processed={self.last_processed}, last_error={self.last_error}, no_processing={self.no_processing})"
@@ -165,3 +168,25 @@ class ProcessingItemResultEntity(Base):
 
     def __repr__(self):
         return f"ProcessingItemResultEntity(id={self.id}, key={self.key}, json_data={self.json_data})"
+
+
+class ModelResponseCacheEntity(Base):
+    __tablename__ = "model_response_cache"
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    value: Mapped[str]
+    size: Mapped[int]
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    accessed_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True,
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"ModelResponseCacheEntity(key={self.key}, size={self.size})"
@@ -1,11 +1,12 @@
+import asyncio
 import datetime
 import logging
 import uuid
 from typing import Optional, MutableSequence, List, Sequence, Callable, cast
 
 from google.protobuf import json_format
-from sqlalchemy import select, delete, update
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy import select, delete, update, func, or_
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, AsyncConnection
 
 from dev_observer.api.types.config_pb2 import GlobalConfig
 from dev_observer.api.types.processing_pb2 import ProcessingItem, ProcessingItemKey, \
@@ -16,21 +17,38 @@ from dev_observer.api.types.tokens_pb2 import AuthTokenProvider, AuthToken, Toke
 from dev_observer.common.crypto import Encryptor
 from dev_observer.storage.postgresql.model import GitRepoEntity, ProcessingItemEntity, GlobalConfigEntity, \
     WebsiteEntity, ProcessingItemResultEntity, AuthTokenEntity
-from dev_observer.storage.provider import StorageProvider, AddWebSiteData
+from dev_observer.log import s_
+from dev_observer.storage.notifier import ProcessingNotifier
+from dev_observer.storage.provider import StorageProvider, AddWebSiteData, ProcessingQuota
 from dev_observer.util import parse_json_pb, pb_to_json, Clock, RealClock
 
 _log = logging.getLogger(__name__)
 
+_processing_channel = "dev_observer_processing"
+_config_channel = "dev_observer_config"
+# Cached config is revalidated against its updated_at at least this often, even if notifications work.
+_config_max_age = datetime.timedelta(minutes=5)
+
 
 class PostgresqlStorageProvider(StorageProvider):
     _engine: AsyncEngine
     _encryptor: Encryptor
     _clock: Clock
+    _notifier: ProcessingNotifier
+    _listener: Optional[AsyncConnection] = None
+    _listener_lock: asyncio.Lock
+    _config: Optional[GlobalConfig] = None
+    _config_updated_at: Optional[datetime.datetime] = None
+    _config_checked_at: Optional[datetime.datetime] = None
+    # Bumped on every change notification, so that a load racing with a change does not cache stale data.
+    _config_generation: int = 0
 
     def __init__(self, url: str, encryptor: Encryptor, echo: bool = False, clock: Clock = RealClock()):
         self._engine = create_async_engine(url, echo=echo)
         self._encryptor = encryptor
         self._clock = clock
+        self._notifier = ProcessingNotifier()
+        self._listener_lock = asyncio.Lock()
 
     async def get_git_repos(self) -> MutableSequence[GitRepository]:
         async with AsyncSession(self._engine) as session:
@@ -148,56 +166,176 @@ class PostgresqlStorageProvider(StorageProvider):
 
     async def next_processing_item(
             self, delay: datetime.timedelta = datetime.timedelta(minutes=30)) -> Optional[ProcessingItem]:
-        next_processing_time = self._clock.now()
+        items = await self.claim_processing_items(1, delay)
+        return items[0] if len(items) > 0 else None
+
+    async def claim_processing_items(
+            self,
+            limit: int,
+            delay: datetime.timedelta = datetime.timedelta(minutes=30),
+            worker_id: Optional[str] = None,
+            quotas: Optional[Sequence[ProcessingQuota]] = None,
+    ) -> List[ProcessingItem]:
+        if limit <= 0:
+            return []
+        if quotas is None:
+            quotas = [ProcessingQuota(limit=limit)]
+        typed = [q.entity_type for q in quotas if q.entity_type is not None]
+        now = self._clock.now()
         async with AsyncSession(self._engine) as session:
             async with session.begin():
-                res = await session.execute(
-                    select(ProcessingItemEntity)
-                    .where(
+                entities: List[ProcessingItemEntity] = []
+                for quota in quotas:
+                    quota_limit = min(quota.limit, limit - len(entities))
+                    if quota_limit <= 0:
+                        continue
+                    query = select(ProcessingItemEntity).where(
                         ProcessingItemEntity.next_processing != None,
-                        ProcessingItemEntity.next_processing < next_processing_time,
+                        ProcessingItemEntity.next_processing < now,
                     )
-                    .order_by(ProcessingItemEntity.next_processing)
-                )
-                item = res.first()
-                if item is None:
-                    return None
-                i: ProcessingItemEntity = item[0]
-                retry_time = self._clock.now() + datetime.timedelta(minutes=30)
+                    if quota.entity_type is not None:
+                        query = query.where(ProcessingItemEntity.entity_type == quota.entity_type)
+                    elif len(typed) > 0:
+                        query = query.where(or_(
+                            ProcessingItemEntity.entity_type == None,
+                            ProcessingItemEntity.entity_type.not_in(typed),
+                        ))
+                    # Rows locked by a concurrent claim are skipped instead of waited for, so that several workers
+                    # can drain the queue in parallel without ever getting the same item.
+                    res = await session.scalars(
+                        query
+                        .order_by(ProcessingItemEntity.next_processing)
+                        .limit(quota_limit)
+                        .with_for_update(skip_locked=True)
+                    )
+                    entities.extend(res.all())
+                if len(entities) == 0:
+                    return []
+                items = [_to_item(e) for e in entities]
+                for item in items:
+                    item.next_processing = now + delay
+                    item.processing_started_at = now
+                    if worker_id is None:
+                        item.ClearField("worker_id")
+                    else:
+                        item.worker_id = worker_id
                 await session.execute(
                     update(ProcessingItemEntity)
-                    .where(ProcessingItemEntity.key == i.key)
+                    .where(ProcessingItemEntity.key.in_([e.key for e in entities]))
                     .values(
-                        next_processing=retry_time,
-                        processing_started_at=self._clock.now(),
+                        next_processing=now + delay,
+                        processing_started_at=now,
+                        worker_id=worker_id,
+                    )
+                )
+                return items
+
+    async def renew_processing_lease(
+            self, key: ProcessingItemKey, worker_id: str, next_time: datetime.datetime,
+    ) -> bool:
+        key_str = _to_key_str(key)
+        async with AsyncSession(self._engine) as session:
+            async with session.begin():
+                res = await session.execute(
+                    update(ProcessingItemEntity)
+                    .where(
+                        ProcessingItemEntity.key == key_str,
+                        ProcessingItemEntity.worker_id == worker_id,
+                        ProcessingItemEntity.processing_started_at != None,
                     )
+                    .values(next_processing=next_time)
                 )
-                return _to_item(i)
+                return res.rowcount > 0
+
+    async def get_next_processing_time(
+            self, exclude_entity_types: Optional[Sequence[str]] = None,
+    ) -> Optional[datetime.datetime]:
+        query = select(func.min(ProcessingItemEntity.next_processing))
+        if exclude_entity_types:
+            query = query.where(or_(
+                ProcessingItemEntity.entity_type == None,
+                ProcessingItemEntity.entity_type.not_in(exclude_entity_types),
+            ))
+        async with AsyncSession(self._engine) as session:
+            return await session.scalar(query)
+
+    async def wait_processing_changes(self, timeout: datetime.timedelta) -> bool:
+        if not await self._ensure_listener():
+            # Changes made before the listener was (re)started are not delivered, so report a possible change.
+            return True
+        return await self._notifier.wait(timeout.total_seconds())
+
+    async def _ensure_listener(self) -> bool:
+        # Called concurrently by the processing loop and config reads, only one of them may (re)connect.
+        async with self._listener_lock:
+            listener = self._listener
+            if listener is not None:
+                raw = await listener.get_raw_connection()
+                if not raw.driver_connection.is_closed():
+                    return True
+                _log.warning(s_("Processing notifications listener connection closed, reconnecting"))
+                self._listener = None
+                try:
+                    await listener.close()
+                except Exception as e:
+                    _log.debug(s_("Failed to close processing notifications listener"), exc_info=e)
+
+            listener = await self._engine.connect()
+            try:
+                raw = await listener.get_raw_connection()
+                await raw.driver_connection.add_listener(_processing_channel, lambda *_: self._notifier.notify())
+                await raw.driver_connection.add_listener(_config_channel, lambda *_: self._invalidate_config())
+            except Exception:
+                await listener.close()
+                raise
+            self._listener = listener
+            return False
 
     async def set_next_processing_time(
             self, key: ProcessingItemKey,
             next_time: Optional[datetime.datetime],
             error: Optional[str] = None,
             processing_started_at: Optional[datetime.datetime] = None,
-    ):
+            worker_id: Optional[str] = None,
+    ) -> bool:
         key_str = _to_key_str(key)
+        values: dict = {
+            "next_processing": next_time,
+            "last_error": error,
+            "processing_started_at": processing_started_at,
+            "worker_id": None,
+        }
         async with AsyncSession(self._engine) as session:
             async with session.begin():
+                if worker_id is not None:
+                    res = await session.execute(
+                        update(ProcessingItemEntity)
+                        .where(ProcessingItemEntity.key == key_str, ProcessingItemEntity.worker_id == worker_id)
+                        .values(**values)
+                    )
+                    if res.rowcount == 0:
+                        return False
+                    if next_time is not None:
+                        await _notify_processing(session)
+                    return True
                 existing = await session.get(ProcessingItemEntity, key_str)
                 if existing is not None:
                     await session.execute(
                         update(ProcessingItemEntity)
                         .where(ProcessingItemEntity.key == key_str)
-                        .values(
-                            next_processing=next_time,
-                            last_error=error,
-                            processing_started_at=processing_started_at,
-                        )
+                        .values(**values)
                     )
                 else:
                     session.add(ProcessingItemEntity(
-                        key=key_str, next_processing=next_time, last_error=error, json_data="{}",
+                        key=key_str,
+                        entity_type=key.WhichOneof("entity"),
+                        next_processing=next_time,
+                        last_error=error,
+                        json_data="{}",
                     ))
+                if next_time is not None:
+                    await _notify_processing(session)
+        return True
 
     async def create_processing_time(
             self,
@@ -211,6 +349,7 @@ class PostgresqlStorageProvider(StorageProvider):
                 is_req = data and data.WhichOneof("type") == "request"
                 session.add(ProcessingItemEntity(
                     key=key_str,
+                    entity_type=key.WhichOneof("entity"),
                     next_processing=next_time,
                     request_type=data.request.WhichOneof("type") if is_req else None,
                     reference_id=data.reference_id if data else None,
@@ -218,17 +357,29 @@ class PostgresqlStorageProvider(StorageProvider):
                     created_by=data.created_by if data else None,
                     json_data=pb_to_json(ProcessingItem(key=key, data=data)),
                 ))
+                if next_time is not None:
+                    await _notify_processing(session)
 
     async def update_processing_item(
             self,
             key: ProcessingItemKey,
             updater: Callable[[ProcessingItem], ProcessingItem],
             next_time: Optional[datetime.datetime] = None,
-    ):
+            worker_id: Optional[str] = None,
+    ) -> bool:
         key_str = _to_key_str(key)
         async with AsyncSession(self._engine) as session:
             async with session.begin():
-                existing = await session.get(ProcessingItemEntity, key_str)
+                if worker_id is not None:
+                    existing = await session.scalar(
+                        select(ProcessingItemEntity)
+                        .where(ProcessingItemEntity.key == key_str, ProcessingItemEntity.worker_id == worker_id)
+                        .with_for_update()
+                    )
+                    if existing is None:
+                        return False
+                else:
+                    existing = await session.get(ProcessingItemEntity, key_str)
                 item = _to_item(existing)
                 updated = updater(item)
                 values: dict = {"json_data": pb_to_json(updated)}
@@ -239,20 +390,36 @@ class PostgresqlStorageProvider(StorageProvider):
                     .where(ProcessingItemEntity.key == key_str)
                     .values(**values)
                 )
+                if next_time is not None:
+                    await _notify_processing(session)
+        return True
 
-    async def delete_processing_item(self, key: ProcessingItemKey):
+    async def delete_processing_item(self, key: ProcessingItemKey, worker_id: Optional[str] = None) -> bool:
         key_str = _to_key_str(key)
+        query = delete(ProcessingItemEntity).where(ProcessingItemEntity.key == key_str)
+        if worker_id is not None:
+            query = query.where(ProcessingItemEntity.worker_id == worker_id)
         async with AsyncSession(self._engine) as session:
             async with session.begin():
-                await session.execute(delete(ProcessingItemEntity).where(ProcessingItemEntity.key == key_str))
+                res = await session.execute(query)
+                return res.rowcount > 0
 
-    async def add_processing_result(self, item: ProcessingItemResult) -> str:
+    async def add_processing_result(self, item: ProcessingItemResult, worker_id: Optional[str] = None) -> Optional[str]:
         key_str = _to_key_str(item.key)
         new_id = item.id
         if new_id is None or len(new_id) == 0:
             new_id = str(uuid.uuid4())
         async with AsyncSession(self._engine) as session:
             async with session.begin():
+                if worker_id is not None:
+                    # Holds the claimed item until the result is committed, so it can't be reclaimed in between.
+                    owned = await session.scalar(
+                        select(ProcessingItemEntity.key)
+                        .where(ProcessingItemEntity.key == key_str, ProcessingItemEntity.worker_id == worker_id)
+                        .with_for_update()
+                    )
+                    if owned is None:
+                        return None
                 is_req = item.HasField("data") and item.data.WhichOneof("type") == "request"
                 session.add(ProcessingItemResultEntity(
                     id=new_id,
@@ -302,6 +469,26 @@ class PostgresqlStorageProvider(StorageProvider):
                 )
 
     async def get_global_config(self) -> GlobalConfig:
+        try:
+            listening = await self._ensure_listener()
+        except Exception as e:
+            _log.warning(s_("Failed to listen for config changes"), exc_info=e)
+            listening = False
+
+        cached = self._config
+        now = self._clock.now()
+        if cached is not None:
+            if listening and now - self._config_checked_at < _config_max_age:
+                return _copy_config(cached)
+            async with AsyncSession(self._engine) as session:
+                updated_at = await session.scalar(
+                    select(GlobalConfigEntity.updated_at).where(GlobalConfigEntity.id == "global_config")
+                )
+            if updated_at is not None and updated_at == self._config_updated_at:
+                self._config_checked_at = now
+                return _copy_config(cached)
+
+        generation = self._config_generation
         async with AsyncSession(self._engine) as session:
             async with session.begin():
                 all_configs = await session.execute(select(GlobalConfigEntity))
@@ -309,7 +496,12 @@ class PostgresqlStorageProvider(StorageProvider):
                 if ent is None:
                     session.add(GlobalConfigEntity(id="global_config", json_data="{}"))
                     return GlobalConfig()
-                return parse_json_pb(ent[0].json_data, GlobalConfig())
+                config = parse_json_pb(ent[0].json_data, GlobalConfig())
+                if generation == self._config_generation:
+                    self._config = config
+                    self._config_updated_at = ent[0].updated_at
+                    self._config_checked_at = now
+                return _copy_config(config)
 
     async def set_global_config(self, config: GlobalConfig) -> GlobalConfig:
         async with AsyncSession(self._engine) as session:
@@ -319,8 +511,14 @@ class PostgresqlStorageProvider(StorageProvider):
                     .where(GlobalConfigEntity.id == "global_config")
                     .values(json_data=pb_to_json(config))
                 )
+                await session.execute(select(func.pg_notify(_config_channel, "")))
+        self._invalidate_config()
         return await self.get_global_config()
 
+    def _invalidate_config(self):
+        self._config_generation += 1
+        self._config = None
+
     async def get_processing_item(self, key: ProcessingItemKey) -> Optional[ProcessingItem]:
         key_str = _to_key_str(key)
         async with AsyncSession(self._engine) as session:
@@ -504,6 +702,10 @@ def _to_item(ent: ProcessingItemEntity) -> ProcessingItem:
         data.processing_started_at = ent.processing_started_at
     data.last_error = ent.last_error if ent.last_error else ""
     data.no_processing = ent.no_processing
+    if ent.worker_id is None:
+        data.ClearField("worker_id")
+    else:
+        data.worker_id = ent.worker_id
     data.key.CopyFrom(parse_json_pb(ent.key, ProcessingItemKey()))
     return data
 
@@ -518,5 +720,17 @@ def _to_processing_item_result(ent: ProcessingItemResultEntity) -> ProcessingIte
     return data
 
 
+def _copy_config(config: GlobalConfig) -> GlobalConfig:
+    # Callers are free to modify the returned config.
+    result = GlobalConfig()
+    result.CopyFrom(config)
+    return result
+
+
+async def _notify_processing(session: AsyncSession):
+    # Delivered to listeners only when the surrounding transaction commits.
+    await session.execute(select(func.pg_notify(_processing_channel, "")))
+
+
 def _to_key_str(key: ProcessingItemKey) -> str:
     return json_format.MessageToJson(key, indent=None, sort_keys=True)
@@ -17,6 +17,13 @@ class AddWebSiteData:
     created: bool
 
 
+@dataclasses.dataclass
+class ProcessingQuota:
+    """Up to `limit` items of `entity_type` to claim. `None` type stands for all types without their own quota."""
+    limit: int
+    entity_type: Optional[str] = None
+
+
 class StorageProvider(Protocol):
     async def get_git_repos(self) -> MutableSequence[GitRepository]:
         ...
@@ -55,6 +62,47 @@ class StorageProvider(Protocol):
             self, delay: datetime.timedelta = datetime.timedelta(minutes=30)) -> Optional[ProcessingItem]:
         ...
 
+    async def claim_processing_items(
+            self,
+            limit: int,
+            delay: datetime.timedelta = datetime.timedelta(minutes=30),
+            worker_id: Optional[str] = None,
+            quotas: Optional[Sequence[ProcessingQuota]] = None,
+    ) -> List[ProcessingItem]:
+        """Atomically claims up to `limit` due items, pushing their next processing time by `delay`.
+
+        An item claimed by one caller is never returned to another caller until its delay expires.
+        `delay` acts as a lease held by `worker_id`, which can be extended with `renew_processing_lease`.
+        If `quotas` are set, items are claimed quota by quota in the given order, e.g. by priority.
+        """
+        ...
+
+    async def renew_processing_lease(
+            self, key: ProcessingItemKey, worker_id: str, next_time: datetime.datetime,
+    ) -> bool:
+        """Moves the next processing time of an item claimed by `worker_id` to `next_time`.
+
+        Returns False if the item is no longer claimed by the worker, e.g. it was finalized or the lease
+        expired and another worker claimed it.
+        """
+        ...
+
+    async def get_next_processing_time(
+            self, exclude_entity_types: Optional[Sequence[str]] = None,
+    ) -> Optional[datetime.datetime]:
+        """Returns the earliest scheduled processing time across all items, if any.
+
+        Items of `exclude_entity_types` are not considered, e.g. types that can't be claimed at the moment.
+        """
+        ...
+
+    async def wait_processing_changes(self, timeout: datetime.timedelta) -> bool:
+        """Waits until processing items are created or rescheduled, or until `timeout` passes.
+
+        Returns True if woken up by a change.
+        """
+        ...
+
     async def create_processing_time(
             self,
             key: ProcessingItemKey,
@@ -69,10 +117,19 @@ class StorageProvider(Protocol):
     async def update_processing_item(self,
                                      key: ProcessingItemKey,
                                      updater: Callable[[ProcessingItem], ProcessingItem],
-                                     next_time: Optional[datetime.datetime] = None):
+                                     next_time: Optional[datetime.datetime] = None,
+                                     worker_id: Optional[str] = None) -> bool:
+        """Updates the item, if `worker_id` is set only while the item is claimed by that worker.
+
+        Returns False if the item was not updated because it is claimed by another worker or not at all.
+        """
         ...
 
-    async def delete_processing_item(self, key: ProcessingItemKey):
+    async def delete_processing_item(self, key: ProcessingItemKey, worker_id: Optional[str] = None) -> bool:
+        """Deletes the item, if `worker_id` is set only while the item is claimed by that worker.
+
+        Returns False if nothing was deleted.
+        """
         ...
 
     async def set_next_processing_time(
@@ -81,7 +138,13 @@ class StorageProvider(Protocol):
             next_time: Optional[datetime.datetime],
             error: Optional[str] = None,
             processing_started_at: Optional[datetime.datetime] = None,
-    ):
+            worker_id: Optional[str] = None,
+    ) -> bool:
+        """Sets the next processing time and releases the claim on the item, creating it if missing.
+
+        If `worker_id` is set, the item is only updated while claimed by that worker and never created.
+        Returns False if the item was not updated.
+        """
         ...
 
     async def get_processing_item(self, key: ProcessingItemKey) -> Optional[ProcessingItem]:
@@ -96,7 +159,13 @@ class StorageProvider(Protocol):
     async def set_global_config(self, config: GlobalConfig) -> GlobalConfig:
         ...
 
-    async def add_processing_result(self, item: ProcessingItemResult):
+    async def add_processing_result(
+            self, item: ProcessingItemResult, worker_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """Stores the result and returns its id, if `worker_id` is set only while its item is claimed by that worker.
+
+        Returns None if the result was not stored.
+        """
         ...
 
     async def get_processing_results(
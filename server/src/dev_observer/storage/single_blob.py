@@ -16,12 +16,15 @@ from dev_observer.api.types.repo_pb2 import GitRepository, GitProperties, ReposF
 from dev_observer.api.types.sites_pb2 import WebSite
 from dev_observer.api.types.tokens_pb2 import AuthToken, AuthTokenProvider, TokensFilter
 from dev_observer.common.schedule import pb_to_datetime
-from dev_observer.storage.provider import StorageProvider, AddWebSiteData
+from dev_observer.storage.notifier import ProcessingNotifier
+from dev_observer.storage.provider import StorageProvider, AddWebSiteData, ProcessingQuota
 from dev_observer.util import Clock, RealClock
 
 _log = logging.getLogger(__name__)
 
 _lock = asyncio.Lock()
+# Shared by all instances, since the API and the background processor use separate storage instances.
+_notifier = ProcessingNotifier()
 
 
 class SingleBlobStorageProvider(abc.ABC, StorageProvider):
@@ -123,6 +126,7 @@ class SingleBlobStorageProvider(abc.ABC, StorageProvider):
                 ))
 
         await self._update(up)
+        _notifier.notify()
         async with _lock:
             for s in self._get().web_sites:
                 if s.url == site.url:
@@ -132,16 +136,75 @@ class SingleBlobStorageProvider(abc.ABC, StorageProvider):
 
     async def next_processing_item(
             self, delay: datetime.timedelta = datetime.timedelta(minutes=30)) -> Optional[ProcessingItem]:
-        now = self._clock.now()
-        items = [i for i in self._get().processing_items if
-                 i.HasField("next_processing") and pb_to_datetime(i.next_processing) < now]
-        if len(items) == 0:
-            return None
-        items.sort(key=lambda item: pb_to_datetime(item.next_processing))
-        i = items[0]
-        i.next_processing = now + delay
-        i.processing_started_at = now
-        return i
+        items = await self.claim_processing_items(1, delay)
+        return items[0] if len(items) > 0 else None
+
+    async def claim_processing_items(
+            self,
+            limit: int,
+            delay: datetime.timedelta = datetime.timedelta(minutes=30),
+            worker_id: Optional[str] = None,
+            quotas: Optional[Sequence[ProcessingQuota]] = None,
+    ) -> List[ProcessingItem]:
+        claimed: List[ProcessingItem] = []
+        if limit <= 0:
+            return claimed
+        if quotas is None:
+            quotas = [ProcessingQuota(limit=limit)]
+        typed = [q.entity_type for q in quotas if q.entity_type is not None]
+
+        def up(d: LocalStorageData):
+            now = self._clock.now()
+            due = [i for i in d.processing_items if
+                   i.HasField("next_processing") and pb_to_datetime(i.next_processing) < now]
+            due.sort(key=lambda item: pb_to_datetime(item.next_processing))
+            for quota in quotas:
+                quota_limit = min(quota.limit, limit - len(claimed))
+                if quota_limit <= 0:
+                    continue
+                if quota.entity_type is not None:
+                    items = [i for i in due if i.key.WhichOneof("entity") == quota.entity_type]
+                else:
+                    items = [i for i in due if i.key.WhichOneof("entity") not in typed]
+                for i in items[:quota_limit]:
+                    i.next_processing = now + delay
+                    i.processing_started_at = now
+                    if worker_id is None:
+                        i.ClearField("worker_id")
+                    else:
+                        i.worker_id = worker_id
+                    item = ProcessingItem()
+                    item.CopyFrom(i)
+                    claimed.append(item)
+
+        await self._update(up)
+        return claimed
+
+    async def renew_processing_lease(
+            self, key: ProcessingItemKey, worker_id: str, next_time: datetime.datetime,
+    ) -> bool:
+        renewed = False
+
+        def up(d: LocalStorageData):
+            nonlocal renewed
+            for i in d.processing_items:
+                if i.key == key and i.worker_id == worker_id and i.HasField("processing_started_at"):
+                    i.next_processing = next_time
+                    renewed = True
+
+        await self._update(up)
+        return renewed
+
+    async def get_next_processing_time(
+            self, exclude_entity_types: Optional[Sequence[str]] = None,
+    ) -> Optional[datetime.datetime]:
+        excluded = exclude_entity_types or []
+        times = [pb_to_datetime(i.next_processing) for i in self._get().processing_items if
+                 i.HasField("next_processing") and i.key.WhichOneof("entity") not in excluded]
+        return min(times) if len(times) > 0 else None
+
+    async def wait_processing_changes(self, timeout: datetime.timedelta) -> bool:
+        return await _notifier.wait(timeout.total_seconds())
 
     async def get_processing_items(self, filter: ProcessingItemsFilter) -> Sequence[ProcessingItem]:
         items = []
@@ -169,24 +232,34 @@ class SingleBlobStorageProvider(abc.ABC, StorageProvider):
     async def set_next_processing_time(self, key: ProcessingItemKey, next_time: Optional[datetime.datetime],
                                        error: Optional[str] = None,
                                        processing_started_at: Optional[datetime.datetime] = None,
-                                       ):
+                                       worker_id: Optional[str] = None,
+                                       ) -> bool:
+        found = False
+
         def up(d: LocalStorageData):
-            found = False
+            nonlocal found
             for i in d.processing_items:
                 if i.key == key:
+                    if worker_id is not None and i.worker_id != worker_id:
+                        return
                     found = True
                     if next_time is None:
                         i.ClearField("next_processing")
                     else:
                         i.next_processing.CopyFrom(timestamp.from_milliseconds(int(next_time.timestamp() * 1000)))
                     i.last_error = error or ""
+                    i.ClearField("worker_id")
                     if processing_started_at:
                         i.processing_started_at = processing_started_at
 
-            if not found:
+            if not found and worker_id is None:
                 d.processing_items.append(ProcessingItem(key=key, next_processing=next_time, last_error=error))
+                found = True
 
         await self._update(up)
+        if found and next_time is not None:
+            _notifier.notify()
+        return found
 
     async def upsert_processing_item(self, item: ProcessingItem):
         def up(d: LocalStorageData):
@@ -231,31 +304,50 @@ class SingleBlobStorageProvider(abc.ABC, StorageProvider):
             d.processing_items.append(new_item)
 
         await self._update(up)
+        if next_time is not None:
+            _notifier.notify()
 
     async def update_processing_item(
             self,
             key: ProcessingItemKey,
             updater: Callable[[ProcessingItem], ProcessingItem],
             next_time: Optional[datetime.datetime] = None,
-    ):
+            worker_id: Optional[str] = None,
+    ) -> bool:
+        updated = False
+
         def up(d: LocalStorageData):
+            nonlocal updated
             for item in d.processing_items:
                 if item.key == key:
+                    if worker_id is not None and item.worker_id != worker_id:
+                        return
                     updater(item)
                     if next_time:
                         item.next_processing.CopyFrom(timestamp.from_milliseconds(int(next_time.timestamp() * 1000)))
+                    updated = True
                     return
-            raise ValueError(f"Processing item with key {key} not found")
+            if worker_id is None:
+                raise ValueError(f"Processing item with key {key} not found")
 
         await self._update(up)
+        if updated and next_time is not None:
+            _notifier.notify()
+        return updated
+
+    async def delete_processing_item(self, key: ProcessingItemKey, worker_id: Optional[str] = None) -> bool:
+        deleted = False
 
-    async def delete_processing_item(self, key: ProcessingItemKey):
         def up(d: LocalStorageData):
-            new_items = [item for item in d.processing_items if item.key != key]
+            nonlocal deleted
+            new_items = [item for item in d.processing_items if
+                         item.key != key or (worker_id is not None and item.worker_id != worker_id)]
+            deleted = len(new_items) < len(d.processing_items)
             d.ClearField("processing_items")
             d.processing_items.extend(new_items)
 
         await self._update(up)
+        return deleted
 
     async def set_processing_error(self, key: ProcessingItemKey, error: Optional[str] = None):
         def up(d: LocalStorageData):
@@ -267,11 +359,17 @@ class SingleBlobStorageProvider(abc.ABC, StorageProvider):
 
         await self._update(up)
 
-    async def add_processing_result(self, item: ProcessingItemResult) -> str:
+    async def add_processing_result(self, item: ProcessingItemResult, worker_id: Optional[str] = None) -> Optional[str]:
         if not item.id or len(item.id) == 0:
             item.id = f"{uuid.uuid4()}"
+        added = False
 
         def up(d: LocalStorageData):
+            nonlocal added
+            if worker_id is not None and not any(i.key == item.key and i.worker_id == worker_id
+                                                 for i in d.processing_items):
+                return
+            added = True
             # Set created_at if not already set
             if not item.HasField("created_at"):
                 item.created_at.CopyFrom(timestamp.from_milliseconds(int(self._clock.now().timestamp() * 1000)))
@@ -279,7 +377,7 @@ class SingleBlobStorageProvider(abc.ABC, StorageProvider):
             d.processing_results.append(item)
 
         await self._update(up)
-        return item.id
+        return item.id if added else None
 
     async def get_processing_results(
             self,
@@ -10,4 +10,20 @@ class TokenizerProvider(Protocol):
 
     @abstractmethod
     def decode(self, tokens: List[int]) -> str:
-        ...
\ No newline at end of file
+        ...
+
+    # Async variants are used from the event loop. The defaults run inline, which is only suitable for cheap
+    # tokenizers, implementations doing real work should run them in a worker pool.
+
+    async def aencode(self, content: str) -> List[int]:
+        return (await self.aencode_batch([content]))[0]
+
+    async def aencode_batch(self, contents: List[str]) -> List[List[int]]:
+        return [self.encode(c) for c in contents]
+
+    async def adecode(self, tokens: List[int]) -> str:
+        return self.decode(tokens)
+
+    async def acount(self, contents: List[str]) -> List[int]:
+        """Returns the number of tokens in each of `contents`."""
+        return [len(t) for t in await self.aencode_batch(contents)]
@@ -1,4 +1,6 @@
-from typing import List
+import asyncio
+import concurrent.futures
+from typing import List, Optional
 
 import tiktoken
 from tiktoken import Encoding
@@ -7,13 +9,59 @@ from dev_observer.tokenizer.provider import TokenizerProvider
 
 
 class TiktokenTokenizerProvider(TokenizerProvider):
+    """Tiktoken encoding, async methods run in `executor` to keep the event loop responsive.
+
+    The executor may be a thread pool, tiktoken releases the GIL while encoding, or a process pool.
+    Without an executor, async methods run in the default executor of the running loop.
+    """
     _encoding: Encoding
+    _executor: Optional[concurrent.futures.Executor]
+    _batch_threads: int
 
-    def __init__(self, encoding: str):
+    def __init__(self, encoding: str, executor: Optional[concurrent.futures.Executor] = None, batch_threads: int = 4):
         self._encoding = tiktoken.get_encoding(encoding)
+        self._executor = executor
+        self._batch_threads = batch_threads
 
     def encode(self, content: str) -> List[int]:
         return self._encoding.encode(content)
 
     def decode(self, tokens: List[int]) -> str:
         return self._encoding.decode(tokens)
+
+    async def aencode_batch(self, contents: List[str]) -> List[List[int]]:
+        if len(contents) == 0:
+            return []
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, _encode_batch, self._encoding.name, contents, self._batch_threads,
+        )
+
+    async def adecode(self, tokens: List[int]) -> str:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, _decode, self._encoding.name, tokens,
+        )
+
+    async def acount(self, contents: List[str]) -> List[int]:
+        if len(contents) == 0:
+            return []
+        # Only counts are sent back, which is considerably cheaper for process pools.
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, _count_batch, self._encoding.name, contents, self._batch_threads,
+        )
+
+
+# Module level functions, so that they can be sent to process pools. Encodings are cached by tiktoken per process.
+
+def _encode_batch(encoding: str, contents: List[str], num_threads: int) -> List[List[int]]:
+    enc = tiktoken.get_encoding(encoding)
+    if len(contents) == 1:
+        return [enc.encode(contents[0])]
+    return enc.encode_batch(contents, num_threads=num_threads)
+
+
+def _count_batch(encoding: str, contents: List[str], num_threads: int) -> List[int]:
+    return [len(t) for t in _encode_batch(encoding, contents, num_threads)]
+
+
+def _decode(encoding: str, tokens: List[int]) -> str:
+    return tiktoken.get_encoding(encoding).decode(tokens)
@@ -4,7 +4,7 @@ import os
 import random
 import shutil
 import string
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 from dev_observer.api.types.config_pb2 import WebsiteCrawlingConfig
 from dev_observer.flatten.flatten import FlattenResult
@@ -43,7 +43,7 @@ class CombineWebsiteResult:
     folder_path: str
     total_tokens: int
 
-def combine_website(website_path: str, tokenizer: TokenizerProvider, max_tokens_per_file: int) -> CombineWebsiteResult:
+async def combine_website(website_path: str, tokenizer: TokenizerProvider, max_tokens_per_file: int) -> CombineWebsiteResult:
     """
     Combine website files into one or more files, respecting max tokens per file.
     Process files in level order (top level first, then next level, etc.).
@@ -68,9 +68,7 @@ def combine_website(website_path: str, tokenizer: TokenizerProvider, max_tokens_
         return CombineWebsiteResult(output_files=[], folder_path=folder_path, total_tokens=0)
 
     # First pass: compute tokens for all files and prepare their content
-    file_contents = []
-    total_tokens = 0
-
+    contents: List[Tuple[str, str]] = []
     for file_path in all_files:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -79,17 +77,24 @@ def combine_website(website_path: str, tokenizer: TokenizerProvider, max_tokens_
             # Get relative path from website_path for the file name header
             rel_path = os.path.relpath(file_path, website_path)
             file_header = f"# File: {rel_path}\n\n"
-
-            # Calculate tokens for this file with header
-            file_content = file_header + content
-            file_tokens = len(tokenizer.encode(file_content))
-
-            file_contents.append((file_content, file_tokens))
-            total_tokens += file_tokens
-
+            contents.append((file_path, file_header + content))
         except Exception as e:
             _log.error(s_("Error processing file", file=file_path, error=str(e)))
 
+    # Calculate tokens for all files with headers in one batch
+    file_contents = []
+    try:
+        counts = await tokenizer.acount([c for _, c in contents])
+        file_contents = [(c, t) for (_, c), t in zip(contents, counts)]
+    except Exception:
+        # Fall back to one by one to skip only the failing files
+        for file_path, file_content in contents:
+            try:
+                file_contents.append((file_content, len(await tokenizer.aencode(file_content))))
+            except Exception as e:
+                _log.error(s_("Error processing file", file=file_path, error=str(e)))
+    total_tokens = sum(t for _, t in file_contents)
+
     # Second pass: create output files with appropriate names based on total token count
     use_combined_file = total_tokens <= max_tokens_per_file
     current_chunk = 0
@@ -161,7 +166,7 @@ async def flatten_website(
         return cleaned
 
     _log.debug(s_("Combining website files..."))
-    comb_res = combine_website(website_path, tokenizer, max_tokens_per_file)
+    comb_res = await combine_website(website_path, tokenizer, max_tokens_per_file)
     out_files = comb_res.output_files
     output_dir = comb_res.folder_path
     total_tokens=comb_res.total_tokens
@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import time
+from multiprocessing.process import BaseProcess
+from typing import List, Optional, Dict
+
+from dev_observer.log import configure_app_logging, s_
+from dev_observer.settings import load_settings, Worker
+
+_log = logging.getLogger(__name__)
+
+# Delay before restarting a worker that exited, doubled on every restart of a slot that keeps crashing.
+_min_restart_delay = 1.0
+_max_restart_delay = 60.0
+# A worker that stayed up this long is considered healthy, its next restart starts over from the minimal delay.
+_stable_uptime = 300.0
+
+
+def run_worker(index: int):
+    """Runs a single processor loop in the current process.
+
+    The first SIGTERM stops claiming new items and lets in-flight items finish, a second one cancels them.
+    """
+    # Leave the supervisor's process group, so that Ctrl+C or a group-wide kill is delivered only once,
+    # through the supervisor.
+    os.setpgrp()
+    configure_app_logging()
+
+    from dev_observer.server import detect
+    processor = detect.env.periodic_processor
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+
+        def on_sigterm():
+            if processor.stopping:
+                _log.warning(s_("Cancelling in-flight items", worker=index))
+                task.cancel()
+                return
+            _log.info(s_("Shutting down worker", worker=index))
+            processor.stop()
+
+        loop.add_signal_handler(signal.SIGTERM, on_sigterm)
+        try:
+            await processor.run()
+        finally:
+            await detect.env.observations.close()
+
+    _log.info(s_("Starting worker", worker=index, pid=os.getpid()))
+    asyncio.run(run())
+
+
+def start_workers(processes: int):
+    """Starts `processes` worker processes and supervises them until SIGTERM or SIGINT.
+
+    Workers that exit unexpectedly are restarted, with an exponential delay while they keep crashing. On shutdown
+    the signal is forwarded to all workers and this call returns once every worker has finished its in-flight items.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    workers: List[Optional[BaseProcess]] = [None] * processes
+    started_at: List[float] = [0.0] * processes
+    delays: List[float] = [0.0] * processes
+    # Slots waiting for a restart, by the time the worker is started again.
+    restarts: Dict[int, float] = {}
+    # Wakes up the supervisor on a signal, also when no worker is running.
+    stop_recv, stop_send = ctx.Pipe(duplex=False)
+    stopping = False
+
+    def start(index: int):
+        p = ctx.Process(target=run_worker, args=(index,), name=f"dev-observer-worker-{index}")
+        p.start()
+        workers[index] = p
+        started_at[index] = time.monotonic()
+
+    def on_signal(signum, _):
+        nonlocal stopping
+        _log.info(s_("Stopping workers", signal=signal.Signals(signum).name, forced=stopping))
+        stopping = True
+        stop_send.send_bytes(b"")
+        for w in workers:
+            if w is not None and w.is_alive():
+                os.kill(w.pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, on_signal)
+    signal.signal(signal.SIGINT, on_signal)
+
+    for i in range(processes):
+        start(i)
+    while not stopping:
+        timeout = None
+        if len(restarts) > 0:
+            timeout = max(0.0, min(restarts.values()) - time.monotonic())
+        sentinels = [w.sentinel for i, w in enumerate(workers) if i not in restarts]
+        multiprocessing.connection.wait([stop_recv, *sentinels], timeout)
+        if stopping:
+            break
+        now = time.monotonic()
+        for i, w in enumerate(workers):
+            if i in restarts:
+                if restarts[i] <= now:
+                    del restarts[i]
+                    start(i)
+                continue
+            if w.is_alive():
+                continue
+            if now - started_at[i] >= _stable_uptime:
+                delays[i] = _min_restart_delay
+            else:
+                delays[i] = min(_max_restart_delay, max(_min_restart_delay, delays[i] * 2))
+            _log.error(s_("Worker exited unexpectedly, restarting", worker=i, exit_code=w.exitcode,
+                          delay=delays[i]))
+            restarts[i] = now + delays[i]
+
+    for w in workers:
+        w.join()
+    _log.info(s_("All workers stopped"))
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Runs processing workers separately from the API server.")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Number of worker processes. Defaults to worker.processes from settings.")
+    parsed = parser.parse_args(args)
+
+    configure_app_logging()
+    processes = parsed.processes
+    if processes is None:
+        processes = (load_settings().worker or Worker()).processes
+    start_workers(max(processes, 1))
+
+
+if __name__ == "__main__":
+    main()
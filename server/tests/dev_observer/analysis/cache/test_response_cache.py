@@ -0,0 +1,118 @@
+import os
+import tempfile
+import time
+import unittest
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from dev_observer.analysis.cache.disk import DiskResponseCacheBackend
+from dev_observer.analysis.cache.observations import ObservationsResponseCacheBackend
+from dev_observer.analysis.cache.response_cache import ResponseCache, cache_key
+from dev_observer.api.types.ai_pb2 import ModelConfig
+from dev_observer.observations.local import LocalObservationsProvider
+
+_model = ModelConfig(provider="openai", model_name="gpt-test")
+_messages = [SystemMessage(content="Summarize"), HumanMessage(content=[{"type": "text", "text": "code"}])]
+
+
+class _Model:
+    calls: int = 0
+
+    def __init__(self, response: AIMessage):
+        self._response = response
+
+    async def __call__(self) -> AIMessage:
+        self.calls += 1
+        return self._response
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_cache_key(self):
+        key = cache_key(_model, _messages)
+        same = [SystemMessage(content="Summarize", id="1"), HumanMessage(content=[{"type": "text", "text": "code"}])]
+        self.assertEqual(key, cache_key(_model, same))
+        self.assertNotEqual(key, cache_key(ModelConfig(provider="openai", model_name="other"), _messages))
+        self.assertNotEqual(key, cache_key(_model, [SystemMessage(content="Summarize")]))
+
+    async def test_hit_and_miss(self):
+        cache = ResponseCache(DiskResponseCacheBackend(self._dir.name, ttl_seconds=60, max_bytes=1024 * 1024))
+        model = _Model(AIMessage(
+            content="summary",
+            tool_calls=[{"name": "bash", "args": {"cmd": "ls"}, "id": "call-1"}],
+            response_metadata={"finish_reason": "STOP"},
+        ))
+        key = cache_key(_model, _messages)
+
+        first = await cache.get_or_invoke(key, model)
+        second = await cache.get_or_invoke(key, model)
+        self.assertEqual(1, model.calls)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first.tool_calls, second.tool_calls)
+        self.assertIsInstance(second, AIMessage)
+        self.assertEqual((1, 1), (cache.stats.hits, cache.stats.misses))
+
+    async def test_failed_responses_are_not_cached(self):
+        cache = ResponseCache(DiskResponseCacheBackend(self._dir.name, ttl_seconds=60, max_bytes=1024 * 1024))
+        model = _Model(AIMessage(content="", response_metadata={"finish_reason": "MALFORMED_FUNCTION_CALL"}))
+        key = cache_key(_model, _messages)
+        await cache.get_or_invoke(key, model)
+        await cache.get_or_invoke(key, model)
+        self.assertEqual(2, model.calls)
+
+    async def test_disk_ttl(self):
+        backend = DiskResponseCacheBackend(self._dir.name, ttl_seconds=60, max_bytes=1024 * 1024)
+        await backend.put("aa01", "value")
+        self.assertEqual("value", await backend.get("aa01"))
+        path = os.path.join(self._dir.name, "aa", "aa01.json")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        self.assertIsNone(await backend.get("aa01"))
+        self.assertFalse(os.path.exists(path))
+
+    async def test_disk_ttl_counts_from_write(self):
+        backend = DiskResponseCacheBackend(self._dir.name, ttl_seconds=60, max_bytes=1024 * 1024)
+        await backend.put("aa01", "value")
+        path = os.path.join(self._dir.name, "aa", "aa01.json")
+        written = time.time() - 50
+        os.utime(path, (written, written))
+        # Reads don't extend the entry's lifetime.
+        self.assertEqual("value", await backend.get("aa01"))
+        self.assertEqual(written, os.path.getmtime(path))
+        self.assertGreater(os.path.getatime(path), written)
+
+    async def test_disk_oversized_put_removes_previous_value(self):
+        backend = DiskResponseCacheBackend(self._dir.name, ttl_seconds=60, max_bytes=20)
+        await backend.put("aa01", "old")
+        await backend.put("aa01", "x" * 30)
+        self.assertIsNone(await backend.get("aa01"))
+
+    async def test_disk_evicts_least_recently_used(self):
+        backend = DiskResponseCacheBackend(self._dir.name, ttl_seconds=60, max_bytes=25)
+        now = time.time()
+        for i, key in enumerate(["aa01", "bb02"]):
+            await backend.put(key, "x" * 10)
+            path = os.path.join(self._dir.name, key[:2], f"{key}.json")
+            os.utime(path, (now - 10 + i, now - 10 + i))
+        # Reading refreshes the entry, so the other one is evicted first.
+        self.assertIsNotNone(await backend.get("aa01"))
+        await backend.put("cc03", "x" * 10)
+        self.assertIsNotNone(await backend.get("aa01"))
+        self.assertIsNone(await backend.get("bb02"))
+        self.assertIsNotNone(await backend.get("cc03"))
+
+    async def test_observations_backend(self):
+        observations = LocalObservationsProvider(self._dir.name)
+        backend = ObservationsResponseCacheBackend(observations, ttl_seconds=60)
+        self.assertIsNone(await backend.get("aa01"))
+        await backend.put("aa01", "value")
+        self.assertEqual("value", await backend.get("aa01"))
+
+        expired = ObservationsResponseCacheBackend(observations, ttl_seconds=-1)
+        self.assertIsNone(await expired.get("aa01"))
+        self.assertEqual([], await observations.list("llm_cache"))
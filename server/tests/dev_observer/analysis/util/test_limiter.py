@@ -0,0 +1,104 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from dev_observer.analysis.util import limiter
+from dev_observer.analysis.util.limiter import RateLimiter, ModelLimits, is_rate_limit_error
+from dev_observer.api.types.ai_pb2 import ModelConfig
+
+_model = ModelConfig(provider="openai", model_name="gpt-test")
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_max_concurrency(self):
+        rl = RateLimiter(limits={"openai": ModelLimits(max_concurrency=2)})
+        running = 0
+        max_running = 0
+
+        async def call():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return "ok"
+
+        results = await asyncio.gather(*[rl.run(_model, 10, call) for _ in range(6)])
+        self.assertEqual(["ok"] * 6, results)
+        self.assertEqual(2, max_running)
+
+    async def test_tokens_per_minute(self):
+        rl = RateLimiter(limits={"openai:gpt-test": ModelLimits(tokens_per_minute=600)})
+
+        async def call():
+            return "ok"
+
+        start = time.monotonic()
+        # A full minute of budget is available at once.
+        await rl.run(_model, 600, call)
+        self.assertLess(time.monotonic() - start, 0.2)
+        # The next 5 tokens become available after 0.5 seconds at 10 tokens per second.
+        await rl.run(_model, 5, call)
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+
+    async def test_limits_are_per_model(self):
+        rl = RateLimiter(limits={"openai:gpt-test": ModelLimits(requests_per_minute=1)})
+
+        async def call():
+            return "ok"
+
+        start = time.monotonic()
+        await rl.run(_model, 1, call)
+        await rl.run(ModelConfig(provider="openai", model_name="other"), 1, call)
+        self.assertLess(time.monotonic() - start, 0.2)
+
+    async def test_retries_rate_limited_calls(self):
+        rl = RateLimiter(max_retries=2)
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise _RateLimitError()
+            return "ok"
+
+        with mock.patch.object(limiter, "_min_backoff_sec", 0.01):
+            self.assertEqual("ok", await rl.run(_model, 1, call))
+        self.assertEqual(3, attempts)
+
+    async def test_gives_up_after_max_retries(self):
+        rl = RateLimiter(max_retries=1)
+
+        async def call():
+            raise _RateLimitError()
+
+        with mock.patch.object(limiter, "_min_backoff_sec", 0.01):
+            with self.assertRaises(_RateLimitError):
+                await rl.run(_model, 1, call)
+
+    async def test_other_errors_are_not_retried(self):
+        rl = RateLimiter()
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("bad request")
+
+        with self.assertRaises(ValueError):
+            await rl.run(_model, 1, call)
+        self.assertEqual(1, attempts)
+
+    def test_is_rate_limit_error(self):
+        class ResourceExhausted(Exception):
+            pass
+
+        self.assertTrue(is_rate_limit_error(_RateLimitError()))
+        self.assertTrue(is_rate_limit_error(ResourceExhausted()))
+        self.assertFalse(is_rate_limit_error(ValueError()))
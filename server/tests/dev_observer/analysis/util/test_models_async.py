@@ -0,0 +1,59 @@
+import unittest
+from typing import List
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage, BaseMessage
+
+from dev_observer.analysis.util.models import clean_tools, aclean_tools, truncate_history, atruncate_history, \
+    chunk_messages, achunk_messages, count_messages_tokens, acount_messages_tokens
+from dev_observer.tokenizer.provider import TokenizerProvider
+
+
+class _CharTokenizer(TokenizerProvider):
+    def encode(self, content: str) -> List[int]:
+        return [ord(c) for c in content]
+
+    def decode(self, tokens: List[int]) -> str:
+        return "".join(chr(t) for t in tokens)
+
+
+def _history() -> List[BaseMessage]:
+    messages: List[BaseMessage] = [HumanMessage(content="start")]
+    for i in range(4):
+        messages.append(AIMessage(content=f"plan {i}", response_metadata={"iteration": i}))
+        messages.append(ToolMessage(content="x" * (300 * (i + 1)), tool_call_id=f"call-{i}",
+                                    response_metadata={"iteration": i}))
+    return messages
+
+
+def _dump(messages: List[BaseMessage]):
+    return [(m.type, m.content, getattr(m, "tool_call_id", None)) for m in messages]
+
+
+class TestAsyncTokenCounting(unittest.IsolatedAsyncioTestCase):
+    """Async variants must behave exactly like the sync ones."""
+
+    def setUp(self):
+        self.tokenizer = _CharTokenizer()
+
+    async def test_clean_tools(self):
+        for depth in [-1, 0, 1, 2, 10]:
+            for limit in [None, 0, 10]:
+                expected = clean_tools(_history(), self.tokenizer, depth, limit)
+                actual = await aclean_tools(_history(), self.tokenizer, depth, limit)
+                self.assertEqual(_dump(expected), _dump(actual), f"depth={depth}, limit={limit}")
+
+    async def test_truncate_history(self):
+        for limit in [10, 1000, 2000, 100_000]:
+            expected = truncate_history(_history(), self.tokenizer, limit)
+            actual = await atruncate_history(_history(), self.tokenizer, limit)
+            self.assertEqual(_dump(expected), _dump(actual), f"limit={limit}")
+
+    async def test_chunk_messages(self):
+        for limit in [100, 1000, 5000]:
+            expected = chunk_messages(_history(), self.tokenizer, limit)
+            actual = await achunk_messages(_history(), self.tokenizer, limit)
+            self.assertEqual([_dump(c) for c in expected], [_dump(c) for c in actual], f"limit={limit}")
+
+    async def test_count_messages_tokens(self):
+        self.assertEqual(count_messages_tokens(_history(), self.tokenizer),
+                         await acount_messages_tokens(_history(), self.tokenizer))
@@ -0,0 +1,167 @@
+import tempfile
+import threading
+import unittest
+from typing import Dict, List, Optional
+from unittest import mock
+
+from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
+from dev_observer.common.disk_lru import DiskLRU
+from dev_observer.observations.cache import CachingObservationsProvider
+from dev_observer.observations.memory import MemoryObservationsProvider
+from dev_observer.observations.provider import ObservationsProvider, VersionedObservation
+
+
+class _VersionedProvider(ObservationsProvider):
+    """Keeps observations in memory with a version per store, counts content transfers."""
+    transfers: int = 0
+
+    def __init__(self):
+        self._memory = MemoryObservationsProvider()
+        self._versions: Dict[str, int] = {}
+        self._next_version = 0
+
+    def replace(self, o: Observation):
+        """Stores bypassing the cache, like another process would."""
+        self._next_version += 1
+        self._versions[o.key.key] = self._next_version
+        self._memory._observations = [e for e in self._memory._observations if e.key.key != o.key.key] + [o]
+
+    async def store(self, o: Observation):
+        self.replace(o)
+
+    async def list(self, kind: str, path: Optional[str] = None) -> List[ObservationKey]:
+        return await self._memory.list(kind, path)
+
+    async def get(self, key: ObservationKey) -> Observation:
+        return (await self.get_versioned(key)).observation
+
+    async def get_versioned(self, key: ObservationKey, known_version: Optional[str] = None) -> VersionedObservation:
+        version = str(self._versions[key.key])
+        if version == known_version:
+            return VersionedObservation(observation=None, version=version)
+        self.transfers += 1
+        return VersionedObservation(observation=await self._memory.get(key), version=version)
+
+    async def exists(self, key: ObservationKey) -> bool:
+        return await self._memory.exists(key)
+
+    async def delete(self, key: ObservationKey) -> bool:
+        self._versions.pop(key.key, None)
+        return await self._memory.delete(key)
+
+
+def _key(name: str) -> ObservationKey:
+    return ObservationKey(kind="repos", name=name, key=f"org/repo/{name}")
+
+
+class TestCachingObservationsProvider(unittest.IsolatedAsyncioTestCase):
+    async def test_revalidates_cached_content(self):
+        provider = _VersionedProvider()
+        cache = CachingObservationsProvider(provider, max_memory_bytes=1000)
+        await cache.store(Observation(key=_key("a.md"), content="a1"))
+
+        self.assertEqual("a1", (await cache.get(_key("a.md"))).content)
+        self.assertEqual("a1", (await cache.get(_key("a.md"))).content)
+        self.assertEqual(1, provider.transfers)
+
+        # Changed by another process.
+        provider.replace(Observation(key=_key("a.md"), content="a2"))
+        self.assertEqual("a2", (await cache.get(_key("a.md"))).content)
+        self.assertEqual("a2", (await cache.get(_key("a.md"))).content)
+        self.assertEqual(2, provider.transfers)
+
+        stats = cache.stats
+        self.assertEqual(2, stats.memory_hits)
+        self.assertEqual(2, stats.misses)
+        self.assertEqual(0.5, stats.hit_rate)
+        self.assertEqual(2, stats.memory_bytes)
+
+    async def test_invalidates_on_store_and_delete(self):
+        provider = _VersionedProvider()
+        cache = CachingObservationsProvider(provider, max_memory_bytes=1000)
+        await cache.store(Observation(key=_key("a.md"), content="a1"))
+        await cache.get(_key("a.md"))
+
+        await cache.store(Observation(key=_key("a.md"), content="a2"))
+        self.assertEqual(0, cache.stats.memory_bytes)
+        self.assertEqual("a2", (await cache.get(_key("a.md"))).content)
+
+        self.assertTrue(await cache.delete(_key("a.md")))
+        self.assertEqual(0, cache.stats.memory_bytes)
+        with self.assertRaises(Exception):
+            await cache.get(_key("a.md"))
+
+    async def test_evicts_to_disk(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            provider = _VersionedProvider()
+            cache = CachingObservationsProvider(provider, max_memory_bytes=10, disk_dir=disk_dir, max_disk_bytes=30)
+            for name in ["a", "b", "c"]:
+                await cache.store(Observation(key=_key(name), content=name * 6))
+                await cache.get(_key(name))
+            self.assertEqual(6, cache.stats.memory_bytes)
+
+            self.assertEqual("aaaaaa", (await cache.get(_key("a"))).content)
+            self.assertEqual("bbbbbb", (await cache.get(_key("b"))).content)
+            self.assertEqual(3, provider.transfers)
+            stats = cache.stats
+            self.assertEqual(2, stats.disk_hits)
+            self.assertEqual(0, stats.memory_hits)
+            self.assertLessEqual(stats.disk_bytes, 30)
+
+            # Too large for memory, the disk tier keeps it.
+            await cache.store(Observation(key=_key("d"), content="d\r\n" * 5))
+            await cache.get(_key("d"))
+            self.assertEqual("d\r\n" * 5, (await cache.get(_key("d"))).content)
+            self.assertEqual(4, provider.transfers)
+
+            disk_bytes = cache.stats.disk_bytes
+            await cache.delete(_key("d"))
+            self.assertEqual(disk_bytes - len("5\n") - 15, cache.stats.disk_bytes)
+
+    async def test_grown_content_replaces_memory_entry(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            provider = _VersionedProvider()
+            cache = CachingObservationsProvider(provider, max_memory_bytes=10, disk_dir=disk_dir, max_disk_bytes=100)
+            await cache.store(Observation(key=_key("a"), content="a"))
+            await cache.get(_key("a"))
+            self.assertEqual(1, cache.stats.memory_bytes)
+
+            # Changed by another process and no longer fits in memory.
+            provider.replace(Observation(key=_key("a"), content="a" * 20))
+            self.assertEqual("a" * 20, (await cache.get(_key("a"))).content)
+            self.assertEqual(0, cache.stats.memory_bytes)
+            self.assertEqual("a" * 20, (await cache.get(_key("a"))).content)
+            self.assertEqual(2, provider.transfers)
+
+    async def test_disk_access_runs_off_the_loop(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            cache = CachingObservationsProvider(
+                _VersionedProvider(), max_memory_bytes=1, disk_dir=disk_dir, max_disk_bytes=1000,
+            )
+            threads: List[threading.Thread] = []
+            for method in ["get", "put", "remove"]:
+                original = getattr(DiskLRU, method)
+
+                def recorded(self, *args, _original=original):
+                    threads.append(threading.current_thread())
+                    return _original(self, *args)
+
+                self.enterContext(mock.patch.object(DiskLRU, method, recorded))
+
+            await cache.store(Observation(key=_key("a"), content="aaaaaa"))
+            await cache.get(_key("a"))
+            self.assertEqual("aaaaaa", (await cache.get(_key("a"))).content)
+            self.assertEqual(1, cache.stats.disk_hits)
+
+            self.assertGreater(len(threads), 0)
+            self.assertNotIn(threading.current_thread(), threads)
+
+    async def test_unversioned_provider_is_not_cached(self):
+        provider = MemoryObservationsProvider()
+        cache = CachingObservationsProvider(provider, max_memory_bytes=1000)
+        await cache.store(Observation(key=_key("a.md"), content="a1"))
+
+        self.assertEqual("a1", (await cache.get(_key("a.md"))).content)
+        self.assertEqual("a1", (await cache.get(_key("a.md"))).content)
+        self.assertEqual(0, cache.stats.hits)
+        self.assertEqual(0, cache.stats.memory_bytes)
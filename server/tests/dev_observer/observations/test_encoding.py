@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
+from dev_observer.observations.encoding import encode_content, decode_content, get_content_encoding, ContentDecoder, \
+    get_content_type
+from dev_observer.observations.local import LocalObservationsProvider
+
+_content = "".join(f"## Section {i}\nNaïve résumé of module {i % 7}.\n\n" for i in range(500))
+
+
+class TestEncoding(unittest.TestCase):
+    def test_round_trip(self):
+        for compression in ["zstd", "gzip"]:
+            data = encode_content(_content, compression)
+
+            self.assertEqual(compression, get_content_encoding(data))
+            self.assertEqual(f"application/{compression}", get_content_type(data))
+            self.assertLess(len(data), len(_content) // 10)
+            self.assertEqual(_content, decode_content(data))
+
+    def test_plain(self):
+        for data in [encode_content(_content), encode_content("FORCE", "zstd"), b"", b"ab"]:
+            self.assertIsNone(get_content_encoding(data))
+            self.assertIsNone(get_content_type(data))
+            self.assertEqual(data.decode("utf-8"), decode_content(data))
+
+    def test_streaming(self):
+        for compression in ["zstd", "gzip", "none"]:
+            data = encode_content(_content, compression)
+            decoder = ContentDecoder()
+            # Splits magic numbers and multibyte characters.
+            for i in range(0, len(data), 3):
+                decoder.feed(data[i:i + 3])
+            self.assertEqual(_content, decoder.finish())
+
+    def test_truncated(self):
+        data = encode_content(_content, "gzip")
+        with self.assertRaises(ValueError):
+            decode_content(data[:len(data) // 2])
+
+
+class TestLocalCompression(unittest.IsolatedAsyncioTestCase):
+    async def test_reads_uncompressed(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            provider = LocalObservationsProvider(root_dir, compression="zstd")
+            legacy = ObservationKey(kind="repos", name="legacy.md", key="org/repo/legacy.md")
+            os.makedirs(os.path.join(root_dir, "repos", "org", "repo"))
+            with open(os.path.join(root_dir, "repos", "org", "repo", "legacy.md"), "w") as f:
+                f.write(_content)
+            key = ObservationKey(kind="repos", name="new.md", key="org/repo/new.md")
+
+            await provider.store(Observation(key=key, content=_content))
+
+            self.assertLess(os.path.getsize(os.path.join(root_dir, "repos", "org", "repo", "new.md")), len(_content))
+            self.assertEqual([_content, _content], [o.content for o in await provider.get_many([legacy, key])])
@@ -0,0 +1,153 @@
+import os
+import unittest
+import uuid
+from typing import Dict, List, Tuple
+from unittest import mock
+
+import aiohttp
+from aiohttp import web
+
+from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
+from dev_observer.observations.gcs import GCSObservationsProvider
+
+_bucket = "observations"
+
+
+class _FakeGCS:
+    """Serves the subset of the GCS JSON API used by the provider, records the requests."""
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+        self.content_types: Dict[str, str] = {}
+        self.generations: Dict[str, int] = {}
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        self.peers: set = set()
+        self.app = web.Application(middlewares=[self._record])
+        self.app.router.add_get("/storage/v1/b/{bucket}/o", self._list)
+        self.app.router.add_get("/storage/v1/b/{bucket}/o/{name:.+}", self._get)
+        self.app.router.add_delete("/storage/v1/b/{bucket}/o/{name:.+}", self._delete)
+        self.app.router.add_post("/upload/storage/v1/b/{bucket}/o", self._upload)
+
+    @web.middleware
+    async def _record(self, request: web.Request, handler):
+        self.requests.append((request.method, request.path, dict(request.query)))
+        self.peers.add(request.transport.get_extra_info("peername"))
+        return await handler(request)
+
+    async def _list(self, request: web.Request):
+        prefix = request.query.get("prefix", "")
+        return web.json_response({"items": [{"name": n} for n in sorted(self.objects) if n.startswith(prefix)]})
+
+    async def _get(self, request: web.Request):
+        name = request.match_info["name"]
+        if name not in self.objects:
+            return web.json_response({"error": "not found"}, status=404)
+        if request.query.get("alt") == "media":
+            return web.Response(body=self.objects[name])
+        return web.json_response({
+            "name": name, "size": str(len(self.objects[name])), "generation": str(self.generations[name]),
+        })
+
+    async def _delete(self, request: web.Request):
+        if self.objects.pop(request.match_info["name"], None) is None:
+            return web.json_response({"error": "not found"}, status=404)
+        return web.Response(status=204)
+
+    async def _upload(self, request: web.Request):
+        name = request.query["name"]
+        self.objects[name] = await request.read()
+        self.content_types[name] = request.content_type
+        self.generations[name] = self.generations.get(name, 0) + 1
+        return web.json_response({"name": name})
+
+
+class _ProviderTests:
+    provider: GCSObservationsProvider
+
+    async def test_round_trip(self):
+        key = ObservationKey(kind="repos", name="summary.md", key=f"{uuid.uuid4().hex}/summary.md")
+
+        self.assertFalse(await self.provider.exists(key))
+        await self.provider.store(Observation(key=key, content="content"))
+        self.assertTrue(await self.provider.exists(key))
+        self.assertEqual("content", (await self.provider.get(key)).content)
+        self.assertIn(key, await self.provider.list("repos", key.key.split("/")[0]))
+        self.assertTrue(await self.provider.delete(key))
+        self.assertFalse(await self.provider.delete(key))
+        self.assertFalse(await self.provider.exists(key))
+
+
+class TestGCSObservationsProvider(_ProviderTests, unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.gcs = _FakeGCS()
+        runner = web.AppRunner(self.gcs.app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.addAsyncCleanup(runner.cleanup)
+        self.port = site._server.sockets[0].getsockname()[1]
+        self.provider = self._provider()
+
+    def _provider(self, **kwargs) -> GCSObservationsProvider:
+        with mock.patch.dict(os.environ, {"STORAGE_EMULATOR_HOST": f"http://127.0.0.1:{self.port}"}):
+            provider = GCSObservationsProvider(bucket=_bucket, **kwargs)
+            provider._get_client()
+        self.addAsyncCleanup(provider.close)
+        return provider
+
+    async def test_exists_reads_metadata_only(self):
+        self.gcs.objects["repos/big.md"] = b"x" * 100_000
+        self.gcs.generations["repos/big.md"] = 1
+        key = ObservationKey(kind="repos", name="big.md", key="big.md")
+
+        self.assertTrue(await self.provider.exists(key))
+        self.assertEqual([("GET", f"/storage/v1/b/{_bucket}/o/repos/big.md", {"alt": "json"})], self.gcs.requests)
+
+    async def test_get_versioned(self):
+        key = ObservationKey(kind="repos", name="a.md", key="a.md")
+        await self.provider.store(Observation(key=key, content="a1"))
+
+        first = await self.provider.get_versioned(key)
+        self.assertEqual("a1", first.observation.content)
+        self.gcs.requests.clear()
+        unchanged = await self.provider.get_versioned(key, first.version)
+        self.assertIsNone(unchanged.observation)
+        self.assertEqual([{"alt": "json"}], [params for _, _, params in self.gcs.requests])
+
+        await self.provider.store(Observation(key=key, content="a2"))
+        changed = await self.provider.get_versioned(key, first.version)
+        self.assertEqual("a2", changed.observation.content)
+        self.assertNotEqual(first.version, changed.version)
+
+    async def test_compression(self):
+        provider = self._provider(compression="zstd")
+        content = "analysis\n" * 1000
+        self.gcs.objects["repos/legacy.md"] = content.encode("utf-8")
+        self.gcs.generations["repos/legacy.md"] = 1
+        key = ObservationKey(kind="repos", name="new.md", key="new.md")
+
+        await provider.store(Observation(key=key, content=content))
+
+        self.assertLess(len(self.gcs.objects["repos/new.md"]), 100)
+        self.assertEqual("application/zstd", self.gcs.content_types["repos/new.md"])
+        self.assertEqual(content, (await provider.get(key)).content)
+        self.assertEqual(content, (await provider.get(ObservationKey(kind="repos", key="legacy.md"))).content)
+
+    async def test_reuses_session(self):
+        await self.test_round_trip()
+
+        self.assertEqual(1, len(self.gcs.peers))
+
+
+@unittest.skipIf(os.getenv("STORAGE_EMULATOR_HOST") is None, "STORAGE_EMULATOR_HOST is not set")
+class TestGCSObservationsProviderEmulator(_ProviderTests, unittest.IsolatedAsyncioTestCase):
+    """Runs against a GCS emulator, e.g. `docker run -p 4443:4443 fsouza/fake-gcs-server -scheme http`."""
+
+    async def asyncSetUp(self):
+        host = os.environ["STORAGE_EMULATOR_HOST"]
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{host}/storage/v1/b", params={"project": "test"}, json={"name": _bucket}):
+                # Fails with a conflict if the bucket already exists.
+                pass
+        self.provider = GCSObservationsProvider(bucket=_bucket)
+        self.addAsyncCleanup(self.provider.close)
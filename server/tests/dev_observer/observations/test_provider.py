@@ -0,0 +1,73 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import List, Optional
+
+from dev_observer.api.types.observations_pb2 import Observation, ObservationKey
+from dev_observer.observations.local import LocalObservationsProvider
+from dev_observer.observations.memory import MemoryObservationsProvider
+from dev_observer.observations.provider import ObservationsProvider
+
+
+class _RemoteProvider(ObservationsProvider):
+    """Keeps observations in memory behind a delay, tracks requests in flight."""
+    running: int = 0
+    max_running: int = 0
+
+    def __init__(self):
+        self._memory = MemoryObservationsProvider()
+
+    async def _request(self):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+
+    async def store(self, o: Observation):
+        await self._request()
+        await self._memory.store(o)
+
+    async def list(self, kind: str, path: Optional[str] = None) -> List[ObservationKey]:
+        return await self._memory.list(kind, path)
+
+    async def get(self, key: ObservationKey) -> Observation:
+        await self._request()
+        return await self._memory.get(key)
+
+    async def exists(self, key: ObservationKey) -> bool:
+        await self._request()
+        return await self._memory.exists(key)
+
+    async def delete(self, key: ObservationKey) -> bool:
+        return await self._memory.delete(key)
+
+
+def _key(i: int) -> ObservationKey:
+    return ObservationKey(kind="repos", name=f"{i}.md", key=f"org/repo/{i}.md")
+
+
+class TestBatchOperations(unittest.IsolatedAsyncioTestCase):
+    async def _round_trip(self, provider: ObservationsProvider, **kwargs):
+        await provider.store_many([Observation(key=_key(i), content=f"content {i}") for i in range(10)], **kwargs)
+
+        keys = [_key(i) for i in reversed(range(12))]
+        self.assertEqual([False, False] + [True] * 10, await provider.exists_many(keys, **kwargs))
+        observations = await provider.get_many(keys[2:], **kwargs)
+        self.assertEqual([f"content {i}" for i in reversed(range(10))], [o.content for o in observations])
+        with self.assertRaises(Exception):
+            await provider.get_many(keys, **kwargs)
+
+    async def test_bounded_concurrency(self):
+        provider = _RemoteProvider()
+
+        await self._round_trip(provider, concurrency=4)
+
+        self.assertEqual(4, provider.max_running)
+
+    async def test_memory(self):
+        await self._round_trip(MemoryObservationsProvider())
+
+    async def test_local(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            await self._round_trip(LocalObservationsProvider(os.path.join(root_dir, "observations")))
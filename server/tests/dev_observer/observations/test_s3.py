@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+
+from dev_observer.observations.s3 import S3ObservationsProvider
+
+
+def _provider() -> S3ObservationsProvider:
+    return S3ObservationsProvider(
+        endpoint="http://localhost:1", access_key="key", secret_key="secret", bucket="bucket",
+        max_pool_connections=7, keepalive_timeout_sec=5,
+    )
+
+
+class TestS3ObservationsProvider(unittest.IsolatedAsyncioTestCase):
+    async def test_reuses_client(self):
+        provider = _provider()
+        clients = await asyncio.gather(*[provider._get_client() for _ in range(5)])
+
+        self.assertTrue(all(c is clients[0] for c in clients))
+        self.assertEqual(7, clients[0].meta.config.max_pool_connections)
+        await provider.close()
+
+        client = await provider._get_client()
+        self.assertIsNot(clients[0], client)
+        await provider.close()
+
+    async def test_client_per_loop(self):
+        provider = _provider()
+        client = await provider._get_client()
+
+        def other_loop():
+            async def get():
+                c = await provider._get_client()
+                await provider.close()
+                return c
+
+            return asyncio.run(get())
+
+        other = await asyncio.to_thread(other_loop)
+        self.assertIsNot(client, other)
+        self.assertIs(client, await provider._get_client())
+        await provider.close()
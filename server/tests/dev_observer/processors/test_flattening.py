@@ -0,0 +1,201 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Optional, Dict, List, Tuple, Callable, Awaitable
+
+from dev_observer.analysis.provider import AnalysisProvider, AnalysisResult
+from dev_observer.api.types.ai_pb2 import UserMessage
+from dev_observer.api.types.config_pb2 import GlobalConfig, AnalysisConfig
+from dev_observer.api.types.observations_pb2 import ObservationKey
+from dev_observer.flatten.flatten import FlattenResult
+from dev_observer.observations.memory import MemoryObservationsProvider
+from dev_observer.processors.flattening import FlatteningProcessor, ObservationRequest
+from dev_observer.prompts.provider import PromptsProvider, FormattedPrompt
+from dev_observer.tokenizer.stub import StubTokenizerProvider
+
+
+class _Prompts(PromptsProvider):
+    async def get_formatted(self, name: str, params: Optional[Dict[str, str]] = None) -> FormattedPrompt:
+        if name.startswith("broken"):
+            raise ValueError("no such prompt")
+        return FormattedPrompt(config=None, system=None, user=UserMessage(text=name), prompt_name=name)
+
+    async def get_optional(self, name: str, params: Optional[Dict[str, str]] = None) -> Optional[FormattedPrompt]:
+        return None
+
+
+class _Analysis(AnalysisProvider):
+    running: int = 0
+    max_running: int = 0
+
+    def __init__(self):
+        self.started: List[Tuple[str, int]] = []
+        self.processor: Optional[FlatteningProcessor] = None
+
+    async def analyze(self, prompt: FormattedPrompt, session_id: Optional[str] = None) -> AnalysisResult:
+        published = self.processor.published if self.processor is not None else 0
+        self.started.append((prompt.prompt_name, published))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.running -= 1
+        return AnalysisResult(analysis=f"analysis of {prompt.prompt_name}")
+
+
+class _Processor(FlatteningProcessor[str]):
+    cleaned: bool = False
+    # Chunks to stream, a single file is analyzed if empty.
+    chunks: List[str] = []
+    published: int = 0
+    flatten_error: Optional[Exception] = None
+    # Whether flattening waits after publishing chunks until it is cancelled.
+    block_flatten: bool = False
+    # Whether a cancelled flattening still returns its result, as if it was about to finish.
+    finish_on_cancel: bool = False
+    flatten_cancelled: bool = False
+
+    def __init__(self, analysis: _Analysis, observations: MemoryObservationsProvider, work_dir: str):
+        super().__init__(analysis, _Prompts(), observations, StubTokenizerProvider())
+        self._work_dir = work_dir
+        self._analysis = analysis
+        analysis.processor = self
+
+    async def get_flatten(self, entity: str, config: GlobalConfig) -> FlattenResult:
+        path = os.path.join(self._work_dir, "full.md")
+        with open(path, "w") as f:
+            f.write(entity)
+
+        def clean_up():
+            # All analyzers are done by then.
+            assert self._analysis.running == 0
+            self.cleaned = True
+            return True
+
+        return FlattenResult(full_file_path=path, file_paths=[], total_tokens=0, clean_up=clean_up)
+
+    async def get_flatten_stream(
+            self, entity: str, config: GlobalConfig, on_chunk: Callable[[str], Awaitable[None]],
+    ) -> FlattenResult:
+        if len(self.chunks) == 0:
+            return await super().get_flatten_stream(entity, config, on_chunk)
+        res = await self.get_flatten(entity, config)
+        for i, chunk in enumerate(self.chunks):
+            path = os.path.join(self._work_dir, f"chunk_{i}.md")
+            with open(path, "w") as f:
+                f.write(chunk)
+            await on_chunk(path)
+            self.published += 1
+            res.file_paths.append(path)
+            # Faster than analysis.
+            await asyncio.sleep(0)
+        if self.flatten_error is not None:
+            raise self.flatten_error
+        if self.block_flatten:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.flatten_cancelled = True
+                if not self.finish_on_cancel:
+                    raise
+        return res
+
+
+def _request(prefix: str) -> ObservationRequest:
+    return ObservationRequest(prompt_prefix=prefix, key=ObservationKey(kind="repos", name=prefix, key=prefix))
+
+
+class TestFlatteningProcessor(unittest.IsolatedAsyncioTestCase):
+    async def test_runs_analyzers_concurrently(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            analysis = _Analysis()
+            observations = MemoryObservationsProvider()
+            processor = _Processor(analysis, observations, work_dir)
+            requests = [_request("a"), _request("broken"), _request("b"), _request("c"), _request("d")]
+            config = GlobalConfig(analysis=AnalysisConfig(analyzer_concurrency=2))
+
+            result = await processor.process("content", requests, config)
+
+            self.assertEqual(["a", "b", "c", "d"], [k.key for k in result.observations])
+            self.assertEqual(2, analysis.max_running)
+            self.assertTrue(processor.cleaned)
+            content = (await observations.get(_request("c").key)).content
+            self.assertEqual("analysis of c_analyze_full", content)
+
+    async def test_default_concurrency(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            analysis = _Analysis()
+            processor = _Processor(analysis, MemoryObservationsProvider(), work_dir)
+            requests: List[ObservationRequest] = [_request(str(i)) for i in range(5)]
+
+            result = await processor.process("content", requests, GlobalConfig())
+
+            self.assertEqual(5, len(result.observations))
+            self.assertEqual(3, analysis.max_running)
+
+
+class TestPipelinedFlatteningProcessor(unittest.IsolatedAsyncioTestCase):
+    async def _process(self, chunks: List[str], error: Optional[Exception] = None, max_pending: int = 1):
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir)
+        analysis = _Analysis()
+        observations = MemoryObservationsProvider()
+        processor = _Processor(analysis, observations, work_dir)
+        processor.chunks = chunks
+        processor.flatten_error = error
+        config = GlobalConfig(analysis=AnalysisConfig(
+            pipelined_analysis=True, pipeline_max_pending_chunks=max_pending, chunk_concurrency=1,
+        ))
+        result = await processor.process("content", [_request("a"), _request("b")], config)
+        return result, analysis, processor, observations
+
+    async def test_analyzes_chunks_while_flattening(self):
+        result, analysis, processor, observations = await self._process([f"chunk {i}" for i in range(6)])
+
+        self.assertEqual(["a", "b"], [k.key for k in result.observations])
+        self.assertTrue(processor.cleaned)
+        for prefix in ["a", "b"]:
+            # Chunks published when analysis of each chunk started.
+            starts = [published for name, published in analysis.started if name == f"{prefix}_analyze_chunk"]
+            self.assertEqual(6, len(starts))
+            # Analysis starts with the first chunk, and flattening never runs more than a chunk ahead.
+            for i, published in enumerate(starts):
+                self.assertLessEqual(published, i + 2)
+        combined = [name for name, _ in analysis.started if name.endswith("_analyze_combined_chunks")]
+        self.assertEqual(["a_analyze_combined_chunks", "b_analyze_combined_chunks"], sorted(combined))
+        self.assertEqual("analysis of a_analyze_combined_chunks", (await observations.get(_request("a").key)).content)
+
+    async def test_single_file(self):
+        result, analysis, processor, _ = await self._process([])
+
+        self.assertEqual(["a", "b"], [k.key for k in result.observations])
+        self.assertEqual(["a_analyze_full", "b_analyze_full"], sorted(name for name, _ in analysis.started))
+        self.assertTrue(processor.cleaned)
+
+    async def test_flatten_failure(self):
+        with self.assertRaises(ValueError):
+            await self._process(["chunk 0", "chunk 1"], error=ValueError("clone failed"))
+
+    async def test_cancel_stops_flattening(self):
+        for finish_on_cancel in [False, True]:
+            with tempfile.TemporaryDirectory() as work_dir:
+                analysis = _Analysis()
+                processor = _Processor(analysis, MemoryObservationsProvider(), work_dir)
+                processor.chunks = ["chunk 0"]
+                processor.block_flatten = True
+                processor.finish_on_cancel = finish_on_cancel
+                config = GlobalConfig(analysis=AnalysisConfig(pipelined_analysis=True))
+                task = asyncio.create_task(processor.process("content", [_request("a")], config))
+                async with asyncio.timeout(5):
+                    while len(analysis.started) == 0:
+                        await asyncio.sleep(0.01)
+
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                # Flattening was stopped before processing returned, and its result cleaned up if it arrived.
+                self.assertTrue(processor.flatten_cancelled)
+                self.assertEqual(finish_on_cancel, processor.cleaned)
@@ -0,0 +1,204 @@
+import asyncio
+import datetime
+import tempfile
+import unittest
+from typing import List, Optional, Sequence
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, PeriodicConfig
+from dev_observer.api.types.processing_pb2 import ProcessingItem, ProcessingItemKey, ProcessingItemResultData
+from dev_observer.processors.periodic import PeriodicProcessor
+from dev_observer.storage.local import LocalStorageProvider
+from dev_observer.storage.provider import StorageProvider, ProcessingQuota
+
+
+class _BlockingProcessor(PeriodicProcessor):
+    started: List[str]
+    finished: List[str]
+    release: asyncio.Event
+
+    def __init__(self, storage: StorageProvider):
+        super().__init__(storage, None, None, None)
+        self.started = []
+        self.finished = []
+        self.release = asyncio.Event()
+
+    async def _process_item(self, item: ProcessingItem) -> Optional[ProcessingItemResultData]:
+        entity_id = getattr(item.key, item.key.WhichOneof("entity"))
+        self.started.append(entity_id)
+        await self.release.wait()
+        self.finished.append(entity_id)
+        return ProcessingItemResultData()
+
+
+class _LosingLeaseStorage(LocalStorageProvider):
+    async def renew_processing_lease(
+            self, key: ProcessingItemKey, worker_id: str, next_time: datetime.datetime,
+    ) -> bool:
+        return False
+
+
+class _CountingClaimsStorage(LocalStorageProvider):
+    claims: int = 0
+
+    async def claim_processing_items(
+            self,
+            limit: int,
+            delay: datetime.timedelta = datetime.timedelta(minutes=30),
+            worker_id: Optional[str] = None,
+            quotas: Optional[Sequence[ProcessingQuota]] = None,
+    ) -> List[ProcessingItem]:
+        self.claims += 1
+        return await super().claim_processing_items(limit, delay, worker_id, quotas)
+
+
+class TestPeriodicProcessorRun(unittest.IsolatedAsyncioTestCase):
+    async def test_stop_finishes_in_flight_items(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir)
+            await storage.set_global_config(GlobalConfig(periodic=PeriodicConfig(concurrency=2)))
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            for i, repo_id in enumerate(["r1", "r2", "r3"]):
+                await storage.set_next_processing_time(
+                    ProcessingItemKey(github_repo_id=repo_id), now - datetime.timedelta(minutes=3 - i),
+                )
+
+            processor = _BlockingProcessor(storage)
+            run = asyncio.create_task(processor.run())
+            while len(processor.started) < 2:
+                await asyncio.sleep(0.01)
+
+            processor.stop()
+            await asyncio.sleep(0.05)
+            self.assertFalse(run.done())
+
+            processor.release.set()
+            await asyncio.wait_for(run, timeout=5)
+            self.assertEqual(["r1", "r2"], sorted(processor.finished))
+            # The third item was never claimed, so it is still due.
+            item = await storage.get_processing_item(ProcessingItemKey(github_repo_id="r3"))
+            self.assertLess(item.next_processing.ToDatetime(tzinfo=datetime.timezone.utc), now)
+            item = await storage.get_processing_item(ProcessingItemKey(github_repo_id="r1"))
+            self.assertFalse(item.HasField("next_processing"))
+
+    async def test_wakes_up_on_new_items(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir)
+            await storage.set_global_config(GlobalConfig(periodic=PeriodicConfig(concurrency=2)))
+            processor = _BlockingProcessor(storage)
+            processor.release.set()
+            run = asyncio.create_task(processor.run())
+            await asyncio.sleep(0.05)
+
+            await storage.set_next_processing_time(
+                ProcessingItemKey(github_repo_id="r1"), datetime.datetime.now(tz=datetime.timezone.utc),
+            )
+            async with asyncio.timeout(5):
+                while len(processor.finished) < 1:
+                    await asyncio.sleep(0.01)
+            processor.stop()
+            await asyncio.wait_for(run, timeout=5)
+            self.assertEqual(["r1"], processor.finished)
+
+    async def test_lease_is_renewed_while_processing(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir)
+            await storage.set_global_config(GlobalConfig(periodic=PeriodicConfig(concurrency=1, lease_duration_sec=1)))
+            key = ProcessingItemKey(github_repo_id="r1")
+            await storage.set_next_processing_time(key, datetime.datetime.now(tz=datetime.timezone.utc))
+
+            processor = _BlockingProcessor(storage)
+            run = asyncio.create_task(processor.run())
+            async with asyncio.timeout(5):
+                while len(processor.started) < 1:
+                    await asyncio.sleep(0.01)
+
+            # Outlive the lease several times, the item must never become claimable by another worker.
+            for _ in range(6):
+                await asyncio.sleep(0.5)
+                self.assertEqual([], await storage.claim_processing_items(1, worker_id="other"))
+
+            processor.release.set()
+            processor.stop()
+            await asyncio.wait_for(run, timeout=5)
+            item = await storage.get_processing_item(key)
+            self.assertFalse(item.HasField("next_processing"))
+            self.assertFalse(item.HasField("worker_id"))
+
+    async def test_lost_lease_cancels_processing(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = _LosingLeaseStorage(root_dir)
+            await storage.set_global_config(GlobalConfig(periodic=PeriodicConfig(concurrency=1, lease_duration_sec=1)))
+            key = ProcessingItemKey(github_repo_id="r1")
+            await storage.set_next_processing_time(key, datetime.datetime.now(tz=datetime.timezone.utc))
+
+            processor = _BlockingProcessor(storage)
+            claimed = await storage.claim_processing_items(1, datetime.timedelta(seconds=1), processor._worker_id)
+            processing = asyncio.create_task(processor._process_claimed(claimed[0], datetime.timedelta(seconds=1)))
+            await asyncio.wait_for(processing, timeout=5)
+
+            self.assertEqual(["r1"], processor.started)
+            self.assertEqual([], processor.finished)
+            # Not finalized: no result, and the item is left to whoever holds it now.
+            self.assertEqual(0, len(storage._get().processing_results))
+            item = await storage.get_processing_item(key)
+            self.assertTrue(item.HasField("next_processing"))
+            self.assertEqual(processor._worker_id, item.worker_id)
+
+    async def test_entity_type_limits(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir)
+            await storage.set_global_config(GlobalConfig(periodic=PeriodicConfig(concurrency=3, entity_limits=[
+                PeriodicConfig.EntityTypeLimit(entity_type="github_repo_id", concurrency=1),
+                PeriodicConfig.EntityTypeLimit(entity_type="research_git_repo_id", priority=10),
+            ])))
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            for i, repo_id in enumerate(["r1", "r2", "r3"]):
+                await storage.set_next_processing_time(
+                    ProcessingItemKey(github_repo_id=repo_id), now - datetime.timedelta(minutes=10 - i),
+                )
+            await storage.set_next_processing_time(ProcessingItemKey(research_git_repo_id="x1"), now)
+
+            processor = _BlockingProcessor(storage)
+            run = asyncio.create_task(processor.run())
+            async with asyncio.timeout(5):
+                while len(processor.started) < 2:
+                    await asyncio.sleep(0.01)
+            await asyncio.sleep(0.1)
+            # Only one repo summary runs at a time, while the research item takes a free slot.
+            self.assertEqual(["r1", "x1"], sorted(processor.started))
+
+            processor.release.set()
+            async with asyncio.timeout(10):
+                while len(processor.finished) < 4:
+                    await asyncio.sleep(0.01)
+            processor.stop()
+            await asyncio.wait_for(run, timeout=5)
+
+    async def test_due_items_of_saturated_type_do_not_wake_up(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = _CountingClaimsStorage(root_dir)
+            await storage.set_global_config(GlobalConfig(periodic=PeriodicConfig(concurrency=3, entity_limits=[
+                PeriodicConfig.EntityTypeLimit(entity_type="github_repo_id", concurrency=1),
+            ])))
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            for i, repo_id in enumerate(["r1", "r2"]):
+                await storage.set_next_processing_time(
+                    ProcessingItemKey(github_repo_id=repo_id), now - datetime.timedelta(minutes=10 - i),
+                )
+
+            processor = _BlockingProcessor(storage)
+            run = asyncio.create_task(processor.run())
+            async with asyncio.timeout(5):
+                while len(processor.started) < 1:
+                    await asyncio.sleep(0.01)
+            # "r2" is due but can't be claimed until "r1" is done, so the loop sleeps instead of polling for it.
+            await asyncio.sleep(2.5)
+            self.assertEqual(1, storage.claims)
+
+            processor.release.set()
+            async with asyncio.timeout(5):
+                while len(processor.finished) < 2:
+                    await asyncio.sleep(0.01)
+            processor.stop()
+            await asyncio.wait_for(run, timeout=5)
+            self.assertEqual(["r1", "r2"], processor.finished)
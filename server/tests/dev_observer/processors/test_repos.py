@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+from typing import List, Optional, Dict
+from unittest import mock
+
+from dev_observer.analysis.provider import AnalysisProvider, AnalysisResult
+from dev_observer.api.types.ai_pb2 import UserMessage
+from dev_observer.api.types.config_pb2 import GlobalConfig
+from dev_observer.api.types.observations_pb2 import ObservationKey
+from dev_observer.api.types.repo_pb2 import GitRepository
+from dev_observer.flatten.flatten import FlattenResult
+from dev_observer.observations.local import LocalObservationsProvider
+from dev_observer.processors import repos
+from dev_observer.processors.flattening import ObservationRequest
+from dev_observer.processors.repos import ReposProcessor, mark_forced_analysis, get_force_key
+from dev_observer.prompts.provider import PromptsProvider, FormattedPrompt
+from dev_observer.repository.types import ObservedRepo
+from dev_observer.tokenizer.stub import StubTokenizerProvider
+
+
+class _Prompts(PromptsProvider):
+    async def get_formatted(self, name: str, params: Optional[Dict[str, str]] = None) -> FormattedPrompt:
+        return FormattedPrompt(config=None, system=None, user=UserMessage(text=params["content"]), prompt_name=name)
+
+    async def get_optional(self, name: str, params: Optional[Dict[str, str]] = None) -> Optional[FormattedPrompt]:
+        return None
+
+
+class _SummaryPrompts(_Prompts):
+    async def get_optional(self, name: str, params: Optional[Dict[str, str]] = None) -> Optional[FormattedPrompt]:
+        return FormattedPrompt(config=None, system=None, user=UserMessage(text=f"summary of {params['content']}"),
+                               prompt_name=name)
+
+
+class _Analysis(AnalysisProvider):
+    def __init__(self):
+        self.analyzed: List[str] = []
+        self.fail_summaries = False
+
+    async def analyze(self, prompt: FormattedPrompt, session_id: Optional[str] = None) -> AnalysisResult:
+        if self.fail_summaries and prompt.user.text.startswith("summary of"):
+            raise RuntimeError("summary failed")
+        self.analyzed.append(prompt.user.text)
+        return AnalysisResult(analysis=f"analysis of {prompt.user.text}")
+
+
+class _Processor(ReposProcessor):
+    chunks: List[str]
+    commit_sha: str
+    flattened: int = 0
+
+    def __init__(
+            self, analysis: AnalysisProvider, observations: LocalObservationsProvider, work_dir: str,
+            prompts: PromptsProvider = _Prompts(),
+    ):
+        super().__init__(analysis, None, prompts, observations, StubTokenizerProvider())
+        self._work_dir = work_dir
+
+    async def get_flatten(self, repo: ObservedRepo, config: GlobalConfig) -> FlattenResult:
+        self.flattened += 1
+        paths = []
+        for i, chunk in enumerate(self.chunks):
+            path = os.path.join(self._work_dir, f"chunk_{i}.md")
+            with open(path, "w") as f:
+                f.write(chunk)
+            paths.append(path)
+        return FlattenResult(
+            full_file_path=os.path.join(self._work_dir, "full.md"),
+            file_paths=paths,
+            total_tokens=0,
+            clean_up=lambda: True,
+            commit_sha=self.commit_sha,
+        )
+
+
+class TestReposProcessorIncremental(unittest.IsolatedAsyncioTestCase):
+    async def test_reuses_unchanged_analyses(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            observations = LocalObservationsProvider(os.path.join(root_dir, "observations"))
+            analysis = _Analysis()
+            processor = _Processor(analysis, observations, root_dir)
+            repo = ObservedRepo(url="https://github.com/org/repo", git_repo=GitRepository(full_name="org/repo"))
+            key = ObservationKey(kind="repos", name="analysis.md", key="org/repo/analysis.md")
+            requests = [ObservationRequest(prompt_prefix="repo", key=key)]
+            remote_head = "sha1"
+
+            async def get_remote_head(*_):
+                return remote_head
+
+            async def run():
+                analysis.analyzed.clear()
+                with mock.patch.object(repos, "get_remote_head_sha", get_remote_head):
+                    return await processor.process(repo, requests, GlobalConfig())
+
+            processor.chunks, processor.commit_sha = ["a", "b"], "sha1"
+            result = await run()
+            self.assertEqual([key], list(result.observations))
+            # Two chunks and the combined analysis.
+            self.assertEqual(3, len(analysis.analyzed))
+
+            # Remote head didn't move.
+            result = await run()
+            self.assertEqual([key], list(result.observations))
+            self.assertEqual([], analysis.analyzed)
+            self.assertEqual(1, processor.flattened)
+
+            processor.chunks, processor.commit_sha = ["a", "c"], "sha2"
+            remote_head = "sha2"
+            await run()
+            self.assertEqual(2, processor.flattened)
+            self.assertEqual("c", analysis.analyzed[0])
+            self.assertEqual(2, len(analysis.analyzed))
+            content = (await observations.get(key)).content
+            self.assertEqual("analysis of analysis of a\n\n-------\n\nanalysis of c", content)
+
+            # Forced runs don't skip, but still reuse unchanged analyses.
+            await mark_forced_analysis(repo.git_repo, observations)
+            await run()
+            self.assertEqual(3, processor.flattened)
+            self.assertEqual([], analysis.analyzed)
+            self.assertFalse(await observations.exists(get_force_key(repo.git_repo)))
+
+    async def test_skipped_run_returns_summaries(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            observations = LocalObservationsProvider(os.path.join(root_dir, "observations"))
+            analysis = _Analysis()
+            processor = _Processor(analysis, observations, root_dir, _SummaryPrompts())
+            processor.chunks, processor.commit_sha = ["a"], "sha1"
+            repo = ObservedRepo(url="https://github.com/org/repo", git_repo=GitRepository(full_name="org/repo"))
+            key = ObservationKey(kind="repos", name="analysis.md", key="org/repo/analysis.md")
+            sum_key = ObservationKey(kind="repos", name="__summary__analysis.md", key="org/repo/__summary__analysis.md")
+            requests = [ObservationRequest(prompt_prefix="repo", key=key, summary_key=sum_key)]
+
+            async def get_remote_head(*_):
+                return "sha1"
+
+            async def run():
+                with mock.patch.object(repos, "get_remote_head_sha", get_remote_head):
+                    return await processor.process(repo, requests, GlobalConfig())
+
+            # A failed summary doesn't let the next run skip the repository.
+            analysis.fail_summaries = True
+            result = await run()
+            self.assertEqual([key], list(result.observations))
+            analysis.fail_summaries = False
+            result = await run()
+            self.assertEqual(2, processor.flattened)
+            self.assertEqual([key, sum_key], list(result.observations))
+
+            result = await run()
+            self.assertEqual(2, processor.flattened)
+            self.assertEqual([key, sum_key], list(result.observations))
+
+            # Summaries removed since are produced again.
+            await observations.delete(sum_key)
+            await run()
+            self.assertEqual(3, processor.flattened)
+            self.assertTrue(await observations.exists(sum_key))
@@ -0,0 +1,112 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Optional, Dict, List, Tuple
+
+from dev_observer.analysis.provider import AnalysisProvider, AnalysisResult
+from dev_observer.api.types.ai_pb2 import UserMessage
+from dev_observer.flatten.flatten import FlattenResult
+from dev_observer.processors.tokenized import TokenizedAnalyzer
+from dev_observer.prompts.provider import PromptsProvider, FormattedPrompt
+from dev_observer.tokenizer.stub import StubTokenizerProvider
+
+_separator = "\n\n-------\n\n"
+
+
+class _Prompts(PromptsProvider):
+    async def get_formatted(self, name: str, params: Optional[Dict[str, str]] = None) -> FormattedPrompt:
+        return FormattedPrompt(config=None, system=None, user=UserMessage(text=params["content"]), prompt_name=name)
+
+    async def get_optional(self, name: str, params: Optional[Dict[str, str]] = None) -> Optional[FormattedPrompt]:
+        return None
+
+
+class _Analysis(AnalysisProvider):
+    """Summarizes chunk `<n>` as `sum-<n>` and any combination as `comb`, one token per character."""
+    running: int = 0
+    max_running: int = 0
+
+    def __init__(self):
+        self.combined: List[str] = []
+
+    async def analyze(self, prompt: FormattedPrompt, session_id: Optional[str] = None) -> AnalysisResult:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if prompt.prompt_name.endswith("_analyze_chunk"):
+            return AnalysisResult(analysis=f"sum-{prompt.user.text}")
+        self.combined.append(prompt.user.text)
+        return AnalysisResult(analysis="comb")
+
+
+class TestTokenizedAnalyzer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.paths: List[str] = []
+        for i in range(6):
+            path = os.path.join(self._tmp.name, f"chunk_{i}.md")
+            with open(path, "w") as f:
+                f.write(str(i))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    async def _analyze(self, limit: int, **kwargs) -> Tuple[str, _Analysis]:
+        analysis = _Analysis()
+        analyzer = TokenizedAnalyzer(
+            prompts_prefix="repo",
+            analysis=analysis,
+            prompts=_Prompts(),
+            summary_tokens_limit=limit,
+            tokenizer=StubTokenizerProvider(),
+            **kwargs,
+        )
+        result = await analyzer.analyze_flatten(FlattenResult(
+            full_file_path=os.path.join(self._tmp.name, "full.md"),
+            file_paths=self.paths,
+            total_tokens=0,
+            clean_up=lambda: True,
+        ))
+        return result, analysis
+
+    async def test_single_combine_when_fits(self):
+        result, analysis = await self._analyze(1000)
+
+        self.assertEqual("comb", result)
+        self.assertEqual([_separator.join(f"sum-{i}" for i in range(6))], analysis.combined)
+
+    async def test_combines_groups_within_tokens_limit(self):
+        # Summaries take 5 tokens, so 3 of them fit a prompt.
+        result, analysis = await self._analyze(15)
+
+        self.assertEqual("comb", result)
+        self.assertEqual([
+            _separator.join(["sum-0", "sum-1", "sum-2"]),
+            _separator.join(["sum-3", "sum-4", "sum-5"]),
+            _separator.join(["comb", "comb"]),
+        ], analysis.combined)
+
+    async def test_combines_groups_within_fan_out(self):
+        _, analysis = await self._analyze(1000, fan_out=2)
+
+        self.assertEqual([
+            _separator.join(["sum-0", "sum-1"]),
+            _separator.join(["sum-2", "sum-3"]),
+            _separator.join(["sum-4", "sum-5"]),
+            # The last summary is left as is.
+            _separator.join(["comb", "comb"]),
+            _separator.join(["comb", "comb"]),
+        ], analysis.combined)
+
+    async def test_truncates_at_max_depth(self):
+        _, analysis = await self._analyze(15, max_depth=0)
+
+        self.assertEqual([_separator.join(["sum-0", "sum-1", "sum-2"])], analysis.combined)
+
+    async def test_concurrency_window(self):
+        _, analysis = await self._analyze(1000, concurrency=4)
+
+        self.assertEqual(4, analysis.max_running)
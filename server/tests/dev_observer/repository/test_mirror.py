@@ -0,0 +1,107 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from typing import Optional
+
+from dev_observer.api.types.repo_pb2 import GitRepository
+from dev_observer.repository.mirror import MirroringGitRepositoryProvider
+from dev_observer.repository.provider import GitRepositoryProvider, RepositoryInfo, CloneOptions
+from dev_observer.repository.types import ObservedRepo
+
+
+def _run(*args: str, cwd: Optional[str] = None) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+class _LocalProvider(GitRepositoryProvider):
+    """Resolves clone urls to local paths, the way real providers resolve them to authenticated urls."""
+
+    def __init__(self, paths: dict):
+        self.paths = paths
+
+    async def get_repo(self, repo: ObservedRepo) -> RepositoryInfo:
+        return RepositoryInfo(owner="test", name=repo.git_repo.name, clone_url=repo.url, size_kb=0)
+
+    async def clone(
+            self, repo: ObservedRepo, info: RepositoryInfo, dest: str, depth: Optional[str] = None,
+            options: Optional[CloneOptions] = None,
+    ):
+        raise AssertionError("Delegate should not clone")
+
+    async def get_authenticated_url(self, repo: ObservedRepo) -> str:
+        return self.paths[repo.url]
+
+    async def get_repo_token(self, repo: ObservedRepo) -> str:
+        return ""
+
+
+class TestMirroringGitRepositoryProvider(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.cache_dir = os.path.join(self.root, "cache")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _origin(self, name: str) -> str:
+        path = os.path.join(self.root, "work", name)
+        os.makedirs(path)
+        _run("init", "--quiet", "--initial-branch=main", cwd=path)
+        _run("config", "user.email", "test@example.com", cwd=path)
+        _run("config", "user.name", "Test", cwd=path)
+        self._commit(path, "README.md", name)
+        return path
+
+    def _commit(self, path: str, file: str, content: str):
+        with open(os.path.join(path, file), "w") as f:
+            f.write(content)
+        _run("add", ".", cwd=path)
+        _run("commit", "--quiet", "-m", f"update {file}", cwd=path)
+
+    def _repo(self, name: str) -> ObservedRepo:
+        return ObservedRepo(url=f"https://example.com/test/{name}.git", git_repo=GitRepository(name=name))
+
+    async def _clone(self, provider: MirroringGitRepositoryProvider, repo: ObservedRepo) -> str:
+        dest = tempfile.mkdtemp(dir=self.root)
+        await provider.clone(repo, await provider.get_repo(repo), dest)
+        return dest
+
+    async def test_clone_fetches_updates(self):
+        origin = self._origin("app")
+        repo = self._repo("app")
+        provider = MirroringGitRepositoryProvider(_LocalProvider({repo.url: origin}), self.cache_dir, 1 << 30)
+
+        first = await self._clone(provider, repo)
+        with open(os.path.join(first, "README.md")) as f:
+            self.assertEqual("app", f.read())
+
+        self._commit(origin, "README.md", "app v2")
+        second = await self._clone(provider, repo)
+        with open(os.path.join(second, "README.md")) as f:
+            self.assertEqual("app v2", f.read())
+        self.assertEqual(_run("rev-parse", "HEAD", cwd=origin), _run("rev-parse", "HEAD", cwd=second))
+
+        mirrors = [n for n in os.listdir(self.cache_dir) if n.endswith(".git")]
+        self.assertEqual(1, len(mirrors))
+        # The mirror keeps the public url, not the one used for fetching.
+        self.assertEqual(repo.url, _run("remote", "get-url", "origin", cwd=os.path.join(self.cache_dir, mirrors[0])))
+
+    async def test_evicts_unused_mirrors(self):
+        repos = [self._repo(n) for n in ["a", "b", "c"]]
+        paths = {r.url: self._origin(r.git_repo.name) for r in repos}
+        provider = MirroringGitRepositoryProvider(_LocalProvider(paths), self.cache_dir, 1)
+
+        await self._clone(provider, repos[0])
+        unused = await self._clone(provider, repos[1])
+        # Deleted clones are pruned from their mirrors.
+        shutil.rmtree(unused)
+        await self._clone(provider, repos[2])
+
+        mirrors = {n for n in os.listdir(self.cache_dir) if n.endswith(".git")}
+        self.assertEqual({
+            os.path.basename(provider._get_mirror_path(repos[0].url)),
+            os.path.basename(provider._get_mirror_path(repos[2].url)),
+        }, mirrors)
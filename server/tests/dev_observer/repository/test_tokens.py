@@ -0,0 +1,111 @@
+import asyncio
+import datetime
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, RepoAnalysisConfig
+from dev_observer.api.types.observations_pb2 import Observation
+from dev_observer.api.types.repo_pb2 import GitRepository
+from dev_observer.flatten.flatten import TokenStats
+from dev_observer.observations.memory import MemoryObservationsProvider
+from dev_observer.repository.cloner import list_remote_files, RemoteFile
+from dev_observer.repository import tokens
+from dev_observer.repository.tokens import TokenRatios, calibrate_token_ratios, load_token_ratios, TOKEN_RATIOS_KEY
+from dev_observer.repository.provider import RepositoryInfo
+from dev_observer.repository.types import ObservedRepo
+from dev_observer.util import MockClock
+from .test_mirror import _LocalProvider
+
+_info = RepositoryInfo(owner="test", name="repo", clone_url="", size_kb=1)
+
+
+class TestTokenRatios(unittest.IsolatedAsyncioTestCase):
+    def test_estimate_skips_filtered_files(self):
+        ratios = TokenRatios({".py": TokenStats(bytes=100_000, tokens=20_000)})
+        config = GlobalConfig()
+        config.repo_analysis.flatten.CopyFrom(RepoAnalysisConfig.Flatten(
+            ignore_pattern="docs/**", max_file_size_bytes=10_000,
+        ))
+        files = [
+            RemoteFile(path="a.py", size_bytes=1_000 - 4 - 24),
+            RemoteFile(path="large.py", size_bytes=20_000),
+            RemoteFile(path="docs/a.py", size_bytes=1_000),
+            RemoteFile(path="logo.png", size_bytes=1_000),
+            RemoteFile(path="package-lock.json", size_bytes=1_000),
+        ]
+        self.assertEqual(200, ratios.estimate(files, config, _info))
+
+    def test_ratio_falls_back_to_overall(self):
+        ratios = TokenRatios({
+            ".py": TokenStats(bytes=100_000, tokens=20_000),
+            ".go": TokenStats(bytes=100_000, tokens=40_000),
+            ".rs": TokenStats(bytes=100, tokens=90),
+        })
+        self.assertAlmostEqual(0.2, ratios.ratio(".py"))
+        self.assertAlmostEqual(60_090 / 200_100, ratios.ratio(".rs"))
+        self.assertAlmostEqual(60_090 / 200_100, ratios.ratio(".ts"))
+        self.assertAlmostEqual(0.25, TokenRatios({}).ratio(".py"))
+
+    async def test_calibrate(self):
+        observations = MemoryObservationsProvider()
+        clock = MockClock()
+        await calibrate_token_ratios(observations, {".py": TokenStats(bytes=100_000, tokens=20_000)}, clock)
+        clock.bump(datetime.timedelta(seconds=1))
+        await calibrate_token_ratios(observations, {
+            ".py": TokenStats(bytes=20_000, tokens=10_000),
+            ".md": TokenStats(bytes=50_000, tokens=5_000),
+        }, clock)
+        ratios = await load_token_ratios(observations)
+        self.assertEqual({
+            ".py": TokenStats(bytes=100_000, tokens=26_000),
+            ".md": TokenStats(bytes=50_000, tokens=5_000),
+        }, ratios.stats)
+
+    async def test_concurrent_calibrations_are_kept(self):
+        observations = MemoryObservationsProvider()
+        await observations.store(Observation(
+            key=TOKEN_RATIOS_KEY, content=json.dumps({".go": {"bytes": 10_000, "tokens": 3_000}}),
+        ))
+        exts = [f".e{i}" for i in range(tokens._max_calibrations + 5)]
+        await asyncio.gather(*[
+            calibrate_token_ratios(observations, {ext: TokenStats(bytes=1_000, tokens=100)}) for ext in exts
+        ])
+
+        self.assertEqual(tokens._max_calibrations, len(await observations.list("tokens", "calibrations/")))
+        ratios = await load_token_ratios(observations)
+        # Stats of the oldest calibrations were dropped, all others are combined.
+        self.assertEqual(tokens._max_calibrations, len([ext for ext in exts if ext in ratios.stats]))
+        self.assertIn(".go", ratios.stats)
+
+
+class TestListRemoteFiles(unittest.IsolatedAsyncioTestCase):
+    async def test_lists_files_with_sizes(self):
+        with tempfile.TemporaryDirectory() as origin:
+            os.makedirs(os.path.join(origin, "src"))
+            for path, size in [("README.md", 10), ("src/main.py", 1234)]:
+                with open(os.path.join(origin, path), "w") as f:
+                    f.write("x" * size)
+            for args in [["init", "--quiet"], ["add", "."],
+                         ["-c", "user.email=t@example.com", "-c", "user.name=T", "commit", "--quiet", "-m", "init"]]:
+                subprocess.run(["git", *args], cwd=origin, check=True)
+            repo = ObservedRepo(url="https://example.com/test/repo.git", git_repo=GitRepository(name="repo"))
+
+            files = await list_remote_files(repo, _LocalProvider({repo.url: f"file://{origin}"}))
+
+        self.assertEqual([RemoteFile("README.md", 10), RemoteFile("src/main.py", 1234)], files)
+
+    async def test_non_utf8_paths(self):
+        with tempfile.TemporaryDirectory() as origin:
+            with open(os.path.join(origin.encode(), b"caf\xe9.md"), "w") as f:
+                f.write("x" * 5)
+            for args in [["init", "--quiet"], ["add", "."],
+                         ["-c", "user.email=t@example.com", "-c", "user.name=T", "commit", "--quiet", "-m", "init"]]:
+                subprocess.run(["git", *args], cwd=origin, check=True)
+            repo = ObservedRepo(url="https://example.com/test/repo.git", git_repo=GitRepository(name="repo"))
+
+            files = await list_remote_files(repo, _LocalProvider({repo.url: f"file://{origin}"}))
+
+        self.assertEqual([RemoteFile("caf\ufffd.md", 5)], files)
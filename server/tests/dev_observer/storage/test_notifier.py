@@ -0,0 +1,25 @@
+import asyncio
+import threading
+import unittest
+
+from dev_observer.storage.notifier import ProcessingNotifier
+
+
+class TestProcessingNotifier(unittest.IsolatedAsyncioTestCase):
+    async def test_wait_times_out(self):
+        notifier = ProcessingNotifier()
+        self.assertFalse(await notifier.wait(0.01))
+
+    async def test_notification_is_latched(self):
+        notifier = ProcessingNotifier()
+        self.assertFalse(await notifier.wait(0))
+        notifier.notify()
+        await asyncio.sleep(0)
+        self.assertTrue(await notifier.wait(0.01))
+        self.assertFalse(await notifier.wait(0.01))
+
+    async def test_notify_from_another_thread(self):
+        notifier = ProcessingNotifier()
+        self.assertFalse(await notifier.wait(0))
+        threading.Timer(0.05, notifier.notify).start()
+        self.assertTrue(await notifier.wait(5))
@@ -0,0 +1,138 @@
+import datetime
+import tempfile
+import unittest
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, PeriodicConfig
+from dev_observer.api.types.processing_pb2 import ProcessingItemKey, ProcessingItemResult
+from dev_observer.common.schedule import pb_to_datetime
+from dev_observer.storage.local import LocalStorageProvider
+from dev_observer.storage.provider import ProcessingQuota
+from dev_observer.util import MockClock
+
+
+class TestSingleBlobClaimProcessingItems(unittest.IsolatedAsyncioTestCase):
+    async def test_claim_processing_items(self):
+        clock = MockClock()
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir, clock)
+            for i, repo_id in enumerate(["r1", "r2", "r3"]):
+                await storage.set_next_processing_time(
+                    ProcessingItemKey(github_repo_id=repo_id), clock.now() - datetime.timedelta(minutes=3 - i),
+                )
+            await storage.set_next_processing_time(
+                ProcessingItemKey(github_repo_id="future"), clock.now() + datetime.timedelta(minutes=1),
+            )
+
+            claimed = await storage.claim_processing_items(2, datetime.timedelta(minutes=5))
+            self.assertEqual(["r1", "r2"], [i.key.github_repo_id for i in claimed])
+            self.assertEqual(clock.now() + datetime.timedelta(minutes=5), pb_to_datetime(claimed[0].next_processing))
+
+            # Claimed items are persisted and are not handed out again until the delay expires.
+            claimed = await storage.claim_processing_items(5, datetime.timedelta(minutes=5))
+            self.assertEqual(["r3"], [i.key.github_repo_id for i in claimed])
+            self.assertEqual([], await storage.claim_processing_items(5))
+
+            clock.bump(datetime.timedelta(minutes=2))
+            claimed = await storage.claim_processing_items(5)
+            self.assertEqual(["future"], [i.key.github_repo_id for i in claimed])
+
+    async def test_wait_processing_changes(self):
+        clock = MockClock()
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir, clock)
+            self.assertIsNone(await storage.get_next_processing_time())
+            self.assertFalse(await storage.wait_processing_changes(datetime.timedelta(milliseconds=10)))
+
+            next_time = clock.now() + datetime.timedelta(minutes=3)
+            await storage.set_next_processing_time(ProcessingItemKey(github_repo_id="r1"), next_time)
+            await storage.create_processing_time(ProcessingItemKey(github_repo_id="r2"))
+            self.assertTrue(await storage.wait_processing_changes(datetime.timedelta(seconds=5)))
+            self.assertEqual(next_time, await storage.get_next_processing_time())
+            self.assertIsNone(await storage.get_next_processing_time(["github_repo_id"]))
+
+    async def test_renew_processing_lease(self):
+        clock = MockClock()
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir, clock)
+            key = ProcessingItemKey(github_repo_id="r1")
+            await storage.set_next_processing_time(key, clock.now() - datetime.timedelta(seconds=1))
+
+            claimed = await storage.claim_processing_items(1, datetime.timedelta(seconds=30), "w1")
+            self.assertEqual("w1", claimed[0].worker_id)
+            self.assertFalse(await storage.renew_processing_lease(key, "w2", clock.now()))
+            self.assertTrue(await storage.renew_processing_lease(key, "w1", clock.now() + datetime.timedelta(minutes=1)))
+
+            clock.bump(datetime.timedelta(seconds=45))
+            self.assertEqual([], await storage.claim_processing_items(1, datetime.timedelta(seconds=30), "w2"))
+
+            # Once the lease expires the item is reclaimed and the old worker can no longer renew it.
+            clock.bump(datetime.timedelta(seconds=30))
+            claimed = await storage.claim_processing_items(1, datetime.timedelta(seconds=30), "w2")
+            self.assertEqual("w2", claimed[0].worker_id)
+            self.assertFalse(await storage.renew_processing_lease(key, "w1", clock.now()))
+
+            await storage.set_next_processing_time(key, None)
+            self.assertFalse(await storage.renew_processing_lease(key, "w2", clock.now()))
+
+    async def test_finalize_only_while_claimed(self):
+        clock = MockClock()
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir, clock)
+            key = ProcessingItemKey(github_repo_id="r1")
+            await storage.set_next_processing_time(key, clock.now() - datetime.timedelta(seconds=1))
+            await storage.claim_processing_items(1, datetime.timedelta(seconds=30), "w1")
+
+            # The lease of w1 expired and w2 claimed the item.
+            clock.bump(datetime.timedelta(minutes=1))
+            await storage.claim_processing_items(1, datetime.timedelta(seconds=30), "w2")
+            self.assertIsNone(await storage.add_processing_result(ProcessingItemResult(key=key), worker_id="w1"))
+            self.assertFalse(await storage.set_next_processing_time(key, None, worker_id="w1"))
+            self.assertFalse(await storage.update_processing_item(key, lambda i: i, clock.now(), worker_id="w1"))
+            self.assertFalse(await storage.delete_processing_item(key, worker_id="w1"))
+            self.assertEqual("w2", (await storage.get_processing_item(key)).worker_id)
+            self.assertFalse(await storage.set_next_processing_time(
+                ProcessingItemKey(github_repo_id="missing"), None, worker_id="w1",
+            ))
+            self.assertIsNone(await storage.get_processing_item(ProcessingItemKey(github_repo_id="missing")))
+
+            self.assertIsNotNone(await storage.add_processing_result(ProcessingItemResult(key=key), worker_id="w2"))
+            self.assertTrue(await storage.set_next_processing_time(key, None, worker_id="w2"))
+            self.assertFalse((await storage.get_processing_item(key)).HasField("worker_id"))
+
+    async def test_claim_with_quotas(self):
+        clock = MockClock()
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorageProvider(root_dir, clock)
+            keys = [
+                ProcessingItemKey(research_git_repo_id="research1"),
+                ProcessingItemKey(research_git_repo_id="research2"),
+                ProcessingItemKey(github_repo_id="repo1"),
+                ProcessingItemKey(request_id="req1"),
+                ProcessingItemKey(request_id="req2"),
+            ]
+            for i, key in enumerate(keys):
+                await storage.set_next_processing_time(key, clock.now() - datetime.timedelta(minutes=len(keys) - i))
+
+            claimed = await storage.claim_processing_items(4, quotas=[
+                ProcessingQuota(limit=4, entity_type="request_id"),
+                ProcessingQuota(limit=4),
+                ProcessingQuota(limit=1, entity_type="research_git_repo_id"),
+            ])
+            self.assertEqual(
+                ["req1", "req2", "repo1", "research1"],
+                [getattr(i.key, i.key.WhichOneof("entity")) for i in claimed],
+            )
+
+    async def test_global_config_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            writer = LocalStorageProvider(root_dir)
+            reader = LocalStorageProvider(root_dir)
+            self.assertEqual(0, (await reader.get_global_config()).periodic.concurrency)
+
+            await writer.set_global_config(GlobalConfig(periodic=PeriodicConfig(concurrency=3)))
+            config = await reader.get_global_config()
+            self.assertEqual(3, config.periodic.concurrency)
+
+            # Returned configs are copies, modifying them does not affect the storage.
+            config.periodic.concurrency = 10
+            self.assertEqual(3, (await reader.get_global_config()).periodic.concurrency)
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+from typing import List
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, RepoAnalysisConfig
+from dev_observer.flatten.flatten import combine_commits, make_output_dir
+from dev_observer.repository.provider import RepositoryInfo
+
+_info = RepositoryInfo(owner="test", name="repo", clone_url="", size_kb=1)
+
+
+def _commit(root: str, message: str, files: dict):
+    for path, content in files.items():
+        full_path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w") as f:
+            f.write(content)
+    subprocess.run(["git", "add", "."], cwd=root, check=True)
+    subprocess.run(["git", "-c", "user.email=t@example.com", "-c", "user.name=Test", "commit", "--quiet",
+                    "-m", message], cwd=root, check=True)
+
+
+def _combine(root: str, config: GlobalConfig):
+    streamed: List[str] = []
+
+    async def on_content(text: str):
+        streamed.append(text)
+
+    now = datetime.now()
+    result = asyncio.run(combine_commits(
+        root, _info, config, now - timedelta(days=1), now + timedelta(days=1), make_output_dir(root, "out"),
+        on_content,
+    ))
+    with open(result.file_path, encoding="utf-8") as f:
+        return f.read(), "".join(streamed)
+
+
+def test_combine_commits():
+    with tempfile.TemporaryDirectory() as root:
+        subprocess.run(["git", "init", "--quiet"], cwd=root, check=True)
+        _commit(root, "Add main", {"src/main.py": "print('hello')\n", "package-lock.json": "{}\n"})
+        _commit(root, "Add big file", {
+            "src/big.py": "".join(f"line_{i} = {i}\n" for i in range(1000)),
+            "api/types_pb2.py": "generated\n",
+        })
+        config = GlobalConfig()
+        config.repo_analysis.flatten.CopyFrom(RepoAnalysisConfig.Flatten(max_diff_size_bytes=500))
+
+        content, streamed = _combine(root, config)
+
+        assert content == streamed
+        commits = content.split("\n## Commit: ")
+        assert len(commits) == 2
+        assert commits[0].startswith("## Commit: ")
+        assert " by Test <t@example.com> on " in commits[0].split("\n")[0]
+        assert commits[0].split("\n")[1] == "Add big file"
+        assert commits[1].split("\n")[1] == "Add main"
+
+        assert "diff --git a/api/types_pb2.py b/api/types_pb2.py\n(diff omitted)\n" in commits[0]
+        assert "+generated" not in content
+        assert "+line_0 = 0\n" in commits[0]
+        assert "+line_999 = 999" not in content
+        assert "more lines)\n" in commits[0]
+        big_diff = commits[0].split("diff --git a/src/big.py")[1]
+        assert len(big_diff.encode("utf-8")) < 600
+
+        assert "diff --git a/package-lock.json b/package-lock.json\n(diff omitted)\n" in commits[1]
+        assert "+print('hello')\n" in commits[1]
+
+
+def test_combine_commits_failure():
+    with tempfile.TemporaryDirectory() as root:
+        # Not a git repository.
+        content, _ = _combine(root, GlobalConfig())
+
+        assert content.startswith("\nFailed to get commits: git log failed")
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import tempfile
+from typing import List
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, RepoAnalysisConfig
+from dev_observer.flatten.flatten import FileChunker, TokenizeResult
+from .test_tokenize import _WordTokenizer
+
+
+def _config(max_tokens: int) -> GlobalConfig:
+    config = GlobalConfig()
+    config.repo_analysis.flatten.CopyFrom(RepoAnalysisConfig.Flatten(max_tokens_per_chunk=max_tokens))
+    return config
+
+
+def _file(path: str, words: int) -> str:
+    body = "\n".join(f"w{i}" for i in range(words))
+    return f"## File: {path}\n```\n{body}\n```\n\n"
+
+
+def _chunk(content: str, max_tokens: int, write_size: int, out_dir: str) -> TokenizeResult:
+    async def run():
+        chunker = FileChunker(out_dir, _WordTokenizer(), _config(max_tokens))
+        for i in range(0, len(content), write_size):
+            await chunker.write(content[i:i + write_size])
+        return await chunker.close()
+
+    return asyncio.run(run())
+
+
+def _read(paths: List[str]) -> List[str]:
+    result: List[str] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            result.append(f.read())
+    return result
+
+
+_header = "# Files\n\n"
+_small = [_file(f"src/small_{i}.py", 5) for i in range(6)]
+_large = _file("src/large.py", 60)
+_content = _header + "".join(_small[:3]) + _large + "".join(_small[3:])
+
+
+def test_packs_whole_files():
+    for write_size in [7, 100, len(_content)]:
+        with tempfile.TemporaryDirectory() as tmp:
+            # 4 tokens of the header and 25 tokens per small file, 135 tokens of the large file.
+            result = _chunk(_content, 80, write_size, tmp)
+            chunks = _read(result.file_paths)
+
+            assert "".join(chunks) == _content
+            assert [c.files[:] for c in result.chunks] == [
+                ["src/small_0.py", "src/small_1.py", "src/small_2.py"],
+                ["src/large.py"],
+                ["src/large.py", "src/small_3.py"],
+                ["src/small_4.py", "src/small_5.py"],
+            ]
+            assert [c.name for c in result.chunks] == [os.path.basename(p) for p in result.file_paths]
+            assert result.total_tokens == sum(c.tokens for c in result.chunks)
+            # All but the header preceding the first file.
+            assert list(result.token_stats.keys()) == [".py"]
+            assert result.token_stats[".py"].tokens == result.total_tokens - 4
+            assert result.token_stats[".py"].bytes == len(_content) - len(_header)
+            # Small files are never split.
+            for small in _small:
+                assert any(small in chunk for chunk in chunks)
+
+
+def test_single_chunk_writes_no_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        content = _header + "".join(_small)
+        result = _chunk(content, 1_000_000, 10, tmp)
+
+        assert result.file_paths == []
+        assert os.listdir(tmp) == []
+        assert len(result.chunks) == 1
+        assert result.chunks[0].name == ""
+        assert result.chunks[0].files == [f"src/small_{i}.py" for i in range(6)]
+        assert result.total_tokens == len(_WordTokenizer().encode(content))
+
+
+def test_xml_style():
+    content = "".join(f'<file path="src/{i}.py">\n{"x " * 20}\n</file>\n' for i in range(4))
+    with tempfile.TemporaryDirectory() as tmp:
+        result = _chunk(content, 120, 13, tmp)
+
+        assert "".join(_read(result.file_paths)) == content
+        assert [c.files[:] for c in result.chunks] == [["src/0.py", "src/1.py"], ["src/2.py", "src/3.py"]]
+
+
+def test_publishes_chunks_as_written():
+    with tempfile.TemporaryDirectory() as tmp:
+        published: List[str] = []
+        # Number of chunks published before the content is fully written.
+        published_before_close = 0
+
+        async def on_chunk(path: str):
+            assert os.path.exists(path)
+            published.append(path)
+
+        async def run():
+            nonlocal published_before_close
+            chunker = FileChunker(tmp, _WordTokenizer(), _config(1000), on_chunk)
+            # More than the window of the chunker.
+            for i in range(2000):
+                await chunker.write(_file(f"src/{i}.py", 50))
+            published_before_close = len(published)
+            return await chunker.close()
+
+        chunker_result = asyncio.run(run())
+
+        assert published == chunker_result.file_paths
+        assert 0 < published_before_close < len(published)
+
+
+def test_headers_inside_files_are_content():
+    quoting = (
+        "## File: docs/headers.md\n````md\n# Headers\n```\n## File: fake.py\n<file path=\"fake.xml\">\n```\n"
+        "## File: fake2.py\n````\n\n"
+    )
+    content = _header + _small[0] + quoting + _small[1]
+    for write_size in [5, len(content)]:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = _chunk(content, 1_000_000, write_size, tmp)
+
+            assert result.chunks[0].files == ["src/small_0.py", "docs/headers.md", "src/small_1.py"]
+            assert result.token_stats[".md"].bytes == len(quoting)
+            assert result.token_stats[".py"].bytes == len(_small[0]) + len(_small[1])
+
+
+def test_write_file():
+    quoting = "## File: docs/headers.md\n```md\n## File: fake.py\n```\n\n"
+
+    async def run(out_dir: str) -> TokenizeResult:
+        chunker = FileChunker(out_dir, _WordTokenizer(), _config(80))
+        await chunker.write_file(None, _header)
+        await chunker.write_file("docs/headers.md", quoting)
+        for i, small in enumerate(_small):
+            await chunker.write_file(f"src/small_{i}.py", small)
+        return await chunker.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = asyncio.run(run(tmp))
+
+        assert "".join(_read(result.file_paths)) == _header + quoting + "".join(_small)
+        assert [c.files[:] for c in result.chunks] == [
+            ["docs/headers.md", "src/small_0.py", "src/small_1.py"],
+            ["src/small_2.py", "src/small_3.py", "src/small_4.py"],
+            ["src/small_5.py"],
+        ]
+        assert list(result.token_stats.keys()) == [".md", ".py"]
@@ -0,0 +1,177 @@
+import asyncio
+import datetime
+import os
+import subprocess
+import tempfile
+from unittest import mock
+
+import pytest
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, RepoAnalysisConfig
+from dev_observer.api.types.repo_pb2 import GitRepository
+from dev_observer.flatten import flatten
+from dev_observer.flatten.flatten import combine_repository_native, TokenChunker, tokenize_file, make_output_dir, \
+    FileChunker
+from dev_observer.flatten.native import compile_patterns, split_patterns
+from dev_observer.repository.cloner import CloneResult
+from dev_observer.repository.provider import RepositoryInfo
+from dev_observer.repository.types import ObservedRepo, ObservedGitChanges
+from .test_tokenize import _WordTokenizer
+
+_info = RepositoryInfo(owner="test", name="repo", clone_url="", size_kb=1)
+
+
+def _config(**kwargs) -> GlobalConfig:
+    config = GlobalConfig()
+    config.repo_analysis.flatten.CopyFrom(RepoAnalysisConfig.Flatten(flattener="native", **kwargs))
+    return config
+
+
+def _write(root: str, path: str, content):
+    full_path = os.path.join(root, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "wb" if isinstance(content, bytes) else "w") as f:
+        f.write(content)
+
+
+def _repo(root: str):
+    _write(root, ".gitignore", "*.tmp\nbuild/\n")
+    _write(root, "src/main.py", "print('hello')\n")
+    _write(root, "src/util.py", "def f():\n    return 1\n")
+    _write(root, "README.md", "# Readme\n```\ncode\n```\n")
+    _write(root, "notes.tmp", "ignored by .gitignore")
+    _write(root, "build/out.js", "ignored by .gitignore")
+    _write(root, "docs/guide.md", "ignored by pattern")
+    _write(root, "package-lock.json", "ignored by default")
+    _write(root, "image.png", b"\x89PNG\0\0\0binary")
+    _write(root, "big.txt", "x" * 200)
+    subprocess.run(["git", "init", "--quiet"], cwd=root, check=True)
+    subprocess.run(["git", "add", "src/main.py"], cwd=root, check=True)
+
+
+def test_combine_repository_native_filters_files():
+    with tempfile.TemporaryDirectory() as root:
+        _repo(root)
+        out_dir = make_output_dir(root, "devplan_tmp_native")
+        config = _config(ignore_pattern="docs/**", max_file_size_bytes=100)
+        result = asyncio.run(combine_repository_native(root, _info, config, out_dir))
+
+        with open(result.file_path, encoding="utf-8") as f:
+            content = f.read()
+        files = [line[len("## File: "):] for line in content.splitlines() if line.startswith("## File: ")]
+        assert files == [".gitignore", "README.md", "src/main.py", "src/util.py"]
+        assert result.size_bytes == len(content.encode("utf-8"))
+        # Content with fences gets a longer fence.
+        assert "## File: README.md\n````md\n# Readme\n```\ncode\n```\n````\n" in content
+
+
+@pytest.mark.parametrize("max_tokens", [5, 100, 1_000_000])
+def test_streamed_chunks_match_tokenize_file(max_tokens):
+    tokenizer = _WordTokenizer()
+    with tempfile.TemporaryDirectory() as root:
+        _repo(root)
+        for i in range(50):
+            _write(root, f"src/gen/file_{i}.py", f"def f_{i}():\n    return {i}\n" * (i % 5 + 1))
+        config = _config(max_tokens_per_chunk=max_tokens)
+        out_dir = make_output_dir(root, "devplan_tmp_native")
+        expected_dir = make_output_dir(root, "expected")
+
+        async def run():
+            chunker = TokenChunker(out_dir, tokenizer, config)
+            combined = await combine_repository_native(root, _info, config, out_dir, chunker.write)
+            return combined, await chunker.close()
+
+        with mock.patch.object(flatten, "_min_read_window_chars", 16):
+            combined, streamed = asyncio.run(run())
+            expected = asyncio.run(tokenize_file(combined.file_path, expected_dir, tokenizer, config))
+
+        assert streamed.total_tokens == expected.total_tokens
+        assert [os.path.basename(p) for p in streamed.file_paths] == [os.path.basename(p) for p in expected.file_paths]
+        for streamed_path, expected_path in zip(streamed.file_paths, expected.file_paths):
+            with open(streamed_path, encoding="utf-8") as s, open(expected_path, encoding="utf-8") as e:
+                assert s.read() == e.read()
+
+
+def test_file_boundaries_are_passed_to_chunker():
+    with tempfile.TemporaryDirectory() as root:
+        _write(root, "a.md", "# Notes\n## File: fake.py\n<file path=\"fake.xml\">\n")
+        _write(root, "b.py", "print('b')\n")
+        config = _config(max_tokens_per_chunk=1000)
+        out_dir = make_output_dir(root, "devplan_tmp_native")
+
+        async def run():
+            chunker = FileChunker(out_dir, _WordTokenizer(), config)
+            await combine_repository_native(root, _info, config, out_dir, on_file=chunker.write_file)
+            return await chunker.close()
+
+        result = asyncio.run(run())
+
+        assert result.chunks[0].files == ["a.md", "b.py"]
+        assert sorted(result.token_stats.keys()) == [".md", ".py"]
+
+
+def test_flatten_repository_removes_clone_on_failure():
+    with tempfile.TemporaryDirectory() as root:
+        clone_path = os.path.join(root, "clone")
+        _repo(clone_path)
+
+        async def clone(*args, **kwargs):
+            return CloneResult(path=clone_path, repo=_info)
+
+        async def fail(*args, **kwargs):
+            raise ValueError("flatten failed")
+
+        repo = ObservedRepo(url="https://example.com/test/repo.git", git_repo=GitRepository(name="repo"))
+        with mock.patch.object(flatten, "clone_repository", clone), \
+                mock.patch.object(flatten, "combine_repository_native", fail):
+            with pytest.raises(ValueError):
+                asyncio.run(flatten.flatten_repository(repo, None, _WordTokenizer(), _config(max_tokens_per_chunk=100)))
+
+        assert not os.path.exists(clone_path)
+
+
+def test_flatten_repo_changes_removes_clone_on_failure():
+    with tempfile.TemporaryDirectory() as root:
+        clone_path = os.path.join(root, "clone")
+        _repo(clone_path)
+
+        async def clone(*args, **kwargs):
+            return CloneResult(path=clone_path, repo=_info)
+
+        async def fail(*args, **kwargs):
+            raise ValueError("combine failed")
+
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        changes = ObservedGitChanges(
+            repo=ObservedRepo(url="https://example.com/test/repo.git", git_repo=GitRepository(name="repo")),
+            from_date=now - datetime.timedelta(days=7),
+            to_date=now,
+        )
+        with mock.patch.object(flatten, "clone_repository", clone), \
+                mock.patch.object(flatten, "combine_commits", fail):
+            with pytest.raises(ValueError):
+                asyncio.run(flatten.flatten_repo_changes(changes, None, _WordTokenizer(), _config()))
+
+        assert not os.path.exists(clone_path)
+
+
+@pytest.mark.parametrize("pattern,path,matches", [
+    ("*.lock", "a/b/yarn.lock", True),
+    ("*.lock", "yarn.lock", True),
+    ("/dist", "dist/index.js", True),
+    ("/dist", "web/dist/index.js", False),
+    ("dist", "web/dist/index.js", True),
+    ("docs/**", "docs/a/b.md", True),
+    ("docs/**", "web/docs/a.md", False),
+    ("**/test_*.py", "tests/test_a.py", True),
+    ("src/*.py", "src/a/b.py", False),
+    ("*.{png,jpg}", "img/a.jpg", True),
+    ("file?.txt", "file1.txt", True),
+    ("file[!0-9].txt", "file1.txt", False),
+])
+def test_compile_patterns(pattern, path, matches):
+    assert (compile_patterns(split_patterns(pattern)).fullmatch(path) is not None) == matches
+
+
+def test_split_patterns():
+    assert split_patterns("a/**, *.{png,jpg},,b") == ["a/**", "*.{png,jpg}", "b"]
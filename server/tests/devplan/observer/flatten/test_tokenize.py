@@ -0,0 +1,70 @@
+import asyncio
+import os
+import re
+import tempfile
+from typing import List, Dict
+from unittest import mock
+
+import pytest
+
+from dev_observer.api.types.config_pb2 import GlobalConfig, RepoAnalysisConfig
+from dev_observer.flatten import flatten
+from dev_observer.flatten.flatten import tokenize_file
+from dev_observer.tokenizer.provider import TokenizerProvider
+
+
+class _WordTokenizer(TokenizerProvider):
+    """Context sensitive like BPE: runs of whitespace, word characters and punctuation are single tokens."""
+    _vocab: Dict[str, int]
+    _words: List[str]
+
+    def __init__(self):
+        self._vocab = {}
+        self._words = []
+
+    def encode(self, content: str) -> List[int]:
+        result: List[int] = []
+        for word in re.findall(r"\w+|\s+|[^\w\s]+", content):
+            if word not in self._vocab:
+                self._vocab[word] = len(self._words)
+                self._words.append(word)
+            result.append(self._vocab[word])
+        return result
+
+    def decode(self, tokens: List[int]) -> str:
+        return "".join(self._words[t] for t in tokens)
+
+
+def _config(max_tokens: int) -> GlobalConfig:
+    config = GlobalConfig()
+    config.repo_analysis.flatten.CopyFrom(RepoAnalysisConfig.Flatten(max_tokens_per_chunk=max_tokens))
+    return config
+
+
+_content = "".join(
+    f"## File {i}\n\n```\ndef f_{i}():\n    return {i} * {{'a': [1, 2]}}\n```\n  \n"
+    + ("x" * 300 if i % 7 == 0 else "")
+    for i in range(200)
+)
+
+
+@pytest.mark.parametrize("max_tokens", [5, 13, 100, 1_000_000])
+def test_tokenize_file_matches_whole_file_encoding(max_tokens):
+    tokenizer = _WordTokenizer()
+    expected = tokenizer.encode(_content)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "full.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_content)
+        with mock.patch.object(flatten, "_min_read_window_chars", 16):
+            result = asyncio.run(tokenize_file(path, tmp, tokenizer, _config(max_tokens)))
+
+        assert result.total_tokens == len(expected)
+        if len(expected) <= max_tokens:
+            assert result.file_paths == []
+            return
+        offsets = list(range(0, len(expected), max_tokens))
+        assert result.file_paths == [os.path.join(tmp, f"chunk_{i}.md") for i in offsets]
+        for i, chunk_path in zip(offsets, result.file_paths):
+            with open(chunk_path, encoding="utf-8") as f:
+                assert f.read() == tokenizer.decode(expected[i:i + max_tokens])
@@ -47,7 +47,7 @@ const RepositoryDetailsPage: React.FC = () => {
   }, [id, rescanRepository])
   const runTokenAnalysis = useCallback(() => {
     analyzeTokens(id!)
-      .then(() => toast.success(`Tokens processed`))
+      .then(() => toast.success(`Tokens analysis started`))
       .catch(e => toast.error(`Failed to analyze tokens: ${e}`))
   }, [analyzeTokens, id])
 
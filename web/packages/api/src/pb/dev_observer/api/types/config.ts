@@ -19,6 +19,19 @@ export interface GlobalConfig {
 
 export interface PeriodicConfig {
   concurrency: number;
+  /** Lease a worker holds on a claimed item, renewed while the item is processed. Defaults to 60 seconds. */
+  leaseDurationSec: number;
+  /** Per entity type limits. Types without an entry are claimed with priority 0 and only bounded by `concurrency`. */
+  entityLimits: PeriodicConfig_EntityTypeLimit[];
+}
+
+export interface PeriodicConfig_EntityTypeLimit {
+  /** Name of the ProcessingItemKey entity field, e.g. "request_id" or "research_git_repo_id". */
+  entityType: string;
+  /** Max number of items of the type processed concurrently by a worker. 0 means no separate limit. */
+  concurrency: number;
+  /** Types with a higher priority are claimed first. */
+  priority: number;
 }
 
 export interface AnalysisConfig {
@@ -27,6 +40,21 @@ export interface AnalysisConfig {
   disableMasking: boolean;
   defaultGitChangesAnalyzer?: Analyzer | undefined;
   defaultAggregatedSummaryAnalyzer?: Analyzer | undefined;
+  /** Max number of analyzers run concurrently on the same flattened content. Defaults to 3. */
+  analyzerConcurrency: number;
+  /**
+   * Chunk analyses that don't fit a single prompt are combined in groups, and the results combined again.
+   * Max number of summaries combined by a single prompt. 0 means only the summary tokens limit applies.
+   */
+  combineFanOut: number;
+  /** Max number of combining levels, remaining summaries that don't fit are omitted. Defaults to 3. */
+  combineMaxDepth: number;
+  /** Max number of chunks of an analyzer analyzed concurrently. Defaults to 10. */
+  chunkConcurrency: number;
+  /** Analyze chunks while the content is still being flattened, instead of after flattening. */
+  pipelinedAnalysis: boolean;
+  /** Max number of chunks flattened ahead of the slowest analyzer with `pipelined_analysis`. Defaults to 4. */
+  pipelineMaxPendingChunks: number;
 }
 
 export interface UserManagementStatus {
@@ -54,6 +82,16 @@ export interface RepoAnalysisConfig_Flatten {
   largeRepoIgnorePattern: string;
   compressLarge: boolean;
   maxFileSizeBytes: number;
+  /** "repomix" (default) or "native" for the in-process flattener. */
+  flattener: string;
+  /** Clone without file contents and fetch only the checked out ones, see `git clone --filter=blob:none`. */
+  bloblessClone: boolean;
+  /** Don't check out files matching ignore patterns. Most useful together with `blobless_clone`. */
+  sparseCheckout: boolean;
+  /** Timeout of cloning a repository, 30 minutes by default. */
+  cloneTimeoutSec: number;
+  /** Diffs of a single file in change summaries are truncated to this size, 20000 by default. */
+  maxDiffSizeBytes: number;
 }
 
 export interface RepoAnalysisConfig_Research {
@@ -197,7 +235,7 @@ export const GlobalConfig: MessageFns<GlobalConfig> = {
 };
 
 function createBasePeriodicConfig(): PeriodicConfig {
-  return { concurrency: 0 };
+  return { concurrency: 0, leaseDurationSec: 0, entityLimits: [] };
 }
 
 export const PeriodicConfig: MessageFns<PeriodicConfig> = {
@@ -205,6 +243,12 @@ export const PeriodicConfig: MessageFns<PeriodicConfig> = {
     if (message.concurrency !== 0) {
       writer.uint32(8).int32(message.concurrency);
     }
+    if (message.leaseDurationSec !== 0) {
+      writer.uint32(16).int32(message.leaseDurationSec);
+    }
+    for (const v of message.entityLimits) {
+      PeriodicConfig_EntityTypeLimit.encode(v!, writer.uint32(26).fork()).join();
+    }
     return writer;
   },
 
@@ -223,6 +267,22 @@ export const PeriodicConfig: MessageFns<PeriodicConfig> = {
           message.concurrency = reader.int32();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.leaseDurationSec = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.entityLimits.push(PeriodicConfig_EntityTypeLimit.decode(reader, reader.uint32()));
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -233,7 +293,13 @@ export const PeriodicConfig: MessageFns<PeriodicConfig> = {
   },
 
   fromJSON(object: any): PeriodicConfig {
-    return { concurrency: isSet(object.concurrency) ? gt.Number(object.concurrency) : 0 };
+    return {
+      concurrency: isSet(object.concurrency) ? gt.Number(object.concurrency) : 0,
+      leaseDurationSec: isSet(object.leaseDurationSec) ? gt.Number(object.leaseDurationSec) : 0,
+      entityLimits: gt.Array.isArray(object?.entityLimits)
+        ? object.entityLimits.map((e: any) => PeriodicConfig_EntityTypeLimit.fromJSON(e))
+        : [],
+    };
   },
 
   toJSON(message: PeriodicConfig): unknown {
@@ -241,6 +307,12 @@ export const PeriodicConfig: MessageFns<PeriodicConfig> = {
     if (message.concurrency !== 0) {
       obj.concurrency = Math.round(message.concurrency);
     }
+    if (message.leaseDurationSec !== 0) {
+      obj.leaseDurationSec = Math.round(message.leaseDurationSec);
+    }
+    if (message.entityLimits?.length) {
+      obj.entityLimits = message.entityLimits.map((e) => PeriodicConfig_EntityTypeLimit.toJSON(e));
+    }
     return obj;
   },
 
@@ -250,6 +322,100 @@ export const PeriodicConfig: MessageFns<PeriodicConfig> = {
   fromPartial(object: DeepPartial<PeriodicConfig>): PeriodicConfig {
     const message = createBasePeriodicConfig();
     message.concurrency = object.concurrency ?? 0;
+    message.leaseDurationSec = object.leaseDurationSec ?? 0;
+    message.entityLimits = object.entityLimits?.map((e) => PeriodicConfig_EntityTypeLimit.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBasePeriodicConfig_EntityTypeLimit(): PeriodicConfig_EntityTypeLimit {
+  return { entityType: "", concurrency: 0, priority: 0 };
+}
+
+export const PeriodicConfig_EntityTypeLimit: MessageFns<PeriodicConfig_EntityTypeLimit> = {
+  encode(message: PeriodicConfig_EntityTypeLimit, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.entityType !== "") {
+      writer.uint32(10).string(message.entityType);
+    }
+    if (message.concurrency !== 0) {
+      writer.uint32(16).int32(message.concurrency);
+    }
+    if (message.priority !== 0) {
+      writer.uint32(24).int32(message.priority);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): PeriodicConfig_EntityTypeLimit {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBasePeriodicConfig_EntityTypeLimit();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.entityType = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.concurrency = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.priority = reader.int32();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): PeriodicConfig_EntityTypeLimit {
+    return {
+      entityType: isSet(object.entityType) ? gt.String(object.entityType) : "",
+      concurrency: isSet(object.concurrency) ? gt.Number(object.concurrency) : 0,
+      priority: isSet(object.priority) ? gt.Number(object.priority) : 0,
+    };
+  },
+
+  toJSON(message: PeriodicConfig_EntityTypeLimit): unknown {
+    const obj: any = {};
+    if (message.entityType !== "") {
+      obj.entityType = message.entityType;
+    }
+    if (message.concurrency !== 0) {
+      obj.concurrency = Math.round(message.concurrency);
+    }
+    if (message.priority !== 0) {
+      obj.priority = Math.round(message.priority);
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<PeriodicConfig_EntityTypeLimit>): PeriodicConfig_EntityTypeLimit {
+    return PeriodicConfig_EntityTypeLimit.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<PeriodicConfig_EntityTypeLimit>): PeriodicConfig_EntityTypeLimit {
+    const message = createBasePeriodicConfig_EntityTypeLimit();
+    message.entityType = object.entityType ?? "";
+    message.concurrency = object.concurrency ?? 0;
+    message.priority = object.priority ?? 0;
     return message;
   },
 };
@@ -261,6 +427,12 @@ function createBaseAnalysisConfig(): AnalysisConfig {
     disableMasking: false,
     defaultGitChangesAnalyzer: undefined,
     defaultAggregatedSummaryAnalyzer: undefined,
+    analyzerConcurrency: 0,
+    combineFanOut: 0,
+    combineMaxDepth: 0,
+    chunkConcurrency: 0,
+    pipelinedAnalysis: false,
+    pipelineMaxPendingChunks: 0,
   };
 }
 
@@ -281,6 +453,24 @@ export const AnalysisConfig: MessageFns<AnalysisConfig> = {
     if (message.defaultAggregatedSummaryAnalyzer !== undefined) {
       Analyzer.encode(message.defaultAggregatedSummaryAnalyzer, writer.uint32(42).fork()).join();
     }
+    if (message.analyzerConcurrency !== 0) {
+      writer.uint32(56).int32(message.analyzerConcurrency);
+    }
+    if (message.combineFanOut !== 0) {
+      writer.uint32(64).int32(message.combineFanOut);
+    }
+    if (message.combineMaxDepth !== 0) {
+      writer.uint32(72).int32(message.combineMaxDepth);
+    }
+    if (message.chunkConcurrency !== 0) {
+      writer.uint32(80).int32(message.chunkConcurrency);
+    }
+    if (message.pipelinedAnalysis !== false) {
+      writer.uint32(88).bool(message.pipelinedAnalysis);
+    }
+    if (message.pipelineMaxPendingChunks !== 0) {
+      writer.uint32(96).int32(message.pipelineMaxPendingChunks);
+    }
     return writer;
   },
 
@@ -331,6 +521,54 @@ export const AnalysisConfig: MessageFns<AnalysisConfig> = {
           message.defaultAggregatedSummaryAnalyzer = Analyzer.decode(reader, reader.uint32());
           continue;
         }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.analyzerConcurrency = reader.int32();
+          continue;
+        }
+        case 8: {
+          if (tag !== 64) {
+            break;
+          }
+
+          message.combineFanOut = reader.int32();
+          continue;
+        }
+        case 9: {
+          if (tag !== 72) {
+            break;
+          }
+
+          message.combineMaxDepth = reader.int32();
+          continue;
+        }
+        case 10: {
+          if (tag !== 80) {
+            break;
+          }
+
+          message.chunkConcurrency = reader.int32();
+          continue;
+        }
+        case 11: {
+          if (tag !== 88) {
+            break;
+          }
+
+          message.pipelinedAnalysis = reader.bool();
+          continue;
+        }
+        case 12: {
+          if (tag !== 96) {
+            break;
+          }
+
+          message.pipelineMaxPendingChunks = reader.int32();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -355,6 +593,12 @@ export const AnalysisConfig: MessageFns<AnalysisConfig> = {
       defaultAggregatedSummaryAnalyzer: isSet(object.defaultAggregatedSummaryAnalyzer)
         ? Analyzer.fromJSON(object.defaultAggregatedSummaryAnalyzer)
         : undefined,
+      analyzerConcurrency: isSet(object.analyzerConcurrency) ? gt.Number(object.analyzerConcurrency) : 0,
+      combineFanOut: isSet(object.combineFanOut) ? gt.Number(object.combineFanOut) : 0,
+      combineMaxDepth: isSet(object.combineMaxDepth) ? gt.Number(object.combineMaxDepth) : 0,
+      chunkConcurrency: isSet(object.chunkConcurrency) ? gt.Number(object.chunkConcurrency) : 0,
+      pipelinedAnalysis: isSet(object.pipelinedAnalysis) ? gt.Boolean(object.pipelinedAnalysis) : false,
+      pipelineMaxPendingChunks: isSet(object.pipelineMaxPendingChunks) ? gt.Number(object.pipelineMaxPendingChunks) : 0,
     };
   },
 
@@ -375,6 +619,24 @@ export const AnalysisConfig: MessageFns<AnalysisConfig> = {
     if (message.defaultAggregatedSummaryAnalyzer !== undefined) {
       obj.defaultAggregatedSummaryAnalyzer = Analyzer.toJSON(message.defaultAggregatedSummaryAnalyzer);
     }
+    if (message.analyzerConcurrency !== 0) {
+      obj.analyzerConcurrency = Math.round(message.analyzerConcurrency);
+    }
+    if (message.combineFanOut !== 0) {
+      obj.combineFanOut = Math.round(message.combineFanOut);
+    }
+    if (message.combineMaxDepth !== 0) {
+      obj.combineMaxDepth = Math.round(message.combineMaxDepth);
+    }
+    if (message.chunkConcurrency !== 0) {
+      obj.chunkConcurrency = Math.round(message.chunkConcurrency);
+    }
+    if (message.pipelinedAnalysis !== false) {
+      obj.pipelinedAnalysis = message.pipelinedAnalysis;
+    }
+    if (message.pipelineMaxPendingChunks !== 0) {
+      obj.pipelineMaxPendingChunks = Math.round(message.pipelineMaxPendingChunks);
+    }
     return obj;
   },
 
@@ -394,6 +656,12 @@ export const AnalysisConfig: MessageFns<AnalysisConfig> = {
       (object.defaultAggregatedSummaryAnalyzer !== undefined && object.defaultAggregatedSummaryAnalyzer !== null)
         ? Analyzer.fromPartial(object.defaultAggregatedSummaryAnalyzer)
         : undefined;
+    message.analyzerConcurrency = object.analyzerConcurrency ?? 0;
+    message.combineFanOut = object.combineFanOut ?? 0;
+    message.combineMaxDepth = object.combineMaxDepth ?? 0;
+    message.chunkConcurrency = object.chunkConcurrency ?? 0;
+    message.pipelinedAnalysis = object.pipelinedAnalysis ?? false;
+    message.pipelineMaxPendingChunks = object.pipelineMaxPendingChunks ?? 0;
     return message;
   },
 };
@@ -598,6 +866,11 @@ function createBaseRepoAnalysisConfig_Flatten(): RepoAnalysisConfig_Flatten {
     largeRepoIgnorePattern: "",
     compressLarge: false,
     maxFileSizeBytes: 0,
+    flattener: "",
+    bloblessClone: false,
+    sparseCheckout: false,
+    cloneTimeoutSec: 0,
+    maxDiffSizeBytes: 0,
   };
 }
 
@@ -633,6 +906,21 @@ export const RepoAnalysisConfig_Flatten: MessageFns<RepoAnalysisConfig_Flatten>
     if (message.maxFileSizeBytes !== 0) {
       writer.uint32(80).int32(message.maxFileSizeBytes);
     }
+    if (message.flattener !== "") {
+      writer.uint32(90).string(message.flattener);
+    }
+    if (message.bloblessClone !== false) {
+      writer.uint32(96).bool(message.bloblessClone);
+    }
+    if (message.sparseCheckout !== false) {
+      writer.uint32(104).bool(message.sparseCheckout);
+    }
+    if (message.cloneTimeoutSec !== 0) {
+      writer.uint32(112).int32(message.cloneTimeoutSec);
+    }
+    if (message.maxDiffSizeBytes !== 0) {
+      writer.uint32(120).int32(message.maxDiffSizeBytes);
+    }
     return writer;
   },
 
@@ -723,6 +1011,46 @@ export const RepoAnalysisConfig_Flatten: MessageFns<RepoAnalysisConfig_Flatten>
           message.maxFileSizeBytes = reader.int32();
           continue;
         }
+        case 11: {
+          if (tag !== 90) {
+            break;
+          }
+
+          message.flattener = reader.string();
+          continue;
+        }
+        case 12: {
+          if (tag !== 96) {
+            break;
+          }
+
+          message.bloblessClone = reader.bool();
+          continue;
+        }
+        case 13: {
+          if (tag !== 104) {
+            break;
+          }
+
+          message.sparseCheckout = reader.bool();
+          continue;
+        }
+        case 14: {
+          if (tag !== 112) {
+            break;
+          }
+
+          message.cloneTimeoutSec = reader.int32();
+          continue;
+        }
+        case 15: {
+          if (tag !== 120) {
+            break;
+          }
+
+          message.maxDiffSizeBytes = reader.int32();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -744,6 +1072,11 @@ export const RepoAnalysisConfig_Flatten: MessageFns<RepoAnalysisConfig_Flatten>
       largeRepoIgnorePattern: isSet(object.largeRepoIgnorePattern) ? gt.String(object.largeRepoIgnorePattern) : "",
       compressLarge: isSet(object.compressLarge) ? gt.Boolean(object.compressLarge) : false,
       maxFileSizeBytes: isSet(object.maxFileSizeBytes) ? gt.Number(object.maxFileSizeBytes) : 0,
+      flattener: isSet(object.flattener) ? gt.String(object.flattener) : "",
+      bloblessClone: isSet(object.bloblessClone) ? gt.Boolean(object.bloblessClone) : false,
+      sparseCheckout: isSet(object.sparseCheckout) ? gt.Boolean(object.sparseCheckout) : false,
+      cloneTimeoutSec: isSet(object.cloneTimeoutSec) ? gt.Number(object.cloneTimeoutSec) : 0,
+      maxDiffSizeBytes: isSet(object.maxDiffSizeBytes) ? gt.Number(object.maxDiffSizeBytes) : 0,
     };
   },
 
@@ -779,6 +1112,21 @@ export const RepoAnalysisConfig_Flatten: MessageFns<RepoAnalysisConfig_Flatten>
     if (message.maxFileSizeBytes !== 0) {
       obj.maxFileSizeBytes = Math.round(message.maxFileSizeBytes);
     }
+    if (message.flattener !== "") {
+      obj.flattener = message.flattener;
+    }
+    if (message.bloblessClone !== false) {
+      obj.bloblessClone = message.bloblessClone;
+    }
+    if (message.sparseCheckout !== false) {
+      obj.sparseCheckout = message.sparseCheckout;
+    }
+    if (message.cloneTimeoutSec !== 0) {
+      obj.cloneTimeoutSec = Math.round(message.cloneTimeoutSec);
+    }
+    if (message.maxDiffSizeBytes !== 0) {
+      obj.maxDiffSizeBytes = Math.round(message.maxDiffSizeBytes);
+    }
     return obj;
   },
 
@@ -797,6 +1145,11 @@ export const RepoAnalysisConfig_Flatten: MessageFns<RepoAnalysisConfig_Flatten>
     message.largeRepoIgnorePattern = object.largeRepoIgnorePattern ?? "";
     message.compressLarge = object.compressLarge ?? false;
     message.maxFileSizeBytes = object.maxFileSizeBytes ?? 0;
+    message.flattener = object.flattener ?? "";
+    message.bloblessClone = object.bloblessClone ?? false;
+    message.sparseCheckout = object.sparseCheckout ?? false;
+    message.cloneTimeoutSec = object.cloneTimeoutSec ?? 0;
+    message.maxDiffSizeBytes = object.maxDiffSizeBytes ?? 0;
     return message;
   },
 };
@@ -38,6 +38,8 @@ export interface ProcessingItem {
   noProcessing: boolean;
   processingStartedAt?: Date | undefined;
   data?: ProcessingItemData | undefined;
+  /** Worker currently holding the lease on the item. */
+  workerId?: string | undefined;
 }
 
 export interface PeriodicAggregation {
@@ -56,7 +58,10 @@ export interface AggregatedSummaryParams_Target {
 }
 
 export interface ProcessingRequest {
-  type?: { $case: "gitChanges"; value: ProcessGitChangesRequest } | undefined;
+  type?:
+    | { $case: "gitChanges"; value: ProcessGitChangesRequest }
+    | { $case: "analyzeTokens"; value: AnalyzeRepoTokensRequest }
+    | undefined;
 }
 
 export interface ProcessGitChangesRequest {
@@ -64,6 +69,12 @@ export interface ProcessGitChangesRequest {
   lookBackDays: number;
 }
 
+export interface AnalyzeRepoTokensRequest {
+  gitRepoId: string;
+  /** Counts tokens by flattening and tokenizing the repository instead of estimating them from file sizes. */
+  exact: boolean;
+}
+
 export interface ProcessingItemResult {
   /** Unique id of the result */
   id: string;
@@ -94,8 +105,17 @@ export interface ProcessingItemData {
     | undefined;
 }
 
+/** Files of flattened content that landed in a chunk analyzed separately. */
+export interface FlattenChunk {
+  name: string;
+  tokens: number;
+  /** Files split between chunks are listed in each of them. Empty name stands for content fitting a single chunk. */
+  files: string[];
+}
+
 export interface ProcessingItemResultData {
   observations: ObservationKey[];
+  chunks: FlattenChunk[];
   type?: { $case: "periodicAggregation"; value: PeriodicAggregationResult } | undefined;
 }
 
@@ -277,6 +297,7 @@ function createBaseProcessingItem(): ProcessingItem {
     noProcessing: false,
     processingStartedAt: undefined,
     data: undefined,
+    workerId: undefined,
   };
 }
 
@@ -303,6 +324,9 @@ export const ProcessingItem: MessageFns<ProcessingItem> = {
     if (message.data !== undefined) {
       ProcessingItemData.encode(message.data, writer.uint32(66).fork()).join();
     }
+    if (message.workerId !== undefined) {
+      writer.uint32(74).string(message.workerId);
+    }
     return writer;
   },
 
@@ -369,6 +393,14 @@ export const ProcessingItem: MessageFns<ProcessingItem> = {
           message.data = ProcessingItemData.decode(reader, reader.uint32());
           continue;
         }
+        case 9: {
+          if (tag !== 74) {
+            break;
+          }
+
+          message.workerId = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -389,6 +421,7 @@ export const ProcessingItem: MessageFns<ProcessingItem> = {
         ? fromJsonTimestamp(object.processingStartedAt)
         : undefined,
       data: isSet(object.data) ? ProcessingItemData.fromJSON(object.data) : undefined,
+      workerId: isSet(object.workerId) ? gt.String(object.workerId) : undefined,
     };
   },
 
@@ -415,6 +448,9 @@ export const ProcessingItem: MessageFns<ProcessingItem> = {
     if (message.data !== undefined) {
       obj.data = ProcessingItemData.toJSON(message.data);
     }
+    if (message.workerId !== undefined) {
+      obj.workerId = message.workerId;
+    }
     return obj;
   },
 
@@ -434,6 +470,7 @@ export const ProcessingItem: MessageFns<ProcessingItem> = {
     message.data = (object.data !== undefined && object.data !== null)
       ? ProcessingItemData.fromPartial(object.data)
       : undefined;
+    message.workerId = object.workerId ?? undefined;
     return message;
   },
 };
@@ -680,6 +717,9 @@ export const ProcessingRequest: MessageFns<ProcessingRequest> = {
       case "gitChanges":
         ProcessGitChangesRequest.encode(message.type.value, writer.uint32(802).fork()).join();
         break;
+      case "analyzeTokens":
+        AnalyzeRepoTokensRequest.encode(message.type.value, writer.uint32(810).fork()).join();
+        break;
     }
     return writer;
   },
@@ -699,6 +739,14 @@ export const ProcessingRequest: MessageFns<ProcessingRequest> = {
           message.type = { $case: "gitChanges", value: ProcessGitChangesRequest.decode(reader, reader.uint32()) };
           continue;
         }
+        case 101: {
+          if (tag !== 810) {
+            break;
+          }
+
+          message.type = { $case: "analyzeTokens", value: AnalyzeRepoTokensRequest.decode(reader, reader.uint32()) };
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -712,6 +760,8 @@ export const ProcessingRequest: MessageFns<ProcessingRequest> = {
     return {
       type: isSet(object.gitChanges)
         ? { $case: "gitChanges", value: ProcessGitChangesRequest.fromJSON(object.gitChanges) }
+        : isSet(object.analyzeTokens)
+        ? { $case: "analyzeTokens", value: AnalyzeRepoTokensRequest.fromJSON(object.analyzeTokens) }
         : undefined,
     };
   },
@@ -720,6 +770,8 @@ export const ProcessingRequest: MessageFns<ProcessingRequest> = {
     const obj: any = {};
     if (message.type?.$case === "gitChanges") {
       obj.gitChanges = ProcessGitChangesRequest.toJSON(message.type.value);
+    } else if (message.type?.$case === "analyzeTokens") {
+      obj.analyzeTokens = AnalyzeRepoTokensRequest.toJSON(message.type.value);
     }
     return obj;
   },
@@ -736,6 +788,12 @@ export const ProcessingRequest: MessageFns<ProcessingRequest> = {
         }
         break;
       }
+      case "analyzeTokens": {
+        if (object.type?.value !== undefined && object.type?.value !== null) {
+          message.type = { $case: "analyzeTokens", value: AnalyzeRepoTokensRequest.fromPartial(object.type.value) };
+        }
+        break;
+      }
     }
     return message;
   },
@@ -817,6 +875,82 @@ export const ProcessGitChangesRequest: MessageFns<ProcessGitChangesRequest> = {
   },
 };
 
+function createBaseAnalyzeRepoTokensRequest(): AnalyzeRepoTokensRequest {
+  return { gitRepoId: "", exact: false };
+}
+
+export const AnalyzeRepoTokensRequest: MessageFns<AnalyzeRepoTokensRequest> = {
+  encode(message: AnalyzeRepoTokensRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.gitRepoId !== "") {
+      writer.uint32(10).string(message.gitRepoId);
+    }
+    if (message.exact !== false) {
+      writer.uint32(16).bool(message.exact);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): AnalyzeRepoTokensRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseAnalyzeRepoTokensRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.gitRepoId = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.exact = reader.bool();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): AnalyzeRepoTokensRequest {
+    return {
+      gitRepoId: isSet(object.gitRepoId) ? gt.String(object.gitRepoId) : "",
+      exact: isSet(object.exact) ? gt.Boolean(object.exact) : false,
+    };
+  },
+
+  toJSON(message: AnalyzeRepoTokensRequest): unknown {
+    const obj: any = {};
+    if (message.gitRepoId !== "") {
+      obj.gitRepoId = message.gitRepoId;
+    }
+    if (message.exact !== false) {
+      obj.exact = message.exact;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<AnalyzeRepoTokensRequest>): AnalyzeRepoTokensRequest {
+    return AnalyzeRepoTokensRequest.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<AnalyzeRepoTokensRequest>): AnalyzeRepoTokensRequest {
+    const message = createBaseAnalyzeRepoTokensRequest();
+    message.gitRepoId = object.gitRepoId ?? "";
+    message.exact = object.exact ?? false;
+    return message;
+  },
+};
+
 function createBaseProcessingItemResult(): ProcessingItemResult {
   return {
     id: "",
@@ -1250,8 +1384,100 @@ export const ProcessingItemData: MessageFns<ProcessingItemData> = {
   },
 };
 
+function createBaseFlattenChunk(): FlattenChunk {
+  return { name: "", tokens: 0, files: [] };
+}
+
+export const FlattenChunk: MessageFns<FlattenChunk> = {
+  encode(message: FlattenChunk, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.name !== "") {
+      writer.uint32(10).string(message.name);
+    }
+    if (message.tokens !== 0) {
+      writer.uint32(16).int32(message.tokens);
+    }
+    for (const v of message.files) {
+      writer.uint32(26).string(v!);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): FlattenChunk {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseFlattenChunk();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.name = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.tokens = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.files.push(reader.string());
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): FlattenChunk {
+    return {
+      name: isSet(object.name) ? gt.String(object.name) : "",
+      tokens: isSet(object.tokens) ? gt.Number(object.tokens) : 0,
+      files: gt.Array.isArray(object?.files) ? object.files.map((e: any) => gt.String(e)) : [],
+    };
+  },
+
+  toJSON(message: FlattenChunk): unknown {
+    const obj: any = {};
+    if (message.name !== "") {
+      obj.name = message.name;
+    }
+    if (message.tokens !== 0) {
+      obj.tokens = Math.round(message.tokens);
+    }
+    if (message.files?.length) {
+      obj.files = message.files;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<FlattenChunk>): FlattenChunk {
+    return FlattenChunk.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<FlattenChunk>): FlattenChunk {
+    const message = createBaseFlattenChunk();
+    message.name = object.name ?? "";
+    message.tokens = object.tokens ?? 0;
+    message.files = object.files?.map((e) => e) || [];
+    return message;
+  },
+};
+
 function createBaseProcessingItemResultData(): ProcessingItemResultData {
-  return { observations: [], type: undefined };
+  return { observations: [], chunks: [], type: undefined };
 }
 
 export const ProcessingItemResultData: MessageFns<ProcessingItemResultData> = {
@@ -1259,6 +1485,9 @@ export const ProcessingItemResultData: MessageFns<ProcessingItemResultData> = {
     for (const v of message.observations) {
       ObservationKey.encode(v!, writer.uint32(10).fork()).join();
     }
+    for (const v of message.chunks) {
+      FlattenChunk.encode(v!, writer.uint32(18).fork()).join();
+    }
     switch (message.type?.$case) {
       case "periodicAggregation":
         PeriodicAggregationResult.encode(message.type.value, writer.uint32(802).fork()).join();
@@ -1282,6 +1511,14 @@ export const ProcessingItemResultData: MessageFns<ProcessingItemResultData> = {
           message.observations.push(ObservationKey.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.chunks.push(FlattenChunk.decode(reader, reader.uint32()));
+          continue;
+        }
         case 100: {
           if (tag !== 802) {
             break;
@@ -1307,6 +1544,7 @@ export const ProcessingItemResultData: MessageFns<ProcessingItemResultData> = {
       observations: gt.Array.isArray(object?.observations)
         ? object.observations.map((e: any) => ObservationKey.fromJSON(e))
         : [],
+      chunks: gt.Array.isArray(object?.chunks) ? object.chunks.map((e: any) => FlattenChunk.fromJSON(e)) : [],
       type: isSet(object.periodicAggregation)
         ? { $case: "periodicAggregation", value: PeriodicAggregationResult.fromJSON(object.periodicAggregation) }
         : undefined,
@@ -1318,6 +1556,9 @@ export const ProcessingItemResultData: MessageFns<ProcessingItemResultData> = {
     if (message.observations?.length) {
       obj.observations = message.observations.map((e) => ObservationKey.toJSON(e));
     }
+    if (message.chunks?.length) {
+      obj.chunks = message.chunks.map((e) => FlattenChunk.toJSON(e));
+    }
     if (message.type?.$case === "periodicAggregation") {
       obj.periodicAggregation = PeriodicAggregationResult.toJSON(message.type.value);
     }
@@ -1330,6 +1571,7 @@ export const ProcessingItemResultData: MessageFns<ProcessingItemResultData> = {
   fromPartial(object: DeepPartial<ProcessingItemResultData>): ProcessingItemResultData {
     const message = createBaseProcessingItemResultData();
     message.observations = object.observations?.map((e) => ObservationKey.fromPartial(e)) || [];
+    message.chunks = object.chunks?.map((e) => FlattenChunk.fromPartial(e)) || [];
     switch (object.type?.$case) {
       case "periodicAggregation": {
         if (object.type?.value !== undefined && object.type?.value !== null) {
@@ -71,6 +71,8 @@ export interface GitMeta {
 export interface TokensInfo {
   createdAt: Date | undefined;
   tokensCount: number;
+  /** Whether the count is estimated from file sizes instead of tokenizing the repository. */
+  estimated: boolean;
 }
 
 export interface GitAppInfo {
@@ -581,7 +583,7 @@ export const GitMeta: MessageFns<GitMeta> = {
 };
 
 function createBaseTokensInfo(): TokensInfo {
-  return { createdAt: undefined, tokensCount: 0 };
+  return { createdAt: undefined, tokensCount: 0, estimated: false };
 }
 
 export const TokensInfo: MessageFns<TokensInfo> = {
@@ -592,6 +594,9 @@ export const TokensInfo: MessageFns<TokensInfo> = {
     if (message.tokensCount !== 0) {
       writer.uint32(16).int32(message.tokensCount);
     }
+    if (message.estimated !== false) {
+      writer.uint32(24).bool(message.estimated);
+    }
     return writer;
   },
 
@@ -618,6 +623,14 @@ export const TokensInfo: MessageFns<TokensInfo> = {
           message.tokensCount = reader.int32();
           continue;
         }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.estimated = reader.bool();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -631,6 +644,7 @@ export const TokensInfo: MessageFns<TokensInfo> = {
     return {
       createdAt: isSet(object.createdAt) ? fromJsonTimestamp(object.createdAt) : undefined,
       tokensCount: isSet(object.tokensCount) ? gt.Number(object.tokensCount) : 0,
+      estimated: isSet(object.estimated) ? gt.Boolean(object.estimated) : false,
     };
   },
 
@@ -642,6 +656,9 @@ export const TokensInfo: MessageFns<TokensInfo> = {
     if (message.tokensCount !== 0) {
       obj.tokensCount = Math.round(message.tokensCount);
     }
+    if (message.estimated !== false) {
+      obj.estimated = message.estimated;
+    }
     return obj;
   },
 
@@ -652,6 +669,7 @@ export const TokensInfo: MessageFns<TokensInfo> = {
     const message = createBaseTokensInfo();
     message.createdAt = object.createdAt ?? undefined;
     message.tokensCount = object.tokensCount ?? 0;
+    message.estimated = object.estimated ?? false;
     return message;
   },
 };
@@ -32,6 +32,15 @@ export interface RescanRepositoryRequest {
 export interface RescanRepositoryResponse {
 }
 
+export interface AnalyzeRepoTokensRequest {
+  exact?: boolean | undefined;
+}
+
+export interface AnalyzeRepoTokensResponse {
+  /** Id of the processing request, see `/processing/requests/runs/{request_id}`. */
+  requestId: string;
+}
+
 export interface GetRepositoryResponse {
   repo: GitRepository | undefined;
 }
@@ -402,6 +411,122 @@ export const RescanRepositoryResponse: MessageFns<RescanRepositoryResponse> = {
   },
 };
 
+function createBaseAnalyzeRepoTokensRequest(): AnalyzeRepoTokensRequest {
+  return { exact: undefined };
+}
+
+export const AnalyzeRepoTokensRequest: MessageFns<AnalyzeRepoTokensRequest> = {
+  encode(message: AnalyzeRepoTokensRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.exact !== undefined) {
+      writer.uint32(8).bool(message.exact);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): AnalyzeRepoTokensRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseAnalyzeRepoTokensRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.exact = reader.bool();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): AnalyzeRepoTokensRequest {
+    return { exact: isSet(object.exact) ? gt.Boolean(object.exact) : undefined };
+  },
+
+  toJSON(message: AnalyzeRepoTokensRequest): unknown {
+    const obj: any = {};
+    if (message.exact !== undefined) {
+      obj.exact = message.exact;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<AnalyzeRepoTokensRequest>): AnalyzeRepoTokensRequest {
+    return AnalyzeRepoTokensRequest.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<AnalyzeRepoTokensRequest>): AnalyzeRepoTokensRequest {
+    const message = createBaseAnalyzeRepoTokensRequest();
+    message.exact = object.exact ?? undefined;
+    return message;
+  },
+};
+
+function createBaseAnalyzeRepoTokensResponse(): AnalyzeRepoTokensResponse {
+  return { requestId: "" };
+}
+
+export const AnalyzeRepoTokensResponse: MessageFns<AnalyzeRepoTokensResponse> = {
+  encode(message: AnalyzeRepoTokensResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.requestId !== "") {
+      writer.uint32(10).string(message.requestId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): AnalyzeRepoTokensResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseAnalyzeRepoTokensResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.requestId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): AnalyzeRepoTokensResponse {
+    return { requestId: isSet(object.requestId) ? gt.String(object.requestId) : "" };
+  },
+
+  toJSON(message: AnalyzeRepoTokensResponse): unknown {
+    const obj: any = {};
+    if (message.requestId !== "") {
+      obj.requestId = message.requestId;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<AnalyzeRepoTokensResponse>): AnalyzeRepoTokensResponse {
+    return AnalyzeRepoTokensResponse.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<AnalyzeRepoTokensResponse>): AnalyzeRepoTokensResponse {
+    const message = createBaseAnalyzeRepoTokensResponse();
+    message.requestId = object.requestId ?? "";
+    return message;
+  },
+};
+
 function createBaseGetRepositoryResponse(): GetRepositoryResponse {
   return { repo: undefined };
 }